@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics_results', '0002_initial'),
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyticsresult',
+            name='cache_key',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='analyticsresult',
+            index=models.Index(fields=['project', 'cache_key'], name='analytics_r_project_58a85c_idx'),
+        ),
+    ]
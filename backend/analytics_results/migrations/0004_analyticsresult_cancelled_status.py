@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics_results', '0003_analyticsresult_cache_key'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='analyticsresult',
+            name='sync_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed'), ('cancelled', 'Cancelled')], default='pending', max_length=20),
+        ),
+    ]
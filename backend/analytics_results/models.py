@@ -22,6 +22,7 @@ class AnalyticsResult(models.Model):
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
+        ('cancelled', 'Cancelled'),
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -31,6 +32,8 @@ class AnalyticsResult(models.Model):
     results = models.JSONField(default=dict)  # Analysis results and outputs
     generated_at = models.DateTimeField(auto_now_add=True)
     sync_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    # Hash of (endpoint, parameters, project data version) for results cached by the analytics engine
+    cache_key = models.CharField(max_length=64, blank=True, default='')
 
     class Meta:
         db_table = 'analytics_results'
@@ -38,6 +41,7 @@ class AnalyticsResult(models.Model):
         indexes = [
             models.Index(fields=['project', 'analysis_type']),
             models.Index(fields=['sync_status', 'generated_at']),
+            models.Index(fields=['project', 'cache_key']),
         ]
 
     def __str__(self):
@@ -190,6 +190,10 @@ ANALYTICS_SETTINGS = {
     'MAX_RESULTS_PER_PROJECT': 100,
     'DEFAULT_ANALYSIS_TYPES': ['descriptive_stats', 'frequency_analysis'],
     'RESULT_CACHE_TIMEOUT': 3600,  # 1 hour
+    # FastAPI analytics engine, told which projects a sync batch changed so it
+    # can warm their hot analyses
+    'ENGINE_URL': os.getenv('ANALYTICS_ENGINE_URL', 'http://127.0.0.1:8001/api/v1'),
+    'INGEST_NOTIFY_TIMEOUT': 2,  # seconds
 }
 
 SYNC_SETTINGS = {
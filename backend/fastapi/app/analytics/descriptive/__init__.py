@@ -14,6 +14,16 @@ from .basic_statistics import (
     calculate_covariance_matrix
 )
 
+from .streaming_statistics import (
+    ColumnMoments,
+    ColumnStatistics,
+    summarize_columns,
+    summarize_chunks,
+    merge_summaries
+)
+
+from .quantile_sketch import QuantileSketch
+
 from .distributions import (
     analyze_distribution,
     test_normality,
@@ -30,6 +40,8 @@ from .categorical_analysis import (
     analyze_categorical_associations
 )
 
+from .contingency import ContingencyTables
+
 from .outlier_detection import (
     detect_outliers_iqr,
     detect_outliers_zscore,
@@ -46,6 +58,8 @@ from .missing_data import (
     analyze_missing_by_group
 )
 
+from .missing_bitmap import MissingMask
+
 from .temporal_analysis import (
     analyze_temporal_patterns,
     calculate_time_series_stats,
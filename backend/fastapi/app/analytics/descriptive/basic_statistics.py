@@ -7,6 +7,8 @@ import numpy as np
 from typing import Dict, Any, List, Optional, Union
 from scipy import stats
 
+from .streaming_statistics import DEFAULT_PERCENTILES, summarize_columns
+
 def calculate_basic_stats(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
     """
     Calculate comprehensive basic descriptive statistics for numerical columns.
@@ -18,52 +20,12 @@ def calculate_basic_stats(df: pd.DataFrame, columns: Optional[List[str]] = None)
     Returns:
         Dictionary containing statistics for each numerical column
     """
-    if columns is None:
-        columns = df.select_dtypes(include=[np.number]).columns.tolist()
-    
-    stats_dict = {}
-    for column in columns:
-        if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-            col_data = df[column].dropna()
-            
-            stats_dict[column] = {
-                # Central tendency
-                "mean": float(col_data.mean()),
-                "median": float(col_data.median()),
-                "mode": float(col_data.mode()[0]) if not col_data.mode().empty else None,
-                "trimmed_mean_5": float(stats.trim_mean(col_data, 0.05)),
-                
-                # Dispersion
-                "std": float(col_data.std()),
-                "variance": float(col_data.var()),
-                "mad": float((col_data - col_data.mean()).abs().mean()),  # Mean absolute deviation
-                "iqr": float(col_data.quantile(0.75) - col_data.quantile(0.25)),
-                "range": float(col_data.max() - col_data.min()),
-                "cv": float(col_data.std() / col_data.mean()) if col_data.mean() != 0 else None,  # Coefficient of variation
-                
-                # Position
-                "min": float(col_data.min()),
-                "max": float(col_data.max()),
-                "q1": float(col_data.quantile(0.25)),
-                "q3": float(col_data.quantile(0.75)),
-                
-                # Shape
-                "skewness": float(col_data.skew()),
-                "kurtosis": float(col_data.kurtosis()),
-                
-                # Count statistics
-                "count": int(col_data.count()),
-                "missing_count": int(df[column].isna().sum()),
-                "missing_percentage": float(df[column].isna().sum() / len(df) * 100),
-                "unique_count": int(col_data.nunique()),
-                "unique_percentage": float(col_data.nunique() / len(col_data) * 100) if len(col_data) > 0 else 0
-            }
-    
-    return stats_dict
+    summary = summarize_columns(df, columns)
+    return {column: statistics.basic_stats() for column, statistics in summary.items()}
 
 def calculate_percentiles(df: pd.DataFrame, 
                          columns: Optional[List[str]] = None,
-                         percentiles: List[float] = [0.01, 0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]) -> Dict[str, Dict[str, float]]:
+                         percentiles: List[float] = DEFAULT_PERCENTILES) -> Dict[str, Dict[str, float]]:
     """
     Calculate custom percentiles for numerical columns.
     
@@ -75,19 +37,8 @@ def calculate_percentiles(df: pd.DataFrame,
     Returns:
         Dictionary containing percentiles for each column
     """
-    if columns is None:
-        columns = df.select_dtypes(include=[np.number]).columns.tolist()
-    
-    percentile_dict = {}
-    for column in columns:
-        if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-            col_data = df[column].dropna()
-            percentile_dict[column] = {}
-            
-            for p in percentiles:
-                percentile_dict[column][f"p{int(p*100)}"] = float(col_data.quantile(p))
-    
-    return percentile_dict
+    summary = summarize_columns(df, columns)
+    return {column: statistics.percentiles(percentiles) for column, statistics in summary.items()}
 
 def calculate_grouped_stats(df: pd.DataFrame, 
                            group_by: Union[str, List[str]], 
@@ -8,6 +8,8 @@ from typing import Dict, Any, List, Tuple, Union
 from scipy.stats import chi2_contingency, chi2
 import itertools
 
+from .contingency import ContingencyTables, chi_square_of_table, _interpret_cramers_v
+
 def analyze_categorical(series: pd.Series, 
                        max_categories: int = 50) -> Dict[str, Any]:
     """
@@ -94,45 +96,7 @@ def calculate_chi_square(df: pd.DataFrame,
     Returns:
         Dictionary containing chi-square test results
     """
-    # Create contingency table
-    crosstab = pd.crosstab(df[var1], df[var2])
-    
-    # Perform chi-square test
-    chi2_stat, p_value, dof, expected = chi2_contingency(crosstab)
-    
-    # Calculate effect size (Cramér's V)
-    n = crosstab.sum().sum()
-    min_dim = min(crosstab.shape[0] - 1, crosstab.shape[1] - 1)
-    cramers_v = np.sqrt(chi2_stat / (n * min_dim)) if min_dim > 0 else 0
-    
-    # Contribution to chi-square
-    chi2_contributions = ((crosstab - expected) ** 2 / expected)
-    
-    return {
-        "chi2_statistic": float(chi2_stat),
-        "p_value": float(p_value),
-        "degrees_of_freedom": int(dof),
-        "cramers_v": float(cramers_v),
-        "effect_size_interpretation": _interpret_cramers_v(cramers_v),
-        "is_significant": p_value < 0.05,
-        "contingency_table": crosstab.to_dict(),
-        "expected_frequencies": pd.DataFrame(expected, 
-                                            index=crosstab.index, 
-                                            columns=crosstab.columns).to_dict(),
-        "chi2_contributions": chi2_contributions.to_dict(),
-        "sample_size": int(n)
-    }
-
-def _interpret_cramers_v(v: float) -> str:
-    """Interpret Cramér's V effect size."""
-    if v < 0.1:
-        return "Negligible association"
-    elif v < 0.3:
-        return "Weak association"
-    elif v < 0.5:
-        return "Moderate association"
-    else:
-        return "Strong association"
+    return chi_square_of_table(ContingencyTables(df, [var1, var2]).table(var1, var2))
 
 def calculate_cramers_v(df: pd.DataFrame, 
                        var1: str, 
@@ -148,12 +112,7 @@ def calculate_cramers_v(df: pd.DataFrame,
     Returns:
         Cramér's V statistic
     """
-    crosstab = pd.crosstab(df[var1], df[var2])
-    chi2_stat = chi2_contingency(crosstab)[0]
-    n = crosstab.sum().sum()
-    min_dim = min(crosstab.shape[0] - 1, crosstab.shape[1] - 1)
-    
-    return np.sqrt(chi2_stat / (n * min_dim)) if min_dim > 0 else 0
+    return ContingencyTables(df, [var1, var2]).pair_statistics(var1, var2)["cramers_v"]
 
 def analyze_cross_tabulation(df: pd.DataFrame, 
                            var1: str, 
@@ -171,27 +130,7 @@ def analyze_cross_tabulation(df: pd.DataFrame,
     Returns:
         Dictionary containing cross-tabulation analysis
     """
-    # Create crosstab
-    crosstab = pd.crosstab(df[var1], df[var2], margins=True, margins_name="Total")
-    
-    # Create normalized versions
-    crosstab_pct_row = pd.crosstab(df[var1], df[var2], normalize='index') * 100
-    crosstab_pct_col = pd.crosstab(df[var1], df[var2], normalize='columns') * 100
-    crosstab_pct_all = pd.crosstab(df[var1], df[var2], normalize='all') * 100
-    
-    # Chi-square test
-    chi2_results = calculate_chi_square(df, var1, var2)
-    
-    return {
-        "crosstab": crosstab.to_dict(),
-        "row_percentages": crosstab_pct_row.to_dict(),
-        "column_percentages": crosstab_pct_col.to_dict(),
-        "total_percentages": crosstab_pct_all.to_dict(),
-        "chi_square": chi2_results,
-        "row_totals": crosstab.loc[:, "Total"].to_dict(),
-        "column_totals": crosstab.loc["Total", :].to_dict(),
-        "grand_total": int(crosstab.loc["Total", "Total"])
-    }
+    return ContingencyTables(df, [var1, var2]).cross_tabulation(var1, var2)
 
 def calculate_diversity_metrics(value_counts: pd.Series) -> Dict[str, float]:
     """
@@ -252,24 +191,16 @@ def analyze_categorical_associations(df: pd.DataFrame,
     if categorical_columns is None:
         categorical_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
     
+    if method == 'cramers_v':
+        # Every pair's table comes from one sparse pass over the integer-coded columns
+        return ContingencyTables(df, categorical_columns).association_matrix()
+    
     n_vars = len(categorical_columns)
     association_matrix = pd.DataFrame(
         np.zeros((n_vars, n_vars)),
         index=categorical_columns,
         columns=categorical_columns
     )
+    np.fill_diagonal(association_matrix.values, 1.0)  # Placeholder for other methods
     
-    for i, var1 in enumerate(categorical_columns):
-        for j, var2 in enumerate(categorical_columns):
-            if i == j:
-                association_matrix.iloc[i, j] = 1.0
-            elif i < j:
-                if method == 'cramers_v':
-                    assoc = calculate_cramers_v(df, var1, var2)
-                else:
-                    assoc = 0.0  # Placeholder for other methods
-                
-                association_matrix.iloc[i, j] = assoc
-                association_matrix.iloc[j, i] = assoc
-    
-    return association_matrix
\ No newline at end of file
+    return association_matrix
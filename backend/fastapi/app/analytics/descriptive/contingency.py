@@ -0,0 +1,261 @@
+"""
+Contingency tables of categorical columns from integer codes.
+
+Cross-tabulation and Cramér's V used to call pd.crosstab for every pair of
+columns (five times per pair in analyze_cross_tabulation), grouping the raw
+values again each time. Here each column is factorized once into integer
+codes, and
+
+    one pair     its table is a bincount of the combined codes
+                 code1 * n_categories2 + code2
+
+    all pairs    the columns' one-hot indicators X (rows x all categories)
+                 give every pairwise table at once as the blocks of the
+                 sparse product X'X
+
+Pearson's chi-square only needs the non-zero cells of a table:
+
+    chi2 = n * (sum over cells of O^2 / (row total * column total) - 1)
+
+so the statistics of every pair, and the Cramér's V association matrix, come
+from one sparse product whatever the columns' cardinalities. Pairs of
+two-category columns get Yates' continuity correction from their 2x2 table,
+as scipy.stats.chi2_contingency applies it, so results match the per-pair
+computations.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import sparse
+from scipy.stats import chi2, chi2_contingency
+from typing import Any, Dict, List, Optional, Tuple
+
+# Largest table (rows x columns) all-pairs cross-tabulation lists cell by cell
+MAX_LISTED_TABLE_CELLS = 10_000
+
+
+def _factorize(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Codes (-1 for missing) and sorted categories, as pd.crosstab orders them"""
+    try:
+        codes, categories = pd.factorize(series, sort=True)
+    except TypeError:
+        # Values that cannot be compared with each other keep their order of appearance
+        codes, categories = pd.factorize(series, sort=False)
+    return codes.astype(np.int64), pd.Index(categories)
+
+
+class ContingencyTables:
+    """Integer-coded categorical columns and their pairwise contingency tables."""
+
+    def __init__(self, df: pd.DataFrame, columns: List[str]):
+        """
+        Factorize the columns.
+
+        Args:
+            df: Pandas DataFrame containing the data
+            columns: Categorical columns to cross-tabulate
+        """
+        self.columns = list(columns)
+        self.n_rows = len(df)
+        self.codes: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, pd.Index] = {}
+        for column in self.columns:
+            self.codes[column], self.categories[column] = _factorize(df[column])
+        self._statistics: Optional[Dict[str, np.ndarray]] = None
+
+    def table(self, var1: str, var2: str) -> pd.DataFrame:
+        """Counts of each combination of values, as pd.crosstab(df[var1], df[var2])"""
+        codes1, codes2 = self.codes[var1], self.codes[var2]
+        n1, n2 = len(self.categories[var1]), len(self.categories[var2])
+        present = (codes1 >= 0) & (codes2 >= 0)
+        counts = np.bincount(codes1[present] * n2 + codes2[present], minlength=n1 * n2).reshape(n1, n2)
+
+        # Values only seen where the other column is missing have no row or column
+        rows, columns = counts.sum(axis=1) > 0, counts.sum(axis=0) > 0
+        return pd.DataFrame(
+            counts[rows][:, columns],
+            index=self.categories[var1][rows].rename(var1),
+            columns=self.categories[var2][columns].rename(var2),
+        )
+
+    def statistics(self) -> Dict[str, np.ndarray]:
+        """
+        Chi-square statistics of every pair of columns in one sparse pass.
+
+        Returns:
+            Column-by-column arrays: 'n' (rows where both are present), 'rows'
+            and 'columns' (categories present in the pair's table),
+            'chi2_statistic', 'degrees_of_freedom', 'p_value' and 'cramers_v'
+            (1 on the diagonal)
+        """
+        if self._statistics is not None:
+            return self._statistics
+
+        k = len(self.columns)
+        offsets = np.cumsum([0] + [len(self.categories[column]) for column in self.columns])
+        owner = np.repeat(np.arange(k), np.diff(offsets))
+        present = np.column_stack([self.codes[column] >= 0 for column in self.columns]).reshape(self.n_rows, k)
+
+        rows = np.concatenate([np.flatnonzero(present[:, i]) for i in range(k)])
+        categories = np.concatenate([self.codes[column][present[:, i]] + offsets[i]
+                                     for i, column in enumerate(self.columns)])
+        indicators = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, categories)), shape=(self.n_rows, offsets[-1])
+        )
+        presence = sparse.csr_matrix(present.astype(float))
+
+        # Block (i, j) of the Gram matrix is the table of columns i and j
+        gram = (indicators.T @ indicators).tocoo()
+        # totals[u, j]: rows with category u that have column j present (table margins)
+        totals = np.asarray((indicators.T @ presence).todense())
+        n = np.asarray((presence.T @ presence).todense())
+
+        owner_u, owner_v = owner[gram.row], owner[gram.col]
+        upper = owner_u < owner_v
+        u, v, observed = gram.row[upper], gram.col[upper], gram.data[upper]
+        i, j = owner_u[upper], owner_v[upper]
+        terms = observed * observed / (totals[u, j] * totals[v, i])
+        ratio = np.bincount(i * k + j, weights=terms, minlength=k * k).reshape(k, k)
+
+        levels = np.zeros((k, k))
+        np.add.at(levels, owner, totals > 0)
+        rows_present, columns_present = levels, levels.T
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            statistic = np.maximum(n * (ratio - 1), 0)
+            dof = (rows_present - 1) * (columns_present - 1)
+            dof[n == 0] = 0
+            statistic[dof == 0] = 0.0
+            min_dim = np.minimum(rows_present, columns_present) - 1
+            p_value = chi2.sf(statistic, dof)
+            p_value[dof == 0] = 1.0
+            cramers_v = np.where(min_dim > 0, np.sqrt(statistic / (n * min_dim)), 0.0)
+
+        # Yates' correction applies to 2x2 tables
+        for a, b in zip(*np.nonzero(np.triu(dof == 1, 1))):
+            table = self.table(self.columns[a], self.columns[b]).to_numpy()
+            statistic[a, b], p_value[a, b] = chi2_contingency(table)[:2]
+            cramers_v[a, b] = np.sqrt(statistic[a, b] / n[a, b])
+
+        def symmetric(matrix: np.ndarray, diagonal: float) -> np.ndarray:
+            matrix = np.triu(matrix, 1)
+            matrix = matrix + matrix.T
+            np.fill_diagonal(matrix, diagonal)
+            return matrix
+
+        self._statistics = {
+            'n': n.astype(np.int64),
+            'rows': rows_present.astype(np.int64),
+            'columns': columns_present.astype(np.int64),
+            'chi2_statistic': symmetric(statistic, 0.0),
+            'degrees_of_freedom': dof.astype(np.int64),
+            'p_value': symmetric(p_value, 1.0),
+            'cramers_v': symmetric(cramers_v, 1.0),
+        }
+        return self._statistics
+
+    def pair_statistics(self, var1: str, var2: str) -> Dict[str, Any]:
+        """Chi-square test summary of one pair, from the all-pairs pass"""
+        statistics = self.statistics()
+        a, b = self.columns.index(var1), self.columns.index(var2)
+        cramers_v = float(statistics['cramers_v'][a, b])
+        return {
+            "chi2_statistic": float(statistics['chi2_statistic'][a, b]),
+            "p_value": float(statistics['p_value'][a, b]),
+            "degrees_of_freedom": int(statistics['degrees_of_freedom'][a, b]),
+            "cramers_v": cramers_v,
+            "effect_size_interpretation": _interpret_cramers_v(cramers_v),
+            "is_significant": bool(statistics['p_value'][a, b] < 0.05),
+            "table_shape": [int(statistics['rows'][a, b]), int(statistics['columns'][a, b])],
+            "sample_size": int(statistics['n'][a, b])
+        }
+
+    def cross_tabulations(self, max_cells: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Cross-tabulation of every pair of columns, keyed "<var1>_vs_<var2>".
+
+        Pairs whose table has at most max_cells (MAX_LISTED_TABLE_CELLS by
+        default) cells get the full cross_tabulation; larger tables
+        (identifiers, free text) get the test statistics of the all-pairs pass only.
+        """
+        max_cells = MAX_LISTED_TABLE_CELLS if max_cells is None else max_cells
+        statistics = self.statistics()
+        results = {}
+        for a, var1 in enumerate(self.columns):
+            for b in range(a + 1, len(self.columns)):
+                var2 = self.columns[b]
+                key = f"{var1}_vs_{var2}"
+                cells = statistics['rows'][a, b] * statistics['columns'][a, b]
+                try:
+                    if cells <= max_cells:
+                        results[key] = self.cross_tabulation(var1, var2)
+                    else:
+                        results[key] = {
+                            "chi_square": self.pair_statistics(var1, var2),
+                            "note": f"Contingency table has {int(cells)} cells; only test statistics are reported"
+                        }
+                except Exception as e:
+                    results[key] = {'error': f'Cross-tabulation failed: {str(e)}'}
+        return results
+
+    def association_matrix(self) -> pd.DataFrame:
+        """Cramér's V of every pair of columns"""
+        return pd.DataFrame(self.statistics()['cramers_v'], index=self.columns, columns=self.columns)
+
+    def cross_tabulation(self, var1: str, var2: str) -> Dict[str, Any]:
+        """Cross-tabulation of one pair, as analyze_cross_tabulation reports it"""
+        table = self.table(var1, var2)
+        crosstab = table.copy()
+        crosstab["Total"] = crosstab.sum(axis=1)
+        crosstab.loc["Total"] = crosstab.sum(axis=0)
+
+        return {
+            "crosstab": crosstab.to_dict(),
+            "row_percentages": (table.div(table.sum(axis=1), axis=0) * 100).to_dict(),
+            "column_percentages": (table / table.sum(axis=0) * 100).to_dict(),
+            "total_percentages": (table / table.to_numpy().sum() * 100).to_dict(),
+            "chi_square": chi_square_of_table(table),
+            "row_totals": crosstab.loc[:, "Total"].to_dict(),
+            "column_totals": crosstab.loc["Total", :].to_dict(),
+            "grand_total": int(crosstab.loc["Total", "Total"])
+        }
+
+
+def chi_square_of_table(crosstab: pd.DataFrame) -> Dict[str, Any]:
+    """Chi-square test of independence on a contingency table (see calculate_chi_square)"""
+    chi2_stat, p_value, dof, expected = chi2_contingency(crosstab)
+
+    # Calculate effect size (Cramér's V)
+    n = crosstab.sum().sum()
+    min_dim = min(crosstab.shape[0] - 1, crosstab.shape[1] - 1)
+    cramers_v = np.sqrt(chi2_stat / (n * min_dim)) if min_dim > 0 else 0
+
+    # Contribution to chi-square
+    chi2_contributions = ((crosstab - expected) ** 2 / expected)
+
+    return {
+        "chi2_statistic": float(chi2_stat),
+        "p_value": float(p_value),
+        "degrees_of_freedom": int(dof),
+        "cramers_v": float(cramers_v),
+        "effect_size_interpretation": _interpret_cramers_v(cramers_v),
+        "is_significant": p_value < 0.05,
+        "contingency_table": crosstab.to_dict(),
+        "expected_frequencies": pd.DataFrame(expected,
+                                            index=crosstab.index,
+                                            columns=crosstab.columns).to_dict(),
+        "chi2_contributions": chi2_contributions.to_dict(),
+        "sample_size": int(n)
+    }
+
+
+def _interpret_cramers_v(v: float) -> str:
+    """Interpret Cramér's V effect size."""
+    if v < 0.1:
+        return "Negligible association"
+    elif v < 0.3:
+        return "Weak association"
+    elif v < 0.5:
+        return "Moderate association"
+    else:
+        return "Strong association"
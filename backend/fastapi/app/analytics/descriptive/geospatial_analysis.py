@@ -1,14 +1,32 @@
 """
 Geospatial analysis for location-based research data.
+
+Pairwise distances are computed with a vectorized haversine kernel in row
+blocks that fit DISTANCE_BLOCK_BYTES, and Moran's I uses a sparse spatial
+weights matrix built from a BallTree, so neither materializes an n x n matrix
+or loops over pairs in Python.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterator, List, Tuple, Optional
 from math import radians, cos, sin, asin, sqrt
+from scipy import sparse
 from sklearn.cluster import DBSCAN, KMeans
+from sklearn.neighbors import BallTree
 from collections import Counter
 
+EARTH_RADIUS_KM = 6371
+# Memory for one block of pairwise distances (and its temporaries)
+DISTANCE_BLOCK_BYTES = 64 * 1024 * 1024
+# Above this many points, mean and max pairwise distances come from a sample of points
+MAX_EXACT_DISTANCE_POINTS = 10000
+DISTANCE_SAMPLE_POINTS = 5000
+# Distance-band neighbor pairs allowed before Moran's I switches to k-nearest-neighbor weights
+MAX_NEIGHBOR_PAIRS = 5_000_000
+NEIGHBOR_PROBE_POINTS = 1000
+DEFAULT_NEIGHBORS = 8
+
 def analyze_spatial_distribution(df: pd.DataFrame,
                                lat_column: str,
                                lon_column: str,
@@ -54,12 +72,7 @@ def analyze_spatial_distribution(df: pd.DataFrame,
     }
     
     # Calculate distances
-    distances = _calculate_distance_matrix(lats, lons)
-    spatial_stats["distance_stats"] = {
-        "mean_distance_km": float(distances[distances > 0].mean()),
-        "max_distance_km": float(distances.max()),
-        "min_distance_km": float(distances[distances > 0].min())
-    }
+    spatial_stats["distance_stats"] = _distance_statistics(lats, lons)
     
     # Spatial clustering
     if len(location_df) >= 5:
@@ -95,19 +108,94 @@ def _haversine_distance(lat1: float, lon1: float,
     
     return c * r
 
-def _calculate_distance_matrix(lats: np.ndarray, 
-                             lons: np.ndarray) -> np.ndarray:
-    """Calculate pairwise distances between all points."""
+def _haversine_distances(lats1: np.ndarray, lons1: np.ndarray,
+                         lats2: np.ndarray, lons2: np.ndarray) -> np.ndarray:
+    """
+    Great circle distances between every point of one set and every point of another.
+    
+    Args:
+        lats1, lons1: Coordinates (degrees) of the first set, shape (m,)
+        lats2, lons2: Coordinates (degrees) of the second set, shape (n,)
+        
+    Returns:
+        Distances in kilometers, shape (m, n)
+    """
+    lat1 = np.radians(np.asarray(lats1, dtype=float))[:, np.newaxis]
+    lon1 = np.radians(np.asarray(lons1, dtype=float))[:, np.newaxis]
+    lat2 = np.radians(np.asarray(lats2, dtype=float))[np.newaxis, :]
+    lon2 = np.radians(np.asarray(lons2, dtype=float))[np.newaxis, :]
+    
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def _distance_blocks(lats: np.ndarray, lons: np.ndarray,
+                     upper: bool = False) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Pairwise distances in row blocks of at most DISTANCE_BLOCK_BYTES.
+    
+    Args:
+        lats, lons: Point coordinates (degrees)
+        upper: Only the distances to later points (columns start..n of rows
+            start..stop, with the pairs on or below the diagonal set to NaN)
+        
+    Yields:
+        (start, block) with block[i - start, j] the distance between points i and j
+        (j offset by start when `upper`)
+    """
     n = len(lats)
-    distances = np.zeros((n, n))
+    # The kernel keeps about six float64 temporaries of the block's size alive
+    rows = max(1, int(DISTANCE_BLOCK_BYTES // (6 * 8 * max(n, 1))))
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        first = start if upper else 0
+        block = _haversine_distances(lats[start:stop], lons[start:stop], lats[first:], lons[first:])
+        if upper:
+            square = block[:, :stop - start]
+            square[np.tril_indices(stop - start)] = np.nan
+        yield start, block
+
+def _distance_statistics(lats: np.ndarray, lons: np.ndarray) -> Dict[str, Any]:
+    """
+    Mean and maximum distance between distinct locations and distance to the nearest one.
     
-    for i in range(n):
-        for j in range(i+1, n):
-            dist = _haversine_distance(lats[i], lons[i], lats[j], lons[j])
-            distances[i, j] = dist
-            distances[j, i] = dist
+    Pairs are scanned block by block without keeping the distance matrix. Above
+    MAX_EXACT_DISTANCE_POINTS points, mean and maximum come from a fixed random
+    sample of points (plus the extreme ones); the minimum is always exact.
+    """
+    n = len(lats)
+    sampled = n > MAX_EXACT_DISTANCE_POINTS
+    if sampled:
+        rng = np.random.default_rng(0)
+        extremes = [lats.argmin(), lats.argmax(), lons.argmin(), lons.argmax()]
+        points = np.unique(np.concatenate([rng.choice(n, DISTANCE_SAMPLE_POINTS, replace=False), extremes]))
+        sample_lats, sample_lons = lats[points], lons[points]
+    else:
+        sample_lats, sample_lons = lats, lons
+    
+    total, count, largest = 0.0, 0, 0.0
+    for _, block in _distance_blocks(sample_lats, sample_lons, upper=True):
+        positive = block[block > 0]
+        total += float(positive.sum())
+        count += len(positive)
+        if len(positive):
+            largest = max(largest, float(positive.max()))
+    
+    # Nearest distinct location of each location
+    coords = np.radians(np.unique(np.column_stack((lats, lons)), axis=0))
+    if len(coords) > 1:
+        nearest, _ = BallTree(coords, metric='haversine').query(coords, k=2)
+        smallest = float(nearest[:, 1].min() * EARTH_RADIUS_KM)
+    else:
+        smallest = np.nan
     
-    return distances
+    stats = {
+        "mean_distance_km": total / count if count else np.nan,
+        "max_distance_km": largest,
+        "min_distance_km": smallest
+    }
+    if sampled:
+        stats["sampled_points"] = len(sample_lats)
+    return stats
 
 def _perform_spatial_clustering(lats: np.ndarray, 
                               lons: np.ndarray) -> Dict[str, Any]:
@@ -185,20 +273,30 @@ def calculate_spatial_autocorrelation(df: pd.DataFrame,
                                     lat_column: str,
                                     lon_column: str,
                                     value_column: str,
-                                    max_distance_km: float = 10) -> Dict[str, Any]:
+                                    max_distance_km: float = 10,
+                                    neighbors: Optional[int] = None) -> Dict[str, Any]:
     """
     Calculate Moran's I for spatial autocorrelation.
     
+    Points are weighted by inverse distance, row-standardized. By default every
+    other point within max_distance_km is a neighbor; if that band holds more
+    than MAX_NEIGHBOR_PAIRS pairs, or `neighbors` is given, the k nearest
+    points within the band are.
+    
     Args:
         df: DataFrame with spatial data
         lat_column: Latitude column
         lon_column: Longitude column  
         value_column: Value column to test
         max_distance_km: Maximum distance for neighbors
+        neighbors: Use the k nearest points (within max_distance_km) as neighbors
         
     Returns:
         Dictionary with spatial autocorrelation results
     """
+    if neighbors is not None and neighbors < 1:
+        return {"error": "neighbors must be at least 1"}
+    
     # Prepare data
     clean_df = df[[lat_column, lon_column, value_column]].dropna()
     
@@ -207,36 +305,27 @@ def calculate_spatial_autocorrelation(df: pd.DataFrame,
     
     lats = clean_df[lat_column].values
     lons = clean_df[lon_column].values
-    values = clean_df[value_column].values
+    values = clean_df[value_column].values.astype(float)
     
     # Create spatial weights matrix
     n = len(values)
-    weights = np.zeros((n, n))
-    
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                dist = _haversine_distance(lats[i], lons[i], lats[j], lons[j])
-                if dist <= max_distance_km and dist > 0:
-                    weights[i, j] = 1 / dist  # Inverse distance weighting
+    weights, scheme = _spatial_weights(lats, lons, max_distance_km, neighbors)
     
     # Row-standardize weights
-    row_sums = weights.sum(axis=1)
+    row_sums = np.asarray(weights.sum(axis=1)).ravel()
     row_sums[row_sums == 0] = 1  # Avoid division by zero
-    weights = weights / row_sums[:, np.newaxis]
-    weights[np.isnan(weights)] = 0
+    weights = sparse.diags(1 / row_sums) @ weights
+    total_weight = weights.sum()
     
-    # Calculate Moran's I
-    mean_value = values.mean()
-    numerator = 0
-    denominator = 0
+    if total_weight == 0:
+        return {"error": f"No pairs of points within {max_distance_km} km"}
     
-    for i in range(n):
-        for j in range(n):
-            numerator += weights[i, j] * (values[i] - mean_value) * (values[j] - mean_value)
-        denominator += (values[i] - mean_value) ** 2
+    # Calculate Moran's I
+    deviations = values - values.mean()
+    numerator = float(deviations @ (weights @ deviations))
+    denominator = float(deviations @ deviations)
     
-    morans_i = (n / weights.sum()) * (numerator / denominator) if denominator > 0 else 0
+    morans_i = (n / total_weight) * (numerator / denominator) if denominator > 0 else 0
     
     # Expected value and variance under null hypothesis
     expected_i = -1 / (n - 1)
@@ -246,9 +335,52 @@ def calculate_spatial_autocorrelation(df: pd.DataFrame,
         "expected_i": float(expected_i),
         "interpretation": _interpret_morans_i(morans_i),
         "max_distance_km": max_distance_km,
-        "n_observations": n
+        "n_observations": n,
+        "weights": scheme
     }
 
+def _spatial_weights(lats: np.ndarray, lons: np.ndarray, max_distance_km: float,
+                     neighbors: Optional[int] = None) -> Tuple[sparse.csr_matrix, Dict[str, Any]]:
+    """
+    Sparse inverse-distance weights between distinct neighboring points.
+    
+    Returns:
+        (weights, description of the neighbor scheme)
+    """
+    n = len(lats)
+    coords = np.radians(np.column_stack((lats, lons)))
+    tree = BallTree(coords, metric='haversine')
+    radius = max_distance_km / EARTH_RADIUS_KM
+    
+    if neighbors is None:
+        # Size of the distance band, estimated from a fixed sample of points
+        probe = coords if n <= NEIGHBOR_PROBE_POINTS else \
+            coords[np.random.default_rng(0).choice(n, NEIGHBOR_PROBE_POINTS, replace=False)]
+        band_pairs = tree.query_radius(probe, radius, count_only=True).sum() * n / len(probe) - n
+        if band_pairs <= MAX_NEIGHBOR_PAIRS:
+            indices, distances = tree.query_radius(coords, radius, return_distance=True)
+            rows = np.repeat(np.arange(n), [len(ind) for ind in indices])
+            columns = np.concatenate(indices)
+            distances = np.concatenate(distances) * EARTH_RADIUS_KM
+            scheme = {"type": "distance_band"}
+        else:
+            neighbors = DEFAULT_NEIGHBORS
+    
+    if neighbors is not None:
+        # One extra to skip the point itself
+        k = min(neighbors + 1, n)
+        distances, indices = tree.query(coords, k=k)
+        rows = np.repeat(np.arange(n), k)
+        columns = indices.ravel()
+        distances = distances.ravel() * EARTH_RADIUS_KM
+        scheme = {"type": "k_nearest", "neighbors": k - 1}
+    
+    # The point itself and points at the same location are not neighbors
+    keep = (distances > 0) & (distances <= max_distance_km) & (rows != columns)
+    weights = sparse.csr_matrix((1 / distances[keep], (rows[keep], columns[keep])), shape=(n, n))
+    scheme["neighbor_pairs"] = int(weights.nnz)
+    return weights, scheme
+
 def _interpret_morans_i(morans_i: float) -> str:
     """Interpret Moran's I value."""
     if morans_i > 0.3:
@@ -0,0 +1,156 @@
+"""
+Missingness of a frame as packed bitsets.
+
+Missing data analysis used to build df.isna() as a boolean frame, then an
+integer copy of it, several times per request, grouping rows by pattern
+tuples and correlating the integer columns. Here missingness is packed once,
+a column at a time, in two layouts:
+
+    row words      one bit per column for each row (ceil(columns / 64)
+                   uint64 words a row); equal patterns have equal words, so
+                   patterns are counted by hashing the words
+    column words   one bit per row for each column; rows missing both
+                   columns a and b are popcount(a & b), which with the
+                   column counts gives every missingness correlation
+
+The column of bit c in a row's words is c // 64 and it sits at position
+63 - c % 64, so words compare like 0/1 pattern tuples. Patterns are listed
+by count; equally frequent patterns are ordered by those tuples (patterns
+missing later columns first), which need not be the tie order
+DataFrame.value_counts() gives.
+Per-group counts come from the column words and the group column's codes.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import List, Optional, Tuple
+
+# Bits set in each byte, for numpy versions without bitwise_count
+_BYTE_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits of each uint64 word"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1)
+
+
+class MissingMask:
+    """Packed missingness indicators of a frame's columns."""
+
+    def __init__(self, columns: List[str], n_rows: int, row_words: np.ndarray, column_words: np.ndarray):
+        self.columns = columns
+        self.n_rows = n_rows
+        self.row_words = row_words
+        self.column_words = column_words
+
+    @classmethod
+    def of(cls, df: pd.DataFrame, columns: Optional[List[str]] = None) -> "MissingMask":
+        """
+        Pack the missingness of a frame.
+
+        Args:
+            df: Pandas DataFrame
+            columns: Columns to pack (all by default)
+        """
+        columns = list(df.columns if columns is None else columns)
+        n_rows = len(df)
+        row_words = np.zeros((n_rows, max(1, (len(columns) + 63) // 64)), dtype=np.uint64)
+        column_words = np.zeros((len(columns), (n_rows + 63) // 64), dtype=np.uint64)
+        column_bytes = column_words.view(np.uint8).reshape(len(columns), -1)
+
+        for c, column in enumerate(columns):
+            missing = df[column].isna().to_numpy()
+            row_words[:, c // 64] |= missing.astype(np.uint64) << np.uint64(63 - c % 64)
+            packed = np.packbits(missing, bitorder='little')
+            column_bytes[c, :len(packed)] = packed
+        return cls(columns, n_rows, row_words, column_words)
+
+    def column_counts(self) -> np.ndarray:
+        """Missing values per column"""
+        return _popcount(self.column_words).sum(axis=1).astype(np.int64)
+
+    def row_counts(self) -> np.ndarray:
+        """Missing values per row"""
+        return _popcount(self.row_words).sum(axis=1).astype(np.int64)
+
+    def column_missing(self, column: str) -> np.ndarray:
+        """Missingness indicators of one column"""
+        packed = self.column_words[self.columns.index(column)].view(np.uint8)
+        return np.unpackbits(packed, count=self.n_rows, bitorder='little').astype(bool)
+
+    def pattern_columns(self, words: np.ndarray) -> List[str]:
+        """Columns missing in a pattern"""
+        return [column for c, column in enumerate(self.columns)
+                if (int(words[c // 64]) >> (63 - c % 64)) & 1]
+
+    def patterns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distinct missingness patterns, most frequent first; ties in ascending
+        order of their 0/1 column tuples.
+
+        Returns:
+            Pattern words (patterns x words) and the number of rows with each
+        """
+        words = self.row_words
+        if words.shape[1] == 1:
+            patterns, counts = np.unique(words[:, 0], return_counts=True)
+            patterns = patterns[:, np.newaxis]
+        else:
+            keys = np.zeros(self.n_rows, dtype=np.uint64)
+            for w in range(words.shape[1]):
+                keys = (keys ^ words[:, w]) * _HASH_MULTIPLIER
+                keys ^= keys >> np.uint64(29)
+            _, first, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+            if np.array_equal(words[first[inverse.ravel()]], words):
+                patterns = words[first]
+            else:
+                # Hash collision
+                patterns, counts = np.unique(words, axis=0, return_counts=True)
+
+        # Equally frequent patterns in ascending order of their words
+        order = np.lexsort(tuple(patterns[:, w] for w in reversed(range(patterns.shape[1]))) + (-counts,))
+        return patterns[order], counts[order]
+
+    def correlations(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Pearson correlations of the missingness indicators, as df.isna().astype(int).corr()"""
+        columns = self.columns if columns is None else columns
+        positions = [self.columns.index(column) for column in columns]
+        words = self.column_words[positions]
+        n = self.n_rows
+        missing = _popcount(words).sum(axis=1).astype(float)
+
+        both = np.empty((len(positions), len(positions)))
+        for a in range(len(positions)):
+            both[a, a:] = _popcount(words[a] & words[a:]).sum(axis=1)
+            both[a:, a] = both[a, a:]
+
+        spread = np.sqrt(missing * (n - missing))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matrix = (n * both - np.outer(missing, missing)) / np.outer(spread, spread)
+        matrix = np.clip(matrix, -1.0, 1.0)
+        constant = spread == 0
+        np.fill_diagonal(matrix, np.where(constant, np.nan, 1.0))
+        return pd.DataFrame(matrix, index=columns, columns=columns)
+
+    def group_counts(self, groups: pd.Series) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+        """
+        Rows and missing values per group, as df.groupby(groups) forms them.
+
+        Returns:
+            Group labels, rows per group and missing counts (groups x columns)
+        """
+        try:
+            codes, labels = pd.factorize(groups, sort=True)
+        except TypeError:
+            codes, labels = pd.factorize(groups, sort=False)
+        grouped = codes >= 0
+        codes = codes[grouped]
+        rows = np.bincount(codes, minlength=len(labels))
+        counts = np.column_stack([
+            np.bincount(codes, weights=self.column_missing(column)[grouped], minlength=len(labels))
+            for column in self.columns
+        ]).reshape(len(labels), len(self.columns)).astype(np.int64)
+        return pd.Index(labels), rows, counts
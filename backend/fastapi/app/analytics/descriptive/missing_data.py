@@ -4,27 +4,31 @@ Missing data analysis and patterns.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import seaborn as sns
 import matplotlib.pyplot as plt
 
-def analyze_missing_data(df: pd.DataFrame) -> Dict[str, Any]:
+from .missing_bitmap import MissingMask
+
+def analyze_missing_data(df: pd.DataFrame, mask: Optional[MissingMask] = None) -> Dict[str, Any]:
     """
     Comprehensive missing data analysis.
     
     Args:
         df: Pandas DataFrame to analyze
+        mask: Packed missingness of df, if the caller already has it
         
     Returns:
         Dictionary containing missing data analysis
     """
+    mask = mask if mask is not None else MissingMask.of(df)
     total_cells = df.shape[0] * df.shape[1]
-    total_missing = df.isna().sum().sum()
+    column_counts = mask.column_counts()
+    total_missing = column_counts.sum()
     
     # Column-wise analysis
     missing_by_column = {}
-    for col in df.columns:
-        n_missing = df[col].isna().sum()
+    for col, n_missing in zip(df.columns, column_counts):
         missing_by_column[col] = {
             "count": int(n_missing),
             "percentage": float(n_missing / len(df) * 100),
@@ -32,14 +36,14 @@ def analyze_missing_data(df: pd.DataFrame) -> Dict[str, Any]:
         }
     
     # Row-wise analysis
-    missing_by_row = df.isna().sum(axis=1)
+    missing_by_row = pd.Series(mask.row_counts(), index=df.index)
     rows_with_missing = (missing_by_row > 0).sum()
     
     # Missing patterns
-    patterns = get_missing_patterns(df)
+    patterns = get_missing_patterns(df, mask=mask)
     
     # Missing data types
-    missing_types = _classify_missing_types(df)
+    missing_types = _classify_missing_types(df, mask=mask)
     
     return {
         "summary": {
@@ -67,30 +71,30 @@ def analyze_missing_data(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
 def get_missing_patterns(df: pd.DataFrame, 
-                        max_patterns: int = 20) -> Dict[str, Any]:
+                        max_patterns: int = 20,
+                        mask: Optional[MissingMask] = None) -> Dict[str, Any]:
     """
     Identify patterns in missing data.
     
     Args:
         df: Pandas DataFrame
         max_patterns: Maximum number of patterns to return
+        mask: Packed missingness of df, if the caller already has it
         
     Returns:
-        Dictionary containing missing data patterns
+        Dictionary containing missing data patterns, most frequent first
+        (equally frequent ones ordered by their columns' missingness bits,
+        see MissingMask.patterns)
     """
-    # Create binary matrix of missing values
-    missing_matrix = df.isna().astype(int)
+    mask = mask if mask is not None else MissingMask.of(df)
     
-    # Find unique patterns
-    patterns = missing_matrix.value_counts()
+    # Rows with the same pattern have the same packed words
+    patterns, counts = mask.patterns()
     
     # Convert to more readable format
     pattern_dict = {}
-    for i, (pattern, count) in enumerate(patterns.head(max_patterns).items()):
-        if isinstance(pattern, tuple):
-            missing_cols = [col for col, is_missing in zip(df.columns, pattern) if is_missing]
-        else:
-            missing_cols = [df.columns[0]] if pattern else []
+    for i, (pattern, count) in enumerate(zip(patterns[:max_patterns], counts[:max_patterns])):
+        missing_cols = mask.pattern_columns(pattern)
         
         pattern_dict[f"pattern_{i+1}"] = {
             "missing_columns": missing_cols,
@@ -104,39 +108,41 @@ def get_missing_patterns(df: pd.DataFrame,
         "most_common_pattern": pattern_dict.get("pattern_1", {})
     }
 
-def calculate_missing_correlations(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_missing_correlations(df: pd.DataFrame, mask: Optional[MissingMask] = None) -> pd.DataFrame:
     """
     Calculate correlations between missingness indicators.
     
     Args:
         df: Pandas DataFrame
+        mask: Packed missingness of df, if the caller already has it
         
     Returns:
         Correlation matrix of missing indicators
     """
-    # Create binary matrix of missing values
-    missing_matrix = df.isna().astype(int)
+    mask = mask if mask is not None else MissingMask.of(df)
     
     # Only include columns with some missing values
-    cols_with_missing = missing_matrix.columns[missing_matrix.sum() > 0]
+    cols_with_missing = [col for col, count in zip(mask.columns, mask.column_counts()) if count > 0]
     
     if len(cols_with_missing) < 2:
         return pd.DataFrame()
     
-    return missing_matrix[cols_with_missing].corr()
+    # Rows missing both columns are popcounts of the AND of their bitsets
+    return mask.correlations(cols_with_missing)
 
-def _classify_missing_types(df: pd.DataFrame) -> Dict[str, Any]:
+def _classify_missing_types(df: pd.DataFrame, mask: Optional[MissingMask] = None) -> Dict[str, Any]:
     """
     Classify potential types of missingness (MCAR, MAR, MNAR).
     
     Args:
         df: Pandas DataFrame
+        mask: Packed missingness of df, if the caller already has it
         
     Returns:
         Dictionary with missingness type indicators
     """
     # This is a simplified heuristic approach
-    missing_corr = calculate_missing_correlations(df)
+    missing_corr = calculate_missing_correlations(df, mask=mask)
     
     if missing_corr.empty:
         return {"note": "No missing data correlations to analyze"}
@@ -173,30 +179,34 @@ def create_missing_data_heatmap(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
 def analyze_missing_by_group(df: pd.DataFrame, 
-                           group_column: str) -> Dict[str, Any]:
+                           group_column: str,
+                           mask: Optional[MissingMask] = None) -> Dict[str, Any]:
     """
     Analyze missing data patterns by group.
     
     Args:
         df: Pandas DataFrame
         group_column: Column to group by
+        mask: Packed missingness of df, if the caller already has it
         
     Returns:
         Dictionary containing grouped missing data analysis
     """
-    grouped_missing = {}
+    mask = mask if mask is not None else MissingMask.of(df)
+    groups, group_rows, missing_counts = mask.group_counts(df[group_column])
+    columns = [(c, col) for c, col in enumerate(mask.columns) if col != group_column]
     
-    for group_name, group_df in df.groupby(group_column):
-        missing_counts = group_df.isna().sum()
+    grouped_missing = {}
+    for g, group_name in enumerate(groups):
         grouped_missing[str(group_name)] = {
-            "total_rows": len(group_df),
+            "total_rows": int(group_rows[g]),
             "missing_by_column": {
                 col: {
-                    "count": int(missing_counts[col]),
-                    "percentage": float(missing_counts[col] / len(group_df) * 100)
+                    "count": int(missing_counts[g, c]),
+                    "percentage": float(missing_counts[g, c] / group_rows[g] * 100)
                 }
-                for col in df.columns if col != group_column
+                for c, col in columns
             }
         }
     
-    return grouped_missing
\ No newline at end of file
+    return grouped_missing
@@ -4,20 +4,23 @@ Outlier detection methods for research data.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from scipy import stats
 from sklearn.ensemble import IsolationForest
 from sklearn.covariance import EllipticEnvelope
 import warnings
 
 def detect_outliers_iqr(series: pd.Series, 
-                       multiplier: float = 1.5) -> Dict[str, Any]:
+                       multiplier: float = 1.5,
+                       quartiles: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
     """
     Detect outliers using the Interquartile Range (IQR) method.
     
     Args:
         series: Pandas Series containing numeric data
         multiplier: IQR multiplier for outlier bounds (typically 1.5 or 3)
+        quartiles: Precomputed (q1, q3), e.g. from a quantile sketch, used
+            instead of sorting the series
         
     Returns:
         Dictionary containing outlier information
@@ -27,8 +30,11 @@ def detect_outliers_iqr(series: pd.Series,
     if len(clean_series) < 4:
         return {"error": "Insufficient data for IQR outlier detection"}
     
-    q1 = clean_series.quantile(0.25)
-    q3 = clean_series.quantile(0.75)
+    if quartiles is not None:
+        q1, q3 = quartiles
+    else:
+        q1 = clean_series.quantile(0.25)
+        q3 = clean_series.quantile(0.75)
     iqr = q3 - q1
     
     lower_bound = q1 - multiplier * iqr
@@ -40,6 +46,7 @@ def detect_outliers_iqr(series: pd.Series,
     return {
         "method": "IQR",
         "multiplier": multiplier,
+        "quartile_method": "sketch" if quartiles is not None else "exact",
         "q1": float(q1),
         "q3": float(q3),
         "iqr": float(iqr),
@@ -205,7 +212,8 @@ def detect_outliers_mad(series: pd.Series,
 
 def get_outlier_summary(df: pd.DataFrame, 
                        columns: List[str] = None,
-                       methods: List[str] = None) -> Dict[str, Dict[str, Any]]:
+                       methods: List[str] = None,
+                       quartiles: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Dict[str, Any]]:
     """
     Comprehensive outlier detection using multiple methods.
     
@@ -213,6 +221,7 @@ def get_outlier_summary(df: pd.DataFrame,
         df: Pandas DataFrame containing the data
         columns: Columns to analyze (None for all numeric)
         methods: List of methods to use
+        quartiles: Precomputed (q1, q3) per column for the IQR method
         
     Returns:
         Dictionary containing outlier analysis for each column
@@ -232,7 +241,7 @@ def get_outlier_summary(df: pd.DataFrame,
         }
         
         if 'iqr' in methods:
-            col_results['iqr'] = detect_outliers_iqr(df[col])
+            col_results['iqr'] = detect_outliers_iqr(df[col], quartiles=(quartiles or {}).get(col))
         
         if 'zscore' in methods:
             col_results['zscore'] = detect_outliers_zscore(df[col])
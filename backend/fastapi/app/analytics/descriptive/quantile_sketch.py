@@ -0,0 +1,173 @@
+"""
+Mergeable approximate quantile sketches.
+
+Percentiles, IQR outlier bounds and median confidence intervals sort the full
+column on every call. A QuantileSketch (a KLL-style compactor hierarchy) keeps
+a few times 1/epsilon values per column however many it has seen, and
+answers any quantile with a rank error of about epsilon * n. Sketches of
+disjoint row sets (chunks, worker processes, newly arrived rows) merge into a
+sketch of their union with the same error bound.
+
+Which half of a sorted buffer a compaction keeps is a pseudo-random bit
+derived from the level and the compaction count, so a sketch is a
+deterministic function of the values and the order they were added in, and
+repeated requests get identical answers.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+# Default rank error, as a fraction of the number of values
+DEFAULT_EPSILON = 0.01
+# Capacity of the top compactor per 1/epsilon; measured rank errors stay below epsilon
+CAPACITY_FACTOR = 5.0
+# Capacity ratio between a compactor and the one above it
+CAPACITY_DECAY = 2.0 / 3.0
+MIN_CAPACITY = 8
+
+
+def _coin(level: int, count: int) -> int:
+    """Pseudo-random bit for the count-th compaction of a level (SplitMix64 mixing)"""
+    z = (level * 0x632BE59BD9B4E019 + (count + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return (z ^ (z >> 31)) & 1
+
+
+class QuantileSketch:
+    """KLL-style quantile sketch of numerical values."""
+
+    def __init__(self, epsilon: float = DEFAULT_EPSILON):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            epsilon: Target rank error as a fraction of the values seen (0-1)
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        self.epsilon = epsilon
+        self.k = max(MIN_CAPACITY, int(np.ceil(CAPACITY_FACTOR / epsilon)))
+        # levels[h] holds values that each stand for 2**h values
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.flips: List[int] = [0]
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+
+    @classmethod
+    def of(cls, values: Any, epsilon: float = DEFAULT_EPSILON) -> "QuantileSketch":
+        """Sketch of a Series or array (missing values are skipped)"""
+        return cls(epsilon).update(values)
+
+    def update(self, values: Any) -> "QuantileSketch":
+        """Add values to the sketch in place and return it"""
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=float, na_value=np.nan)
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.n += len(values)
+        self.min = float(np.fmin(self.min, values.min()))
+        self.max = float(np.fmax(self.max, values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merged(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Sketch of both value sets, at the coarser of the two error bounds"""
+        sketch = QuantileSketch(max(self.epsilon, other.epsilon))
+        depth = max(len(self.levels), len(other.levels))
+        sketch.levels = [
+            np.concatenate([source.levels[h] for source in (self, other) if h < len(source.levels)])
+            for h in range(depth)
+        ]
+        sketch.flips = [
+            sum(source.flips[h] for source in (self, other) if h < len(source.flips))
+            for h in range(depth)
+        ]
+        sketch.n = self.n + other.n
+        sketch.min = float(np.fmin(self.min, other.min))
+        sketch.max = float(np.fmax(self.max, other.max))
+        sketch._compress()
+        return sketch
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(MIN_CAPACITY, int(np.ceil(self.k * CAPACITY_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        """Halve every compactor over capacity, promoting half its values one level up"""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                    self.flips.append(0)
+                items = np.sort(items)
+                # An odd value out stays at this level
+                keep = items[len(items) - len(items) % 2:]
+                paired = items[:len(items) - len(items) % 2]
+                offset = _coin(level, self.flips[level])
+                self.flips[level] += 1
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], paired[offset::2]])
+            level += 1
+
+    def _weighted_values(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** h, dtype=np.int64)
+                                  for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Approximate quantiles (the value at rank q * (n - 1), as with 'lower' interpolation)"""
+        if self.n == 0:
+            return [np.nan for _ in qs]
+        values, cumulative = self._weighted_values()
+        results = []
+        for q in qs:
+            if q <= 0:
+                results.append(self.min)
+            elif q >= 1:
+                results.append(self.max)
+            else:
+                rank = q * (self.n - 1)
+                index = min(int(np.searchsorted(cumulative, rank, side='right')), len(values) - 1)
+                results.append(float(values[index]))
+        return results
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles([q])[0]
+
+    def rank(self, value: float) -> float:
+        """Approximate fraction of values less than or equal to `value`"""
+        if self.n == 0:
+            return np.nan
+        values, cumulative = self._weighted_values()
+        index = int(np.searchsorted(values, value, side='right'))
+        return float(cumulative[index - 1] / self.n) if index else 0.0
+
+    def size(self) -> int:
+        """Values kept by the sketch"""
+        return int(sum(len(items) for items in self.levels))
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'n': int(self.n),
+            'epsilon': self.epsilon,
+            'retained_values': self.size(),
+        }
+
+
+def sketch_quantiles(sketch: Optional[QuantileSketch], series: pd.Series, qs: Sequence[float],
+                     epsilon: float = DEFAULT_EPSILON) -> List[float]:
+    """Quantiles from a stored sketch, or from a sketch of `series` if there is none"""
+    if sketch is None:
+        sketch = QuantileSketch.of(series, epsilon)
+    return sketch.quantiles(qs)
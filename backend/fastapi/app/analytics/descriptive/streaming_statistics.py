@@ -0,0 +1,298 @@
+"""
+Mergeable statistics of numerical columns.
+
+calculate_basic_stats and calculate_percentiles used to need the whole column
+in memory and recompute everything on each call. Here a column is summarized
+as partial aggregates that can be built chunk by chunk, in different
+processes, and merged, or extended with new rows without rescanning the old:
+
+    moments      count, mean and the central moment sums M2, M3 and M4,
+                 combined with Chan's parallel update; min and max
+    value table  sorted distinct values and their counts, added together
+
+Mean, variance, skewness and kurtosis come from the moments. The order
+statistics (median, mode, quantiles, trimmed mean), the mean absolute
+deviation and unique counts come from the value table. Survey answers (ratings,
+counts, ages) repeat heavily, so the table is much smaller than the column.
+Merged statistics agree with the full-column pandas/scipy computations up to
+floating point rounding.
+
+Statistics built with a sketch error bound also carry a QuantileSketch, for
+approximate percentiles that do not depend on the size of the value table.
+"""
+
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from .quantile_sketch import QuantileSketch
+
+DEFAULT_PERCENTILES = [0.01, 0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]
+
+
+@dataclass
+class ColumnMoments:
+    """Count, mean and central moment sums of a column; moments of disjoint rows merge exactly."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    m3: float = 0.0
+    m4: float = 0.0
+    min: float = np.nan
+    max: float = np.nan
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> "ColumnMoments":
+        """Moments of non-missing values"""
+        if len(values) == 0:
+            return cls()
+        mean = float(values.mean())
+        deviations = values - mean
+        squares = deviations * deviations
+        return cls(
+            count=int(len(values)),
+            mean=mean,
+            m2=float(squares.sum()),
+            m3=float((squares * deviations).sum()),
+            m4=float((squares * squares).sum()),
+            min=float(values.min()),
+            max=float(values.max()),
+        )
+
+    def merged(self, other: "ColumnMoments") -> "ColumnMoments":
+        """Moments of both row sets (Chan et al. / Pebay pairwise update)"""
+        if other.count == 0:
+            return ColumnMoments(**self.__dict__)
+        if self.count == 0:
+            return ColumnMoments(**other.__dict__)
+
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3
+              + delta * delta_n * delta_n * na * nb * (na - nb)
+              + 3.0 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6.0 * delta_n * delta_n * (na * na * other.m2 + nb * nb * self.m2)
+              + 4.0 * delta_n * (na * other.m3 - nb * self.m3))
+        return ColumnMoments(
+            count=n,
+            mean=self.mean + delta_n * nb,
+            m2=m2, m3=m3, m4=m4,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+        )
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def skewness(self) -> float:
+        """Adjusted Fisher-Pearson skewness, as pandas Series.skew"""
+        n = self.count
+        if n < 3:
+            return np.nan
+        if self.m2 == 0:
+            return 0.0
+        m2, m3 = self.m2 / n, self.m3 / n
+        return float(m3 / m2 ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2))
+
+    @property
+    def kurtosis(self) -> float:
+        """Unbiased excess kurtosis, as pandas Series.kurtosis"""
+        n = self.count
+        if n < 4:
+            return np.nan
+        denominator = (n - 2) * (n - 3) * self.m2 * self.m2
+        if denominator == 0:
+            return 0.0
+        adjustment = 3.0 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        return float(n * (n + 1) * (n - 1) * self.m4 / denominator - adjustment)
+
+
+@dataclass
+class ColumnStatistics:
+    """Mergeable statistics of one numerical column."""
+    moments: ColumnMoments = field(default_factory=ColumnMoments)
+    values: np.ndarray = field(default_factory=lambda: np.empty(0))
+    counts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    missing: int = 0
+    sketch: Optional[QuantileSketch] = None
+
+    @classmethod
+    def of(cls, series: pd.Series, sketch_epsilon: Optional[float] = None) -> "ColumnStatistics":
+        """
+        Statistics of a numerical Series.
+
+        Args:
+            series: Column values
+            sketch_epsilon: Rank error of a quantile sketch to keep as well (None for no sketch)
+        """
+        array = series.to_numpy(dtype=float, na_value=np.nan)
+        present = array[~np.isnan(array)]
+        values, counts = np.unique(present, return_counts=True)
+        return cls(
+            moments=ColumnMoments.of(present),
+            values=values,
+            counts=counts.astype(np.int64),
+            missing=int(len(array) - len(present)),
+            sketch=QuantileSketch.of(present, sketch_epsilon) if sketch_epsilon is not None else None,
+        )
+
+    def merged(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        """Statistics of both row sets"""
+        values = np.union1d(self.values, other.values)
+        counts = np.zeros(len(values), dtype=np.int64)
+        counts[np.searchsorted(values, self.values)] += self.counts
+        counts[np.searchsorted(values, other.values)] += other.counts
+        return ColumnStatistics(
+            moments=self.moments.merged(other.moments),
+            values=values,
+            counts=counts,
+            missing=self.missing + other.missing,
+            sketch=(self.sketch.merged(other.sketch)
+                    if self.sketch is not None and other.sketch is not None else None),
+        )
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def quantile(self, q: float) -> float:
+        """Quantile with linear interpolation, as pandas Series.quantile"""
+        n = self.count
+        if n == 0:
+            return np.nan
+        position = (n - 1) * q
+        lower = int(np.floor(position))
+        upper = min(lower + 1, n - 1)
+        ends = np.cumsum(self.counts)
+        low_value = self.values[np.searchsorted(ends, lower, side='right')]
+        high_value = self.values[np.searchsorted(ends, upper, side='right')]
+        return float(low_value + (position - lower) * (high_value - low_value))
+
+    def trimmed_mean(self, proportion: float) -> float:
+        """Mean without `proportion` of the values at each end, as scipy.stats.trim_mean"""
+        n = self.count
+        cut = int(proportion * n)
+        if cut >= n - cut:
+            return np.nan
+        ends = np.cumsum(self.counts)
+        starts = ends - self.counts
+        kept = np.clip(ends, cut, n - cut) - np.clip(starts, cut, n - cut)
+        return float(np.dot(kept, self.values) / (n - 2 * cut))
+
+    def mode(self) -> Optional[float]:
+        """Smallest most frequent value"""
+        if self.count == 0:
+            return None
+        return float(self.values[np.argmax(self.counts)])
+
+    def mean_absolute_deviation(self) -> float:
+        if self.count == 0:
+            return np.nan
+        return float(np.dot(self.counts, np.abs(self.values - self.moments.mean)) / self.count)
+
+    def basic_stats(self) -> Dict[str, Optional[float]]:
+        """The statistics calculate_basic_stats reports for a column"""
+        moments = self.moments
+        n = self.count
+        rows = n + self.missing
+        mean = moments.mean if n else np.nan
+        std = float(np.sqrt(moments.variance))
+        q1, q3 = self.quantile(0.25), self.quantile(0.75)
+        unique_count = int(len(self.values))
+
+        return {
+            # Central tendency
+            "mean": float(mean),
+            "median": self.quantile(0.5),
+            "mode": self.mode(),
+            "trimmed_mean_5": self.trimmed_mean(0.05),
+
+            # Dispersion
+            "std": std,
+            "variance": float(moments.variance),
+            "mad": self.mean_absolute_deviation(),  # Mean absolute deviation
+            "iqr": float(q3 - q1),
+            "range": float(moments.max - moments.min),
+            "cv": float(std / mean) if mean != 0 else None,  # Coefficient of variation
+
+            # Position
+            "min": float(moments.min),
+            "max": float(moments.max),
+            "q1": q1,
+            "q3": q3,
+
+            # Shape
+            "skewness": moments.skewness,
+            "kurtosis": moments.kurtosis,
+
+            # Count statistics
+            "count": int(n),
+            "missing_count": int(self.missing),
+            "missing_percentage": float(self.missing / rows * 100) if rows else 0.0,
+            "unique_count": unique_count,
+            "unique_percentage": float(unique_count / n * 100) if n > 0 else 0
+        }
+
+    def percentiles(self, percentiles: List[float] = DEFAULT_PERCENTILES,
+                    approximate: bool = False) -> Dict[str, float]:
+        """
+        The percentiles calculate_percentiles reports for a column.
+
+        Args:
+            percentiles: Percentiles to report (0-1 scale)
+            approximate: Read them from the quantile sketch, if there is one,
+                instead of the value table
+        """
+        if approximate and self.sketch is not None:
+            values = self.sketch.quantiles(percentiles)
+        else:
+            values = [self.quantile(p) for p in percentiles]
+        return {f"p{int(p*100)}": value for p, value in zip(percentiles, values)}
+
+
+def summarize_columns(df: pd.DataFrame, columns: Optional[List[str]] = None,
+                      sketch_epsilon: Optional[float] = None) -> Dict[str, ColumnStatistics]:
+    """
+    Mergeable statistics of a frame's numerical columns.
+
+    Args:
+        df: Pandas DataFrame (or one chunk of it)
+        columns: Specific columns to summarize (None for all numeric columns)
+        sketch_epsilon: Rank error of quantile sketches to keep as well (None for none)
+
+    Returns:
+        ColumnStatistics for each numerical column
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    return {
+        column: ColumnStatistics.of(df[column], sketch_epsilon)
+        for column in columns if column in df.columns and pd.api.types.is_numeric_dtype(df[column])
+    }
+
+
+def merge_summaries(*summaries: Dict[str, ColumnStatistics]) -> Dict[str, ColumnStatistics]:
+    """Merge column statistics of disjoint row sets (chunks, processes or new rows)"""
+    merged: Dict[str, ColumnStatistics] = {}
+    for summary in summaries:
+        for column, statistics in summary.items():
+            merged[column] = merged[column].merged(statistics) if column in merged else statistics
+    return merged
+
+
+def summarize_chunks(chunks: Iterable[pd.DataFrame], columns: Optional[List[str]] = None,
+                     sketch_epsilon: Optional[float] = None) -> Dict[str, ColumnStatistics]:
+    """Column statistics of a frame processed one chunk at a time"""
+    summary: Dict[str, ColumnStatistics] = {}
+    for chunk in chunks:
+        summary = merge_summaries(summary, summarize_columns(chunk, columns, sketch_epsilon))
+    return summary
@@ -4,7 +4,7 @@ Generate comprehensive statistical summaries and reports.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime
 import json
 
@@ -16,7 +16,8 @@ from .missing_data import analyze_missing_data
 
 def generate_full_report(df: pd.DataFrame,
                         project_name: str = "Research Data Analysis",
-                        include_advanced: bool = True) -> Dict[str, Any]:
+                        include_advanced: bool = True,
+                        progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
     """
     Generate a comprehensive statistical report.
     
@@ -24,10 +25,13 @@ def generate_full_report(df: pd.DataFrame,
         df: DataFrame to analyze
         project_name: Name of the project
         include_advanced: Include advanced statistics
+        progress: Called as progress(fraction, message, partial) after each
+            report section, with the completed fraction of the report
         
     Returns:
         Dictionary containing full statistical report
     """
+    progress = progress or (lambda *args, **kwargs: None)
     report = {
         "metadata": {
             "project_name": project_name,
@@ -48,6 +52,7 @@ def generate_full_report(df: pd.DataFrame,
             "duplicate_percentage": float(df.duplicated().sum() / len(df) * 100)
         }
     }
+    progress(0.2, "Data quality complete", {"data_quality": report["data_quality"]})
     
     # Numeric variables analysis
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -64,6 +69,7 @@ def generate_full_report(df: pd.DataFrame,
                 col: test_normality(df[col]) for col in numeric_cols
             }
             report["numeric_analysis"]["correlations"] = df[numeric_cols].corr().to_dict()
+        progress(0.6, "Numeric analysis complete", {"numeric_analysis": report["numeric_analysis"]})
     
     # Categorical variables analysis
     categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
@@ -71,6 +77,7 @@ def generate_full_report(df: pd.DataFrame,
         report["categorical_analysis"] = {
             col: analyze_categorical(df[col]) for col in categorical_cols
         }
+        progress(0.8, "Categorical analysis complete", {"categorical_analysis": report["categorical_analysis"]})
     
     # Summary statistics by groups (if applicable)
     if categorical_cols and numeric_cols:
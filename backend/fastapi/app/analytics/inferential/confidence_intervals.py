@@ -5,7 +5,7 @@ Confidence interval calculations for various statistics.
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import Dict, Any, Tuple, Optional, Union
+from typing import Dict, Any, Callable, Tuple, Optional, Union
 import warnings
 
 def calculate_mean_ci(
@@ -256,14 +256,12 @@ def calculate_median_ci(
     Returns:
         Dictionary with CI for median
     """
-    clean_data = data.dropna().sort_values()
+    clean_data = data.dropna()
     n = len(clean_data)
     
     if n < 2:
         return {"error": "Need at least 2 observations"}
     
-    median = clean_data.median()
-    
     if method == 'exact':
         # Using binomial for exact CI
         alpha = 1 - confidence
@@ -278,13 +276,18 @@ def calculate_median_ci(
         if upper_idx >= n:
             upper_idx = n - 1
         
-        lower = clean_data.iloc[lower_idx]
-        upper = clean_data.iloc[upper_idx]
+        # Selecting the order statistics needs no full sort
+        middle = [(n - 1) // 2, n // 2]
+        values = np.partition(clean_data.to_numpy(dtype=float), sorted({lower_idx, upper_idx, *middle}))
+        median = values[middle].mean()
+        lower = values[lower_idx]
+        upper = values[upper_idx]
         
     else:
         # Bootstrap method
         from .bootstrap_methods import bootstrap_median
-        result = bootstrap_median(clean_data, confidence=confidence)
+        median = clean_data.median()
+        result = bootstrap_median(clean_data.sort_values(), confidence=confidence)
         lower = result['confidence_interval']['lower']
         upper = result['confidence_interval']['upper']
     
@@ -304,7 +307,8 @@ def calculate_bootstrap_ci(
     statistic_func: callable,
     confidence: float = 0.95,
     n_bootstrap: int = 10000,
-    method: str = 'percentile'
+    method: str = 'percentile',
+    progress: Optional[Callable[..., None]] = None
 ) -> Dict[str, Any]:
     """
     Calculate bootstrap confidence interval for any statistic.
@@ -315,6 +319,8 @@ def calculate_bootstrap_ci(
         confidence: Confidence level
         n_bootstrap: Number of bootstrap samples
         method: 'percentile', 'bca', or 'basic'
+        progress: Called as progress(fraction, message) every 100 bootstrap
+            samples, with the completed fraction of the samples
         
     Returns:
         Dictionary with bootstrap CI
@@ -330,9 +336,11 @@ def calculate_bootstrap_ci(
     
     # Bootstrap
     bootstrap_stats = []
-    for _ in range(n_bootstrap):
+    for i in range(n_bootstrap):
         sample = clean_data.sample(n=n, replace=True)
         bootstrap_stats.append(statistic_func(sample))
+        if progress is not None and (i + 1) % 100 == 0:
+            progress((i + 1) / n_bootstrap, f"{i + 1} of {n_bootstrap} bootstrap samples")
     
     bootstrap_stats = np.array(bootstrap_stats)
     
@@ -0,0 +1,95 @@
+"""
+NLTK data resources used by the qualitative analyzers.
+
+Resources are looked up in the local NLTK data path only. Downloading them is
+an explicit step (``python start_analytics_backend.py --download-nltk-data``)
+or opt-in at first use via NLTK_AUTO_DOWNLOAD=true, so importing an analyzer
+never touches the network.
+"""
+
+import os
+import logging
+import threading
+from typing import Dict
+
+import nltk
+
+logger = logging.getLogger(__name__)
+
+# Resource name -> path inside the NLTK data directory
+NLTK_RESOURCES: Dict[str, str] = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+}
+
+NLTK_AUTO_DOWNLOAD: bool = os.getenv("NLTK_AUTO_DOWNLOAD", "false").lower() == "true"
+
+_available: Dict[str, bool] = {}
+_lock = threading.Lock()
+
+
+def _find(name: str) -> bool:
+    try:
+        nltk.data.find(NLTK_RESOURCES.get(name, name))
+        return True
+    except LookupError:
+        return False
+
+
+def ensure_nltk_data(*names: str) -> bool:
+    """
+    Check that NLTK resources are installed, downloading them only if enabled.
+
+    Results are remembered per resource, so repeated calls cost a dict lookup
+    and a missing resource is only reported (or downloaded) once.
+
+    Args:
+        names: Resource names, e.g. 'stopwords', 'punkt'
+
+    Returns:
+        True if every resource is available
+    """
+    missing = [name for name in names if not _available.get(name)]
+    if not missing:
+        return True
+
+    with _lock:
+        for name in missing:
+            if name in _available:
+                continue
+            found = _find(name)
+            if not found and NLTK_AUTO_DOWNLOAD:
+                found = download_nltk_data(name)
+            if not found:
+                logger.warning(
+                    f"NLTK resource '{name}' is not installed; run "
+                    f"'python start_analytics_backend.py --download-nltk-data' to install it"
+                )
+            _available[name] = found
+
+    return all(_available[name] for name in names)
+
+
+def download_nltk_data(*names: str) -> bool:
+    """
+    Download NLTK resources (all known resources by default).
+
+    Returns:
+        True if every download succeeded
+    """
+    ok = True
+    for name in names or NLTK_RESOURCES:
+        try:
+            downloaded = bool(nltk.download(name, quiet=True))
+        except Exception as e:
+            logger.warning(f"Could not download NLTK resource '{name}': {e}")
+            downloaded = False
+        if downloaded:
+            # Let ensure_nltk_data look the resource up again
+            _available.pop(name, None)
+        ok = ok and downloaded
+    return ok
@@ -10,12 +10,8 @@ import re
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-import nltk
 
-# Download required NLTK data
-nltk.download('punkt')
-nltk.download('stopwords')
-nltk.download('wordnet')
+from .nltk_resources import ensure_nltk_data
 
 def preprocess_text(text: str) -> List[str]:
     """
@@ -27,6 +23,8 @@ def preprocess_text(text: str) -> List[str]:
     Returns:
         List of preprocessed tokens
     """
+    ensure_nltk_data('punkt', 'stopwords', 'wordnet')
+    
     # Convert to lowercase
     text = text.lower()
     
@@ -3,7 +3,7 @@ Thematic analysis module for qualitative research data.
 Provides tools for identifying themes, patterns, and concepts in text data.
 """
 
-from typing import Dict, Any, List, Tuple, Set
+from typing import Dict, Any, Callable, List, Optional, Tuple, Set
 import pandas as pd
 import numpy as np
 from collections import Counter, defaultdict
@@ -11,32 +11,25 @@ import re
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
 from sklearn.decomposition import LatentDirichletAllocation
-import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from nltk.tag import pos_tag
 import logging
 
+from .nltk_resources import ensure_nltk_data
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
-except:
-    logger.warning("Could not download NLTK data. Some features may not work properly.")
-
 class ThematicAnalyzer:
     """
     A comprehensive thematic analysis tool for qualitative research.
     """
     
     def __init__(self):
+        ensure_nltk_data('punkt', 'stopwords', 'wordnet', 'averaged_perceptron_tagger')
         self.stop_words = set(stopwords.words('english'))
         self.lemmatizer = WordNetLemmatizer()
         self.themes = {}
@@ -245,7 +238,8 @@ class ThematicAnalyzer:
             logger.error(f"Error in LDA theme identification: {e}")
             return {"themes": [], "coherence": 0}
     
-    def analyze_theme_evolution(self, texts: List[str], timestamps: List[str], n_themes: int = 5) -> Dict[str, Any]:
+    def analyze_theme_evolution(self, texts: List[str], timestamps: List[str], n_themes: int = 5,
+                                progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
         """
         Analyze how themes evolve over time.
         
@@ -253,6 +247,8 @@ class ThematicAnalyzer:
             texts: List of text documents
             timestamps: List of timestamps
             n_themes: Number of themes to track
+            progress: Called as progress(fraction, message) after each period
+                is clustered, with the completed fraction of the periods
             
         Returns:
             Dictionary with theme evolution analysis
@@ -283,11 +279,14 @@ class ThematicAnalyzer:
         
         # Analyze themes for each period
         theme_evolution = {}
-        for period in df['period'].unique():
+        periods = df['period'].unique()
+        for i, period in enumerate(periods):
             period_texts = df[df['period'] == period]['text'].tolist()
             if len(period_texts) >= 2:  # Need minimum texts for analysis
                 themes = self.identify_themes_clustering(period_texts, n_themes)
                 theme_evolution[str(period)] = themes
+            if progress is not None:
+                progress((i + 1) / len(periods), f"Themes of {period} identified")
         
         return {
             "theme_evolution": theme_evolution,
@@ -3,7 +3,7 @@ API router for v1 endpoints - modular analytics API.
 """
 
 from fastapi import APIRouter
-from .endpoints import analytics, autoanalytics, descriptive, qualitative, inferential, sync
+from .endpoints import analytics, autoanalytics, batch, descriptive, qualitative, inferential, jobs, sync
 
 api_router = APIRouter()
 
@@ -42,6 +42,20 @@ api_router.include_router(
     tags=["inferential-analytics"]
 )
 
+# Batch analytics endpoints
+api_router.include_router(
+    batch.router,
+    prefix="/analytics/batch",
+    tags=["batch-analytics"]
+)
+
+# Background analysis jobs
+api_router.include_router(
+    jobs.router,
+    prefix="/analytics/jobs",
+    tags=["analysis-jobs"]
+)
+
 # Sync endpoints
 api_router.include_router(
     sync.router,
@@ -0,0 +1,62 @@
+"""
+Response filter dependency shared by the analysis endpoints.
+"""
+
+import uuid
+from datetime import date
+from typing import List, Optional
+
+from fastapi import HTTPException, Query
+
+from core.database import ResponseFilter
+
+
+def _clean(values: Optional[List[str]]) -> tuple:
+    """Strip, de-duplicate and drop empty entries from a repeated query parameter"""
+    if not values:
+        return ()
+    return tuple(dict.fromkeys(value.strip() for value in values if value and value.strip()))
+
+
+async def get_response_filter(
+    date_from: Optional[date] = Query(None, description="Only responses collected on or after this day (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Only responses collected on or before this day (YYYY-MM-DD)"),
+    question_ids: Optional[List[str]] = Query(None, description="Only responses to these question IDs"),
+    respondent_ids: Optional[List[str]] = Query(None, description="Only responses from these respondent IDs"),
+    collected_by: Optional[List[str]] = Query(None, description="Only responses collected by these usernames"),
+    is_validated: Optional[bool] = Query(None, description="Only validated (true) or unvalidated (false) responses"),
+) -> Optional[ResponseFilter]:
+    """
+    Build the response filter for an analysis request from query parameters.
+
+    Returns:
+        ResponseFilter applied when loading project data, or None if no filter was given
+
+    Raises:
+        HTTPException: If the date window is inverted or a question ID is not a UUID
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=422,
+            detail="date_from must not be later than date_to"
+        )
+
+    question_ids = _clean(question_ids)
+    for question_id in question_ids:
+        try:
+            uuid.UUID(question_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid question ID: {question_id}"
+            )
+
+    filters = ResponseFilter(
+        date_from=date_from,
+        date_to=date_to,
+        question_ids=question_ids,
+        respondent_ids=_clean(respondent_ids),
+        collectors=_clean(collected_by),
+        is_validated=is_validated,
+    )
+    return None if filters.is_empty() else filters
@@ -7,9 +7,22 @@ The original analytics endpoints have been reorganized into specialized modules.
 from fastapi import APIRouter
 from typing import Dict, Any
 
+from core.database import db_pool
 from app.utils.shared import AnalyticsUtils
+from app.utils.data_cache import project_data_cache
+from app.utils.snapshot_store import snapshot_store
+from app.utils.profile_store import project_profiles
+from app.utils.spatial_index import project_spatial_indexes
+from app.utils.result_cache import result_cache
+from app.utils.conditional import conditional_responses
+from app.utils.single_flight import request_coalescer
+from app.utils.jobs import analysis_jobs
+from app.utils.compute import compute_executor
+from app.utils.warming import cache_warmer
+from app.utils.module_registry import analytics_modules
+from app.utils.serialization import AnalyticsRoute
 
-router = APIRouter()
+router = APIRouter(route_class=AnalyticsRoute)
 
 @router.get("/migration-guide")
 async def get_migration_guide() -> Dict[str, Any]:
@@ -85,6 +98,14 @@ async def get_migration_guide() -> Dict[str, Any]:
                         'GET /analysis-types',
                         'GET /endpoints'
                     ]
+                },
+                'batch_analytics': {
+                    'prefix': '/analytics/batch',
+                    'description': 'Several analyses on one data load and one data profile',
+                    'endpoints': [
+                        'POST /project/{project_id}',
+                        'GET /analysis-types'
+                    ]
                 }
             },
             'migration_mappings': {
@@ -156,4 +177,32 @@ async def health_check() -> Dict[str, Any]:
         })
         
     except Exception as e:
-        return AnalyticsUtils.handle_analysis_error(e, "health check") 
\ No newline at end of file
+        return AnalyticsUtils.handle_analysis_error(e, "health check") 
+
+@router.get("/metrics")
+async def get_engine_metrics() -> Dict[str, Any]:
+    """
+    Runtime metrics for monitoring the analytics engine.
+    
+    Returns:
+        Counters for the engine's caches and worker pools, and analytics
+        module import times
+    """
+    try:
+        return AnalyticsUtils.format_api_response('success', {
+            'project_data_cache': project_data_cache.stats(),
+            'snapshot_store': snapshot_store.stats(),
+            'data_profiles': project_profiles.stats(),
+            'spatial_indexes': project_spatial_indexes.stats(),
+            'result_cache': result_cache.stats(),
+            'request_coalescing': request_coalescer.stats(),
+            'conditional_requests': conditional_responses.stats(),
+            'analysis_jobs': analysis_jobs.stats(),
+            'cache_warming': cache_warmer.stats(),
+            'compute_executor': compute_executor.stats(),
+            'database_pool': db_pool.stats(),
+            'analytics_modules': analytics_modules.stats()
+        })
+        
+    except Exception as e:
+        return AnalyticsUtils.handle_analysis_error(e, "engine metrics")
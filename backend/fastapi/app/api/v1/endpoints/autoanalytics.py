@@ -9,10 +9,18 @@ from typing import Dict, Any, List, Optional
 import pandas as pd
 from asgiref.sync import sync_to_async
 
-from core.database import get_db
-from app.utils.shared import AnalyticsUtils
+from core.database import get_db, ResponseFilter
+from app.utils.shared import AnalyticsUtils, DataMode
+from app.api.v1.dependencies.filters import get_response_filter
+from app.utils.result_cache import result_cache
+from app.utils.jobs import analysis_jobs, report_progress, run_compute_step
+from app.utils.compute import run_compute
+from app.utils.profile_store import project_profiles
+from app.utils.conditional import conditional_responses
+from app.utils.serialization import AnalyticsRoute
+from app.utils.warming import cache_warmer
 
-router = APIRouter()
+router = APIRouter(route_class=AnalyticsRoute)
 
 @router.get("/project/{project_id}/stats")
 async def get_project_stats(
@@ -30,14 +38,35 @@ async def get_project_stats(
         Project statistics
     """
     try:
-        stats = await AnalyticsUtils.get_project_stats(project_id)
+        # Response totals follow the data version; names, questions and team are read live
+        counts = await get_project_response_counts(project_id=project_id)
+        response_counts = counts['data'] if counts.get('status') == 'success' else None
+        stats = await AnalyticsUtils.get_project_stats(project_id, response_counts)
         return AnalyticsUtils.format_api_response('success', stats)
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "project stats")
 
+@cache_warmer.hot("project-stats")
+@result_cache.cached
+async def get_project_response_counts(project_id: str) -> Dict[str, Any]:
+    """
+    Response and respondent totals shown with the project stats.
+    
+    Counting distinct respondents scans every response, so the totals are
+    cached under the project's data version and warmed after sync ingestion.
+    """
+    try:
+        counts = await AnalyticsUtils.get_project_response_counts(project_id)
+        return AnalyticsUtils.format_api_response('success', counts)
+    except Exception as e:
+        return AnalyticsUtils.handle_analysis_error(e, "project response counts")
+
 @router.get("/project/{project_id}/data-characteristics")
+@conditional_responses.versioned
+@cache_warmer.hot("profile")
 async def get_data_characteristics(
     project_id: str,
+    data_mode: DataMode = "long",
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -45,23 +74,24 @@ async def get_data_characteristics(
     
     Args:
         project_id: Project identifier
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
         db: Database session
         
     Returns:
         Data characteristics and analysis recommendations
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        characteristics = await project_profiles.get_characteristics(project_id, data_mode=data_mode)
         
-        if df.empty:
+        if not characteristics.get('sample_size'):
             return AnalyticsUtils.format_api_response(
                 'error', 
                 None, 
                 'No data available for this project'
             )
         
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
-        recommendations = AnalyticsUtils.generate_analysis_recommendations(characteristics)
+        recommendations = await run_compute(AnalyticsUtils.generate_analysis_recommendations, characteristics)
         
         return AnalyticsUtils.format_api_response('success', {
             'characteristics': characteristics,
@@ -71,8 +101,10 @@ async def get_data_characteristics(
         return AnalyticsUtils.handle_analysis_error(e, "data characteristics")
 
 @router.get("/project/{project_id}/recommendations")
+@conditional_responses.versioned
 async def get_analysis_recommendations(
     project_id: str,
+    data_mode: DataMode = "long",
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -80,23 +112,24 @@ async def get_analysis_recommendations(
     
     Args:
         project_id: Project identifier
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
         db: Database session
         
     Returns:
         Analysis recommendations
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        characteristics = await project_profiles.get_characteristics(project_id, data_mode=data_mode)
         
-        if df.empty:
+        if not characteristics.get('sample_size'):
             return AnalyticsUtils.format_api_response(
                 'error', 
                 None, 
                 'No data available for recommendations'
             )
         
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
-        recommendations = AnalyticsUtils.generate_analysis_recommendations(characteristics)
+        recommendations = await run_compute(AnalyticsUtils.generate_analysis_recommendations, characteristics)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -112,10 +145,14 @@ async def get_analysis_recommendations(
         return AnalyticsUtils.handle_analysis_error(e, "recommendations")
 
 @router.post("/project/{project_id}/analyze")
+@analysis_jobs.background
+@result_cache.cached
 async def analyze_project_data(
     project_id: str,
     analysis_type: str = "auto",
     target_variables: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -125,13 +162,17 @@ async def analyze_project_data(
         project_id: Project identifier
         analysis_type: Type of analysis (auto, comprehensive)
         target_variables: Optional list of specific variables to analyze
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -140,8 +181,12 @@ async def analyze_project_data(
                 'No data available for analysis'
             )
         
+        report_progress(0.2, "Project data loaded")
+        
         # Get data characteristics first
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await project_profiles.get_characteristics(
+            project_id, data_mode=data_mode, filters=filters, df=df
+        )
         
         results = {
             'project_id': project_id,
@@ -149,30 +194,37 @@ async def analyze_project_data(
             'data_characteristics': characteristics,
             'analyses': {}
         }
+        report_progress(0.3, "Data profiled", {'data_characteristics': characteristics})
         
         if analysis_type == "auto":
             # Run all applicable analyses based on data characteristics
-            results['analyses']['descriptive'] = AnalyticsUtils.run_descriptive_analysis(
+            results['analyses']['descriptive'] = await run_compute(AnalyticsUtils.run_descriptive_analysis,
                 df, "comprehensive", target_variables
             )
+            report_progress(0.5, "Descriptive analysis complete", {'descriptive': results['analyses']['descriptive']})
             
             if len(characteristics.get('numeric_variables', [])) >= 2:
-                results['analyses']['correlation'] = AnalyticsUtils.run_correlation_analysis(df)
+                results['analyses']['correlation'] = await run_compute(AnalyticsUtils.run_correlation_analysis, df)
+                report_progress(0.6, "Correlation analysis complete", {'correlation': results['analyses']['correlation']})
             
             if len(characteristics.get('text_variables', [])) >= 1:
-                results['analyses']['text'] = AnalyticsUtils.run_basic_text_analysis(
+                results['analyses']['text'] = await run_compute(AnalyticsUtils.run_basic_text_analysis,
                     df, characteristics['text_variables']
                 )
+                report_progress(0.8, "Text analysis complete", {'text': results['analyses']['text']})
             
             # Add missing data analysis if there's missing data
             if characteristics.get('missing_percentage', 0) > 0:
-                results['analyses']['missing_data'] = AnalyticsUtils.run_missing_data_analysis(df)
+                results['analyses']['missing_data'] = await run_compute(AnalyticsUtils.run_missing_data_analysis, df)
         
         elif analysis_type == "comprehensive":
+            comprehensive_report = await run_compute_step(0.3, 0.8, AnalyticsUtils.generate_comprehensive_report, df)
+            descriptive = await run_compute(AnalyticsUtils.run_descriptive_analysis, df, "comprehensive")
+            report_progress(0.9, "Descriptive analysis complete", {'descriptive': descriptive})
             results['analyses'] = {
-                'comprehensive_report': AnalyticsUtils.generate_comprehensive_report(df),
-                'descriptive': AnalyticsUtils.run_descriptive_analysis(df, "comprehensive"),
-                'data_quality': AnalyticsUtils.run_data_quality_analysis(df)
+                'comprehensive_report': comprehensive_report,
+                'descriptive': descriptive,
+                'data_quality': await run_compute(AnalyticsUtils.run_data_quality_analysis, df)
             }
         
         else:
@@ -0,0 +1,222 @@
+"""
+Batch Analytics Endpoints
+Runs several analyses on one load of the project data and one data profile.
+"""
+
+import time
+import asyncio
+import inspect
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from core.database import get_db, ResponseFilter
+from app.utils.shared import AnalyticsUtils, DataMode
+from app.api.v1.dependencies.filters import get_response_filter
+from app.utils.result_cache import result_cache
+from app.utils.jobs import analysis_jobs, report_progress, run_compute_step
+from app.utils.compute import run_compute
+from app.utils.profile_store import project_profiles
+from app.utils.serialization import AnalyticsRoute
+
+router = APIRouter(route_class=AnalyticsRoute)
+
+# Analyses available in a batch. Each runner takes the prepared frame and the
+# shared data profile; its remaining keyword arguments are the options a spec
+# may set.
+BATCH_ANALYSES = {
+    'basic-statistics': lambda df, profile, variables=None:
+        AnalyticsUtils.run_basic_statistics(df, variables),
+    'distributions': lambda df, profile, variables=None:
+        AnalyticsUtils.run_distribution_analysis(df, variables),
+    'categorical': lambda df, profile, variables=None:
+        AnalyticsUtils.run_categorical_analysis(df, variables),
+    'outliers': lambda df, profile, variables=None, methods=None:
+        AnalyticsUtils.run_outlier_analysis(df, variables, methods),
+    'missing-data': lambda df, profile:
+        AnalyticsUtils.run_missing_data_analysis(df),
+    'data-quality': lambda df, profile:
+        AnalyticsUtils.run_data_quality_analysis(df),
+    'descriptive': lambda df, profile, analysis_type="comprehensive", target_variables=None:
+        AnalyticsUtils.run_descriptive_analysis(df, analysis_type, target_variables),
+    'correlation': lambda df, profile, variables=None, correlation_method="pearson", significance_level=0.05:
+        AnalyticsUtils.run_correlation_analysis(df, variables, correlation_method, significance_level),
+    'data-characteristics': lambda df, profile:
+        profile,
+    'recommendations': lambda df, profile:
+        AnalyticsUtils.generate_analysis_recommendations(profile),
+}
+
+def _analysis_options(analysis: str) -> List[str]:
+    """Option names a spec may set for an analysis"""
+    return list(inspect.signature(BATCH_ANALYSES[analysis]).parameters)[2:]
+
+def _parse_specs(analyses: List[Dict[str, Any]]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Validate analysis specs and assign each a unique result key.
+
+    Returns:
+        (key, analysis, options) per spec
+
+    Raises:
+        HTTPException: If a spec names an unknown analysis or option
+    """
+    if not analyses:
+        raise HTTPException(status_code=422, detail="At least one analysis is required")
+
+    parsed = []
+    keys = set()
+    for spec in analyses:
+        spec = dict(spec)
+        analysis = spec.pop('analysis', None)
+        if analysis not in BATCH_ANALYSES:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown analysis: {analysis}. Available: {', '.join(BATCH_ANALYSES)}"
+            )
+        key = str(spec.pop('key', None) or analysis)
+        unknown = set(spec) - set(_analysis_options(analysis))
+        if unknown:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown options for {analysis}: {', '.join(sorted(unknown))}"
+            )
+
+        unique_key, n = key, 2
+        while unique_key in keys:
+            unique_key, n = f"{key}_{n}", n + 1
+        keys.add(unique_key)
+        parsed.append((unique_key, analysis, spec))
+    return parsed
+
+def _run_analysis(df, profile: Dict[str, Any], analysis: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one analysis of a batch, timing it and capturing its errors."""
+    started = time.perf_counter()
+    try:
+        results = BATCH_ANALYSES[analysis](df, profile, **options)
+        error = results.get('error') if isinstance(results, dict) else None
+    except Exception as e:
+        results, error = None, str(e)
+
+    outcome = {
+        'analysis': analysis,
+        'status': 'error' if error else 'success',
+        'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+    }
+    if error:
+        outcome['error'] = error
+    else:
+        outcome['results'] = results
+    return outcome
+
+def _run_analyses(df, profile: Dict[str, Any], specs: List[Tuple[str, str, Dict[str, Any]]],
+                  progress: Optional[Callable[..., None]] = None) -> Dict[str, Dict[str, Any]]:
+    """Run a batch's analyses one after another on the same frame, keyed by spec key."""
+    results = {}
+    for i, (key, analysis, options) in enumerate(specs):
+        results[key] = _run_analysis(df, profile, analysis, options)
+        if progress is not None:
+            progress((i + 1) / len(specs), f"Finished {key}", {key: results[key]})
+    return results
+
+@router.post("/project/{project_id}")
+@analysis_jobs.background
+@result_cache.cached
+async def run_batch_analysis(
+    project_id: str,
+    analyses: List[Dict[str, Any]] = Body(..., description="Analysis specs, e.g. {\"analysis\": \"outliers\", \"variables\": [\"age\"], \"key\": \"age_outliers\"}"),
+    parallel: bool = Query(False, description="Run the analyses concurrently on the compute pool"),
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Run several analyses on one load of the project data.
+
+    The project is loaded and prepared once and profiled once with the
+    standardized data profiler; every analysis in the batch works on that
+    frame, and the profile is returned alongside the results.
+
+    Args:
+        project_id: Project identifier
+        analyses: Analysis specs. Each names an `analysis` (see /analysis-types),
+            an optional result `key` (defaults to the analysis name) and the
+            analysis' options, such as `variables`
+        parallel: Run the analyses concurrently instead of one after another.
+            Each analysis is a separate compute call, so with the process
+            executor the frame and profile are copied to a worker once per
+            analysis; sequential batches hand them over once
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
+        db: Database session
+
+    Returns:
+        Results keyed by spec key, each with its status and duration, plus
+        the data profile and the time spent loading and profiling
+    """
+    specs = _parse_specs(analyses)
+    try:
+        started = time.perf_counter()
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        if df.empty:
+            return AnalyticsUtils.format_api_response(
+                'error', None, 'No data available for analysis'
+            )
+        report_progress(0.1, "Project data loaded")
+
+        profile_started = time.perf_counter()
+        profile = await project_profiles.get_characteristics(
+            project_id, data_mode=data_mode, filters=filters, df=df
+        )
+        profile_ms = (time.perf_counter() - profile_started) * 1000
+        report_progress(0.2, "Data profiled")
+
+        analyses_started = time.perf_counter()
+        if parallel:
+            outcomes = await asyncio.gather(*(
+                run_compute(_run_analysis, df, profile, analysis, options)
+                for _, analysis, options in specs
+            ))
+            results = {key: outcome for (key, _, _), outcome in zip(specs, outcomes)}
+        else:
+            # One compute call for the whole batch, so the frame is handed over once
+            results = await run_compute_step(0.2, 1.0, _run_analyses, df, profile, specs)
+        analyses_ms = (time.perf_counter() - analyses_started) * 1000
+
+        return AnalyticsUtils.format_api_response('success', {
+            'project_id': project_id,
+            'analysis_type': 'batch',
+            'data_profile': profile,
+            'results': results,
+            'summary': {
+                'analyses_requested': len(specs),
+                'analyses_succeeded': sum(r['status'] == 'success' for r in results.values()),
+                'parallel': parallel,
+                'observations': len(df)
+            },
+            'timing': {
+                'load_ms': round(load_ms, 2),
+                'profile_ms': round(profile_ms, 2),
+                'analyses_ms': round(analyses_ms, 2),
+                'total_ms': round((time.perf_counter() - started) * 1000, 2)
+            }
+        })
+
+    except Exception as e:
+        return AnalyticsUtils.handle_analysis_error(e, "batch analysis")
+
+@router.get("/analysis-types")
+async def get_batch_analysis_types() -> Dict[str, Any]:
+    """
+    Get the analyses a batch can run and the options each accepts.
+
+    Returns:
+        Analysis names mapped to their option names
+    """
+    return AnalyticsUtils.format_api_response('success', {
+        analysis: _analysis_options(analysis) for analysis in BATCH_ANALYSES
+    })
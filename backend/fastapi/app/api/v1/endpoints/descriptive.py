@@ -3,75 +3,38 @@ Descriptive Analytics Endpoints
 Handles comprehensive statistical analysis including distributions, correlations, and data quality assessment.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional, Union
 import pandas as pd
-from asgiref.sync import sync_to_async
 
-from core.database import get_db
-from app.utils.shared import AnalyticsUtils
+from core.database import get_db, run_db, ResponseFilter
+from app.utils.shared import AnalyticsUtils, DataMode
+from app.utils.module_registry import analytics_modules
+from app.api.v1.dependencies.filters import get_response_filter
+from app.utils.result_cache import result_cache
+from app.utils.jobs import analysis_jobs, report_progress, run_compute_step
+from app.utils.compute import compute_executor, run_compute
+from app.utils.profile_store import project_profiles
+from app.utils.spatial_index import MAX_MAP_BINS, project_spatial_indexes
+from app.utils.conditional import conditional_responses
+from app.utils.serialization import AnalyticsRoute
+from app.utils.warming import cache_warmer
 
-# Import descriptive analytics modules for comprehensive functionality
-from app.analytics.descriptive import (
-    # Basic statistics
-    calculate_basic_stats,
-    calculate_percentiles,
-    calculate_grouped_stats,
-    calculate_weighted_stats,
-    calculate_correlation_matrix,
-    calculate_covariance_matrix,
-    
-    # Distributions
-    analyze_distribution,
-    test_normality,
-    calculate_skewness_kurtosis,
-    fit_distribution,
-    
-    # Categorical analysis
-    analyze_categorical,
-    calculate_chi_square,
-    calculate_cramers_v,
-    analyze_cross_tabulation,
-    calculate_diversity_metrics,
-    analyze_categorical_associations,
-    
-    # Outlier detection
-    detect_outliers_iqr,
-    detect_outliers_zscore,
-    detect_outliers_isolation_forest,
-    detect_outliers_mad,
-    get_outlier_summary,
-    
-    # Missing data
-    analyze_missing_data,
-    get_missing_patterns,
-    calculate_missing_correlations,
-    create_missing_data_heatmap,
-    analyze_missing_by_group,
-    
-    # Temporal analysis
-    analyze_temporal_patterns,
-    calculate_time_series_stats,
-    detect_seasonality,
-    
-    # Geospatial analysis
-    analyze_spatial_distribution,
-    calculate_spatial_autocorrelation,
-    create_location_clusters,
-    
-    # Summary generation
-    generate_full_report,
-    generate_executive_summary,
-    export_statistics
-)
+# Descriptive analytics functions, imported on first use
+descriptive_analytics = analytics_modules.lazy('app.analytics.descriptive', requires=['app.analytics.auto_detect'])
 
-router = APIRouter()
+router = APIRouter(route_class=AnalyticsRoute)
 
 @router.post("/project/{project_id}/analyze/basic-statistics")
+@cache_warmer.hot("basic-statistics")
+@result_cache.cached
 async def analyze_basic_statistics(
     project_id: str,
     variables: Optional[List[str]] = None,
+    approximate: bool = False,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -80,20 +43,38 @@ async def analyze_basic_statistics(
     Args:
         project_id: Project identifier
         variables: Optional list of variables to analyze
+        approximate: Read percentiles from the columns' quantile sketches (rank
+            error QUANTILE_SKETCH_EPSILON) instead of exact order statistics
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Basic statistics results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
-        
-        if df.empty:
-            return AnalyticsUtils.format_api_response(
-                'error', None, 'No data available for analysis'
+        # Mergeable column statistics kept with the project's data profile are
+        # extended from new rows instead of rescanning every column
+        statistics = await project_profiles.get_column_statistics(project_id, data_mode=data_mode, filters=filters)
+        if statistics is not None:
+            results = await compute_executor.run_threaded(
+                AnalyticsUtils.summarize_basic_statistics, statistics['columns'], statistics['n_rows'],
+                variables, approximate
             )
-        
-        results = AnalyticsUtils.run_basic_statistics(df, variables)
+        else:
+            df = await AnalyticsUtils.get_project_data(
+                project_id, data_mode=data_mode, filters=filters,
+                columns=AnalyticsUtils.declared_columns(variables)
+            )
+            
+            if df.empty:
+                return AnalyticsUtils.format_api_response(
+                    'error', None, 'No data available for analysis'
+                )
+            
+            results = await run_compute(AnalyticsUtils.run_basic_statistics, df, variables, approximate)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -105,9 +86,12 @@ async def analyze_basic_statistics(
         return AnalyticsUtils.handle_analysis_error(e, "basic statistics analysis")
 
 @router.post("/project/{project_id}/analyze/distributions")
+@result_cache.cached
 async def analyze_distributions(
     project_id: str,
     variables: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -116,20 +100,27 @@ async def analyze_distributions(
     Args:
         project_id: Project identifier
         variables: Optional list of variables to analyze
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Distribution analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_distribution_analysis(df, variables)
+        results = await run_compute(AnalyticsUtils.run_distribution_analysis, df, variables)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -141,9 +132,13 @@ async def analyze_distributions(
         return AnalyticsUtils.handle_analysis_error(e, "distribution analysis")
 
 @router.post("/project/{project_id}/analyze/categorical")
+@cache_warmer.hot("categorical")
+@result_cache.cached
 async def analyze_categorical_data(
     project_id: str,
     variables: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -152,20 +147,27 @@ async def analyze_categorical_data(
     Args:
         project_id: Project identifier
         variables: Optional list of variables to analyze
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Categorical analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_categorical_analysis(df, variables)
+        results = await run_compute(AnalyticsUtils.run_categorical_analysis, df, variables)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -177,10 +179,14 @@ async def analyze_categorical_data(
         return AnalyticsUtils.handle_analysis_error(e, "categorical analysis")
 
 @router.post("/project/{project_id}/analyze/outliers")
+@result_cache.cached
 async def analyze_outliers(
     project_id: str,
     variables: Optional[List[str]] = None,
     methods: Optional[List[str]] = None,
+    approximate: bool = False,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -190,20 +196,41 @@ async def analyze_outliers(
         project_id: Project identifier
         variables: Optional list of variables to analyze
         methods: Optional list of outlier detection methods (iqr, zscore, isolation_forest, mad)
+        approximate: Take IQR bounds from the columns' quantile sketches instead
+            of sorting each column
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Outlier analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_outlier_analysis(df, variables, methods)
+        quartiles = None
+        if approximate:
+            # Sketches kept with the project's data profile, where available
+            statistics = await project_profiles.get_column_statistics(project_id, data_mode=data_mode, filters=filters)
+            if statistics is not None:
+                quartiles = {
+                    column: tuple(column_statistics.sketch.quantiles([0.25, 0.75]))
+                    for column, column_statistics in statistics['columns'].items()
+                    if column_statistics.sketch is not None
+                }
+        
+        results = await run_compute(AnalyticsUtils.run_outlier_analysis, df, variables, methods,
+                                    approximate, quartiles)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -215,8 +242,11 @@ async def analyze_outliers(
         return AnalyticsUtils.handle_analysis_error(e, "outlier analysis")
 
 @router.post("/project/{project_id}/analyze/missing-data")
+@result_cache.cached
 async def analyze_missing_data(
     project_id: str,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -224,20 +254,24 @@ async def analyze_missing_data(
     
     Args:
         project_id: Project identifier
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Missing data analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_missing_data_analysis(df)
+        results = await run_compute(AnalyticsUtils.run_missing_data_analysis, df)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -249,8 +283,12 @@ async def analyze_missing_data(
         return AnalyticsUtils.handle_analysis_error(e, "missing data analysis")
 
 @router.post("/project/{project_id}/analyze/data-quality")
+@cache_warmer.hot("data-quality")
+@result_cache.cached
 async def analyze_data_quality(
     project_id: str,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -258,20 +296,24 @@ async def analyze_data_quality(
     
     Args:
         project_id: Project identifier
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Data quality analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_data_quality_analysis(df)
+        results = await run_compute(AnalyticsUtils.run_data_quality_analysis, df)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -283,10 +325,14 @@ async def analyze_data_quality(
         return AnalyticsUtils.handle_analysis_error(e, "data quality analysis")
 
 @router.post("/project/{project_id}/analyze/descriptive")
+@cache_warmer.hot("descriptive")
+@result_cache.cached
 async def analyze_descriptive(
     project_id: str,
     analysis_type: str = "comprehensive",
     target_variables: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -296,20 +342,24 @@ async def analyze_descriptive(
         project_id: Project identifier
         analysis_type: Type of descriptive analysis (basic, comprehensive)
         target_variables: Optional list of specific variables to analyze
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Descriptive analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_descriptive_analysis(df, analysis_type, target_variables)
+        results = await run_compute(AnalyticsUtils.run_descriptive_analysis, df, analysis_type, target_variables)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -321,9 +371,12 @@ async def analyze_descriptive(
         return AnalyticsUtils.handle_analysis_error(e, "descriptive analysis")
 
 @router.post("/project/{project_id}/generate-report")
+@conditional_responses.versioned
+@analysis_jobs.background
 async def generate_comprehensive_report(
     project_id: str,
     include_plots: bool = False,
+    data_mode: DataMode = "long",
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -332,20 +385,24 @@ async def generate_comprehensive_report(
     Args:
         project_id: Project identifier
         include_plots: Whether to include plot data in the report
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
         db: Database session
         
     Returns:
         Comprehensive analytics report
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for report generation'
             )
         
-        results = AnalyticsUtils.generate_comprehensive_report(df, include_plots)
+        report_progress(0.2, "Project data loaded")
+        
+        results = await run_compute_step(0.2, 1.0, AnalyticsUtils.generate_comprehensive_report, df, include_plots)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -357,6 +414,7 @@ async def generate_comprehensive_report(
         return AnalyticsUtils.handle_analysis_error(e, "comprehensive report generation")
 
 @router.get("/project/{project_id}/explore-data")
+@conditional_responses.versioned
 async def explore_project_data(
     project_id: str,
     page: int = 1,
@@ -391,11 +449,9 @@ async def explore_project_data(
         page_size = min(200, max(1, page_size))
         offset = (page - 1) * page_size
         
-        from core.database import get_django_db_connection
         from django.db import connection
         
-        # Wrap database operations in sync_to_async
-        @sync_to_async
+        # Run database operations on the shared connection pool
         def explore_data_sync():
             # Normalize project_id for database query
             normalized_project_id = AnalyticsUtils.normalize_uuid(project_id)
@@ -522,7 +578,7 @@ async def explore_project_data(
             }
         
         # Execute the sync function
-        result = await explore_data_sync()
+        result = await run_db(explore_data_sync)
         
         return AnalyticsUtils.format_api_response('success', result)
         
@@ -530,6 +586,7 @@ async def explore_project_data(
         return AnalyticsUtils.handle_analysis_error(e, "data exploration")
 
 @router.get("/project/{project_id}/data-summary")
+@conditional_responses.versioned
 async def get_data_summary(
     project_id: str,
     db: Session = Depends(get_db)
@@ -545,11 +602,9 @@ async def get_data_summary(
         Data summary with counts, types, and sample records
     """
     try:
-        from core.database import get_django_db_connection
         from django.db import connection
         
-        # Wrap database operations in sync_to_async
-        @sync_to_async
+        # Run database operations on the shared connection pool
         def get_data_summary_sync():
             # Normalize project_id for database query
             normalized_project_id = AnalyticsUtils.normalize_uuid(project_id)
@@ -626,7 +681,7 @@ async def get_data_summary(
             }
         
         # Execute the sync function
-        result = await get_data_summary_sync()
+        result = await run_db(get_data_summary_sync)
         
         if result is None:
             # Return empty data structure instead of None
@@ -654,13 +709,17 @@ async def get_data_summary(
         return AnalyticsUtils.handle_analysis_error(e, "data summary")
 
 @router.post("/project/{project_id}/analyze/geospatial")
+@result_cache.cached
 async def analyze_geospatial_data(
     project_id: str,
     lat_column: str,
     lon_column: str,
     value_column: Optional[str] = None,
     max_distance_km: float = 10.0,
+    neighbors: Optional[int] = Query(None, ge=1),
     n_clusters: int = 5,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -672,14 +731,23 @@ async def analyze_geospatial_data(
         lon_column: Name of longitude column
         value_column: Optional value column for weighted analysis
         max_distance_km: Maximum distance for spatial autocorrelation
+        neighbors: Weight only the k nearest points within max_distance_km in
+            spatial autocorrelation (all points in range by default)
         n_clusters: Number of location clusters to create
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Geospatial analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(lat_column, lon_column, value_column)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -695,18 +763,18 @@ async def analyze_geospatial_data(
         results = {}
         
         # Spatial distribution analysis
-        results['spatial_distribution'] = analyze_spatial_distribution(
+        results['spatial_distribution'] = await run_compute(descriptive_analytics.analyze_spatial_distribution,
             df, lat_column, lon_column, value_column
         )
         
         # Spatial autocorrelation
         if value_column and value_column in df.columns:
-            results['spatial_autocorrelation'] = calculate_spatial_autocorrelation(
-                df, lat_column, lon_column, value_column, max_distance_km
+            results['spatial_autocorrelation'] = await run_compute(descriptive_analytics.calculate_spatial_autocorrelation,
+                df, lat_column, lon_column, value_column, max_distance_km, neighbors
             )
         
         # Location clustering
-        clustered_df = create_location_clusters(df, lat_column, lon_column, n_clusters)
+        clustered_df = await run_compute(descriptive_analytics.create_location_clusters, df, lat_column, lon_column, n_clusters)
         results['location_clusters'] = {
             'n_clusters': n_clusters,
             'cluster_summary': clustered_df['location_cluster'].value_counts().to_dict()
@@ -721,13 +789,77 @@ async def analyze_geospatial_data(
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "geospatial analysis")
 
+@router.get("/project/{project_id}/map/bins")
+@conditional_responses.versioned
+@cache_warmer.hot("map-bins")
+async def get_map_bins(
+    project_id: str,
+    south: float = -90.0,
+    west: float = -180.0,
+    north: float = 90.0,
+    east: float = 180.0,
+    zoom: int = 0,
+    value_column: Optional[str] = "numeric_value",
+    max_bins: int = MAX_MAP_BINS,
+    filters: Optional[ResponseFilter] = Depends(get_response_filter)
+) -> Dict[str, Any]:
+    """
+    Get response density and value bins for a map view.
+    
+    Bins come from the project's spatial index, which is built once from the
+    responses' location_data (or geo_data) and extended with new responses, so
+    the cost of a view depends on its size rather than the project's.
+    
+    Args:
+        project_id: Project identifier
+        south, west, north, east: Bounding box of the view in degrees (west
+            greater than east crosses the antimeridian)
+        zoom: Map zoom level; bins are up to 3 levels finer (8x8 per tile)
+        value_column: 'numeric_value' or 'data_quality_score' statistics per bin
+            (None for response counts only)
+        max_bins: Most bins the view may span; coarser bins are used above it
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when indexing the responses
+        
+    Returns:
+        Bins with bounds, centroid, response count and value statistics
+    """
+    try:
+        if not 0 <= zoom <= 24:
+            return AnalyticsUtils.format_api_response('error', None, 'zoom must be between 0 and 24')
+        if not 0 < max_bins <= MAX_MAP_BINS:
+            return AnalyticsUtils.format_api_response(
+                'error', None, f'max_bins must be between 1 and {MAX_MAP_BINS}'
+            )
+        
+        index = await project_spatial_indexes.get_index(project_id, filters=filters)
+        if index is None:
+            return AnalyticsUtils.format_api_response(
+                'error', None, 'No data available for analysis'
+            )
+        
+        results = index.query(south, west, north, east, zoom, value_column, max_bins)
+        return AnalyticsUtils.format_api_response('success', {
+            'project_id': project_id,
+            'analysis_type': 'map_bins',
+            'results': results
+        })
+        
+    except ValueError as e:
+        return AnalyticsUtils.format_api_response('error', None, str(e))
+    except Exception as e:
+        return AnalyticsUtils.handle_analysis_error(e, "map bins")
+
 @router.post("/project/{project_id}/analyze/temporal")
+@result_cache.cached
 async def analyze_temporal_data(
     project_id: str,
     date_column: str,
     value_columns: Optional[List[str]] = None,
     detect_seasonal: bool = True,
     seasonal_period: Optional[int] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -739,13 +871,20 @@ async def analyze_temporal_data(
         value_columns: List of value columns to analyze
         detect_seasonal: Whether to perform seasonality detection
         seasonal_period: Period for seasonality analysis (auto-detect if None)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Temporal analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(date_column, value_columns) if value_columns else None
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -761,7 +900,7 @@ async def analyze_temporal_data(
         results = {}
         
         # Temporal patterns analysis
-        results['temporal_patterns'] = analyze_temporal_patterns(
+        results['temporal_patterns'] = await run_compute(descriptive_analytics.analyze_temporal_patterns,
             df, date_column, value_columns
         )
         
@@ -776,13 +915,13 @@ async def analyze_temporal_data(
                 temp_df[date_column] = pd.to_datetime(temp_df[date_column])
                 temp_df = temp_df.set_index(date_column).sort_index()
                 
-                results[f'{col}_time_series'] = calculate_time_series_stats(
+                results[f'{col}_time_series'] = await run_compute(descriptive_analytics.calculate_time_series_stats,
                     temp_df[col], temp_df.index
                 )
                 
                 # Seasonality detection
                 if detect_seasonal:
-                    results[f'{col}_seasonality'] = detect_seasonality(
+                    results[f'{col}_seasonality'] = await run_compute(descriptive_analytics.detect_seasonality,
                         temp_df[col], temp_df.index, seasonal_period
                     )
         
@@ -796,11 +935,14 @@ async def analyze_temporal_data(
         return AnalyticsUtils.handle_analysis_error(e, "temporal analysis")
 
 @router.post("/project/{project_id}/analyze/cross-tabulation")
+@result_cache.cached
 async def analyze_cross_tabulation_data(
     project_id: str,
     var1: str,
     var2: str,
     normalize: Optional[str] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -811,13 +953,20 @@ async def analyze_cross_tabulation_data(
         var1: First categorical variable (rows)
         var2: Second categorical variable (columns)
         normalize: How to normalize ('index', 'columns', 'all', or None)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Cross-tabulation analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(var1, var2)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -831,7 +980,7 @@ async def analyze_cross_tabulation_data(
             )
         
         # Perform cross-tabulation analysis
-        results = analyze_cross_tabulation(df, var1, var2, normalize)
+        results = await run_compute(descriptive_analytics.analyze_cross_tabulation, df, var1, var2, normalize)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -845,10 +994,13 @@ async def analyze_cross_tabulation_data(
         return AnalyticsUtils.handle_analysis_error(e, "cross-tabulation analysis")
 
 @router.post("/project/{project_id}/analyze/normality")
+@result_cache.cached
 async def test_normality_data(
     project_id: str,
     variables: Optional[List[str]] = None,
     alpha: float = 0.05,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -858,13 +1010,20 @@ async def test_normality_data(
         project_id: Project identifier
         variables: List of variables to test (all numeric if None)
         alpha: Significance level for tests
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Normality test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -878,7 +1037,7 @@ async def test_normality_data(
         results = {}
         for var in variables:
             if var in df.columns and pd.api.types.is_numeric_dtype(df[var]):
-                results[var] = test_normality(df[var], alpha)
+                results[var] = await run_compute(descriptive_analytics.test_normality, df[var], alpha)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -891,10 +1050,13 @@ async def test_normality_data(
         return AnalyticsUtils.handle_analysis_error(e, "normality testing")
 
 @router.post("/project/{project_id}/analyze/distribution-fitting")
+@result_cache.cached
 async def fit_distributions_data(
     project_id: str,
     variables: Optional[List[str]] = None,
     distributions: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -904,13 +1066,20 @@ async def fit_distributions_data(
         project_id: Project identifier
         variables: List of variables to analyze (all numeric if None)
         distributions: List of distributions to fit
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Distribution fitting results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -924,7 +1093,7 @@ async def fit_distributions_data(
         results = {}
         for var in variables:
             if var in df.columns and pd.api.types.is_numeric_dtype(df[var]):
-                results[var] = fit_distribution(df[var], distributions)
+                results[var] = await run_compute(descriptive_analytics.fit_distribution, df[var], distributions)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -936,10 +1105,13 @@ async def fit_distributions_data(
         return AnalyticsUtils.handle_analysis_error(e, "distribution fitting")
 
 @router.post("/project/{project_id}/analyze/weighted-statistics")
+@result_cache.cached
 async def calculate_weighted_statistics(
     project_id: str,
     value_column: str,
     weight_column: str,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -949,13 +1121,20 @@ async def calculate_weighted_statistics(
         project_id: Project identifier
         value_column: Column containing values
         weight_column: Column containing weights
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Weighted statistics results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(value_column, weight_column)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -969,7 +1148,7 @@ async def calculate_weighted_statistics(
             )
         
         # Calculate weighted statistics
-        results = calculate_weighted_stats(df, value_column, weight_column)
+        results = await run_compute(descriptive_analytics.calculate_weighted_stats, df, value_column, weight_column)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -983,11 +1162,14 @@ async def calculate_weighted_statistics(
         return AnalyticsUtils.handle_analysis_error(e, "weighted statistics")
 
 @router.post("/project/{project_id}/analyze/grouped-statistics")
+@result_cache.cached
 async def calculate_grouped_statistics(
     project_id: str,
     group_by: Union[str, List[str]],
     target_columns: Optional[List[str]] = None,
     stats_functions: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -998,13 +1180,20 @@ async def calculate_grouped_statistics(
         group_by: Column(s) to group by
         target_columns: Columns to calculate statistics for
         stats_functions: List of statistics to calculate
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Grouped statistics results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(group_by, target_columns) if target_columns else None
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -1020,7 +1209,7 @@ async def calculate_grouped_statistics(
             )
         
         # Calculate grouped statistics
-        results = calculate_grouped_stats(df, group_by, target_columns, stats_functions)
+        results = await run_compute(descriptive_analytics.calculate_grouped_stats, df, group_by, target_columns, stats_functions)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -1033,10 +1222,13 @@ async def calculate_grouped_statistics(
         return AnalyticsUtils.handle_analysis_error(e, "grouped statistics")
 
 @router.post("/project/{project_id}/analyze/missing-patterns")
+@result_cache.cached
 async def analyze_missing_patterns(
     project_id: str,
     max_patterns: int = 20,
     group_column: Optional[str] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -1046,13 +1238,17 @@ async def analyze_missing_patterns(
         project_id: Project identifier
         max_patterns: Maximum number of patterns to return
         group_column: Optional column to group missing analysis by
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Missing data patterns analysis
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -1062,19 +1258,19 @@ async def analyze_missing_patterns(
         results = {}
         
         # Missing patterns
-        results['patterns'] = get_missing_patterns(df, max_patterns)
+        results['patterns'] = await run_compute(descriptive_analytics.get_missing_patterns, df, max_patterns)
         
         # Missing correlations
-        results['correlations'] = calculate_missing_correlations(df)
+        results['correlations'] = await run_compute(descriptive_analytics.calculate_missing_correlations, df)
         if hasattr(results['correlations'], 'to_dict'):
             results['correlations'] = results['correlations'].to_dict()
         
         # Heatmap data
-        results['heatmap_data'] = create_missing_data_heatmap(df)
+        results['heatmap_data'] = await run_compute(descriptive_analytics.create_missing_data_heatmap, df)
         
         # Grouped missing analysis
         if group_column and group_column in df.columns:
-            results['grouped_analysis'] = analyze_missing_by_group(df, group_column)
+            results['grouped_analysis'] = await run_compute(descriptive_analytics.analyze_missing_by_group, df, group_column)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -1086,9 +1282,12 @@ async def analyze_missing_patterns(
         return AnalyticsUtils.handle_analysis_error(e, "missing patterns analysis")
 
 @router.post("/project/{project_id}/analyze/diversity-metrics")
+@result_cache.cached
 async def calculate_diversity_metrics_data(
     project_id: str,
     variables: Optional[List[str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -1097,13 +1296,20 @@ async def calculate_diversity_metrics_data(
     Args:
         project_id: Project identifier
         variables: List of categorical variables (all categorical if None)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Diversity metrics results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -1118,7 +1324,7 @@ async def calculate_diversity_metrics_data(
         for var in variables:
             if var in df.columns:
                 value_counts = df[var].value_counts()
-                results[var] = calculate_diversity_metrics(value_counts)
+                results[var] = await run_compute(descriptive_analytics.calculate_diversity_metrics, value_counts)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -1130,10 +1336,13 @@ async def calculate_diversity_metrics_data(
         return AnalyticsUtils.handle_analysis_error(e, "diversity metrics calculation")
 
 @router.post("/project/{project_id}/analyze/categorical-associations")
+@result_cache.cached
 async def analyze_categorical_associations_data(
     project_id: str,
     variables: Optional[List[str]] = None,
     method: str = 'cramers_v',
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -1143,13 +1352,20 @@ async def analyze_categorical_associations_data(
         project_id: Project identifier
         variables: List of categorical variables
         method: Association measure ('cramers_v' or 'theil_u')
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Categorical associations results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -1157,7 +1373,7 @@ async def analyze_categorical_associations_data(
             )
         
         # Calculate associations
-        associations = analyze_categorical_associations(df, variables, method)
+        associations = await run_compute(descriptive_analytics.analyze_categorical_associations, df, variables, method)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -1170,8 +1386,10 @@ async def analyze_categorical_associations_data(
         return AnalyticsUtils.handle_analysis_error(e, "categorical associations analysis")
 
 @router.post("/project/{project_id}/generate-executive-summary")
+@conditional_responses.versioned
 async def generate_executive_summary_report(
     project_id: str,
+    data_mode: DataMode = "long",
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -1179,13 +1397,15 @@ async def generate_executive_summary_report(
     
     Args:
         project_id: Project identifier
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
         db: Database session
         
     Returns:
         Executive summary report
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -1193,7 +1413,7 @@ async def generate_executive_summary_report(
             )
         
         # Generate executive summary
-        results = generate_executive_summary(df)
+        results = await run_compute(descriptive_analytics.generate_executive_summary, df)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -1205,11 +1425,14 @@ async def generate_executive_summary_report(
         return AnalyticsUtils.handle_analysis_error(e, "executive summary generation")
 
 @router.post("/project/{project_id}/export-report")
+@conditional_responses.versioned
+@analysis_jobs.background
 async def export_analysis_report(
     project_id: str,
     format: str = 'json',
     analysis_type: str = 'comprehensive',
     include_metadata: bool = True,
+    data_mode: DataMode = "long",
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -1220,27 +1443,34 @@ async def export_analysis_report(
         format: Export format ('json', 'html', 'markdown')
         analysis_type: Type of analysis to export
         include_metadata: Include analysis metadata
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
         db: Database session
         
     Returns:
         Exported report in specified format
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
+        report_progress(0.2, "Project data loaded")
+        
         # Generate analysis results
         if analysis_type == 'executive':
-            analysis_results = generate_executive_summary(df)
+            analysis_results = await run_compute(descriptive_analytics.generate_executive_summary, df)
         else:
-            analysis_results = generate_full_report(df, project_name=f"Project {project_id}")
+            analysis_results = await run_compute_step(0.2, 0.8, descriptive_analytics.generate_full_report,
+                                                      df, project_name=f"Project {project_id}")
+        
+        report_progress(0.8, "Report generated")
         
         # Export in specified format
-        exported_content = export_statistics(analysis_results, format, include_metadata)
+        exported_content = await run_compute(descriptive_analytics.export_statistics, analysis_results, format, include_metadata)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -1378,6 +1608,7 @@ async def get_descriptive_endpoints() -> Dict[str, Any]:
                 
                 # Advanced Analysis Endpoints
                 'POST /project/{project_id}/analyze/geospatial': 'Run geospatial analysis with spatial distribution and clustering',
+                'GET /project/{project_id}/map/bins': 'Get response density and value bins for a map view',
                 'POST /project/{project_id}/analyze/temporal': 'Run temporal analysis with time series and seasonality detection',
                 'POST /project/{project_id}/analyze/cross-tabulation': 'Run cross-tabulation analysis between categorical variables',
                 'POST /project/{project_id}/analyze/normality': 'Run comprehensive normality tests on numeric variables',
@@ -1407,7 +1638,7 @@ async def get_descriptive_endpoints() -> Dict[str, Any]:
                     'missing-data', 'data-quality', 'descriptive'
                 ],
                 'advanced_analysis': [
-                    'geospatial', 'temporal', 'cross-tabulation', 'normality',
+                    'geospatial', 'map-bins', 'temporal', 'cross-tabulation', 'normality',
                     'distribution-fitting', 'weighted-statistics', 'grouped-statistics',
                     'missing-patterns', 'diversity-metrics', 'categorical-associations'
                 ],
@@ -1431,6 +1662,7 @@ async def get_descriptive_endpoints() -> Dict[str, Any]:
             },
             'optional_parameters': {
                 'geospatial': ['value_column', 'max_distance_km', 'n_clusters'],
+                'map_bins': ['south', 'west', 'north', 'east', 'zoom', 'value_column', 'max_bins'],
                 'temporal': ['value_columns', 'detect_seasonal', 'seasonal_period'],
                 'cross_tabulation': ['normalize'],
                 'normality': ['variables', 'alpha'],
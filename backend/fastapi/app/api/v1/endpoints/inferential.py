@@ -9,17 +9,26 @@ from typing import Dict, Any, List, Optional
 import pandas as pd
 from asgiref.sync import sync_to_async
 
-from core.database import get_db
-from app.utils.shared import AnalyticsUtils
+from core.database import get_db, ResponseFilter
+from app.utils.shared import AnalyticsUtils, DataMode
+from app.api.v1.dependencies.filters import get_response_filter
+from app.utils.result_cache import result_cache
+from app.utils.jobs import analysis_jobs, report_progress, run_compute_step
+from app.utils.compute import run_compute
+from app.utils.conditional import conditional_responses
+from app.utils.serialization import AnalyticsRoute
 
-router = APIRouter()
+router = APIRouter(route_class=AnalyticsRoute)
 
 @router.post("/project/{project_id}/analyze/correlation")
+@result_cache.cached
 async def analyze_correlations(
     project_id: str,
     variables: Optional[List[str]] = None,
     correlation_method: str = "pearson",
     significance_level: float = 0.05,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -30,20 +39,27 @@ async def analyze_correlations(
         variables: Optional list of variables to correlate
         correlation_method: Correlation method (pearson, spearman, kendall)
         significance_level: Significance level for hypothesis testing
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Correlation analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_correlation_analysis(
+        results = await run_compute(AnalyticsUtils.run_correlation_analysis,
             df, variables, correlation_method, significance_level
         )
         
@@ -59,6 +75,7 @@ async def analyze_correlations(
         return AnalyticsUtils.handle_analysis_error(e, "correlation analysis")
 
 @router.post("/project/{project_id}/analyze/t-test")
+@result_cache.cached
 async def analyze_t_test(
     project_id: str,
     dependent_variable: str,
@@ -66,6 +83,8 @@ async def analyze_t_test(
     test_type: str = "two_sample",
     alternative: str = "two_sided",
     confidence_level: float = 0.95,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -78,20 +97,27 @@ async def analyze_t_test(
         test_type: Type of t-test (one_sample, two_sample, paired)
         alternative: Alternative hypothesis (two_sided, less, greater)
         confidence_level: Confidence level for intervals
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         T-test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(dependent_variable, independent_variable)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_t_test(
+        results = await run_compute(AnalyticsUtils.run_t_test,
             df, dependent_variable, independent_variable, 
             test_type, alternative, confidence_level
         )
@@ -111,6 +137,7 @@ async def analyze_t_test(
         return AnalyticsUtils.handle_analysis_error(e, "t-test analysis")
 
 @router.post("/project/{project_id}/analyze/anova")
+@result_cache.cached
 async def analyze_anova(
     project_id: str,
     dependent_variable: str,
@@ -118,6 +145,8 @@ async def analyze_anova(
     anova_type: str = "one_way",
     post_hoc: bool = True,
     post_hoc_method: str = "tukey",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -130,20 +159,27 @@ async def analyze_anova(
         anova_type: Type of ANOVA (one_way, two_way, repeated_measures)
         post_hoc: Whether to run post-hoc tests
         post_hoc_method: Post-hoc test method (tukey, scheffe, bonferroni)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         ANOVA results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(dependent_variable, independent_variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_anova(
+        results = await run_compute(AnalyticsUtils.run_anova,
             df, dependent_variable, independent_variables,
             anova_type, post_hoc, post_hoc_method
         )
@@ -163,6 +199,7 @@ async def analyze_anova(
         return AnalyticsUtils.handle_analysis_error(e, "ANOVA analysis")
 
 @router.post("/project/{project_id}/analyze/regression")
+@result_cache.cached
 async def analyze_regression(
     project_id: str,
     dependent_variable: str,
@@ -170,6 +207,8 @@ async def analyze_regression(
     regression_type: str = "linear",
     include_diagnostics: bool = True,
     confidence_level: float = 0.95,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -182,20 +221,27 @@ async def analyze_regression(
         regression_type: Type of regression (linear, logistic, polynomial, ridge, lasso)
         include_diagnostics: Whether to include regression diagnostics
         confidence_level: Confidence level for coefficients
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Regression analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(dependent_variable, independent_variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_regression_analysis(
+        results = await run_compute(AnalyticsUtils.run_regression_analysis,
             df, dependent_variable, independent_variables,
             regression_type, include_diagnostics, confidence_level
         )
@@ -215,12 +261,15 @@ async def analyze_regression(
         return AnalyticsUtils.handle_analysis_error(e, "regression analysis")
 
 @router.post("/project/{project_id}/analyze/chi-square")
+@result_cache.cached
 async def analyze_chi_square(
     project_id: str,
     variable1: str,
     variable2: Optional[str] = None,
     test_type: str = "independence",
     expected_frequencies: Optional[List[float]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -232,20 +281,27 @@ async def analyze_chi_square(
         variable2: Second categorical variable (for independence test)
         test_type: Type of chi-square test (independence, goodness_of_fit)
         expected_frequencies: Expected frequencies (for goodness of fit test)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Chi-square test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variable1, variable2)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_chi_square_test(
+        results = await run_compute(AnalyticsUtils.run_chi_square_test,
             df, variable1, variable2, test_type, expected_frequencies
         )
         
@@ -262,6 +318,7 @@ async def analyze_chi_square(
         return AnalyticsUtils.handle_analysis_error(e, "chi-square test")
 
 @router.post("/project/{project_id}/analyze/hypothesis-test")
+@result_cache.cached
 async def analyze_hypothesis_test(
     project_id: str,
     test_type: str,
@@ -270,6 +327,8 @@ async def analyze_hypothesis_test(
     alternative_hypothesis: str,
     significance_level: float = 0.05,
     test_parameters: Optional[Dict[str, Any]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -283,20 +342,27 @@ async def analyze_hypothesis_test(
         alternative_hypothesis: Description of alternative hypothesis
         significance_level: Significance level
         test_parameters: Additional test-specific parameters
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Hypothesis test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_hypothesis_test(
+        results = await run_compute(AnalyticsUtils.run_hypothesis_test,
             df, test_type, variables, null_hypothesis,
             alternative_hypothesis, significance_level, test_parameters
         )
@@ -316,12 +382,16 @@ async def analyze_hypothesis_test(
         return AnalyticsUtils.handle_analysis_error(e, "hypothesis test")
 
 @router.post("/project/{project_id}/analyze/confidence-intervals")
+@analysis_jobs.background
+@result_cache.cached
 async def analyze_confidence_intervals(
     project_id: str,
     variables: List[str],
     confidence_level: float = 0.95,
     interval_type: str = "mean",
     bootstrap_samples: int = 1000,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -333,20 +403,29 @@ async def analyze_confidence_intervals(
         confidence_level: Confidence level
         interval_type: Type of interval (mean, median, proportion, variance)
         bootstrap_samples: Number of bootstrap samples for non-parametric intervals
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Confidence interval results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.calculate_confidence_intervals(
+        report_progress(0.2, "Project data loaded")
+        
+        results = await run_compute_step(0.2, 1.0, AnalyticsUtils.calculate_confidence_intervals,
             df, variables, confidence_level, interval_type, bootstrap_samples
         )
         
@@ -364,11 +443,14 @@ async def analyze_confidence_intervals(
         return AnalyticsUtils.handle_analysis_error(e, "confidence intervals")
 
 @router.post("/project/{project_id}/analyze/effect-size")
+@result_cache.cached
 async def analyze_effect_size(
     project_id: str,
     dependent_variable: str,
     independent_variable: str,
     effect_size_measure: str = "cohen_d",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -379,20 +461,27 @@ async def analyze_effect_size(
         dependent_variable: Dependent variable
         independent_variable: Independent variable
         effect_size_measure: Effect size measure (cohen_d, eta_squared, cramers_v, odds_ratio)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Effect size results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(dependent_variable, independent_variable)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.calculate_effect_size(
+        results = await run_compute(AnalyticsUtils.calculate_effect_size,
             df, dependent_variable, independent_variable, effect_size_measure
         )
         
@@ -409,6 +498,7 @@ async def analyze_effect_size(
         return AnalyticsUtils.handle_analysis_error(e, "effect size analysis")
 
 @router.post("/project/{project_id}/analyze/power-analysis")
+@result_cache.cached
 async def analyze_power(
     project_id: str,
     test_type: str,
@@ -416,6 +506,8 @@ async def analyze_power(
     sample_size: Optional[int] = None,
     power: Optional[float] = None,
     significance_level: float = 0.05,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -428,20 +520,24 @@ async def analyze_power(
         sample_size: Sample size (optional - can be calculated or specified)
         power: Statistical power (optional - can be calculated or specified)
         significance_level: Significance level
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Power analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_power_analysis(
+        results = await run_compute(AnalyticsUtils.run_power_analysis,
             df, test_type, effect_size, sample_size, power, significance_level
         )
         
@@ -460,12 +556,15 @@ async def analyze_power(
         return AnalyticsUtils.handle_analysis_error(e, "power analysis")
 
 @router.post("/project/{project_id}/analyze/nonparametric")
+@result_cache.cached
 async def analyze_nonparametric(
     project_id: str,
     test_type: str,
     variables: List[str],
     groups: Optional[str] = None,
     alternative: str = "two_sided",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -477,20 +576,27 @@ async def analyze_nonparametric(
         variables: Variables for testing
         groups: Grouping variable (if applicable)
         alternative: Alternative hypothesis direction
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Non-parametric test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variables, groups)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_nonparametric_test(
+        results = await run_compute(AnalyticsUtils.run_nonparametric_test,
             df, test_type, variables, groups, alternative
         )
         
@@ -508,6 +614,8 @@ async def analyze_nonparametric(
         return AnalyticsUtils.handle_analysis_error(e, "non-parametric test")
 
 @router.post("/project/{project_id}/analyze/bayesian-t-test")
+@analysis_jobs.background
+@result_cache.cached
 async def analyze_bayesian_t_test(
     project_id: str,
     variable1: str,
@@ -515,6 +623,8 @@ async def analyze_bayesian_t_test(
     prior_mean: float = 0,
     prior_variance: float = 1,
     credible_level: float = 0.95,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -527,20 +637,29 @@ async def analyze_bayesian_t_test(
         prior_mean: Prior mean for effect size
         prior_variance: Prior variance for effect size
         credible_level: Credible interval level
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Bayesian t-test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variable1, variable2)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_bayesian_t_test(
+        report_progress(0.2, "Project data loaded")
+        
+        results = await run_compute(AnalyticsUtils.run_bayesian_t_test,
             df, variable1, variable2, prior_mean, prior_variance, credible_level
         )
         
@@ -559,6 +678,7 @@ async def analyze_bayesian_t_test(
         return AnalyticsUtils.handle_analysis_error(e, "Bayesian t-test")
 
 @router.post("/project/{project_id}/analyze/bayesian-proportion-test")
+@result_cache.cached
 async def analyze_bayesian_proportion_test(
     project_id: str,
     group_variable: str,
@@ -566,6 +686,8 @@ async def analyze_bayesian_proportion_test(
     prior_alpha: float = 1,
     prior_beta: float = 1,
     credible_level: float = 0.95,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -578,20 +700,27 @@ async def analyze_bayesian_proportion_test(
         prior_alpha: Beta prior alpha parameter
         prior_beta: Beta prior beta parameter
         credible_level: Credible interval level
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Bayesian proportion test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(group_variable, success_variable)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_bayesian_proportion_test(
+        results = await run_compute(AnalyticsUtils.run_bayesian_proportion_test,
             df, group_variable, success_variable, prior_alpha, prior_beta, credible_level
         )
         
@@ -610,6 +739,7 @@ async def analyze_bayesian_proportion_test(
         return AnalyticsUtils.handle_analysis_error(e, "Bayesian proportion test")
 
 @router.post("/project/{project_id}/analyze/multiple-comparisons")
+@conditional_responses.versioned
 async def analyze_multiple_comparisons(
     project_id: str,
     p_values: List[float],
@@ -634,7 +764,7 @@ async def analyze_multiple_comparisons(
         if not correction_methods:
             correction_methods = ['bonferroni', 'holm', 'benjamini_hochberg']
         
-        results = AnalyticsUtils.run_multiple_comparisons_correction(
+        results = await run_compute(AnalyticsUtils.run_multiple_comparisons_correction,
             p_values, alpha, correction_methods
         )
         
@@ -651,12 +781,16 @@ async def analyze_multiple_comparisons(
         return AnalyticsUtils.handle_analysis_error(e, "multiple comparisons correction")
 
 @router.post("/project/{project_id}/analyze/post-hoc-tests")
+@analysis_jobs.background
+@result_cache.cached
 async def analyze_post_hoc_tests(
     project_id: str,
     group_variable: str,
     dependent_variable: str,
     test_type: str = "tukey",
     alpha: float = 0.05,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -668,20 +802,29 @@ async def analyze_post_hoc_tests(
         dependent_variable: Dependent variable
         test_type: Type of post-hoc test (tukey, games_howell, dunnett)
         alpha: Significance level
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Post-hoc test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(group_variable, dependent_variable)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_post_hoc_tests(
+        report_progress(0.2, "Project data loaded")
+        
+        results = await run_compute(AnalyticsUtils.run_post_hoc_tests,
             df, group_variable, dependent_variable, test_type, alpha
         )
         
@@ -699,11 +842,14 @@ async def analyze_post_hoc_tests(
         return AnalyticsUtils.handle_analysis_error(e, "post-hoc tests")
 
 @router.post("/project/{project_id}/analyze/time-series/stationarity")
+@result_cache.cached
 async def analyze_stationarity(
     project_id: str,
     variable: str,
     test_types: List[str] = None,
     alpha: float = 0.05,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -714,13 +860,20 @@ async def analyze_stationarity(
         variable: Time series variable to test
         test_types: Types of stationarity tests (adf, kpss, pp)
         alpha: Significance level
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Stationarity test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(variable)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -730,7 +883,7 @@ async def analyze_stationarity(
         if test_types is None:
             test_types = ['adf', 'kpss']
         
-        results = AnalyticsUtils.run_stationarity_test(
+        results = await run_compute(AnalyticsUtils.run_stationarity_test,
             df, variable, test_types, alpha
         )
         
@@ -747,12 +900,15 @@ async def analyze_stationarity(
         return AnalyticsUtils.handle_analysis_error(e, "stationarity test")
 
 @router.post("/project/{project_id}/analyze/time-series/granger-causality")
+@result_cache.cached
 async def analyze_granger_causality(
     project_id: str,
     cause_variable: str,
     effect_variable: str,
     max_lag: int = 10,
     alpha: float = 0.05,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -764,20 +920,27 @@ async def analyze_granger_causality(
         effect_variable: Effect variable
         max_lag: Maximum lag to test
         alpha: Significance level
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Granger causality test results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(cause_variable, effect_variable)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
-        results = AnalyticsUtils.run_granger_causality_test(
+        results = await run_compute(AnalyticsUtils.run_granger_causality_test,
             df, cause_variable, effect_variable, max_lag, alpha
         )
         
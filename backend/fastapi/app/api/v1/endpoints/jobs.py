@@ -0,0 +1,68 @@
+"""
+Background Analysis Job Endpoints
+Status, partial results and cancellation for analyses submitted with ?background=true.
+"""
+
+from fastapi import APIRouter, HTTPException
+from typing import Dict, Any, Optional
+
+from app.utils.shared import AnalyticsUtils
+from app.utils.jobs import analysis_jobs
+from app.utils.serialization import AnalyticsRoute
+
+router = APIRouter(route_class=AnalyticsRoute)
+
+@router.get("")
+async def list_jobs(project_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    List background jobs held in memory, newest first.
+
+    Args:
+        project_id: Only list jobs for this project
+
+    Returns:
+        Job status summaries (without results) and worker counters
+    """
+    jobs = analysis_jobs.list_jobs(project_id)
+    return AnalyticsUtils.format_api_response('success', {
+        'jobs': [job.to_dict(include_result=False) for job in jobs],
+        'workers': analysis_jobs.stats()
+    })
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, include_partial: bool = False,
+                  include_result: bool = True) -> Dict[str, Any]:
+    """
+    Get the status, progress and results of a background job.
+
+    Args:
+        job_id: Job identifier returned on submission
+        include_partial: Include partial results reported so far
+        include_result: Include the final results once the job has completed
+
+    Returns:
+        Job status
+    """
+    info = await analysis_jobs.get_info(job_id, include_partial, include_result)
+    if info is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return AnalyticsUtils.format_api_response('success', info)
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a background job.
+
+    A queued job is cancelled immediately; a running job stops at its next
+    progress checkpoint.
+
+    Args:
+        job_id: Job identifier returned on submission
+
+    Returns:
+        Job status after the cancellation request
+    """
+    job = await analysis_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or no longer running")
+    return AnalyticsUtils.format_api_response('success', job.to_dict(include_result=False))
@@ -5,21 +5,32 @@ Handles text analysis, sentiment analysis, thematic analysis, and qualitative re
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from collections import Counter
 import pandas as pd
 from asgiref.sync import sync_to_async
 import numpy as np
 
-from core.database import get_db
-from app.utils.shared import AnalyticsUtils
+from core.config import settings
+from core.database import get_db, ResponseFilter
+from app.utils.shared import AnalyticsUtils, DataMode
+from app.api.v1.dependencies.filters import get_response_filter
+from app.utils.result_cache import result_cache
+from app.utils.jobs import analysis_jobs, report_progress, run_compute_step
+from app.utils.compute import run_compute
+from app.utils.streaming import chunk_ranges, ndjson_response
+from app.utils.serialization import AnalyticsRoute
 
-router = APIRouter()
+router = APIRouter(route_class=AnalyticsRoute)
 
 @router.post("/project/{project_id}/analyze/text")
+@result_cache.cached
 async def analyze_text_data(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     analysis_type: str = "comprehensive",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -29,13 +40,20 @@ async def analyze_text_data(
         project_id: Project identifier
         text_fields: Optional list of text fields to analyze
         analysis_type: Type of text analysis (basic, comprehensive, sentiment, themes)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Text analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -43,7 +61,7 @@ async def analyze_text_data(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -53,7 +71,7 @@ async def analyze_text_data(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_basic_text_analysis(df, text_fields)
+        results = await run_compute(AnalyticsUtils.run_basic_text_analysis, df, text_fields)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -65,11 +83,96 @@ async def analyze_text_data(
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "text analysis")
 
+def _sentiment_chunk(texts: List[str], offset: int) -> List[Dict[str, Any]]:
+    """Sentiment scores for a chunk of texts, indexed from `offset` within their field."""
+    from app.analytics.qualitative.sentiment import analyze_sentiment_batch
+    
+    sentiments = analyze_sentiment_batch(texts)
+    for sentiment in sentiments:
+        sentiment['index'] += offset
+    return sentiments
+
+async def _stream_sentiment(project_id: str, df: pd.DataFrame, text_fields: List[str],
+                            sentiment_method: str):
+    """Sentiment records: scores per text as computed, then per-field and overall statistics."""
+    series_by_field = {field: df[field].dropna() for field in text_fields if field in df.columns}
+    yield {
+        'type': 'summary',
+        'project_id': project_id,
+        'analysis_type': 'sentiment_analysis',
+        'text_fields_analyzed': text_fields,
+        'sentiment_method': sentiment_method,
+        'total_texts': {field: len(series) for field, series in series_by_field.items()}
+    }
+    
+    overall_categories = Counter()
+    overall_polarity = 0.0
+    for field, series in series_by_field.items():
+        if series.empty:
+            continue
+        # Running sums, so memory does not grow with the number of texts
+        n = 0
+        polarity_sum = polarity_sq = subjectivity_sum = subjectivity_sq = 0.0
+        categories = Counter()
+        most_positive = most_negative = None
+        
+        for start, stop in chunk_ranges(len(series)):
+            texts = series.iloc[start:stop].astype(str).tolist()
+            sentiments = await run_compute(_sentiment_chunk, texts, start)
+            for text, sentiment in zip(texts, sentiments):
+                polarity, subjectivity = sentiment['polarity'], sentiment['subjectivity']
+                n += 1
+                polarity_sum += polarity
+                polarity_sq += polarity * polarity
+                subjectivity_sum += subjectivity
+                subjectivity_sq += subjectivity * subjectivity
+                categories[sentiment['category']] += 1
+                if most_positive is None or polarity > most_positive[0]:
+                    most_positive = (polarity, text)
+                if most_negative is None or polarity < most_negative[0]:
+                    most_negative = (polarity, text)
+                yield {'type': 'item', 'field': field, **sentiment}
+        
+        mean_polarity = polarity_sum / n
+        mean_subjectivity = subjectivity_sum / n
+        yield {
+            'type': 'field_summary',
+            'field': field,
+            'statistics': {
+                'mean_polarity': mean_polarity,
+                'std_polarity': max(polarity_sq / n - mean_polarity ** 2, 0.0) ** 0.5,
+                'mean_subjectivity': mean_subjectivity,
+                'std_subjectivity': max(subjectivity_sq / n - mean_subjectivity ** 2, 0.0) ** 0.5,
+                'total_responses': n
+            },
+            'category_distribution': dict(categories),
+            'most_positive': most_positive[1],
+            'most_negative': most_negative[1]
+        }
+        overall_categories.update(categories)
+        overall_polarity += polarity_sum
+    
+    total = sum(overall_categories.values())
+    if total:
+        yield {
+            'type': 'complete',
+            'overall_sentiment': overall_polarity / total,
+            'sentiment_distribution': dict(overall_categories),
+            'total_texts_analyzed': total,
+            'method_used': sentiment_method
+        }
+    else:
+        yield {'type': 'complete', 'error': 'No valid sentiments calculated'}
+
 @router.post("/project/{project_id}/analyze/sentiment")
+@result_cache.cached
 async def analyze_sentiment(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     sentiment_method: str = "vader",
+    stream: bool = False,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -79,13 +182,22 @@ async def analyze_sentiment(
         project_id: Project identifier
         text_fields: Optional list of text fields to analyze
         sentiment_method: Sentiment analysis method (vader, textblob)
+        stream: Stream NDJSON records (summary, one per text, per-field and overall
+            statistics) as they are computed instead of one JSON document
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Sentiment analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -93,7 +205,7 @@ async def analyze_sentiment(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -103,7 +215,12 @@ async def analyze_sentiment(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_sentiment_analysis(df, text_fields, sentiment_method)
+        if stream:
+            return ndjson_response(
+                _stream_sentiment(project_id, df, text_fields, sentiment_method), "sentiment analysis"
+            )
+        
+        results = await run_compute(AnalyticsUtils.run_sentiment_analysis, df, text_fields, sentiment_method)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -117,11 +234,15 @@ async def analyze_sentiment(
         return AnalyticsUtils.handle_analysis_error(e, "sentiment analysis")
 
 @router.post("/project/{project_id}/analyze/themes")
+@analysis_jobs.background
+@result_cache.cached
 async def analyze_themes(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     num_themes: int = 5,
     theme_method: str = "lda",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -132,21 +253,30 @@ async def analyze_themes(
         text_fields: Optional list of text fields to analyze
         num_themes: Number of themes to extract
         theme_method: Thematic analysis method (lda, nmf, clustering)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Thematic analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
+        report_progress(0.2, "Project data loaded")
+        
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -156,7 +286,7 @@ async def analyze_themes(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_theme_analysis(df, text_fields, num_themes, theme_method)
+        results = await run_compute_step(0.2, 1.0, AnalyticsUtils.run_theme_analysis, df, text_fields, num_themes, theme_method)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -171,12 +301,15 @@ async def analyze_themes(
         return AnalyticsUtils.handle_analysis_error(e, "theme analysis")
 
 @router.post("/project/{project_id}/analyze/word-frequency")
+@result_cache.cached
 async def analyze_word_frequency(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     top_n: int = 50,
     min_word_length: int = 3,
     remove_stopwords: bool = True,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -188,13 +321,20 @@ async def analyze_word_frequency(
         top_n: Number of top words to return
         min_word_length: Minimum word length to include
         remove_stopwords: Whether to remove common stopwords
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Word frequency analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -202,7 +342,7 @@ async def analyze_word_frequency(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -212,7 +352,7 @@ async def analyze_word_frequency(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_word_frequency_analysis(
+        results = await run_compute(AnalyticsUtils.run_word_frequency_analysis,
             df, text_fields, top_n, min_word_length, remove_stopwords
         )
         
@@ -232,11 +372,14 @@ async def analyze_word_frequency(
         return AnalyticsUtils.handle_analysis_error(e, "word frequency analysis")
 
 @router.post("/project/{project_id}/analyze/content-analysis")
+@result_cache.cached
 async def analyze_content(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     analysis_framework: str = "inductive",
     coding_scheme: Optional[Dict[str, List[str]]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -247,13 +390,20 @@ async def analyze_content(
         text_fields: Optional list of text fields to analyze
         analysis_framework: Content analysis framework (inductive, deductive, mixed)
         coding_scheme: Optional predefined coding scheme for deductive analysis
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Content analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -261,7 +411,7 @@ async def analyze_content(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -271,7 +421,7 @@ async def analyze_content(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_content_analysis(
+        results = await run_compute(AnalyticsUtils.run_content_analysis,
             df, text_fields, analysis_framework, coding_scheme
         )
         
@@ -288,11 +438,14 @@ async def analyze_content(
         return AnalyticsUtils.handle_analysis_error(e, "content analysis")
 
 @router.post("/project/{project_id}/analyze/qualitative-coding") 
+@result_cache.cached
 async def analyze_qualitative_coding(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     coding_method: str = "open",
     auto_code: bool = True,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -303,13 +456,20 @@ async def analyze_qualitative_coding(
         text_fields: Optional list of text fields to analyze
         coding_method: Coding method (open, axial, selective)
         auto_code: Whether to use automated coding assistance
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Qualitative coding results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -317,7 +477,7 @@ async def analyze_qualitative_coding(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -327,7 +487,7 @@ async def analyze_qualitative_coding(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_qualitative_coding(
+        results = await run_compute(AnalyticsUtils.run_qualitative_coding,
             df, text_fields, coding_method, auto_code
         )
         
@@ -344,10 +504,13 @@ async def analyze_qualitative_coding(
         return AnalyticsUtils.handle_analysis_error(e, "qualitative coding analysis")
 
 @router.post("/project/{project_id}/analyze/survey")
+@result_cache.cached
 async def analyze_survey_responses(
     project_id: str,
     response_fields: Optional[List[str]] = None,
     question_metadata: Optional[Dict[str, str]] = None,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -357,13 +520,20 @@ async def analyze_survey_responses(
         project_id: Project identifier
         response_fields: Optional list of response fields to analyze
         question_metadata: Optional question descriptions/metadata
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Survey analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(response_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -371,7 +541,7 @@ async def analyze_survey_responses(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not response_fields:
             response_fields = characteristics.get('text_variables', [])
@@ -381,7 +551,7 @@ async def analyze_survey_responses(
                 'error', None, 'No response fields found in the data'
             )
         
-        results = AnalyticsUtils.run_survey_analysis(df, response_fields, question_metadata)
+        results = await run_compute(AnalyticsUtils.run_survey_analysis, df, response_fields, question_metadata)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -395,10 +565,13 @@ async def analyze_survey_responses(
         return AnalyticsUtils.handle_analysis_error(e, "survey analysis")
 
 @router.post("/project/{project_id}/analyze/qualitative-statistics")
+@result_cache.cached
 async def analyze_qualitative_statistics(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     analysis_type: str = "general",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -408,13 +581,20 @@ async def analyze_qualitative_statistics(
         project_id: Project identifier
         text_fields: Optional list of text fields to analyze
         analysis_type: Type of analysis ("survey", "interview", "general")
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Comprehensive qualitative statistics
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -422,7 +602,7 @@ async def analyze_qualitative_statistics(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -432,7 +612,7 @@ async def analyze_qualitative_statistics(
                 'error', None, 'No text variables found in the data'
             )
         
-        results = AnalyticsUtils.run_qualitative_statistics(df, text_fields, analysis_type)
+        results = await run_compute(AnalyticsUtils.run_qualitative_statistics, df, text_fields, analysis_type)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -445,13 +625,38 @@ async def analyze_qualitative_statistics(
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "qualitative statistics analysis")
 
+def _sentiment_trend_results(df: pd.DataFrame, text_fields: List[str], time_field: Optional[str],
+                             category_field: Optional[str]) -> Dict[str, Any]:
+    """Sentiment trends per text field over time (and category, when given)."""
+    trend_results = {}
+    if time_field and time_field in df.columns:
+        try:
+            from app.analytics.qualitative.sentiment import analyze_sentiment_trends
+            
+            for field in text_fields:
+                if field in df.columns:
+                    texts = df[field].dropna().astype(str).tolist()
+                    timestamps = df[time_field].dropna().astype(str).tolist()
+                    categories = df[category_field].tolist() if category_field and category_field in df.columns else None
+                    
+                    if len(texts) == len(timestamps):
+                        trend_analysis = analyze_sentiment_trends(texts, timestamps, categories)
+                        trend_results[field] = trend_analysis
+                    
+        except Exception as trend_error:
+            trend_results['error'] = f'Trend analysis failed: {str(trend_error)}'
+    return trend_results
+
 @router.post("/project/{project_id}/analyze/sentiment-trends")
+@result_cache.cached
 async def analyze_sentiment_trends(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     time_field: Optional[str] = None,
     category_field: Optional[str] = None,
     sentiment_method: str = "vader",
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -463,13 +668,20 @@ async def analyze_sentiment_trends(
         time_field: Optional timestamp field for trend analysis
         category_field: Optional category field for grouped analysis
         sentiment_method: Sentiment analysis method (vader, textblob)
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Sentiment trend analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields, time_field, category_field) if text_fields else None
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -477,7 +689,7 @@ async def analyze_sentiment_trends(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -488,26 +700,10 @@ async def analyze_sentiment_trends(
             )
         
         # First run basic sentiment analysis
-        sentiment_results = AnalyticsUtils.run_sentiment_analysis(df, text_fields, sentiment_method)
+        sentiment_results = await run_compute(AnalyticsUtils.run_sentiment_analysis, df, text_fields, sentiment_method)
         
         # Then perform trend analysis if time field is available
-        trend_results = {}
-        if time_field and time_field in df.columns:
-            try:
-                from app.analytics.qualitative.sentiment import analyze_sentiment_trends
-                
-                for field in text_fields:
-                    if field in df.columns:
-                        texts = df[field].dropna().astype(str).tolist()
-                        timestamps = df[time_field].dropna().astype(str).tolist()
-                        categories = df[category_field].tolist() if category_field and category_field in df.columns else None
-                        
-                        if len(texts) == len(timestamps):
-                            trend_analysis = analyze_sentiment_trends(texts, timestamps, categories)
-                            trend_results[field] = trend_analysis
-                        
-            except Exception as trend_error:
-                trend_results['error'] = f'Trend analysis failed: {str(trend_error)}'
+        trend_results = await run_compute(_sentiment_trend_results, df, text_fields, time_field, category_field)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -523,12 +719,132 @@ async def analyze_sentiment_trends(
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "sentiment trends analysis")
 
+def _similar_pairs(texts: List[str], start: Tuple[int, int], limit: int,
+                   similarity_threshold: float) -> Tuple[List[Dict[str, Any]], Tuple[int, int], int]:
+    """
+    Compare text pairs in order, starting from pair `start`, for up to `limit` comparisons.
+    
+    Returns:
+        (pairs at or above the threshold, next pair to compare, comparisons made) tuple
+    """
+    from app.analytics.qualitative.text_analysis import analyze_text_similarity
+    
+    i, j = start
+    similarities = []
+    comparisons_made = 0
+    while i < len(texts) - 1 and comparisons_made < limit:
+        if j >= len(texts):
+            i, j = i + 1, i + 2
+            continue
+        
+        similarity = analyze_text_similarity(texts[i], texts[j])
+        if similarity >= similarity_threshold:
+            similarities.append({
+                'text1_index': i,
+                'text2_index': j,
+                'text1_preview': texts[i][:100] + "..." if len(texts[i]) > 100 else texts[i],
+                'text2_preview': texts[j][:100] + "..." if len(texts[j]) > 100 else texts[j],
+                'similarity_score': float(similarity)
+            })
+        comparisons_made += 1
+        j += 1
+    return similarities, (i, j), comparisons_made
+
+def _text_similarity_results(df: pd.DataFrame, text_fields: List[str], similarity_threshold: float,
+                             max_comparisons: int) -> Dict[str, Any]:
+    """Pairwise similarity of the responses in each text field."""
+    similarity_results = {}
+    
+    try:
+        for field in text_fields:
+            if field in df.columns:
+                texts = df[field].dropna().astype(str).tolist()
+                
+                if len(texts) >= 2:
+                    similarities, _, comparisons_made = _similar_pairs(
+                        texts, (0, 1), max_comparisons, similarity_threshold
+                    )
+                    
+                    # Sort by similarity score
+                    similarities.sort(key=lambda x: x['similarity_score'], reverse=True)
+                    
+                    similarity_results[field] = {
+                        'total_texts': len(texts),
+                        'comparisons_made': comparisons_made,
+                        'similarities_found': len(similarities),
+                        'similar_pairs': similarities[:20],  # Top 20 most similar pairs
+                        'average_similarity': float(np.mean([s['similarity_score'] for s in similarities])) if similarities else 0.0
+                    }
+                else:
+                    similarity_results[field] = {
+                        'error': f'Need at least 2 texts for similarity analysis, found {len(texts)}'
+                    }
+                    
+    except Exception as similarity_error:
+        similarity_results['error'] = f'Similarity analysis failed: {str(similarity_error)}'
+    return similarity_results
+
+async def _stream_text_similarity(project_id: str, df: pd.DataFrame, text_fields: List[str],
+                                  similarity_threshold: float, max_comparisons: int):
+    """Similarity records: every pair at or above the threshold as found, then per-field counts."""
+    yield {
+        'type': 'summary',
+        'project_id': project_id,
+        'analysis_type': 'text_similarity',
+        'text_fields_analyzed': text_fields,
+        'parameters': {
+            'similarity_threshold': similarity_threshold,
+            'max_comparisons': max_comparisons
+        }
+    }
+    
+    for field in text_fields:
+        if field not in df.columns:
+            continue
+        texts = df[field].dropna().astype(str).tolist()
+        if len(texts) < 2:
+            yield {
+                'type': 'field_summary',
+                'field': field,
+                'error': f'Need at least 2 texts for similarity analysis, found {len(texts)}'
+            }
+            continue
+        
+        cursor, comparisons_made, found, score_sum = (0, 1), 0, 0, 0.0
+        while comparisons_made < max_comparisons:
+            limit = min(settings.STREAM_CHUNK_SIZE, max_comparisons - comparisons_made)
+            similarities, cursor, made = await run_compute(
+                _similar_pairs, texts, cursor, limit, similarity_threshold
+            )
+            if made == 0:
+                break
+            comparisons_made += made
+            found += len(similarities)
+            for similarity in similarities:
+                score_sum += similarity['similarity_score']
+                yield {'type': 'item', 'field': field, **similarity}
+        
+        yield {
+            'type': 'field_summary',
+            'field': field,
+            'total_texts': len(texts),
+            'comparisons_made': comparisons_made,
+            'similarities_found': found,
+            'average_similarity': score_sum / found if found else 0.0
+        }
+    
+    yield {'type': 'complete'}
+
 @router.post("/project/{project_id}/analyze/text-similarity")
+@result_cache.cached
 async def analyze_text_similarity(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     similarity_threshold: float = 0.5,
     max_comparisons: int = 100,
+    stream: bool = False,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -539,13 +855,22 @@ async def analyze_text_similarity(
         text_fields: Optional list of text fields to analyze
         similarity_threshold: Minimum similarity score to report
         max_comparisons: Maximum number of comparisons to perform
+        stream: Stream NDJSON records (summary, every similar pair as found, per-field
+            counts) instead of one JSON document with the top pairs
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Text similarity analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -553,7 +878,7 @@ async def analyze_text_similarity(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -563,56 +888,14 @@ async def analyze_text_similarity(
                 'error', None, 'No text variables found in the data'
             )
         
-        # Perform similarity analysis
-        similarity_results = {}
+        if stream:
+            return ndjson_response(
+                _stream_text_similarity(project_id, df, text_fields, similarity_threshold, max_comparisons),
+                "text similarity analysis"
+            )
         
-        try:
-            from app.analytics.qualitative.text_analysis import analyze_text_similarity
-            
-            for field in text_fields:
-                if field in df.columns:
-                    texts = df[field].dropna().astype(str).tolist()
-                    
-                    if len(texts) >= 2:
-                        similarities = []
-                        comparisons_made = 0
-                        
-                        for i in range(len(texts)):
-                            for j in range(i + 1, len(texts)):
-                                if comparisons_made >= max_comparisons:
-                                    break
-                                    
-                                similarity = analyze_text_similarity(texts[i], texts[j])
-                                if similarity >= similarity_threshold:
-                                    similarities.append({
-                                        'text1_index': i,
-                                        'text2_index': j,
-                                        'text1_preview': texts[i][:100] + "..." if len(texts[i]) > 100 else texts[i],
-                                        'text2_preview': texts[j][:100] + "..." if len(texts[j]) > 100 else texts[j],
-                                        'similarity_score': float(similarity)
-                                    })
-                                comparisons_made += 1
-                            
-                            if comparisons_made >= max_comparisons:
-                                break
-                        
-                        # Sort by similarity score
-                        similarities.sort(key=lambda x: x['similarity_score'], reverse=True)
-                        
-                        similarity_results[field] = {
-                            'total_texts': len(texts),
-                            'comparisons_made': comparisons_made,
-                            'similarities_found': len(similarities),
-                            'similar_pairs': similarities[:20],  # Top 20 most similar pairs
-                            'average_similarity': float(np.mean([s['similarity_score'] for s in similarities])) if similarities else 0.0
-                        }
-                    else:
-                        similarity_results[field] = {
-                            'error': f'Need at least 2 texts for similarity analysis, found {len(texts)}'
-                        }
-                        
-        except Exception as similarity_error:
-            similarity_results['error'] = f'Similarity analysis failed: {str(similarity_error)}'
+        # Perform similarity analysis
+        similarity_results = await run_compute(_text_similarity_results, df, text_fields, similarity_threshold, max_comparisons)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -628,12 +911,51 @@ async def analyze_text_similarity(
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "text similarity analysis")
 
+def _theme_evolution_results(df: pd.DataFrame, text_fields: List[str], time_field: str,
+                             num_themes: int, progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+    """Theme evolution over time per text field, reporting progress per period and field."""
+    evolution_results = {}
+    progress = progress or (lambda *args, **kwargs: None)
+    
+    try:
+        from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
+        
+        analyzer = ThematicAnalyzer()
+        
+        for i, field in enumerate(text_fields):
+            if field in df.columns:
+                # Get texts and timestamps, ensuring they align
+                valid_indices = df[field].notna() & df[time_field].notna()
+                texts = df.loc[valid_indices, field].astype(str).tolist()
+                timestamps = df.loc[valid_indices, time_field].astype(str).tolist()
+                
+                if len(texts) >= 10:  # Need sufficient data for evolution analysis
+                    evolution = analyzer.analyze_theme_evolution(
+                        texts, timestamps, num_themes,
+                        progress=lambda fraction, message: progress((i + fraction) / len(text_fields), f"{field}: {message}")
+                    )
+                    evolution_results[field] = evolution
+                else:
+                    evolution_results[field] = {
+                        'error': f'Need at least 10 timestamped texts for evolution analysis, found {len(texts)}'
+                    }
+                progress((i + 1) / len(text_fields), f"Theme evolution of {field} complete",
+                         {field: evolution_results[field]})
+                    
+    except Exception as evolution_error:
+        evolution_results['error'] = f'Theme evolution analysis failed: {str(evolution_error)}'
+    return evolution_results
+
 @router.post("/project/{project_id}/analyze/theme-evolution")
+@analysis_jobs.background
+@result_cache.cached
 async def analyze_theme_evolution(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     time_field: Optional[str] = None,
     num_themes: int = 5,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -644,21 +966,30 @@ async def analyze_theme_evolution(
         text_fields: Optional list of text fields to analyze
         time_field: Timestamp field for evolution analysis
         num_themes: Number of themes to track
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Theme evolution analysis results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields, time_field) if text_fields and time_field else None
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
                 'error', None, 'No data available for analysis'
             )
         
+        report_progress(0.2, "Project data loaded")
+        
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -680,30 +1011,7 @@ async def analyze_theme_evolution(
             )
         
         # Perform theme evolution analysis
-        evolution_results = {}
-        
-        try:
-            from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
-            
-            analyzer = ThematicAnalyzer()
-            
-            for field in text_fields:
-                if field in df.columns:
-                    # Get texts and timestamps, ensuring they align
-                    valid_indices = df[field].notna() & df[time_field].notna()
-                    texts = df.loc[valid_indices, field].astype(str).tolist()
-                    timestamps = df.loc[valid_indices, time_field].astype(str).tolist()
-                    
-                    if len(texts) >= 10:  # Need sufficient data for evolution analysis
-                        evolution = analyzer.analyze_theme_evolution(texts, timestamps, num_themes)
-                        evolution_results[field] = evolution
-                    else:
-                        evolution_results[field] = {
-                            'error': f'Need at least 10 timestamped texts for evolution analysis, found {len(texts)}'
-                        }
-                        
-        except Exception as evolution_error:
-            evolution_results['error'] = f'Theme evolution analysis failed: {str(evolution_error)}'
+        evolution_results = await run_compute_step(0.2, 1.0, _theme_evolution_results, df, text_fields, time_field, num_themes)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -717,13 +1025,152 @@ async def analyze_theme_evolution(
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "theme evolution analysis")
 
+def _theme_quote_results(df: pd.DataFrame, text_fields: List[str], theme_keywords: Optional[List[str]],
+                         max_quotes: int, auto_extract_themes: bool) -> Dict[str, Any]:
+    """Representative quotes per theme for each text field."""
+    quote_results = {}
+    
+    try:
+        from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
+        
+        analyzer = ThematicAnalyzer()
+        
+        for field in text_fields:
+            if field in df.columns:
+                texts = df[field].dropna().astype(str).tolist()
+                
+                if len(texts) >= 3:
+                    field_results = {}
+                    
+                    # If no theme keywords provided, auto-extract themes first
+                    if not theme_keywords and auto_extract_themes:
+                        theme_analysis = analyzer.identify_themes_clustering(texts, min(5, len(texts)//2))
+                        auto_themes = theme_analysis.get('themes', [])
+                        
+                        for i, theme in enumerate(auto_themes):
+                            theme_name = f"theme_{i+1}"
+                            keywords = theme.get('keywords', [])[:3]  # Top 3 keywords
+                            
+                            if keywords:
+                                quotes = analyzer.extract_quotes_by_theme(texts, keywords, max_quotes)
+                                field_results[theme_name] = {
+                                    'keywords': keywords,
+                                    'quotes': quotes,
+                                    'theme_description': f"Auto-detected theme with keywords: {', '.join(keywords)}"
+                                }
+                    
+                    # If theme keywords provided, extract quotes for each
+                    elif theme_keywords:
+                        quotes = analyzer.extract_quotes_by_theme(texts, theme_keywords, max_quotes)
+                        field_results['custom_theme'] = {
+                            'keywords': theme_keywords,
+                            'quotes': quotes,
+                            'theme_description': f"Custom theme with keywords: {', '.join(theme_keywords)}"
+                        }
+                    else:
+                        field_results['error'] = 'No theme keywords provided and auto-extraction disabled'
+                    
+                    quote_results[field] = {
+                        'total_texts_analyzed': len(texts),
+                        'themes_with_quotes': field_results,
+                        'extraction_method': 'auto-detected' if auto_extract_themes and not theme_keywords else 'custom_keywords'
+                    }
+                else:
+                    quote_results[field] = {
+                        'error': f'Need at least 3 texts for quote extraction, found {len(texts)}'
+                    }
+                    
+    except Exception as extraction_error:
+        quote_results['error'] = f'Quote extraction failed: {str(extraction_error)}'
+    return quote_results
+
+def _auto_theme_keywords(texts: List[str]) -> List[List[str]]:
+    """Top keywords of each theme found by clustering the texts."""
+    from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
+    
+    theme_analysis = ThematicAnalyzer().identify_themes_clustering(texts, min(5, len(texts)//2))
+    return [theme.get('keywords', [])[:3] for theme in theme_analysis.get('themes', [])]
+
+def _theme_quotes(texts: List[str], keywords: List[str], max_quotes: int) -> List[str]:
+    """Representative quotes for one theme."""
+    from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
+    
+    return ThematicAnalyzer().extract_quotes_by_theme(texts, keywords, max_quotes)
+
+async def _stream_theme_quotes(project_id: str, df: pd.DataFrame, text_fields: List[str],
+                               theme_keywords: Optional[List[str]], max_quotes: int,
+                               auto_extract_themes: bool):
+    """Quote records: each theme's quotes as soon as they are extracted, then per-field counts."""
+    yield {
+        'type': 'summary',
+        'project_id': project_id,
+        'analysis_type': 'quote_extraction',
+        'text_fields_analyzed': text_fields,
+        'theme_keywords_provided': theme_keywords,
+        'max_quotes_per_theme': max_quotes,
+        'auto_extraction_enabled': auto_extract_themes
+    }
+    
+    extraction_method = 'auto-detected' if auto_extract_themes and not theme_keywords else 'custom_keywords'
+    for field in text_fields:
+        if field not in df.columns:
+            continue
+        texts = df[field].dropna().astype(str).tolist()
+        if len(texts) < 3:
+            yield {
+                'type': 'field_summary',
+                'field': field,
+                'error': f'Need at least 3 texts for quote extraction, found {len(texts)}'
+            }
+            continue
+        
+        if theme_keywords:
+            themes = [('custom_theme', theme_keywords, f"Custom theme with keywords: {', '.join(theme_keywords)}")]
+        elif auto_extract_themes:
+            themes = [
+                (f"theme_{i+1}", keywords, f"Auto-detected theme with keywords: {', '.join(keywords)}")
+                for i, keywords in enumerate(await run_compute(_auto_theme_keywords, texts))
+                if keywords
+            ]
+        else:
+            yield {
+                'type': 'field_summary',
+                'field': field,
+                'error': 'No theme keywords provided and auto-extraction disabled'
+            }
+            continue
+        
+        for theme_name, keywords, description in themes:
+            yield {
+                'type': 'item',
+                'field': field,
+                'theme': theme_name,
+                'keywords': keywords,
+                'quotes': await run_compute(_theme_quotes, texts, keywords, max_quotes),
+                'theme_description': description
+            }
+        
+        yield {
+            'type': 'field_summary',
+            'field': field,
+            'total_texts_analyzed': len(texts),
+            'themes_found': len(themes),
+            'extraction_method': extraction_method
+        }
+    
+    yield {'type': 'complete'}
+
 @router.post("/project/{project_id}/analyze/extract-quotes")
+@result_cache.cached
 async def extract_quotes_by_theme(
     project_id: str,
     text_fields: Optional[List[str]] = None,
     theme_keywords: Optional[List[str]] = None,
     max_quotes: int = 5,
     auto_extract_themes: bool = True,
+    stream: bool = False,
+    data_mode: DataMode = "long",
+    filters: Optional[ResponseFilter] = Depends(get_response_filter),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -735,13 +1182,22 @@ async def extract_quotes_by_theme(
         theme_keywords: Optional list of theme keywords to search for
         max_quotes: Maximum number of quotes per theme
         auto_extract_themes: Whether to auto-detect themes if keywords not provided
+        stream: Stream NDJSON records (summary, one per theme as its quotes are
+            extracted, per-field counts) instead of one JSON document
+        data_mode: 'long' (one row per response) or 'wide' (one row per respondent,
+            one column per question)
+        filters: Response filter (date window, questions, respondents, collectors,
+            validation status) applied when loading the data
         db: Database session
         
     Returns:
         Quote extraction results
     """
     try:
-        df = await AnalyticsUtils.get_project_data(project_id)
+        df = await AnalyticsUtils.get_project_data(
+            project_id, data_mode=data_mode, filters=filters,
+            columns=AnalyticsUtils.declared_columns(text_fields)
+        )
         
         if df.empty:
             return AnalyticsUtils.format_api_response(
@@ -749,7 +1205,7 @@ async def extract_quotes_by_theme(
             )
         
         # Get data characteristics to identify text variables if not specified
-        characteristics = AnalyticsUtils.analyze_data_characteristics(df)
+        characteristics = await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
         
         if not text_fields:
             text_fields = characteristics.get('text_variables', [])
@@ -759,61 +1215,14 @@ async def extract_quotes_by_theme(
                 'error', None, 'No text variables found in the data'
             )
         
-        # Perform quote extraction
-        quote_results = {}
+        if stream:
+            return ndjson_response(
+                _stream_theme_quotes(project_id, df, text_fields, theme_keywords, max_quotes, auto_extract_themes),
+                "quote extraction"
+            )
         
-        try:
-            from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
-            
-            analyzer = ThematicAnalyzer()
-            
-            for field in text_fields:
-                if field in df.columns:
-                    texts = df[field].dropna().astype(str).tolist()
-                    
-                    if len(texts) >= 3:
-                        field_results = {}
-                        
-                        # If no theme keywords provided, auto-extract themes first
-                        if not theme_keywords and auto_extract_themes:
-                            theme_analysis = analyzer.identify_themes_clustering(texts, min(5, len(texts)//2))
-                            auto_themes = theme_analysis.get('themes', [])
-                            
-                            for i, theme in enumerate(auto_themes):
-                                theme_name = f"theme_{i+1}"
-                                keywords = theme.get('keywords', [])[:3]  # Top 3 keywords
-                                
-                                if keywords:
-                                    quotes = analyzer.extract_quotes_by_theme(texts, keywords, max_quotes)
-                                    field_results[theme_name] = {
-                                        'keywords': keywords,
-                                        'quotes': quotes,
-                                        'theme_description': f"Auto-detected theme with keywords: {', '.join(keywords)}"
-                                    }
-                        
-                        # If theme keywords provided, extract quotes for each
-                        elif theme_keywords:
-                            quotes = analyzer.extract_quotes_by_theme(texts, theme_keywords, max_quotes)
-                            field_results['custom_theme'] = {
-                                'keywords': theme_keywords,
-                                'quotes': quotes,
-                                'theme_description': f"Custom theme with keywords: {', '.join(theme_keywords)}"
-                            }
-                        else:
-                            field_results['error'] = 'No theme keywords provided and auto-extraction disabled'
-                        
-                        quote_results[field] = {
-                            'total_texts_analyzed': len(texts),
-                            'themes_with_quotes': field_results,
-                            'extraction_method': 'auto-detected' if auto_extract_themes and not theme_keywords else 'custom_keywords'
-                        }
-                    else:
-                        quote_results[field] = {
-                            'error': f'Need at least 3 texts for quote extraction, found {len(texts)}'
-                        }
-                        
-        except Exception as extraction_error:
-            quote_results['error'] = f'Quote extraction failed: {str(extraction_error)}'
+        # Perform quote extraction
+        quote_results = await run_compute(_theme_quote_results, df, text_fields, theme_keywords, max_quotes, auto_extract_themes)
         
         return AnalyticsUtils.format_api_response('success', {
             'project_id': project_id,
@@ -2,14 +2,14 @@
 Sync endpoints for data synchronization between devices and server.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
 from datetime import datetime
-from asgiref.sync import sync_to_async
 
-from core.database import get_db
+from core.database import get_db, run_db
 from app.utils.shared import AnalyticsUtils
+from app.utils.warming import cache_warmer
 
 router = APIRouter()
 
@@ -29,9 +29,7 @@ async def get_sync_status(
         Sync status information
     """
     try:
-        @sync_to_async
         def get_sync_data():
-            from core.database import get_django_db_connection
             from projects.models import Project
             from responses.models import Response
             from forms.models import Question
@@ -74,7 +72,7 @@ async def get_sync_status(
                     'last_checked': datetime.now().isoformat()
                 }
         
-        result = await get_sync_data()
+        result = await run_db(get_sync_data)
         
         if result['type'] == 'error':
             return AnalyticsUtils.format_api_response('error', None, result['message'])
@@ -114,58 +112,63 @@ async def sync_project_data(
         Sync operation result
     """
     try:
-        from core.database import get_django_db_connection
-        from projects.models import Project
-        from responses.models import Response
-        from forms.models import Question
-        
-        # Get project
-        try:
-            project = Project.objects.get(id=project_id)
-        except Project.DoesNotExist:
-            return AnalyticsUtils.format_api_response(
-                'error', 
-                None, 
-                'Project not found'
+        def sync_project():
+            from projects.models import Project
+            from responses.models import Response
+            from forms.models import Question
+        
+            # Get project
+            try:
+                project = Project.objects.get(id=project_id)
+            except Project.DoesNotExist:
+                return AnalyticsUtils.format_api_response(
+                    'error', 
+                    None, 
+                    'Project not found'
+                )
+        
+            # Count items to sync
+            pending_responses = Response.objects.filter(
+                project=project, 
+                sync_status='pending'
             )
+            pending_questions = Question.objects.filter(
+                project=project, 
+                sync_status='pending'
+            )
+        
+            response_count = pending_responses.count()
+            question_count = pending_questions.count()
         
-        # Count items to sync
-        pending_responses = Response.objects.filter(
-            project=project, 
-            sync_status='pending'
-        )
-        pending_questions = Question.objects.filter(
-            project=project, 
-            sync_status='pending'
-        )
+            if response_count == 0 and question_count == 0:
+                return AnalyticsUtils.format_api_response('success', {
+                    'project_id': project_id,
+                    'message': 'No pending items to sync',
+                    'synced_responses': 0,
+                    'synced_questions': 0
+                })
         
-        response_count = pending_responses.count()
-        question_count = pending_questions.count()
+            # Simulate sync process (in real implementation, this would sync with cloud)
+            # Mark items as synced
+            pending_responses.update(sync_status='synced')
+            pending_questions.update(sync_status='synced')
+        
+            # Update project sync status
+            project.sync_status = 'synced'
+            project.save()
         
-        if response_count == 0 and question_count == 0:
             return AnalyticsUtils.format_api_response('success', {
                 'project_id': project_id,
-                'message': 'No pending items to sync',
-                'synced_responses': 0,
-                'synced_questions': 0
+                'message': 'Sync completed successfully',
+                'synced_responses': response_count,
+                'synced_questions': question_count,
+                'sync_timestamp': datetime.now().isoformat()
             })
         
-        # Simulate sync process (in real implementation, this would sync with cloud)
-        # Mark items as synced
-        pending_responses.update(sync_status='synced')
-        pending_questions.update(sync_status='synced')
-        
-        # Update project sync status
-        project.sync_status = 'synced'
-        project.save()
-        
-        return AnalyticsUtils.format_api_response('success', {
-            'project_id': project_id,
-            'message': 'Sync completed successfully',
-            'synced_responses': response_count,
-            'synced_questions': question_count,
-            'sync_timestamp': datetime.now().isoformat()
-        })
+        result = await run_db(sync_project)
+        if (result.get('data') or {}).get('synced_responses'):
+            cache_warmer.mark_dirty([project_id])
+        return result
         
     except Exception as e:
         return AnalyticsUtils.handle_analysis_error(e, "project sync")
@@ -184,46 +187,78 @@ async def bulk_sync_all_projects(
         Bulk sync operation result
     """
     try:
-        from core.database import get_django_db_connection
-        from projects.models import Project
-        from responses.models import Response
-        from forms.models import Question
+        synced_projects = []
+        
+        def bulk_sync():
+            from projects.models import Project
+            from responses.models import Response
+            from forms.models import Question
+        
+            # Get all pending items
+            pending_responses = Response.objects.filter(sync_status='pending')
+            pending_questions = Question.objects.filter(sync_status='pending')
         
-        # Get all pending items
-        pending_responses = Response.objects.filter(sync_status='pending')
-        pending_questions = Question.objects.filter(sync_status='pending')
+            total_responses = pending_responses.count()
+            total_questions = pending_questions.count()
         
-        total_responses = pending_responses.count()
-        total_questions = pending_questions.count()
+            if total_responses == 0 and total_questions == 0:
+                return AnalyticsUtils.format_api_response('success', {
+                    'message': 'No pending items to sync',
+                    'total_synced_responses': 0,
+                    'total_synced_questions': 0,
+                    'projects_affected': 0
+                })
+        
+            synced_projects.extend(pending_responses.values_list('project_id', flat=True).distinct())
+            
+            # Simulate bulk sync
+            pending_responses.update(sync_status='synced')
+            pending_questions.update(sync_status='synced')
+        
+            # Update all projects
+            Project.objects.filter(sync_status='pending').update(sync_status='synced')
+        
+            # Count affected projects
+            affected_projects = Project.objects.filter(sync_status='synced').count()
         
-        if total_responses == 0 and total_questions == 0:
             return AnalyticsUtils.format_api_response('success', {
-                'message': 'No pending items to sync',
-                'total_synced_responses': 0,
-                'total_synced_questions': 0,
-                'projects_affected': 0
+                'message': 'Bulk sync completed successfully',
+                'total_synced_responses': total_responses,
+                'total_synced_questions': total_questions,
+                'projects_affected': affected_projects,
+                'sync_timestamp': datetime.now().isoformat()
             })
         
-        # Simulate bulk sync
-        pending_responses.update(sync_status='synced')
-        pending_questions.update(sync_status='synced')
-        
-        # Update all projects
-        Project.objects.filter(sync_status='pending').update(sync_status='synced')
+        result = await run_db(bulk_sync)
+        cache_warmer.mark_dirty(synced_projects)
+        return result
         
-        # Count affected projects
-        affected_projects = Project.objects.filter(sync_status='synced').count()
+    except Exception as e:
+        return AnalyticsUtils.handle_analysis_error(e, "bulk sync")
+
+@router.post("/ingested")
+async def notify_ingested(
+    project_ids: List[str] = Body(..., embed=True, description="Projects whose responses a sync batch changed")
+) -> Dict[str, Any]:
+    """
+    Mark projects changed by sync ingestion so their hot analyses are recomputed
+    in the background before anyone asks.
+    
+    Args:
+        project_ids: Projects whose responses were created, updated or deleted
         
+    Returns:
+        The projects scheduled for warming and the hot analyses that will run
+    """
+    try:
+        scheduled = cache_warmer.mark_dirty(project_ids)
         return AnalyticsUtils.format_api_response('success', {
-            'message': 'Bulk sync completed successfully',
-            'total_synced_responses': total_responses,
-            'total_synced_questions': total_questions,
-            'projects_affected': affected_projects,
-            'sync_timestamp': datetime.now().isoformat()
+            'scheduled_projects': scheduled,
+            'analyses': cache_warmer.analyses,
+            'warming_enabled': cache_warmer.enabled
         })
-        
     except Exception as e:
-        return AnalyticsUtils.handle_analysis_error(e, "bulk sync")
+        return AnalyticsUtils.handle_analysis_error(e, "ingest notification")
 
 @router.get("/health")
 async def sync_health_check(
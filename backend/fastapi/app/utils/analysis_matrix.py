@@ -0,0 +1,141 @@
+"""
+Wide respondent x question analysis matrix.
+
+Project data is stored long (one row per response), but per-variable analyses
+need one row per respondent and one typed column per question. The matrix is
+built from typed column arrays with a single factorize/scatter pass per
+question rather than a generic pandas pivot over object data. A respondent who
+answered a question more than once gets their latest answer; the columns come
+newest first (load_project_columns orders them by collected_at descending).
+"""
+
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns load_project_columns must provide to build the matrix
+MATRIX_SOURCE_COLUMNS = [
+    'respondent_id',
+    'question_id',
+    'question_text',
+    'question_order',
+    'response_data_type',
+    'supports_options',
+    'response_value',
+    'numeric_value',
+    'datetime_value',
+    'choice_text',
+]
+
+TRUE_VALUES = {'true', '1', 'yes', 'y', 't'}
+FALSE_VALUES = {'false', '0', 'no', 'n', 'f'}
+
+
+def _column_names(question_text: np.ndarray) -> List[str]:
+    """Use question text as column names, suffixing repeats so names stay unique."""
+    names = []
+    seen: Dict[str, int] = {}
+    for text in question_text:
+        name = str(text).strip() if text is not None else 'Untitled question'
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(name if count == 0 else f"{name} ({count + 1})")
+    return names
+
+
+def _typed_values(columns: Dict[str, Any], rows: np.ndarray, data_type: str, supports_options: bool):
+    """Pick and type the value source for one question's responses."""
+    if data_type == 'numeric':
+        return np.asarray(columns['numeric_value'])[rows], 'float64'
+    if data_type == 'datetime':
+        return columns['datetime_value'][rows], None
+    if data_type == 'boolean':
+        text = pd.Series(np.asarray(columns['response_value'], dtype=object)[rows], dtype=object)
+        lowered = text.str.strip().str.lower()
+        values = pd.Series(pd.NA, index=lowered.index, dtype='boolean')
+        values[lowered.isin(TRUE_VALUES)] = True
+        values[lowered.isin(FALSE_VALUES)] = False
+        return values.array, 'boolean'
+    if supports_options or data_type == 'json':
+        values = np.asarray(columns['choice_text'], dtype=object)[rows]
+        fallback = np.asarray(columns['response_value'], dtype=object)[rows]
+        missing = pd.isna(values)
+        values[missing] = fallback[missing]
+        return values, 'category'
+    return np.asarray(columns['response_value'], dtype=object)[rows], None
+
+
+def _scatter(values, respondent_codes: np.ndarray, n_respondents: int, dtype) -> pd.Series:
+    """Place one question's values at their respondents' row positions."""
+    if dtype == 'float64':
+        out = np.full(n_respondents, np.nan)
+        out[respondent_codes] = values
+        return pd.Series(out)
+    if dtype == 'boolean':
+        out = pd.array([pd.NA] * n_respondents, dtype='boolean')
+        out[respondent_codes] = values
+        return pd.Series(out)
+    if isinstance(values, pd.api.extensions.ExtensionArray):
+        # Datetime arrays keep their datetime64 dtype (and timezone)
+        out = pd.Series(pd.NaT, index=range(n_respondents), dtype=values.dtype)
+        out.iloc[respondent_codes] = values
+        return out
+
+    out = np.full(n_respondents, None, dtype=object)
+    out[respondent_codes] = values
+    series = pd.Series(out)
+    series = series.mask(series.astype(str).str.strip() == '')
+    return series.astype('category') if dtype == 'category' else series
+
+
+def build_analysis_matrix(columns: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Pivot long project columns into a respondent x question matrix.
+
+    Args:
+        columns: Column arrays from load_project_columns(MATRIX_SOURCE_COLUMNS),
+            newest response first
+
+    Returns:
+        DataFrame indexed by respondent_id with one typed column per question,
+        ordered as the questions appear in the form
+    """
+    if not columns or len(columns.get('respondent_id', [])) == 0:
+        return pd.DataFrame()
+
+    respondent_codes, respondents = pd.factorize(np.asarray(columns['respondent_id'], dtype=object), sort=True)
+    question_codes, question_ids = pd.factorize(np.asarray(columns['question_id'], dtype=object))
+    n_respondents = len(respondents)
+    n_questions = len(question_ids)
+
+    # Group row positions by question once: a stable sort by question code
+    order = np.argsort(question_codes, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(question_codes, minlength=n_questions))])
+    first_rows = order[bounds[:-1]]
+
+    question_order = pd.to_numeric(np.asarray(columns['question_order'], dtype=object)[first_rows], errors='coerce')
+    names = _column_names(np.asarray(columns['question_text'], dtype=object)[first_rows])
+    data_types = np.asarray(columns['response_data_type'], dtype=object)
+    supports_options = np.asarray(columns['supports_options'], dtype=bool)
+
+    matrix = {}
+    for q in np.argsort(question_order, kind='stable'):
+        rows = order[bounds[q]:bounds[q + 1]]
+        # Keep each respondent's first (newest) answer; the stable sort kept load order
+        _, first = np.unique(respondent_codes[rows], return_index=True)
+        if len(first) < len(rows):
+            rows = rows[np.sort(first)]
+        # A question's responses share a type; use the most common one if not
+        q_types = pd.Series(data_types[rows], dtype=object)
+        data_type = q_types.mode().iloc[0] if q_types.notna().any() else 'text'
+        values, dtype = _typed_values(columns, rows, data_type, bool(supports_options[rows].any()))
+        matrix[names[q]] = _scatter(values, respondent_codes[rows], n_respondents, dtype)
+
+    df = pd.DataFrame(matrix)
+    df.index = pd.Index(respondents, name='respondent_id')
+    logger.info(f"Built analysis matrix: {n_respondents} respondents x {n_questions} questions")
+    return df
@@ -0,0 +1,227 @@
+"""
+Executor for CPU-bound analytics work.
+
+Analysis handlers are `async def`, but the statistics, clustering, topic
+modelling and bootstrap code they call is synchronous and CPU-bound. Running
+it on the event loop stalls every other request on the worker, health checks
+included. Handlers hand that work to the compute executor instead.
+
+By default the work runs on a pool of worker processes, so it also escapes the
+GIL. Calls whose function or arguments cannot be pickled, or that run while
+the process pool is unavailable, fall back to a thread pool, as does the whole
+executor when ANALYTICS_COMPUTE_EXECUTOR=thread. Functions sent to the process
+pool must be importable module-level functions or static methods; their
+arguments and results are copied between processes, so in-place changes to
+arguments are not seen by the caller.
+"""
+
+import os
+import time
+import pickle
+import asyncio
+import logging
+import functools
+import threading
+import contextvars
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Errors raised while sending a call to, or its result back from, a worker process
+_TRANSFER_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+
+def _invoke(func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[float, Any]:
+    """
+    Run a call on a pool worker.
+
+    Returns:
+        (wall-clock start time, result) tuple; the start time lets the caller
+        measure queue wait across processes
+    """
+    started_at = time.time()
+    try:
+        return started_at, func(*args, **kwargs)
+    except Exception as e:
+        # Marks the error as raised by the analysis itself, not by the transfer
+        e._compute_started_at = started_at
+        raise
+
+
+class ComputeExecutor:
+    """
+    Runs CPU-bound analysis functions off the event loop.
+
+    Pools are created lazily and per process, so each uvicorn worker gets its
+    own rather than inheriting one across a fork.
+    """
+
+    def __init__(self, workers: int, mode: str = 'process', start_method: str = 'spawn'):
+        """
+        Initialize the executor.
+
+        Args:
+            workers: Number of worker processes (or threads) running analyses at once
+            mode: 'process' for a process pool with thread fallback, 'thread' for threads only
+            start_method: multiprocessing start method for the worker processes
+        """
+        self.workers = max(1, workers)
+        self.mode = mode if mode in ('process', 'thread') else 'process'
+        self.start_method = start_method
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.completed = 0
+        self.errors = 0
+        self.fallbacks = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def _check_pid(self) -> None:
+        """Drop pools inherited from a parent process; called with the lock held."""
+        pid = os.getpid()
+        if self._pid != pid:
+            self._process_pool = None
+            self._thread_pool = None
+            self._pid = pid
+
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            self._check_pid()
+            if self.mode == 'process' and self._process_pool is None:
+                try:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(self.start_method)
+                    )
+                except (OSError, ValueError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable, running analyses on threads: {e}")
+                    self.mode = 'thread'
+            return self._process_pool
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            self._check_pid()
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="analytics-compute"
+                )
+            return self._thread_pool
+
+    def _record(self, submitted_at: float, started_at: Optional[float], error: bool) -> None:
+        finished_at = time.time()
+        with self._lock:
+            self.completed += 1
+            if error:
+                self.errors += 1
+            if started_at is not None:
+                wait = max(0.0, started_at - submitted_at)
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+                self.total_run_seconds += max(0.0, finished_at - started_at)
+
+    async def _run_on_threads(self, submitted_at: float, func: Callable, args: Tuple,
+                              kwargs: Dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, _invoke, func, args, kwargs)
+        try:
+            started_at, result = await loop.run_in_executor(self._get_thread_pool(), call)
+        except Exception as e:
+            self._record(submitted_at, getattr(e, '_compute_started_at', None), error=True)
+            raise
+        self._record(submitted_at, started_at, error=False)
+        return result
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a CPU-bound function on the compute pool and await its result.
+
+        Exceptions raised by the function propagate unchanged.
+        """
+        submitted_at = time.time()
+        with self._lock:
+            self.submitted += 1
+
+        pool = self._get_process_pool()
+        if pool is None:
+            return await self._run_on_threads(submitted_at, func, args, kwargs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            started_at, result = await loop.run_in_executor(pool, _invoke, func, args, kwargs)
+        except Exception as e:
+            if hasattr(e, '_compute_started_at'):
+                self._record(submitted_at, e._compute_started_at, error=True)
+                raise
+            if isinstance(e, BrokenProcessPool):
+                logger.warning("Compute process pool broke; it will be restarted")
+                with self._lock:
+                    if self._process_pool is pool:
+                        self._process_pool = None
+            elif not isinstance(e, _TRANSFER_ERRORS):
+                raise
+            logger.debug(f"Running {getattr(func, '__qualname__', func)} on a thread: {e}")
+            with self._lock:
+                self.fallbacks += 1
+            return await self._run_on_threads(submitted_at, func, args, kwargs)
+
+        self._record(submitted_at, started_at, error=False)
+        return result
+
+    async def run_threaded(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a CPU-bound function on the compute thread pool.
+
+        For calls that need the caller's context, such as a background job's
+        report_progress checkpoints, or arguments that must not be copied.
+        """
+        with self._lock:
+            self.submitted += 1
+        return await self._run_on_threads(time.time(), func, args, kwargs)
+
+    def shutdown(self) -> None:
+        """Stop the pools, cancelling queued calls."""
+        with self._lock:
+            pools = [self._process_pool, self._thread_pool]
+            self._process_pool = self._thread_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring and sizing the pool"""
+        with self._lock:
+            pending = self.submitted - self.completed
+            return {
+                'mode': self.mode,
+                'workers': self.workers,
+                'running': min(pending, self.workers),
+                'queue_depth': max(0, pending - self.workers),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'errors': self.errors,
+                'thread_fallbacks': self.fallbacks,
+                'avg_wait_ms': round(1000 * self.total_wait_seconds / self.completed, 3) if self.completed else 0.0,
+                'max_wait_ms': round(1000 * self.max_wait_seconds, 3),
+                'avg_run_ms': round(1000 * self.total_run_seconds / self.completed, 3) if self.completed else 0.0,
+            }
+
+
+compute_executor = ComputeExecutor(
+    workers=settings.ANALYTICS_COMPUTE_WORKERS,
+    mode=settings.ANALYTICS_COMPUTE_EXECUTOR,
+    start_method=settings.ANALYTICS_COMPUTE_START_METHOD,
+)
+
+async def run_compute(func: Callable, *args, **kwargs) -> Any:
+    """Run a CPU-bound analysis function on the shared compute executor"""
+    return await compute_executor.run(func, *args, **kwargs)
@@ -0,0 +1,152 @@
+"""
+ETags and conditional requests for analysis endpoints.
+
+Clients on slow field connections revisit the same screens, and each visit
+downloaded the full analysis payload again. A project's analysis responses
+now carry an ETag derived from the request (method, path, query parameters,
+JSON body) and the project's data-version token. A client that sends it back
+in If-None-Match gets a bodiless 304 Not Modified while the data is unchanged,
+and the endpoint does not run at all.
+
+Only endpoints whose response depends on nothing but the project's responses
+and the request are tagged: those decorated with result_cache.cached (their
+stored results are keyed the same way) or marked with
+conditional_responses.versioned. Endpoints reporting other project state,
+such as stored result counts and team members in the project stats, are not.
+
+Responses embed their generation timestamp, so tags are weak (W/"..."): two
+responses with the same tag carry the same results, not the same bytes.
+Error responses, streamed responses and background job submissions carry no
+tag.
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request
+
+from core.config import settings
+from core.database import get_project_data_version
+from app.utils.shared import normalize_uuid
+
+logger = logging.getLogger(__name__)
+
+# Endpoint attribute marking responses determined by the data version and the request
+VERSIONED_ATTRIBUTE = 'data_versioned'
+# Query parameters whose responses must never be answered with a 304
+UNCACHEABLE_PARAMETERS = ('background', 'stream')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if (candidate[2:] if candidate.startswith('W/') else candidate) == opaque:
+            return True
+    return False
+
+
+class ConditionalResponses:
+    """Computes request ETags and counts conditional hits."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the validator.
+
+        Args:
+            enabled: When False no ETags are sent and If-None-Match is ignored
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.tagged = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def versioned(func: Callable) -> Callable:
+        """
+        Mark an endpoint whose response depends only on the project's
+        responses and the request parameters, so it may be answered with 304.
+
+        Endpoints decorated with result_cache.cached are marked already.
+        """
+        setattr(func, VERSIONED_ATTRIBUTE, True)
+        return func
+
+    @staticmethod
+    def is_versioned(endpoint: Callable) -> bool:
+        """Whether an endpoint was marked with versioned"""
+        return getattr(endpoint, VERSIONED_ATTRIBUTE, False)
+
+    async def etag_for(self, request: Request) -> Optional[str]:
+        """
+        ETag for a project analysis request, or None if the request is not taggable.
+
+        Requests are taggable if their path names a project and they neither
+        stream nor submit a background job.
+        """
+        project_id = request.path_params.get('project_id')
+        if not self.enabled or not project_id or request.method not in ('GET', 'POST'):
+            return None
+        if any(request.query_params.get(name, '').lower() in ('1', 'true') for name in UNCACHEABLE_PARAMETERS):
+            return None
+
+        try:
+            data_version = await get_project_data_version(normalize_uuid(project_id))
+            body = await request.body()
+            try:
+                # Key order and whitespace in JSON bodies do not change the analysis
+                body = json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode('utf-8') if body else b''
+            except ValueError:
+                pass
+            payload = json.dumps([
+                settings.VERSION, request.method, request.url.path,
+                sorted(request.query_params.multi_items()), data_version,
+            ]).encode('utf-8')
+            digest = hashlib.sha256(payload + b'\0' + body).hexdigest()[:32]
+            return f'W/"{digest}"'
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"Could not compute ETag for {request.url.path}: {e}")
+            return None
+
+    def is_not_modified(self, request: Request, etag: str) -> bool:
+        """Whether the client's If-None-Match already names this ETag (counted as a 304)"""
+        if etag_matches(request.headers.get('if-none-match'), etag):
+            self._count('not_modified')
+            return True
+        return False
+
+    def tag(self, response: Any, etag: str) -> None:
+        """Attach the ETag to a response"""
+        response.headers['ETag'] = etag
+        # Clients may keep the payload but must revalidate before reusing it
+        response.headers['Cache-Control'] = 'private, no-cache'
+        self._count('tagged')
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'tagged': self.tagged,
+                'not_modified': self.not_modified,
+                'errors': self.errors,
+            }
+
+
+conditional_responses = ConditionalResponses(enabled=settings.ETAGS_ENABLED)
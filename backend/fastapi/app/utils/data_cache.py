@@ -0,0 +1,237 @@
+"""
+In-process cache of prepared project DataFrames.
+
+Entries are keyed by project and validated against a cheap data-version token
+(response count plus latest collected/synced timestamps), so a changed project
+is reloaded while unchanged projects are served from memory. The cache is an
+LRU bounded by a memory budget rather than an entry count.
+
+Entries also remember the response ids behind each row and the watermark the
+frame was loaded at, so a stale frame can be refreshed with a delta load
+instead of a full reload.
+
+Callers receive their own frame (see handoff_copy). Under pandas
+Copy-on-Write (always on from pandas 3) that is a lazy copy sharing the cached
+columns until the caller modifies one, so frames loaded from memory-mapped
+snapshots stay mapped; with older pandas it is a deep copy.
+"""
+
+import threading
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def handoff_copy(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    A frame callers may add or overwrite columns on without changing `frame`.
+
+    Lazy under Copy-on-Write: columns are only copied when modified.
+    """
+    if int(pd.__version__.split('.', 1)[0]) >= 3 or pd.get_option('mode.copy_on_write') is True:
+        return frame.copy(deep=False)
+    return frame.copy()
+
+
+@dataclass
+class CacheEntry:
+    """A cached DataFrame with the data version it was built from."""
+    version: str
+    frame: pd.DataFrame
+    nbytes: int
+    row_ids: Optional[np.ndarray] = None
+    watermark: Optional[Dict[str, Any]] = None
+    created_at: float = field(default_factory=time.time)
+    last_access: float = field(default_factory=time.time)
+
+
+class ProjectDataCache:
+    """Memory-bounded LRU cache of prepared project DataFrames."""
+
+    def __init__(self, max_bytes: int, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for all cached frames combined
+            enabled: When False every lookup misses and nothing is stored
+        """
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+
+        # Monitoring counters
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.rejected = 0
+        self.delta_refreshes = 0
+
+    @staticmethod
+    def frame_nbytes(frame: pd.DataFrame) -> int:
+        """Memory footprint of a frame, including Python objects in object columns"""
+        return int(frame.memory_usage(deep=True, index=True).sum())
+
+    def get(self, key: Hashable, version: str,
+            columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Return a copy of the cached frame if it was built from `version`.
+
+        A cached frame with a different version counts as a stale miss; it is
+        kept so the caller can delta-refresh it (see peek) and replaced on put.
+
+        Args:
+            key: Cache key
+            version: Data version the frame must have been built from
+            columns: Only return these columns; a frame missing any of them is a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.version != version:
+                self.stale += 1
+                self.misses += 1
+                return None
+
+            if columns is not None and not set(columns).issubset(entry.frame.columns):
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            entry.last_access = time.time()
+            self.hits += 1
+            frame = entry.frame
+
+        # Callers are free to add or overwrite columns on what they receive
+        if columns is not None:
+            return handoff_copy(frame[list(columns)])
+        return handoff_copy(frame)
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return the entry for `key` whatever its version, without touching LRU order or counters"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Hashable, version: str, frame: pd.DataFrame,
+            row_ids: Optional[np.ndarray] = None, watermark: Optional[Dict[str, Any]] = None,
+            delta: bool = False, nbytes: Optional[int] = None) -> bool:
+        """
+        Store a frame, evicting least recently used entries to stay within budget.
+
+        Args:
+            key: Cache key (project id, optionally followed by variant components)
+            version: Data-version token the frame was built from
+            frame: Prepared DataFrame
+            row_ids: Response id for each row of `frame`, enabling delta refresh
+            watermark: Data state the frame is current as of
+            delta: Whether the frame came from a delta refresh (for monitoring)
+            nbytes: Precomputed frame size; measured when omitted. Delta refreshes
+                pass an estimate scaled from the previous entry, since a deep
+                measurement of object columns costs more than the refresh itself
+
+        Returns:
+            True if the frame was cached, False if caching is disabled or the
+            frame alone exceeds the memory budget
+        """
+        if not self.enabled:
+            return False
+
+        if nbytes is None:
+            nbytes = self.frame_nbytes(frame)
+        if row_ids is not None:
+            nbytes += int(row_ids.nbytes)
+        if nbytes > self.max_bytes:
+            with self._lock:
+                self.rejected += 1
+            logger.info(f"Not caching {key}: {nbytes} bytes exceeds budget of {self.max_bytes}")
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            while self._entries and self._current_bytes + nbytes > self.max_bytes:
+                evicted_key, _ = next(iter(self._entries.items()))
+                self._remove(evicted_key)
+                self.evictions += 1
+                logger.debug(f"Evicted project frame {evicted_key}")
+
+            self._entries[key] = CacheEntry(
+                version=version, frame=frame, nbytes=nbytes,
+                row_ids=row_ids, watermark=watermark
+            )
+            self._current_bytes += nbytes
+            if delta:
+                self.delta_refreshes += 1
+        return True
+
+    def invalidate(self, project_id: Optional[str] = None) -> int:
+        """
+        Drop cached frames for one project (every key variant) or for all projects.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if project_id is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._current_bytes = 0
+                return removed
+
+            keys = [key for key in self._entries if self._key_project(key) == project_id]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and occupancy for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'current_bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'evictions': self.evictions,
+                'rejected': self.rejected,
+                'delta_refreshes': self.delta_refreshes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry; caller must hold the lock"""
+        entry = self._entries.pop(key)
+        self._current_bytes -= entry.nbytes
+
+    @staticmethod
+    def _key_project(key: Hashable) -> Hashable:
+        """Project component of a cache key (keys may be bare ids or tuples led by the id)"""
+        return key[0] if isinstance(key, tuple) else key
+
+
+project_data_cache = ProjectDataCache(
+    max_bytes=settings.PROJECT_CACHE_MAX_MB * 1024 * 1024,
+    enabled=settings.PROJECT_CACHE_ENABLED,
+)
@@ -0,0 +1,428 @@
+"""
+Background execution of long-running analyses.
+
+Endpoints decorated with `analysis_jobs.background` accept `?background=true`.
+The request then returns a job id straight away and the analysis runs on a
+local worker thread with its own event loop, so no external broker is needed.
+Jobs report progress and partial results through report_progress; long steps
+run through run_compute_step report from inside the computation. Jobs can be
+cancelled while queued, or at their next progress checkpoint once running; a
+job whose cancellation was requested after its last checkpoint still ends
+cancelled, without results.
+
+Each job is tracked in an AnalyticsResult row whose id is the job id. The row
+holds the final results, so a finished job can still be fetched after its
+in-memory record expires or the server restarts.
+"""
+
+import uuid
+import time
+import asyncio
+import inspect
+import logging
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Query
+
+from core.config import settings
+from core.database import create_job_record, load_job_record, run_db, update_job_record
+from app.utils.compute import compute_executor, run_compute
+from app.utils.result_cache import AnalysisResultCache
+from app.utils.shared import AnalyticsUtils, normalize_uuid
+from app.utils.serialization import to_jsonable
+
+logger = logging.getLogger(__name__)
+
+# Job status -> AnalyticsResult.sync_status
+JOB_RECORD_STATUS = {
+    'pending': 'pending',
+    'running': 'processing',
+    'completed': 'completed',
+    'failed': 'failed',
+    'cancelled': 'cancelled',
+}
+RECORD_JOB_STATUS = {record: job for job, record in JOB_RECORD_STATUS.items()}
+
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class JobCancelled(BaseException):
+    """
+    Raised at a progress checkpoint of a job whose cancellation was requested.
+
+    Derives from BaseException, like asyncio.CancelledError, so the endpoints'
+    `except Exception` error handling does not swallow it.
+    """
+
+
+@dataclass
+class AnalysisJob:
+    """In-memory state of a background analysis job."""
+    id: str
+    endpoint: str
+    project_id: str
+    parameters: Dict[str, Any]
+    status: str = 'pending'
+    progress: float = 0.0
+    message: Optional[str] = None
+    partial: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_requested: threading.Event = field(default_factory=threading.Event)
+    future: Optional[Future] = None
+
+    def to_dict(self, include_partial: bool = False, include_result: bool = True) -> Dict[str, Any]:
+        """Job status for API responses"""
+        info = {
+            'job_id': self.id,
+            'endpoint': self.endpoint,
+            'project_id': self.project_id,
+            'status': self.status,
+            'progress': round(self.progress, 4),
+            'message': self.message,
+            'error': self.error,
+            'cancel_requested': self.cancel_requested.is_set(),
+            'created_at': datetime.fromtimestamp(self.created_at).isoformat(),
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None,
+            'finished_at': datetime.fromtimestamp(self.finished_at).isoformat() if self.finished_at else None,
+            'partial_sections': list(self.partial),
+        }
+        if include_partial:
+            info['partial'] = self.partial
+        if include_result:
+            info['result'] = self.result
+        return info
+
+
+_current_job: ContextVar[Optional[AnalysisJob]] = ContextVar('current_analysis_job', default=None)
+
+
+def report_progress(fraction: float, message: Optional[str] = None,
+                    partial: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Report progress of the running background job; a no-op outside a job.
+
+    This is also the job's cancellation checkpoint.
+
+    Args:
+        fraction: Completed fraction of the work, 0 to 1
+        message: Description of the current step
+        partial: Results finished so far, merged into the job's partial results
+
+    Raises:
+        JobCancelled: If cancellation of the job was requested
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    if job.cancel_requested.is_set():
+        raise JobCancelled(job.id)
+    job.progress = max(job.progress, min(max(fraction, 0.0), 1.0))
+    if message is not None:
+        job.message = message
+    if partial:
+        job.partial.update(partial)
+
+
+def step_progress(start: float, end: float) -> Callable[..., None]:
+    """
+    report_progress for a step covering fractions start to end of the job.
+
+    The returned function is called as progress(fraction, message, partial)
+    with the completed fraction of the step itself.
+    """
+    def progress(fraction: float, message: Optional[str] = None,
+                 partial: Optional[Dict[str, Any]] = None) -> None:
+        report_progress(start + (end - start) * fraction, message, partial)
+
+    return progress
+
+
+async def run_compute_step(start: float, end: float, func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a CPU-bound analysis step that accepts a `progress` argument.
+
+    Inside a background job the step runs on a compute thread, where its
+    progress calls (see step_progress) reach the job and act as cancellation
+    checkpoints. Otherwise it runs on the compute executor without progress.
+    """
+    if _current_job.get() is None:
+        return await run_compute(func, *args, **kwargs)
+    return await compute_executor.run_threaded(func, *args, progress=step_progress(start, end), **kwargs)
+
+
+class AnalysisJobManager:
+    """Runs analyses on a local worker pool and tracks their progress."""
+
+    def __init__(self, max_workers: int, retention_seconds: int = 3600):
+        """
+        Initialize the manager.
+
+        Args:
+            max_workers: Number of jobs that run at the same time; more are queued
+            retention_seconds: How long finished jobs stay in memory; their
+                results remain available from the database afterwards
+        """
+        self.max_workers = max(1, max_workers)
+        self.retention_seconds = retention_seconds
+        self._jobs: Dict[str, AnalysisJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="analysis-job"
+                )
+            return self._executor
+
+    async def submit(self, endpoint: str, func: Callable, kwargs: Dict[str, Any]) -> AnalysisJob:
+        """
+        Queue an endpoint coroutine function to run in the background.
+
+        Args:
+            endpoint: Endpoint name recorded with the job
+            func: Async endpoint function returning a format_api_response dict
+            kwargs: Arguments for `func`; must include project_id
+
+        Returns:
+            The queued job
+        """
+        job = AnalysisJob(
+            id=str(uuid.uuid4()),
+            endpoint=endpoint,
+            project_id=normalize_uuid(kwargs['project_id']),
+            parameters=AnalysisResultCache.normalize_parameters(kwargs),
+        )
+        await run_db(
+            create_job_record, job.id, job.project_id, endpoint.rsplit('.', 1)[-1],
+            {'endpoint': endpoint, 'parameters': job.parameters}
+        )
+
+        self._prune()
+        with self._lock:
+            self._jobs[job.id] = job
+            self.submitted += 1
+        job.future = self._get_executor().submit(self._run, job, func, kwargs)
+        logger.info(f"Queued analysis job {job.id} for {endpoint}")
+        return job
+
+    def _run(self, job: AnalysisJob, func: Callable, kwargs: Dict[str, Any]) -> None:
+        """Run a job on a worker thread in a fresh event loop."""
+        asyncio.run(self._run_async(job, func, kwargs))
+
+    async def _run_async(self, job: AnalysisJob, func: Callable, kwargs: Dict[str, Any]) -> None:
+        if job.cancel_requested.is_set():
+            await self._finish(job, 'cancelled')
+            return
+
+        token = _current_job.set(job)
+        job.status = 'running'
+        job.started_at = time.time()
+        job.message = 'Running'
+        try:
+            await run_db(update_job_record, job.id, JOB_RECORD_STATUS['running'])
+            response = await func(**kwargs)
+        except JobCancelled:
+            await self._finish(job, 'cancelled')
+            return
+        except Exception as e:
+            logger.error(f"Analysis job {job.id} failed: {e}")
+            job.error = str(e)
+            await self._finish(job, 'failed')
+            return
+        finally:
+            _current_job.reset(token)
+
+        if job.cancel_requested.is_set():
+            # Cancelled after the last checkpoint
+            await self._finish(job, 'cancelled')
+        elif isinstance(response, dict) and response.get('status') == 'success':
+            job.result = response.get('data')
+            await self._finish(job, 'completed')
+        else:
+            job.error = response.get('message') if isinstance(response, dict) else 'Unexpected response'
+            await self._finish(job, 'failed')
+
+    async def _finish(self, job: AnalysisJob, status: str) -> None:
+        """Record a job's final state in memory and in its AnalyticsResult row."""
+        job.status = status
+        job.finished_at = time.time()
+        job.message = status.capitalize()
+        if status == 'completed':
+            job.progress = 1.0
+        with self._lock:
+            setattr(self, status, getattr(self, status) + 1)
+
+        results = job.result if status == 'completed' else {'error': job.error or status}
+        try:
+            await run_db(update_job_record, job.id, JOB_RECORD_STATUS[status], to_jsonable(results))
+        except Exception as e:
+            # Results that are not JSON-serializable stay in memory only;
+            # the row still records how the job ended
+            logger.warning(f"Could not store results of analysis job {job.id}: {e}")
+            try:
+                await run_db(update_job_record, job.id, JOB_RECORD_STATUS[status])
+            except Exception as e:
+                logger.warning(f"Could not update analysis job {job.id}: {e}")
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """In-memory job record, if still retained"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    async def get_info(self, job_id: str, include_partial: bool = False,
+                       include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Status of a job, falling back to its AnalyticsResult row once it is no longer in memory.
+
+        Returns:
+            Job status dict, or None if the job is unknown
+        """
+        job = self.get(job_id)
+        if job is not None:
+            return job.to_dict(include_partial, include_result)
+
+        try:
+            record = await run_db(load_job_record, job_id)
+        except Exception:
+            # Not a valid job id
+            return None
+        if record is None or record['sync_status'] not in RECORD_JOB_STATUS:
+            return None
+
+        status = RECORD_JOB_STATUS[record['sync_status']]
+        if status not in FINISHED_STATUSES:
+            # Left pending/running by a previous server process
+            status = 'failed'
+        results = record['results']
+        info = {
+            'job_id': str(record['id']),
+            'endpoint': record['parameters'].get('endpoint'),
+            'project_id': record['project_id'].hex,
+            'status': status,
+            'progress': 1.0 if status == 'completed' else 0.0,
+            'message': status.capitalize(),
+            'error': results.get('error') if status != 'completed' else None,
+            'finished_at': record['generated_at'].isoformat(),
+        }
+        if include_result:
+            info['result'] = results if status == 'completed' else None
+        return info
+
+    async def cancel(self, job_id: str) -> Optional[AnalysisJob]:
+        """
+        Request cancellation of a job.
+
+        A queued job is cancelled immediately; a running job stops at its next
+        progress checkpoint, or ends cancelled when its work returns.
+
+        Returns:
+            The job, or None if it is not known in memory
+        """
+        job = self.get(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return job
+
+        job.cancel_requested.set()
+        if job.future is not None and job.future.cancel():
+            await self._finish(job, 'cancelled')
+        else:
+            job.message = 'Cancelling'
+        return job
+
+    def list_jobs(self, project_id: Optional[str] = None) -> List[AnalysisJob]:
+        """Jobs held in memory, newest first"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if project_id:
+            project_id = normalize_uuid(project_id)
+            jobs = [job for job in jobs if job.project_id == project_id]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the retention period"""
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the workers without waiting for running jobs."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            if job.status not in FINISHED_STATUSES:
+                job.cancel_requested.set()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+            return {
+                'workers': self.max_workers,
+                'pending': statuses.count('pending'),
+                'running': statuses.count('running'),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'cancelled': self.cancelled,
+            }
+
+    def background(self, func: Callable) -> Callable:
+        """
+        Decorate an analysis endpoint so `?background=true` runs it as a job.
+
+        The endpoint gains a `background` query parameter. When it is set, the
+        response carries the job id and a status URL instead of the results.
+        """
+        endpoint = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, background: bool = False, **kwargs):
+            if not background:
+                return await func(*args, **kwargs)
+
+            job = await self.submit(endpoint, func, kwargs)
+            return AnalyticsUtils.format_api_response('success', {
+                'job_id': job.id,
+                'status': job.status,
+                'status_url': f"{settings.API_V1_STR}/analytics/jobs/{job.id}",
+            }, f"Analysis queued as background job {job.id}")
+
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(
+                'background', inspect.Parameter.KEYWORD_ONLY, annotation=bool,
+                default=Query(False, description="Run as a background job and return its job ID immediately")
+            ),
+        ])
+        return wrapper
+
+
+analysis_jobs = AnalysisJobManager(
+    max_workers=settings.ANALYSIS_JOB_WORKERS,
+    retention_seconds=settings.ANALYSIS_JOB_RETENTION,
+)
@@ -0,0 +1,102 @@
+"""
+Lazy registry of analytics modules.
+
+The analysis packages pull in scikit-learn, statsmodels, pingouin, TextBlob
+and NLTK, which dominate the engine's cold start even though most requests
+only touch a few of them. Callers hold a LazyModule stand-in instead of
+importing a module directly; the real import happens on first attribute
+access and its duration is recorded for monitoring.
+"""
+
+import time
+import logging
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """Stand-in for an analytics module that imports it on first attribute access."""
+
+    __slots__ = ('_name', '_registry')
+
+    def __init__(self, name: str, registry: "AnalyticsModuleRegistry"):
+        self._name = name
+        self._registry = registry
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._registry.load(self._name), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._registry.is_loaded(self._name) else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+class AnalyticsModuleRegistry:
+    """Imports registered analytics modules on first use and records how long each took."""
+
+    def __init__(self):
+        self._modules: Dict[str, Optional[ModuleType]] = {}
+        self._import_seconds: Dict[str, float] = {}
+        self._requires: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def lazy(self, name: str, requires: Sequence[str] = ()) -> LazyModule:
+        """
+        Register a module and return its lazy stand-in.
+
+        Args:
+            name: Dotted module path, e.g. 'app.analytics.descriptive'
+            requires: Modules to import before this one, for packages whose
+                circular imports only resolve in a particular order
+        """
+        with self._lock:
+            self._modules.setdefault(name, None)
+            if requires:
+                self._requires[name] = tuple(dict.fromkeys(self._requires.get(name, ()) + tuple(requires)))
+        return LazyModule(name, self)
+
+    def is_loaded(self, name: str) -> bool:
+        return self._modules.get(name) is not None
+
+    def load(self, name: str) -> ModuleType:
+        """Import a registered module if needed and return it."""
+        module = self._modules.get(name)
+        if module is not None:
+            return module
+
+        with self._lock:
+            module = self._modules.get(name)
+            if module is None:
+                start = time.perf_counter()
+                for required in self._requires.get(name, ()):
+                    importlib.import_module(required)
+                module = importlib.import_module(name)
+                elapsed = time.perf_counter() - start
+                self._modules[name] = module
+                self._import_seconds[name] = elapsed
+                logger.info(f"Imported analytics module {name} on first use in {elapsed:.2f}s")
+        return module
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """Import registered modules ahead of use (all of them by default)."""
+        for name in list(names or self._modules):
+            try:
+                self.load(name)
+            except Exception as e:
+                logger.warning(f"Could not preload analytics module {name}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Registered modules and first-use import times for monitoring"""
+        with self._lock:
+            return {
+                'registered': len(self._modules),
+                'loaded': len(self._import_seconds),
+                'import_seconds': {name: round(seconds, 4) for name, seconds in self._import_seconds.items()},
+            }
+
+
+analytics_modules = AnalyticsModuleRegistry()
@@ -0,0 +1,512 @@
+"""
+Per-project data profiles kept per data version.
+
+StandardizedDataProfiler rescans every column (unique values, duplicated rows,
+missing counts) each time a project's characteristics are requested, and the
+data-characteristics, recommendations and variable-listing calls request them
+constantly. Here a project's profile is built once as mergeable state:
+
+    per column   non-null and missing counts, whether values have fractional
+                 parts, and a k-minimum-values sketch of value hashes; for
+                 numerical columns also their mergeable statistics (moments,
+                 value table and quantile sketch, see
+                 descriptive.streaming_statistics)
+    per frame    row count and the distinct row hashes
+
+The distinct sketch is exact below DISTINCT_SKETCH_SIZE values, which covers
+every threshold the variable type rules use (2, 20 and 50), and an estimate
+above it. Profiles are stored under the project's data-version token, so
+unchanged projects are answered without loading their data. When new responses
+arrive, only the rows after the profile's watermark are loaded and folded in;
+edits and deletions, which a mergeable profile cannot subtract, rebuild it.
+Basic statistics of numerical columns are answered from the same profiles.
+
+Unfiltered profiles are also pickled to PROFILE_DIR so they survive restarts.
+"""
+
+import os
+import copy
+import pickle
+import asyncio
+import logging
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.database import (
+    ResponseFilter, get_project_data_state, load_project_columns, project_data_version, run_db
+)
+from app.utils.compute import compute_executor, run_compute
+from app.utils.data_cache import project_data_cache
+from app.utils.module_registry import analytics_modules
+from app.utils.shared import AnalyticsUtils, DataMode, base_detector, normalize_uuid
+
+# Mergeable column statistics; part of the descriptive package, imported on first use
+streaming_statistics = analytics_modules.lazy(
+    'app.analytics.descriptive.streaming_statistics', requires=['app.analytics.auto_detect']
+)
+
+logger = logging.getLogger(__name__)
+
+# Hashes kept per column; distinct counts below this are exact
+DISTINCT_SKETCH_SIZE = 256
+# Column name fragments StandardizedDataProfiler treats as coordinates
+GEOGRAPHIC_TERMS = ('lat', 'lon', 'latitude', 'longitude')
+
+
+def _hash_values(values: Any) -> np.ndarray:
+    """64-bit hashes of a Series' values or a frame's rows"""
+    try:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # Unhashable values such as lists
+        return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+class DistinctSketch:
+    """K-minimum-values sketch of distinct values; sketches of disjoint row sets merge exactly."""
+
+    def __init__(self, k: int = DISTINCT_SKETCH_SIZE, hashes: Optional[np.ndarray] = None):
+        self.k = k
+        self.hashes = np.unique(hashes)[:k] if hashes is not None else np.empty(0, dtype=np.uint64)
+
+    def merged(self, other: "DistinctSketch") -> "DistinctSketch":
+        sketch = DistinctSketch(self.k)
+        sketch.hashes = np.union1d(self.hashes, other.hashes)[:self.k]
+        return sketch
+
+    def estimate(self) -> int:
+        """Number of distinct values (exact while fewer than k were seen)"""
+        if len(self.hashes) < self.k:
+            return len(self.hashes)
+        kth = float(self.hashes[self.k - 1]) / 2.0 ** 64
+        return int(round((self.k - 1) / kth))
+
+
+@dataclass
+class ColumnProfile:
+    """Mergeable statistics of one column."""
+    dtype: Any
+    non_null: int = 0
+    missing: int = 0
+    has_fraction: bool = False
+    distinct: DistinctSketch = field(default_factory=DistinctSketch)
+    statistics: Any = None
+
+    @staticmethod
+    def summarizable(dtype: Any) -> bool:
+        """Whether columns of this dtype carry mergeable statistics (numeric, not boolean)"""
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+    @classmethod
+    def of(cls, series: pd.Series) -> "ColumnProfile":
+        values = series.dropna()
+        has_fraction = False
+        if pd.api.types.is_float_dtype(values.dtype) and len(values):
+            array = values.to_numpy()
+            finite = array[np.isfinite(array)]
+            has_fraction = bool(np.any(finite != np.trunc(finite)))
+        return cls(
+            dtype=series.dtype,
+            non_null=int(len(values)),
+            missing=int(len(series) - len(values)),
+            has_fraction=has_fraction,
+            distinct=DistinctSketch(hashes=_hash_values(values)),
+            statistics=(streaming_statistics.ColumnStatistics.of(series, settings.QUANTILE_SKETCH_EPSILON)
+                        if cls.summarizable(series.dtype) else None),
+        )
+
+    def merged(self, other: "ColumnProfile") -> "ColumnProfile":
+        return ColumnProfile(
+            dtype=self.dtype,
+            non_null=self.non_null + other.non_null,
+            missing=self.missing + other.missing,
+            has_fraction=self.has_fraction or other.has_fraction,
+            distinct=self.distinct.merged(other.distinct),
+            statistics=(self.statistics.merged(other.statistics)
+                        if self.statistics is not None and other.statistics is not None else None),
+        )
+
+    def variable_type(self, name: str):
+        """DataType by StandardizedDataProfiler's rules, from the profile instead of the values"""
+        DataType = base_detector.DataType
+        if self.non_null == 0:
+            return DataType.EMPTY
+        if name and any(term in str(name).lower() for term in GEOGRAPHIC_TERMS):
+            return DataType.GEOGRAPHIC
+        if pd.api.types.is_datetime64_any_dtype(self.dtype):
+            return DataType.DATETIME
+
+        distinct = self.distinct.estimate()
+        if distinct == 2:
+            return DataType.BINARY
+        if pd.api.types.is_numeric_dtype(self.dtype):
+            if distinct > 20 or self.has_fraction:
+                return DataType.NUMERIC_CONTINUOUS
+            return DataType.NUMERIC_DISCRETE
+        if isinstance(self.dtype, pd.CategoricalDtype) and self.dtype.ordered:
+            return DataType.ORDINAL
+        return DataType.CATEGORICAL if distinct <= 50 else DataType.TEXT
+
+
+@dataclass
+class DataProfile:
+    """Mergeable profile of a project frame and the data state it is current as of."""
+    columns: Dict[str, ColumnProfile]
+    n_rows: int
+    row_hashes: np.ndarray
+    version: str = ''
+    watermark: Optional[Dict[str, Any]] = None
+    row_ids: Optional[np.ndarray] = None
+    summary: Optional[Dict[str, Any]] = None
+    updated_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def of(cls, df: pd.DataFrame) -> "DataProfile":
+        """Profile a frame and summarize it"""
+        profile = cls._measure(df)
+        profile.summary = AnalyticsUtils.summarize_characteristics(profile.characteristics())
+        return profile
+
+    @classmethod
+    def _measure(cls, df: pd.DataFrame) -> "DataProfile":
+        return cls(
+            columns={column: ColumnProfile.of(df[column]) for column in df.columns},
+            n_rows=int(len(df)),
+            row_hashes=np.unique(_hash_values(df)),
+        )
+
+    def extended(self, df: pd.DataFrame) -> "DataProfile":
+        """Profile of these rows plus new rows `df` (same columns and dtypes)"""
+        delta = DataProfile._measure(df)
+        profile = DataProfile(
+            columns={column: self.columns[column].merged(delta.columns[column]) for column in self.columns},
+            n_rows=self.n_rows + delta.n_rows,
+            row_hashes=np.union1d(self.row_hashes, delta.row_hashes),
+        )
+        profile.summary = AnalyticsUtils.summarize_characteristics(profile.characteristics())
+        return profile
+
+    def has_statistics(self) -> bool:
+        """Whether every numerical column carries its statistics and sketch (older profiles do not)"""
+        return all(profile.statistics is not None and profile.statistics.sketch is not None
+                   for profile in self.columns.values() if ColumnProfile.summarizable(profile.dtype))
+
+    def accepts(self, df: pd.DataFrame) -> bool:
+        """Whether new rows `df` can be folded into this profile"""
+        return (list(df.columns) == list(self.columns) and
+                all(df[column].dtype == profile.dtype for column, profile in self.columns.items()))
+
+    def characteristics(self):
+        """DataCharacteristics fields the characteristics summary uses"""
+        characteristics = base_detector.DataCharacteristics()
+        characteristics.n_observations = self.n_rows
+        characteristics.n_variables = len(self.columns)
+        characteristics.data_shape = (self.n_rows, len(self.columns))
+        characteristics.variable_types = {
+            column: profile.variable_type(column) for column, profile in self.columns.items()
+        }
+        characteristics.type_counts = Counter(characteristics.variable_types.values())
+
+        cells = self.n_rows * len(self.columns)
+        missing = {column: profile.missing for column, profile in self.columns.items() if profile.missing > 0}
+        characteristics.missing_percentage = float(sum(missing.values()) / cells * 100) if cells else 0.0
+        characteristics.missing_patterns = {
+            'variables_with_missing': missing,
+            'missing_count': len(missing),
+            'completely_missing_vars': [column for column, count in missing.items() if count == self.n_rows],
+        }
+        characteristics.duplicate_rows = self.n_rows - len(self.row_hashes)
+        characteristics.constant_columns = [
+            column for column, profile in self.columns.items() if profile.distinct.estimate() <= 1
+        ]
+        characteristics.completeness_score = 100 - characteristics.missing_percentage
+        return characteristics
+
+
+class ProjectProfileStore:
+    """Data profiles per project variant, validated against the project's data version."""
+
+    def __init__(self, base_dir: str, max_entries: int, enabled: bool = True):
+        """
+        Initialize the store.
+
+        Args:
+            base_dir: Directory holding one sub-directory of profiles per project
+            max_entries: Profiles kept in memory (least recently used are dropped)
+            enabled: When False characteristics are profiled from the frame on every call
+        """
+        self.base_dir = base_dir
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, DataProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.hits = 0
+        self.incremental_updates = 0
+        self.rebuilds = 0
+        self.disk_reads = 0
+        self.disk_writes = 0
+
+    async def get_characteristics(self, project_id: str, data_mode: DataMode = "long",
+                                  filters: Optional[ResponseFilter] = None,
+                                  df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        Characteristics of a project's data, as AnalyticsUtils.analyze_data_characteristics returns them.
+
+        Args:
+            project_id: Project identifier
+            data_mode: 'long' or 'wide', as passed to get_project_data
+            filters: Response filter, as passed to get_project_data
+            df: The frame get_project_data returned for these arguments, if the
+                caller already has it; profiled instead of loading it again
+
+        Returns:
+            Characteristics dict (sample_size 0 if the project has no data)
+        """
+        if not self.enabled:
+            if df is None:
+                df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
+            return await run_compute(AnalyticsUtils.analyze_data_characteristics, df)
+
+        profile = await self.get_profile(project_id, data_mode=data_mode, filters=filters, df=df)
+        if profile is None:
+            return AnalyticsUtils.analyze_data_characteristics(pd.DataFrame())
+        return copy.deepcopy(profile.summary)
+
+    async def get_column_statistics(self, project_id: str, data_mode: DataMode = "long",
+                                    filters: Optional[ResponseFilter] = None) -> Optional[Dict[str, Any]]:
+        """
+        Mergeable statistics of a project's numerical columns, from its current profile.
+
+        Returns:
+            ColumnStatistics per numerical column and the frame's row count under
+            'n_rows', or None if the store is disabled or the project has no data
+        """
+        if not self.enabled:
+            return None
+        profile = await self.get_profile(project_id, data_mode=data_mode, filters=filters)
+        if profile is None:
+            return None
+        columns = {column: column_profile.statistics for column, column_profile in profile.columns.items()
+                   if column_profile.statistics is not None}
+        return {'columns': columns, 'n_rows': profile.n_rows}
+
+    async def get_profile(self, project_id: str, data_mode: DataMode = "long",
+                          filters: Optional[ResponseFilter] = None,
+                          df: Optional[pd.DataFrame] = None) -> Optional[DataProfile]:
+        """
+        Current profile of a project's data (shared; callers must not modify it).
+
+        Arguments are those of get_characteristics.
+
+        Returns:
+            The profile, or None if the project has no data
+        """
+        normalized_project_id = normalize_uuid(project_id)
+        if filters is not None and filters.is_empty():
+            filters = None
+        key = (normalized_project_id, data_mode)
+        if filters is not None:
+            key += ("filter", filters)
+
+        state = await get_project_data_state(normalized_project_id)
+        version = project_data_version(state)
+        previous = self._lookup(key)
+        if previous is not None and previous.version == version and previous.has_statistics():
+            with self._lock:
+                self.hits += 1
+            return previous
+
+        profile = None
+        if (previous is not None and previous.row_ids is not None and previous.has_statistics() and
+                settings.PROJECT_DELTA_REFRESH_ENABLED):
+            profile = await self._extend(normalized_project_id, previous, state)
+        if profile is None:
+            profile = await self._build(project_id, key, data_mode, filters, state, df)
+            if profile is None:
+                return None
+
+        profile.version = version
+        profile.watermark = state
+        self._store(key, profile)
+        return profile
+
+    async def _extend(self, normalized_project_id: str, previous: DataProfile,
+                      state: Dict[str, Any]) -> Optional[DataProfile]:
+        """
+        Fold responses added since the profile's watermark into it.
+
+        Returns:
+            The extended profile, or None if rows were edited or deleted (or the
+            delta does not match the profiled columns) and a rebuild is needed
+        """
+        try:
+            delta_columns = await run_db(load_project_columns, normalized_project_id, since=previous.watermark)
+            if not delta_columns:
+                return None
+            delta_ids = delta_columns['response_id']
+            if previous.n_rows + len(delta_ids) != state['count'] or pd.Index(delta_ids).isin(previous.row_ids).any():
+                return None
+
+            delta_frame = AnalyticsUtils._prepare_dataframe(pd.DataFrame(delta_columns, copy=False))
+            # Small deltas can infer different dtypes (e.g. an all-null column)
+            delta_frame = delta_frame.astype(
+                {column: profile.dtype for column, profile in previous.columns.items()
+                 if column in delta_frame.columns},
+                errors='ignore'
+            )
+            if not previous.accepts(delta_frame):
+                return None
+
+            profile = await compute_executor.run_threaded(previous.extended, delta_frame)
+            profile.row_ids = np.concatenate([delta_ids, previous.row_ids])
+            with self._lock:
+                self.incremental_updates += 1
+            logger.info(f"Extended profile of project {normalized_project_id} with {len(delta_ids)} rows")
+            return profile
+        except Exception as e:
+            logger.warning(f"Incremental profile update failed, rebuilding: {e}")
+            return None
+
+    async def _build(self, project_id: str, key: Hashable, data_mode: DataMode,
+                     filters: Optional[ResponseFilter], state: Dict[str, Any],
+                     df: Optional[pd.DataFrame]) -> Optional[DataProfile]:
+        """Profile the whole frame; None if the project has no data"""
+        if df is None:
+            df = await AnalyticsUtils.get_project_data(project_id, data_mode=data_mode, filters=filters)
+        if df.empty:
+            return None
+
+        profile = await compute_executor.run_threaded(DataProfile.of, df)
+        if data_mode == "long" and filters is None:
+            # Response ids of the cached frame let later calls extend the profile
+            entry = project_data_cache.peek((key[0],))
+            if (entry is not None and entry.row_ids is not None and len(entry.row_ids) == len(df) and
+                    entry.version == project_data_version(state)):
+                profile.row_ids = entry.row_ids
+        with self._lock:
+            self.rebuilds += 1
+        return profile
+
+    def _lookup(self, key: Hashable) -> Optional[DataProfile]:
+        """Profile for `key` from memory or disk, whatever its version"""
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None:
+                self._entries.move_to_end(key)
+                return profile
+
+        profile = self._read(key)
+        if profile is not None:
+            with self._lock:
+                self.disk_reads += 1
+            self._remember(key, profile)
+        return profile
+
+    def _store(self, key: Hashable, profile: DataProfile) -> None:
+        """Keep a profile in memory and write it to disk off the request path"""
+        self._remember(key, profile)
+        if self._path(key) is not None:
+            asyncio.get_running_loop().run_in_executor(None, self._write, key, profile)
+
+    def _remember(self, key: Hashable, profile: DataProfile) -> None:
+        with self._lock:
+            self._entries[key] = profile
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: Hashable) -> Optional[str]:
+        """File of an unfiltered profile; filtered profiles are kept in memory only"""
+        if len(key) != 2:
+            return None
+        project_id, data_mode = key
+        return os.path.join(self.base_dir, str(project_id), f"{data_mode}.profile")
+
+    def _read(self, key: Hashable) -> Optional[DataProfile]:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            # Unpickling imports the statistics module; it must go through the registry
+            analytics_modules.load('app.analytics.descriptive.streaming_statistics')
+            with open(path, 'rb') as source:
+                return pickle.load(source)
+        except Exception as e:
+            logger.warning(f"Could not read profile {path}: {e}")
+            return None
+
+    def _write(self, key: Hashable, profile: DataProfile) -> bool:
+        """Write a profile atomically, replacing the previous version"""
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as sink:
+                    pickle.dump(profile, sink, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            with self._lock:
+                self.disk_writes += 1
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write profile {path}: {e}")
+            return False
+
+    def invalidate(self, project_id: Optional[str] = None) -> int:
+        """
+        Drop profiles of one project (every variant, in memory and on disk) or of all projects.
+
+        Returns:
+            Number of in-memory profiles removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if project_id is None or key[0] == project_id]
+            for key in keys:
+                del self._entries[key]
+
+        directories = [project_id] if project_id is not None else (
+            os.listdir(self.base_dir) if os.path.isdir(self.base_dir) else []
+        )
+        for directory in directories:
+            directory = os.path.join(self.base_dir, str(directory))
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    if name.endswith('.profile'):
+                        os.remove(os.path.join(directory, name))
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'incremental_updates': self.incremental_updates,
+                'rebuilds': self.rebuilds,
+                'disk_reads': self.disk_reads,
+                'disk_writes': self.disk_writes,
+            }
+
+
+project_profiles = ProjectProfileStore(
+    base_dir=settings.PROFILE_DIR,
+    max_entries=settings.PROFILE_STORE_MAX_ENTRIES,
+    enabled=settings.PROFILE_STORE_ENABLED,
+)
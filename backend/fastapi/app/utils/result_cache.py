@@ -0,0 +1,156 @@
+"""
+Persistent cache of analysis endpoint results.
+
+Results are stored as AnalyticsResult rows keyed by a hash of the endpoint, its
+normalized parameters and the project's data-version token. A changed project
+gets a new version and therefore new keys, so stored results never need to be
+invalidated; they simply stop matching and expire after
+ANALYTICS_SETTINGS['RESULT_CACHE_TIMEOUT']. Unlike the in-process frame cache,
+stored results survive restarts and are shared by every worker.
+"""
+
+import json
+import hashlib
+import logging
+import functools
+import threading
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict
+
+from core.config import settings
+from core.database import get_cached_result, get_project_data_version, save_cached_result
+from app.utils.shared import normalize_uuid
+from app.utils.conditional import conditional_responses
+from app.utils.serialization import to_jsonable
+from app.utils.single_flight import request_coalescer
+
+logger = logging.getLogger(__name__)
+
+# Endpoint arguments that do not affect the result
+IGNORED_PARAMETERS = ('db', 'project_id')
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize parameter values json.dumps does not handle natively"""
+    if is_dataclass(value):
+        return asdict(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(mode='json')
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+class AnalysisResultCache:
+    """Looks up and stores endpoint results in the AnalyticsResult table."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            enabled: When False endpoints always compute and nothing is stored
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    @staticmethod
+    def normalize_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-safe copy of endpoint arguments, without those that do not affect results"""
+        cleaned = {key: value for key, value in parameters.items() if key not in IGNORED_PARAMETERS}
+        return json.loads(json.dumps(cleaned, sort_keys=True, default=_json_default))
+
+    @staticmethod
+    def make_key(endpoint: str, parameters: Dict[str, Any], data_version: str) -> str:
+        """Hash of endpoint, normalized parameters and data version (64 hex characters)"""
+        payload = json.dumps([endpoint, parameters, data_version], sort_keys=True, default=_json_default)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def cached(self, func: Callable) -> Callable:
+        """
+        Decorate an analysis endpoint so repeat calls on unchanged data read the stored result.
+
+        The endpoint must take a `project_id` argument and return a response
+        built by AnalyticsUtils.format_api_response; only successful responses
+        are stored. Cache failures are logged and never fail the request.
+        Identical concurrent calls share one computation (see
+        app.utils.single_flight). Streaming requests (`stream=True`) bypass
+        the cache. Decorated endpoints are marked conditional_responses.versioned.
+        """
+        endpoint = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not (self.enabled or request_coalescer.enabled) or kwargs.get('stream'):
+                return await func(*args, **kwargs)
+
+            project_id = normalize_uuid(kwargs['project_id'])
+            parameters = self.normalize_parameters(kwargs)
+            cache_key = None
+            try:
+                data_version = await get_project_data_version(project_id)
+                cache_key = self.make_key(endpoint, parameters, data_version)
+                results = await get_cached_result(project_id, cache_key) if self.enabled else None
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"Result cache lookup failed for {endpoint}: {e}")
+                results = None
+
+            if results is not None:
+                self._count('hits')
+                # Stored results are plain JSON already
+                return {'status': 'success', 'data': results, 'timestamp': datetime.now().isoformat()}
+            if self.enabled:
+                self._count('misses')
+
+            async def compute():
+                response = await func(*args, **kwargs)
+                if self.enabled and cache_key and isinstance(response, dict) and response.get('status') == 'success':
+                    data = response.get('data') or {}
+                    try:
+                        await save_cached_result(
+                            project_id, cache_key, data.get('analysis_type', endpoint),
+                            {'endpoint': endpoint, 'parameters': parameters, 'data_version': data_version},
+                            to_jsonable(data)
+                        )
+                        self._count('writes')
+                    except Exception as e:
+                        self._count('errors')
+                        logger.warning(f"Could not store result for {endpoint}: {e}")
+                return response
+
+            if cache_key is None:
+                return await compute()
+            return await request_coalescer.run(cache_key, compute)
+
+        # Results keyed by data version and parameters can be revalidated with ETags
+        return conditional_responses.versioned(wrapper)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'errors': self.errors,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+result_cache = AnalysisResultCache(enabled=settings.RESULT_CACHE_ENABLED)
@@ -0,0 +1,166 @@
+"""
+JSON encoding of analysis results.
+
+Results are full of NumPy scalars and arrays, pandas objects, NaN and
+timestamps. AnalyticsUtils.convert_numpy_types made them JSON-safe by
+rebuilding every nested dict and list in Python, after which FastAPI walked
+the whole result again with jsonable_encoder before serializing it. Here
+orjson encodes NumPy scalars, contiguous arrays, datetimes and NaN (as null)
+natively in a single pass; the remaining types go through a small `default`
+hook while being encoded, without copying the rest of the result. Dict keys
+orjson cannot encode (tuples from multi-level columns, NumPy scalars,
+timestamps) make it raise, and only then is the result copied with string
+keys, as jsonable_encoder wrote them, and encoded again.
+
+Endpoint routers use AnalyticsRoute, which returns dict results as an
+AnalyticsJSONResponse directly so FastAPI's own encoding pass is skipped.
+"""
+
+import functools
+import inspect
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+
+from core.database import request_data_states
+from app.utils.conditional import conditional_responses
+
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Convert the values orjson does not encode natively"""
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        # Non-contiguous or object arrays
+        return obj.tolist()
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return obj.to_dict()
+    if isinstance(obj, (datetime, date, time)):
+        # Subclasses such as pd.Timestamp
+        return obj.isoformat()
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    try:
+        if pd.isna(obj):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return str(obj)
+
+
+def _key(key: Any) -> str:
+    """String form of a dict key ("numeric_value,count" for a tuple)"""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, tuple):
+        return ','.join(_key(part) for part in key)
+    if isinstance(key, np.generic):
+        key = key.item()
+    if key is None or key is pd.NaT:
+        return 'null'
+    if isinstance(key, bool):
+        return 'true' if key else 'false'
+    if isinstance(key, (datetime, date, time)):
+        return key.isoformat()
+    return str(key)
+
+
+def _with_string_keys(obj: Any) -> Any:
+    """Copy of the dicts and lists of a result with every dict key a string"""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        obj = obj.to_dict()
+    if isinstance(obj, dict):
+        return {_key(key): _with_string_keys(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_with_string_keys(item) for item in obj]
+    return obj
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode an analysis result as UTF-8 JSON; NaN and infinities become null"""
+    try:
+        return orjson.dumps(obj, default=_default, option=JSON_OPTIONS)
+    except TypeError:
+        # Dict keys orjson does not encode
+        return orjson.dumps(_with_string_keys(obj), default=_default, option=JSON_OPTIONS)
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Plain-Python copy of a result, for storing in JSON database fields"""
+    return orjson.loads(encode_json(obj))
+
+
+class AnalyticsJSONResponse(JSONResponse):
+    """JSON response encoded with encode_json"""
+
+    def render(self, content: Any) -> bytes:
+        self.succeeded = isinstance(content, dict) and content.get('status') == 'success'
+        return encode_json(content)
+
+
+def _respond_directly(endpoint: Callable) -> Callable:
+    """Wrap an async endpoint so dict results are returned as an AnalyticsJSONResponse"""
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return AnalyticsJSONResponse(result)
+
+    return wrapper
+
+
+class AnalyticsRoute(APIRoute):
+    """
+    Route that encodes endpoint results with encode_json.
+
+    FastAPI passes a returned Response through untouched, so wrapping the
+    result skips its jsonable_encoder pass over the whole result.
+
+    Successful responses of versioned project endpoints carry an ETag, and
+    requests whose If-None-Match names the current one are answered with 304
+    Not Modified without running the endpoint (see app.utils.conditional).
+    The project's data state is read once per request and shared by the
+    ETag, the result cache and the data load.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        self.versioned = conditional_responses.is_versioned(endpoint)
+        super().__init__(path, _respond_directly(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+        versioned = self.versioned
+
+        async def conditional_handler(request: Request) -> Response:
+            with request_data_states():
+                etag = await conditional_responses.etag_for(request) if versioned else None
+                if etag is not None and conditional_responses.is_not_modified(request, etag):
+                    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': 'private, no-cache'})
+
+                response = await handler(request)
+                if etag is not None and response.status_code == 200 and getattr(response, 'succeeded', False):
+                    conditional_responses.tag(response, etag)
+                return response
+
+        return conditional_handler
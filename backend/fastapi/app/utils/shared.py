@@ -4,63 +4,39 @@ Shared utilities for analytics operations.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple, Union, Literal
 from datetime import datetime
 import json
+import asyncio
 import logging
 import uuid
-from core.database import get_project_data, get_project_stats
-
-# Inferential analytics imports
-from app.analytics.inferential.hypothesis_testing import (
-    perform_t_test, perform_paired_t_test, perform_welch_t_test, perform_anova,
-    perform_two_way_anova, perform_repeated_measures_anova, perform_chi_square_test,
-    perform_fisher_exact_test, perform_mcnemar_test, perform_correlation_test,
-    perform_partial_correlation
-)
-from app.analytics.inferential.bayesian_inference import (
-    bayesian_t_test, bayesian_proportion_test, calculate_bayes_factor,
-    calculate_posterior_distribution, calculate_credible_interval, bayesian_ab_test
-)
-from app.analytics.inferential.confidence_intervals import (
-    calculate_mean_ci, calculate_proportion_ci, calculate_difference_ci,
-    calculate_correlation_ci, calculate_median_ci, calculate_bootstrap_ci,
-    calculate_prediction_interval, calculate_odds_ratio_ci
-)
-from app.analytics.inferential.effect_sizes import (
-    calculate_cohens_d, calculate_hedges_g, calculate_glass_delta, calculate_eta_squared,
-    calculate_omega_squared, calculate_cohens_f, calculate_cramers_v, calculate_odds_ratio,
-    calculate_risk_ratio, calculate_nnt
-)
-from app.analytics.inferential.power_analysis import (
-    calculate_sample_size_t_test, calculate_sample_size_anova, calculate_sample_size_proportion,
-    calculate_sample_size_correlation, calculate_power_t_test, calculate_power_anova,
-    calculate_effect_size_needed, post_hoc_power_analysis
-)
-from app.analytics.inferential.nonparametric_tests import (
-    mann_whitney_u_test, wilcoxon_signed_rank_test, kruskal_wallis_test, friedman_test,
-    runs_test, kolmogorov_smirnov_test, anderson_darling_test, shapiro_wilk_test,
-    mood_median_test
-)
-from app.analytics.inferential.multiple_comparisons import (
-    bonferroni_correction, holm_bonferroni_correction, benjamini_hochberg_correction,
-    benjamini_yekutieli_correction, tukey_hsd_test, dunnett_test, games_howell_test,
-    apply_multiple_corrections
-)
-from app.analytics.inferential.regression_analysis import (
-    perform_linear_regression, perform_multiple_regression, perform_logistic_regression,
-    perform_poisson_regression, calculate_regression_diagnostics, calculate_vif,
-    perform_ridge_regression, perform_lasso_regression, perform_robust_regression
-)
-from app.analytics.inferential.time_series_inference import (
-    test_stationarity, test_autocorrelation, test_seasonality, granger_causality_test,
-    cointegration_test, change_point_detection, forecast_accuracy_tests
-)
-from app.analytics.inferential.inference_utils import (
-    validate_series_data, validate_two_samples, validate_dataframe_columns,
-    test_normality, test_equal_variances, test_independence, format_p_value,
-    format_confidence_interval, check_test_assumptions
+from asgiref.sync import sync_to_async
+from core.database import (
+    get_project_data, get_project_data_columnar, get_project_data_state, get_project_response_counts,
+    get_project_stats, load_project_columns, project_data_version, run_db, PROJECT_DATA_COLUMNS, ResponseFilter
 )
+from core.config import settings
+from app.utils.data_cache import handoff_copy, project_data_cache
+from app.utils.snapshot_store import snapshot_store
+from app.utils.analysis_matrix import MATRIX_SOURCE_COLUMNS, build_analysis_matrix
+from app.utils.module_registry import analytics_modules
+
+# Analytics modules are imported on first use (see app.utils.module_registry);
+# their scientific dependencies dominate the API's cold start
+hypothesis_testing = analytics_modules.lazy('app.analytics.inferential.hypothesis_testing')
+bayesian_inference = analytics_modules.lazy('app.analytics.inferential.bayesian_inference')
+confidence_intervals = analytics_modules.lazy('app.analytics.inferential.confidence_intervals')
+effect_sizes = analytics_modules.lazy('app.analytics.inferential.effect_sizes')
+power_analysis = analytics_modules.lazy('app.analytics.inferential.power_analysis')
+nonparametric_tests = analytics_modules.lazy('app.analytics.inferential.nonparametric_tests')
+multiple_comparisons = analytics_modules.lazy('app.analytics.inferential.multiple_comparisons')
+regression_analysis = analytics_modules.lazy('app.analytics.inferential.regression_analysis')
+time_series_inference = analytics_modules.lazy('app.analytics.inferential.time_series_inference')
+# app.analytics.auto_detect must be imported before the descriptive package to
+# resolve the circular import between them
+descriptive = analytics_modules.lazy('app.analytics.descriptive', requires=['app.analytics.auto_detect'])
+qualitative = analytics_modules.lazy('app.analytics.qualitative')
+base_detector = analytics_modules.lazy('app.analytics.auto_detect.base_detector')
 
 logger = logging.getLogger(__name__)
 
@@ -94,93 +70,12 @@ def normalize_uuid(uuid_str: str) -> str:
         logger.warning(f"Could not normalize UUID: {uuid_str}")
         return str(uuid_str)
 
-# Import analytics modules
-from app.analytics.auto_detect.survey_detector import SurveyDetector
-from app.analytics.auto_detect.base_detector import StandardizedDataProfiler, DataCharacteristics
+# Shape of the project frame handed to analyses: 'long' is one row per response,
+# 'wide' is one row per respondent with one typed column per question
+DataMode = Literal["long", "wide"]
 
-# Try to import the unified auto-detector
-try:
-    from app.analytics.auto_detect import UnifiedAutoDetector, create_auto_detector
-    UNIFIED_AUTO_DETECTOR_AVAILABLE = True
-except ImportError:
-    UNIFIED_AUTO_DETECTOR_AVAILABLE = False
-    logger.warning("UnifiedAutoDetector not available, using basic auto-detection")
-from app.analytics.descriptive import (
-    # Main analysis functions
-    analyze_descriptive_data,
-    quick_data_overview,
-    auto_detect_analysis_needs,
-    get_data_characteristics as get_descriptive_characteristics,
-    generate_analysis_workflow,
-    
-    # Basic Statistics
-    calculate_basic_stats,
-    calculate_percentiles,
-    calculate_grouped_stats,
-    calculate_weighted_stats,
-    calculate_correlation_matrix,
-    calculate_covariance_matrix,
-    
-    # Distributions
-    analyze_distribution,
-    test_normality,
-    calculate_skewness_kurtosis,
-    fit_distribution,
-    
-    # Categorical Analysis
-    analyze_categorical,
-    calculate_chi_square,
-    calculate_cramers_v,
-    analyze_cross_tabulation,
-    
-    # Outlier Detection
-    detect_outliers_iqr,
-    detect_outliers_zscore,
-    detect_outliers_isolation_forest,
-    detect_outliers_mad,
-    get_outlier_summary,
-    
-    # Missing Data
-    analyze_missing_data,
-    get_missing_patterns,
-    calculate_missing_correlations,
-    
-    # Temporal Analysis
-    analyze_temporal_patterns,
-    calculate_time_series_stats,
-    detect_seasonality,
-    
-    # Geospatial Analysis
-    analyze_spatial_distribution,
-    calculate_spatial_autocorrelation,
-    create_location_clusters,
-    
-    # Summary Generation
-    generate_full_report,
-    generate_executive_summary,
-    export_statistics
-)
-from app.analytics.qualitative import (
-    analyze_sentiment,
-    analyze_sentiment_batch
-)
-
-# Import text analysis functions
-try:
-    from app.analytics.qualitative.text_analysis import analyze_text_frequency, preprocess_text
-except ImportError:
-    # Fallback implementations
-    def analyze_text_frequency(text: str):
-        """Fallback text frequency analysis"""
-        words = text.lower().split()
-        from collections import Counter
-        return dict(Counter(words))
-    
-    def preprocess_text(text: str):
-        """Fallback text preprocessing"""
-        return text.lower().split()
-
-logger = logging.getLogger(__name__)
+# Columns _prepare_dataframe removes from every long-format project frame
+PREPARE_DROPPED_COLUMNS = ['response_id', 'device_info', 'location_data']
 
 class AnalyticsUtils:
     """Comprehensive analytics utilities for the FastAPI endpoints."""
@@ -194,32 +89,294 @@ class AnalyticsUtils:
         return normalize_uuid(uuid_str)
     
     @staticmethod
-    async def get_project_data(project_id: str) -> pd.DataFrame:
-        """Get project data as pandas DataFrame."""
+    async def get_project_data(project_id: str, loader: str = "columnar",
+                               use_cache: bool = True, data_mode: DataMode = "long",
+                               columns: Optional[Sequence[str]] = None,
+                               filters: Optional[ResponseFilter] = None) -> pd.DataFrame:
+        """
+        Get project data as pandas DataFrame.
+        
+        Args:
+            project_id: Project identifier
+            loader: 'columnar' builds the frame from typed column arrays loaded in
+                cursor batches; 'records' uses the legacy per-response dict path
+            use_cache: Serve and store the prepared frame in the shared
+                project data cache, validated against the project's data version.
+                A stale cached frame is refreshed with a delta load when possible.
+            data_mode: 'long' (one row per response) or 'wide' (respondent x
+                question analysis matrix, see app.utils.analysis_matrix)
+            columns: Long-format columns the caller needs. Only these are loaded,
+                skipping unused joins and JSON decoding, and the narrow frame is
+                cached under its own key. Names that are not project data columns
+                are ignored; None (or no known names) loads the full frame.
+                Ignored in wide mode.
+            filters: Optional ResponseFilter (date window, questions, respondents,
+                collectors, validation status) applied in SQL, so only the
+                matching slice is loaded. Filtered frames are cached per filter
+                and always use the columnar loader.
+        """
         try:
             # Normalize UUID format to match database storage
             normalized_project_id = normalize_uuid(project_id)
             logger.info(f"Getting project data for {project_id} -> normalized: {normalized_project_id}")
             
-            data = await get_project_data(normalized_project_id)
-            if not data:
-                return pd.DataFrame()
+            if filters is not None and filters.is_empty():
+                filters = None
+            
+            if data_mode == "wide":
+                return await AnalyticsUtils._get_analysis_matrix(normalized_project_id, use_cache, filters)
+            if data_mode != "long":
+                raise ValueError(f"Unknown data mode: {data_mode}")
+            
+            if filters is not None:
+                # The records loader has no SQL filter support
+                loader = "columnar"
+            
+            projection = AnalyticsUtils._resolve_projection(columns)
+            if not use_cache:
+                df, _ = await AnalyticsUtils._load_project_frame(normalized_project_id, loader, projection, filters)
+                return df
+            
+            full_key = (normalized_project_id,)
+            cache_key = full_key
+            if projection is not None:
+                cache_key += ("columns",) + tuple(sorted(projection))
+            if filters is not None:
+                cache_key += ("filter", filters)
+            state = await get_project_data_state(normalized_project_id)
+            version = project_data_version(state)
+            cached = project_data_cache.get(cache_key, version)
+            if cached is None and projection is not None and filters is None:
+                # A current full frame already holds every projectable column
+                full_entry = project_data_cache.peek(full_key)
+                if full_entry is not None and full_entry.version == version:
+                    cached = project_data_cache.get(full_key, version, columns=projection)
+            if cached is not None:
+                return AnalyticsUtils._order_columns(cached, projection)
+            
+            # Snapshots are kept for full frames only; narrow and filtered loads are cheap
+            if cache_key == full_key:
+                snapshot = await AnalyticsUtils._load_snapshot(cache_key, version)
+                if snapshot is not None:
+                    return snapshot
+            
+            df = None
+            stale_entry = project_data_cache.peek(cache_key)
+            # A delta cannot drop rows that stopped matching a filter, so
+            # filtered frames are always reloaded
+            if (loader == "columnar" and settings.PROJECT_DELTA_REFRESH_ENABLED and filters is None and
+                    stale_entry is not None and stale_entry.row_ids is not None):
+                refreshed = await AnalyticsUtils._refresh_project_frame(
+                    normalized_project_id, stale_entry, state, projection
+                )
+                if refreshed is not None:
+                    df, row_ids = refreshed
+                    estimated_nbytes = int(stale_entry.nbytes * len(df) / max(len(stale_entry.frame), 1))
+                    project_data_cache.put(cache_key, version, df, row_ids=row_ids, watermark=state,
+                                           delta=True, nbytes=estimated_nbytes)
+            
+            if df is None:
+                df, row_ids = await AnalyticsUtils._load_project_frame(
+                    normalized_project_id, loader, projection, filters
+                )
+                if not df.empty:
+                    project_data_cache.put(cache_key, version, df, row_ids=row_ids, watermark=state)
             
-            df = pd.DataFrame(data)
-            return AnalyticsUtils._prepare_dataframe(df)
+            if not df.empty and cache_key == full_key:
+                AnalyticsUtils._save_snapshot(cache_key, version, df, row_ids, state)
+            return AnalyticsUtils._order_columns(handoff_copy(df), projection)
         except Exception as e:
             logger.error(f"Error getting project data: {e}")
             return pd.DataFrame()
     
     @staticmethod
-    async def get_project_stats(project_id: str) -> Dict[str, Any]:
-        """Get basic project statistics."""
+    def _resolve_projection(columns: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+        """Reduce requested column names to loadable project data columns (None for the full frame)."""
+        if columns is None:
+            return None
+        known = tuple(
+            column for column in dict.fromkeys(columns)
+            if column in PROJECT_DATA_COLUMNS and column not in PREPARE_DROPPED_COLUMNS
+        )
+        return known or None
+    
+    @staticmethod
+    def _order_columns(df: pd.DataFrame, projection: Optional[Tuple[str, ...]]) -> pd.DataFrame:
+        """Return a projected frame's columns in the order they were requested."""
+        if projection is None or df.empty:
+            return df
+        ordered = [column for column in projection if column in df.columns]
+        return df if list(df.columns) == ordered else df[ordered]
+    
+    @staticmethod
+    def declared_columns(*fields: Union[str, Sequence[str], None]) -> Optional[List[str]]:
+        """
+        Collect the column names an endpoint was asked to analyze, for use as a
+        get_project_data projection.
+        
+        Args:
+            fields: Column names or lists of names; None entries are skipped
+            
+        Returns:
+            De-duplicated column names, or None if no names were given
+        """
+        names = []
+        for field in fields:
+            if field is None:
+                continue
+            names.extend([field] if isinstance(field, str) else field)
+        return list(dict.fromkeys(names)) or None
+    
+    @staticmethod
+    async def _get_analysis_matrix(normalized_project_id: str, use_cache: bool,
+                                   filters: Optional[ResponseFilter] = None) -> pd.DataFrame:
+        """Get the wide respondent x question matrix, cached per project data version and filter."""
+        if use_cache:
+            cache_key = (normalized_project_id, "wide")
+            if filters is not None:
+                cache_key += ("filter", filters)
+            state = await get_project_data_state(normalized_project_id)
+            version = project_data_version(state)
+            cached = project_data_cache.get(cache_key, version)
+            if cached is not None:
+                return cached
+            
+            if filters is None:
+                snapshot = await AnalyticsUtils._load_snapshot(cache_key, version)
+                if snapshot is not None:
+                    return snapshot
+        
+        columns = await get_project_data_columnar(normalized_project_id, MATRIX_SOURCE_COLUMNS, filters=filters)
+        df = build_analysis_matrix(columns)
+        
+        if use_cache and not df.empty:
+            project_data_cache.put(cache_key, version, df)
+            if filters is None:
+                AnalyticsUtils._save_snapshot(cache_key, version, df)
+            return handoff_copy(df)
+        return df
+    
+    @staticmethod
+    async def _load_snapshot(cache_key: Tuple, version: str) -> Optional[pd.DataFrame]:
+        """Serve a frame from the on-disk snapshot store and promote it into the memory cache."""
+        snapshot = await sync_to_async(snapshot_store.load, thread_sensitive=False)(cache_key, version)
+        if snapshot is None:
+            return None
+        
+        df, row_ids, watermark = snapshot
+        project_data_cache.put(cache_key, version, df, row_ids=row_ids, watermark=watermark)
+        logger.info(f"Loaded project frame {cache_key} from snapshot")
+        return handoff_copy(df)
+    
+    @staticmethod
+    def _save_snapshot(cache_key: Tuple, version: str, df: pd.DataFrame,
+                       row_ids: Optional[np.ndarray] = None, watermark: Optional[Dict[str, Any]] = None) -> None:
+        """Write a frame's snapshot in a worker thread, off the request path."""
+        if snapshot_store.enabled:
+            asyncio.get_running_loop().run_in_executor(
+                None, snapshot_store.save, cache_key, version, df, row_ids, watermark
+            )
+    
+    @staticmethod
+    def _source_columns(projection: Optional[Tuple[str, ...]]) -> Optional[List[str]]:
+        """Database columns to load for a projection (response ids are kept for delta refresh)."""
+        return None if projection is None else ['response_id', *projection]
+    
+    @staticmethod
+    async def _load_project_frame(normalized_project_id: str, loader: str,
+                                  projection: Optional[Tuple[str, ...]] = None,
+                                  filters: Optional[ResponseFilter] = None) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+        """
+        Load and prepare a project frame straight from the database.
+        
+        Returns:
+            (prepared frame, response id per row) tuple
+        """
+        if loader == "columnar":
+            columns = await get_project_data_columnar(
+                normalized_project_id, AnalyticsUtils._source_columns(projection), filters=filters
+            )
+            if not columns:
+                return pd.DataFrame(), None
+            df = pd.DataFrame(columns, copy=False)
+        elif loader == "records":
+            data = await get_project_data(normalized_project_id)
+            if not data:
+                return pd.DataFrame(), None
+            df = pd.DataFrame(data)
+        else:
+            raise ValueError(f"Unknown project data loader: {loader}")
+        
+        row_ids = df['response_id'].to_numpy(dtype=object) if 'response_id' in df.columns else None
+        df = AnalyticsUtils._prepare_dataframe(df)
+        if projection is not None:
+            # The records loader always builds every default column
+            df = df[[column for column in projection if column in df.columns]]
+        return df, row_ids
+    
+    @staticmethod
+    async def _refresh_project_frame(normalized_project_id: str, entry, state: Dict[str, Any],
+                                     projection: Optional[Tuple[str, ...]] = None) -> Optional[Tuple[pd.DataFrame, np.ndarray]]:
+        """
+        Bring a stale cached frame up to date with a watermark delta load.
+        
+        Rows collected or synced after the cached watermark replace their old
+        versions (matched on response id) or are prepended as new rows. If the
+        row count still disagrees with the database, deleted responses are
+        dropped by reconciling against the project's current response ids.
+        
+        Returns:
+            (frame, row ids) tuple, or None if a full reload is needed
+        """
+        try:
+            delta_columns = await run_db(
+                load_project_columns, normalized_project_id,
+                AnalyticsUtils._source_columns(projection), since=entry.watermark
+            )
+            frame, row_ids = entry.frame, entry.row_ids
+            changed = 0
+            
+            if delta_columns:
+                delta_ids = delta_columns['response_id']
+                changed = len(delta_ids)
+                delta_frame = AnalyticsUtils._prepare_dataframe(pd.DataFrame(delta_columns, copy=False))
+                # Small deltas can infer different dtypes (e.g. an all-null column)
+                delta_frame = delta_frame.astype(frame.dtypes.to_dict(), errors='ignore')
+                keep = ~pd.Index(row_ids).isin(delta_ids)
+                frame = pd.concat([delta_frame, frame[keep]], ignore_index=True)
+                row_ids = np.concatenate([delta_ids, row_ids[keep]])
+            
+            if len(frame) != state['count']:
+                # Some responses were deleted since the watermark
+                current = await run_db(
+                    load_project_columns, normalized_project_id, columns=['response_id']
+                )
+                alive = pd.Index(row_ids).isin(current.get('response_id', []))
+                frame = frame[alive].reset_index(drop=True)
+                row_ids = row_ids[alive]
+                if len(frame) != state['count']:
+                    return None
+            
+            logger.info(f"Delta refresh of project {normalized_project_id}: {changed} changed rows")
+            return frame, row_ids
+        except Exception as e:
+            logger.warning(f"Delta refresh failed, falling back to full reload: {e}")
+            return None
+    
+    @staticmethod
+    async def get_project_response_counts(project_id: str) -> Dict[str, int]:
+        """Get response and respondent totals of a project."""
+        return await get_project_response_counts(normalize_uuid(project_id))
+    
+    @staticmethod
+    async def get_project_stats(project_id: str, response_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Get basic project statistics, reusing response totals when given."""
         try:
             # Normalize UUID format to match database storage
             normalized_project_id = normalize_uuid(project_id)
             logger.info(f"Getting project stats for {project_id} -> normalized: {normalized_project_id}")
             
-            stats = await get_project_stats(normalized_project_id)
+            stats = await get_project_stats(normalized_project_id, response_counts)
             if stats is None:
                 raise ValueError(f"Project {project_id} not found")
             return stats
@@ -266,8 +423,7 @@ class AnalyticsUtils:
                 df['data_quality_score'] = pd.to_numeric(df['data_quality_score'], errors='coerce')
             
             # Drop columns that are not useful for analysis
-            columns_to_drop = ['response_id', 'device_info', 'location_data']
-            df = df.drop(columns=[col for col in columns_to_drop if col in df.columns])
+            df = df.drop(columns=[col for col in PREPARE_DROPPED_COLUMNS if col in df.columns])
             
             return df
             
@@ -278,7 +434,12 @@ class AnalyticsUtils:
     
     @staticmethod
     def convert_numpy_types(obj):
-        """Convert numpy types to native Python types for JSON serialization"""
+        """
+        Convert numpy types to native Python types for JSON serialization.
+        
+        Responses do not need this: app.utils.serialization encodes numpy and
+        pandas values directly.
+        """
         if isinstance(obj, dict):
             return {key: AnalyticsUtils.convert_numpy_types(value) for key, value in obj.items()}
         elif isinstance(obj, list):
@@ -332,40 +493,10 @@ class AnalyticsUtils:
 
         try:
             # Use the standardized data profiler
-            profiler = StandardizedDataProfiler()
+            profiler = base_detector.StandardizedDataProfiler()
             characteristics = profiler.profile_data(df)
             
-            # Get current sample size
-            current_sample_size = int(characteristics.n_observations)
-            
-            # Convert to the expected format and ensure all numpy types are converted
-            result = {
-                'sample_size': current_sample_size,
-                'variable_count': int(characteristics.n_variables),
-                'numeric_variables': [col for col, dtype in characteristics.variable_types.items() 
-                                    if dtype.value in ['numeric_continuous', 'numeric_discrete']],
-                'categorical_variables': [col for col, dtype in characteristics.variable_types.items() 
-                                        if dtype.value in ['categorical', 'ordinal', 'binary']],
-                'text_variables': [col for col, dtype in characteristics.variable_types.items() 
-                                 if dtype.value == 'text'],
-                'datetime_variables': [col for col, dtype in characteristics.variable_types.items() 
-                                     if dtype.value == 'datetime'],
-                'completeness_score': float(characteristics.completeness_score),
-                'missing_data_summary': characteristics.missing_patterns.get('variables_with_missing', {}),
-                'data_quality': {
-                    'duplicate_rows': int(characteristics.duplicate_rows),
-                    'constant_columns': characteristics.constant_columns,
-                    'missing_percentage': float(characteristics.missing_percentage)
-                }
-            }
-            
-            # Add sample size adequacy analysis
-            result['sample_size_analysis'] = AnalyticsUtils._analyze_sample_size_adequacy(
-                current_sample_size, result
-            )
-            
-            # Apply numpy type conversion to the entire result
-            return AnalyticsUtils.convert_numpy_types(result)
+            return AnalyticsUtils.summarize_characteristics(characteristics)
             
         except Exception as e:
             logger.error(f"Error in analyze_data_characteristics: {e}")
@@ -392,8 +523,44 @@ class AnalyticsUtils:
                 current_sample_size, result
             )
             
-            # Apply numpy type conversion to the fallback result
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
+    
+    @staticmethod
+    def summarize_characteristics(characteristics: Any) -> Dict[str, Any]:
+        """
+        Convert profiler DataCharacteristics into the characteristics dict the
+        endpoints and recommendations use.
+        """
+        # Get current sample size
+        current_sample_size = int(characteristics.n_observations)
+        
+        # Convert to the expected format and ensure all numpy types are converted
+        result = {
+            'sample_size': current_sample_size,
+            'variable_count': int(characteristics.n_variables),
+            'numeric_variables': [col for col, dtype in characteristics.variable_types.items() 
+                                if dtype.value in ['numeric_continuous', 'numeric_discrete']],
+            'categorical_variables': [col for col, dtype in characteristics.variable_types.items() 
+                                    if dtype.value in ['categorical', 'ordinal', 'binary']],
+            'text_variables': [col for col, dtype in characteristics.variable_types.items() 
+                             if dtype.value == 'text'],
+            'datetime_variables': [col for col, dtype in characteristics.variable_types.items() 
+                                 if dtype.value == 'datetime'],
+            'completeness_score': float(characteristics.completeness_score),
+            'missing_data_summary': characteristics.missing_patterns.get('variables_with_missing', {}),
+            'data_quality': {
+                'duplicate_rows': int(characteristics.duplicate_rows),
+                'constant_columns': characteristics.constant_columns,
+                'missing_percentage': float(characteristics.missing_percentage)
+            }
+        }
+        
+        # Add sample size adequacy analysis
+        result['sample_size_analysis'] = AnalyticsUtils._analyze_sample_size_adequacy(
+            current_sample_size, result
+        )
+        
+        return result
     
     @staticmethod
     def _analyze_sample_size_adequacy(current_size: int, characteristics: Dict[str, Any]) -> Dict[str, Any]:
@@ -413,12 +580,12 @@ class AnalyticsUtils:
             
             # T-test recommendations (if we have numeric variables)
             if numeric_vars >= 2:
-                t_test_small = calculate_sample_size_t_test(
+                t_test_small = power_analysis.calculate_sample_size_t_test(
                     effect_size=small_effect,
                     power=0.80,
                     test_type='two-sample'
                 )
-                t_test_medium = calculate_sample_size_t_test(
+                t_test_medium = power_analysis.calculate_sample_size_t_test(
                     effect_size=medium_effect,
                     power=0.80,
                     test_type='two-sample'
@@ -444,7 +611,7 @@ class AnalyticsUtils:
             # ANOVA recommendations (if we have numeric + categorical variables)
             if numeric_vars >= 1 and categorical_vars >= 1:
                 # Assume 3 groups for ANOVA calculation
-                anova_medium = calculate_sample_size_anova(
+                anova_medium = power_analysis.calculate_sample_size_anova(
                     effect_size=0.25,  # Cohen's f for medium effect
                     n_groups=3,
                     power=0.80
@@ -467,7 +634,7 @@ class AnalyticsUtils:
             
             # Correlation recommendations (if we have multiple numeric variables)
             if numeric_vars >= 2:
-                corr_medium = calculate_sample_size_correlation(
+                corr_medium = power_analysis.calculate_sample_size_correlation(
                     r=0.3,  # Medium correlation
                     power=0.80
                 )
@@ -689,8 +856,7 @@ class AnalyticsUtils:
                         'category': 'qualitative'
                     })
             
-            # Apply numpy type conversion to ensure serialization
-            return AnalyticsUtils.convert_numpy_types(recommendations)
+            return recommendations
             
         except Exception as e:
             logger.error(f"Error generating sophisticated recommendations: {e}")
@@ -756,11 +922,11 @@ class AnalyticsUtils:
                     f'Data completeness is {completeness_score:.1f}% - consider missing data analysis'
                 )
             
-            return AnalyticsUtils.convert_numpy_types(recommendations)
+            return recommendations
             
         except Exception as e:
             logger.error(f"Error generating basic recommendations: {e}")
-            return AnalyticsUtils.convert_numpy_types(recommendations)
+            return recommendations
     
     @staticmethod
     def run_descriptive_analysis(df: pd.DataFrame, analysis_type: str = "comprehensive", 
@@ -793,7 +959,7 @@ class AnalyticsUtils:
                         logger.warning(f"Column {col} contains complex objects: {type(sample_val)}")
             
             # Use the comprehensive descriptive analytics functions
-            results = analyze_descriptive_data(
+            results = descriptive.analyze_descriptive_data(
                 df, 
                 analysis_type=analysis_type,
                 target_variables=target_variables
@@ -820,8 +986,7 @@ class AnalyticsUtils:
                 'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024
             }
             
-            # Apply numpy type conversion
-            return AnalyticsUtils.convert_numpy_types(results)
+            return results
             
         except Exception as e:
             logger.error(f"Error in descriptive analysis: {e}")
@@ -832,8 +997,9 @@ class AnalyticsUtils:
             return {'error': f'Descriptive analysis failed: {str(e)}'}
     
     @staticmethod
-    def run_basic_statistics(df: pd.DataFrame, variables: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Run basic statistical analysis only."""
+    def run_basic_statistics(df: pd.DataFrame, variables: Optional[List[str]] = None,
+                             approximate: bool = False) -> Dict[str, Any]:
+        """Run basic statistical analysis only (percentiles from quantile sketches with `approximate`)."""
         if df.empty:
             return {'error': 'No data available for analysis'}
         
@@ -848,25 +1014,51 @@ class AnalyticsUtils:
             if not numeric_cols:
                 return {'error': 'No numeric variables found for basic statistics'}
             
-            basic_stats = calculate_basic_stats(df, numeric_cols)
-            percentiles = calculate_percentiles(df, numeric_cols)
-            
-            result = {
-                'basic_statistics': basic_stats,
-                'percentiles': percentiles,
-                'summary': {
-                    'variables_analyzed': len(numeric_cols),
-                    'variable_names': numeric_cols,
-                    'observations': len(df)
-                }
-            }
-            
-            return AnalyticsUtils.convert_numpy_types(result)
+            sketch_epsilon = settings.QUANTILE_SKETCH_EPSILON if approximate else None
+            summaries = descriptive.summarize_columns(df, numeric_cols, sketch_epsilon)
+            return AnalyticsUtils.summarize_basic_statistics(summaries, len(df), approximate=approximate)
             
         except Exception as e:
             logger.error(f"Error in basic statistics: {e}")
             return {'error': f'Basic statistics failed: {str(e)}'}
     
+    @staticmethod
+    def summarize_basic_statistics(summaries: Dict[str, Any], observations: int,
+                                   variables: Optional[List[str]] = None,
+                                   approximate: bool = False) -> Dict[str, Any]:
+        """
+        Basic statistics results from mergeable column statistics.
+        
+        Args:
+            summaries: ColumnStatistics per numerical column (see
+                descriptive.summarize_columns and the profile store)
+            observations: Rows of the frame the statistics describe
+            variables: Optional list of variables to report (None for all)
+            approximate: Percentiles from the columns' quantile sketches
+            
+        Returns:
+            Results in the format of run_basic_statistics
+        """
+        numeric_cols = [col for col in variables if col in summaries] if variables else list(summaries)
+        if not numeric_cols:
+            return {'error': 'No numeric variables found for basic statistics'}
+        
+        result = {
+            'basic_statistics': {col: summaries[col].basic_stats() for col in numeric_cols},
+            'percentiles': {col: summaries[col].percentiles(approximate=approximate) for col in numeric_cols},
+            'summary': {
+                'variables_analyzed': len(numeric_cols),
+                'variable_names': numeric_cols,
+                'observations': observations
+            }
+        }
+        if approximate:
+            result['summary']['percentile_rank_error'] = max(
+                (summaries[col].sketch.epsilon for col in numeric_cols if summaries[col].sketch is not None),
+                default=None
+            )
+        return result
+    
     @staticmethod
     def run_distribution_analysis(df: pd.DataFrame, variables: Optional[List[str]] = None) -> Dict[str, Any]:
         """Run distribution analysis for numeric variables."""
@@ -890,10 +1082,10 @@ class AnalyticsUtils:
                     series = df[col].dropna()
                     if len(series) > 0:
                         results[col] = {
-                            'distribution_analysis': analyze_distribution(series),
-                            'normality_test': test_normality(series),
-                            'skewness_kurtosis': calculate_skewness_kurtosis(series),
-                            'outliers': detect_outliers_iqr(series)
+                            'distribution_analysis': descriptive.analyze_distribution(series),
+                            'normality_test': descriptive.test_normality(series),
+                            'skewness_kurtosis': descriptive.calculate_skewness_kurtosis(series),
+                            'outliers': descriptive.detect_outliers_iqr(series)
                         }
                 except Exception as e:
                     results[col] = {'error': f'Analysis failed: {str(e)}'}
@@ -907,7 +1099,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in distribution analysis: {e}")
@@ -935,20 +1127,15 @@ class AnalyticsUtils:
                 try:
                     series = df[col].dropna()
                     if len(series) > 0:
-                        results[col] = analyze_categorical(series)
+                        results[col] = descriptive.analyze_categorical(series)
                 except Exception as e:
                     results[col] = {'error': f'Analysis failed: {str(e)}'}
             
             # Cross-tabulation analysis for pairs of categorical variables
+            # (columns are integer-coded once and every pair's table built from the codes)
             cross_tabs = {}
             if len(categorical_cols) >= 2:
-                for i, col1 in enumerate(categorical_cols):
-                    for col2 in categorical_cols[i+1:]:
-                        try:
-                            cross_tab_key = f"{col1}_vs_{col2}"
-                            cross_tabs[cross_tab_key] = analyze_cross_tabulation(df, col1, col2)
-                        except Exception as e:
-                            cross_tabs[cross_tab_key] = {'error': f'Cross-tabulation failed: {str(e)}'}
+                cross_tabs = descriptive.ContingencyTables(df, categorical_cols).cross_tabulations()
             
             result = {
                 'categorical_analysis': results,
@@ -961,7 +1148,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in categorical analysis: {e}")
@@ -969,8 +1156,14 @@ class AnalyticsUtils:
     
     @staticmethod
     def run_outlier_analysis(df: pd.DataFrame, variables: Optional[List[str]] = None, 
-                           methods: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Run comprehensive outlier detection analysis."""
+                           methods: Optional[List[str]] = None, approximate: bool = False,
+                           quartiles: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Any]:
+        """
+        Run comprehensive outlier detection analysis.
+        
+        With `approximate`, IQR bounds come from quantile sketches (stored ones
+        passed in `quartiles`, else sketched here) instead of sorting each column.
+        """
         if df.empty:
             return {'error': 'No data available for analysis'}
         
@@ -989,6 +1182,13 @@ class AnalyticsUtils:
             if not methods:
                 methods = ['iqr', 'zscore', 'isolation_forest'] if len(df) > 100 else ['iqr', 'zscore']
             
+            quartiles = dict(quartiles or {}) if approximate else {}
+            if approximate and 'iqr' in methods:
+                for col in numeric_cols:
+                    if col not in quartiles:
+                        sketch = descriptive.QuantileSketch.of(df[col], settings.QUANTILE_SKETCH_EPSILON)
+                        quartiles[col] = tuple(sketch.quantiles([0.25, 0.75]))
+            
             results = {}
             for col in numeric_cols:
                 try:
@@ -997,20 +1197,20 @@ class AnalyticsUtils:
                         col_results = {}
                         
                         if 'iqr' in methods:
-                            col_results['iqr_outliers'] = detect_outliers_iqr(series)
+                            col_results['iqr_outliers'] = descriptive.detect_outliers_iqr(series, quartiles=quartiles.get(col))
                         if 'zscore' in methods:
-                            col_results['zscore_outliers'] = detect_outliers_zscore(series)
+                            col_results['zscore_outliers'] = descriptive.detect_outliers_zscore(series)
                         if 'isolation_forest' in methods and len(series) > 50:
-                            col_results['isolation_forest_outliers'] = detect_outliers_isolation_forest(series)
+                            col_results['isolation_forest_outliers'] = descriptive.detect_outliers_isolation_forest(series)
                         if 'mad' in methods:
-                            col_results['mad_outliers'] = detect_outliers_mad(series)
+                            col_results['mad_outliers'] = descriptive.detect_outliers_mad(series)
                         
                         results[col] = col_results
                 except Exception as e:
                     results[col] = {'error': f'Outlier detection failed: {str(e)}'}
             
             # Overall summary
-            outlier_summary = get_outlier_summary(df, numeric_cols)
+            outlier_summary = descriptive.get_outlier_summary(df, numeric_cols, quartiles=quartiles)
             
             result = {
                 'outlier_analysis': results,
@@ -1023,7 +1223,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in outlier analysis: {e}")
@@ -1036,24 +1236,27 @@ class AnalyticsUtils:
             return {'error': 'No data available for analysis'}
         
         try:
-            missing_analysis = analyze_missing_data(df)
-            missing_patterns = get_missing_patterns(df)
-            missing_correlations = calculate_missing_correlations(df)
+            # Missingness is packed into bitsets once and shared by every step
+            mask = descriptive.MissingMask.of(df)
+            missing_analysis = descriptive.analyze_missing_data(df, mask=mask)
+            missing_patterns = descriptive.get_missing_patterns(df, mask=mask)
+            missing_correlations = descriptive.calculate_missing_correlations(df, mask=mask)
+            missing_counts = pd.Series(mask.column_counts(), index=df.columns)
             
             result = {
                 'missing_data_analysis': missing_analysis,
                 'missing_patterns': missing_patterns,
                 'missing_correlations': missing_correlations,
                 'summary': {
-                    'total_missing_values': df.isnull().sum().sum(),
-                    'missing_percentage': (df.isnull().sum().sum() / df.size) * 100,
-                    'columns_with_missing': df.isnull().sum()[df.isnull().sum() > 0].to_dict(),
-                    'complete_cases': len(df.dropna()),
+                    'total_missing_values': missing_counts.sum(),
+                    'missing_percentage': (missing_counts.sum() / df.size) * 100,
+                    'columns_with_missing': missing_counts[missing_counts > 0].to_dict(),
+                    'complete_cases': int((mask.row_counts() == 0).sum()),
                     'observations': len(df)
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in missing data analysis: {e}")
@@ -1084,14 +1287,14 @@ class AnalyticsUtils:
             if not numeric_cols:
                 return {'error': 'No numeric variables found for temporal analysis'}
             
-            temporal_patterns = analyze_temporal_patterns(df, date_column, numeric_cols)
-            time_series_stats = calculate_time_series_stats(df, date_column, numeric_cols)
+            temporal_patterns = descriptive.analyze_temporal_patterns(df, date_column, numeric_cols)
+            time_series_stats = descriptive.calculate_time_series_stats(df, date_column, numeric_cols)
             
             # Seasonality detection for each numeric column
             seasonality_results = {}
             for col in numeric_cols:
                 try:
-                    seasonality_results[col] = detect_seasonality(df, date_column, col)
+                    seasonality_results[col] = descriptive.detect_seasonality(df, date_column, col)
                 except Exception as e:
                     seasonality_results[col] = {'error': f'Seasonality detection failed: {str(e)}'}
             
@@ -1110,7 +1313,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in temporal analysis: {e}")
@@ -1126,9 +1329,9 @@ class AnalyticsUtils:
             return {'error': f'Location columns "{lat_column}" or "{lon_column}" not found in data'}
         
         try:
-            spatial_distribution = analyze_spatial_distribution(df, lat_column, lon_column)
-            spatial_autocorr = calculate_spatial_autocorrelation(df, lat_column, lon_column)
-            location_clusters = create_location_clusters(df, lat_column, lon_column)
+            spatial_distribution = descriptive.analyze_spatial_distribution(df, lat_column, lon_column)
+            spatial_autocorr = descriptive.calculate_spatial_autocorrelation(df, lat_column, lon_column)
+            location_clusters = descriptive.create_location_clusters(df, lat_column, lon_column)
             
             result = {
                 'spatial_distribution': spatial_distribution,
@@ -1142,7 +1345,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in geospatial analysis: {e}")
@@ -1156,7 +1359,7 @@ class AnalyticsUtils:
         
         try:
             # Use the data quality analysis type
-            results = analyze_descriptive_data(df, analysis_type="quality")
+            results = descriptive.analyze_descriptive_data(df, analysis_type="quality")
             
             # Add additional quality metrics
             quality_metrics = {
@@ -1183,30 +1386,46 @@ class AnalyticsUtils:
                 'variables': len(df.columns)
             }
             
-            return AnalyticsUtils.convert_numpy_types(results)
+            return results
             
         except Exception as e:
             logger.error(f"Error in data quality analysis: {e}")
             return {'error': f'Data quality analysis failed: {str(e)}'}
     
     @staticmethod
-    def generate_comprehensive_report(df: pd.DataFrame, include_plots: bool = False) -> Dict[str, Any]:
-        """Generate a comprehensive descriptive statistics report."""
+    def generate_comprehensive_report(df: pd.DataFrame, include_plots: bool = False,
+                                      progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+        """
+        Generate a comprehensive descriptive statistics report.
+        
+        Args:
+            df: Project data
+            include_plots: Whether to include plot data in the report
+            progress: Called as progress(fraction, message, partial) after each
+                report section, with the completed fraction of the report
+                (see jobs.run_compute_step)
+        """
         if df.empty:
             return {'error': 'No data available for analysis'}
         
+        progress = progress or (lambda *args, **kwargs: None)
         try:
             # Generate comprehensive analysis
-            comprehensive_results = analyze_descriptive_data(df, analysis_type="comprehensive")
+            comprehensive_results = descriptive.analyze_descriptive_data(df, analysis_type="comprehensive")
+            progress(0.4, "Comprehensive analysis complete", {'comprehensive_analysis': comprehensive_results})
             
             # Generate executive summary
-            executive_summary = generate_executive_summary(df)
+            executive_summary = descriptive.generate_executive_summary(df)
+            progress(0.5, "Executive summary complete", {'executive_summary': executive_summary})
             
-            # Generate full report
-            full_report = generate_full_report(df)
+            # Generate full report; its sections are the next 40% of this one
+            full_report = descriptive.generate_full_report(
+                df, progress=lambda fraction, message=None, partial=None: progress(0.5 + 0.4 * fraction, message)
+            )
+            progress(0.9, "Full report complete", {'full_report': full_report})
             
             # Generate analysis workflow recommendations
-            workflow = generate_analysis_workflow(df)
+            workflow = descriptive.generate_analysis_workflow(df)
             
             result = {
                 'comprehensive_analysis': comprehensive_results,
@@ -1221,7 +1440,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error generating comprehensive report: {e}")
@@ -1258,8 +1477,7 @@ class AnalyticsUtils:
                 }
             }
             
-            # Apply numpy type conversion
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in text analysis: {e}")
@@ -1293,7 +1511,7 @@ class AnalyticsUtils:
                     text_data = df[col].dropna().astype(str).tolist()
                     if len(text_data) > 0:
                         # Run sentiment analysis
-                        sentiments = analyze_sentiment_batch(text_data)
+                        sentiments = qualitative.analyze_sentiment_batch(text_data)
                         
                         # Calculate statistics
                         polarities = [s['polarity'] for s in sentiments]
@@ -1333,10 +1551,10 @@ class AnalyticsUtils:
             else:
                 summary = {'error': 'No valid sentiments calculated'}
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'sentiment_analysis': results,
                 'summary': summary
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error in sentiment analysis: {e}")
@@ -1344,7 +1562,8 @@ class AnalyticsUtils:
     
     @staticmethod
     def run_theme_analysis(df: pd.DataFrame, text_columns: List[str], 
-                          num_themes: int = 5, theme_method: str = "lda") -> Dict[str, Any]:
+                          num_themes: int = 5, theme_method: str = "lda",
+                          progress: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
         """
         Run thematic analysis on text data.
         
@@ -1353,6 +1572,8 @@ class AnalyticsUtils:
             text_columns: List of text column names to analyze
             num_themes: Number of themes to extract
             theme_method: Method to use ('lda', 'nmf', 'clustering')
+            progress: Called as progress(fraction, message, partial) after each
+                column's themes and key concepts
             
         Returns:
             Dictionary with thematic analysis results
@@ -1360,13 +1581,14 @@ class AnalyticsUtils:
         if df.empty or not text_columns:
             return {'error': 'No text data available for theme analysis'}
         
+        progress = progress or (lambda *args, **kwargs: None)
         try:
             from app.analytics.qualitative.thematic_analysis import ThematicAnalyzer
             
             analyzer = ThematicAnalyzer()
             results = {}
             
-            for col in text_columns:
+            for i, col in enumerate(text_columns):
                 if col in df.columns:
                     text_data = df[col].dropna().astype(str).tolist()
                     if len(text_data) >= 5:  # Need minimum texts for theme analysis
@@ -1374,6 +1596,7 @@ class AnalyticsUtils:
                             themes = analyzer.identify_themes_lda(text_data, num_themes)
                         else:
                             themes = analyzer.identify_themes_clustering(text_data, num_themes)
+                        progress((i + 0.5) / len(text_columns), f"Themes of {col} identified")
                         
                         # Extract key concepts
                         key_concepts = analyzer.extract_key_concepts(text_data, 20)
@@ -1389,6 +1612,7 @@ class AnalyticsUtils:
                         results[col] = {
                             'error': f'Need at least 5 texts for theme analysis, found {len(text_data)}'
                         }
+                    progress((i + 1) / len(text_columns), f"Themes of {col} complete", {col: results[col]})
             
             # Generate overall summary
             valid_results = {k: v for k, v in results.items() if 'error' not in v}
@@ -1398,10 +1622,10 @@ class AnalyticsUtils:
                 'method_used': theme_method
             }
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'theme_analysis': results,
                 'summary': summary
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error in theme analysis: {e}")
@@ -1431,11 +1655,12 @@ class AnalyticsUtils:
             import re
             from collections import Counter
             
-            # Try to import NLTK stopwords
+            # Use NLTK stopwords when installed locally
             try:
                 from nltk.corpus import stopwords
-                import nltk
-                nltk.download('stopwords', quiet=True)
+                from app.analytics.qualitative.nltk_resources import ensure_nltk_data
+                if not ensure_nltk_data('stopwords'):
+                    raise LookupError('stopwords')
                 stop_words = set(stopwords.words('english'))
             except:
                 # Fallback stopwords
@@ -1483,7 +1708,7 @@ class AnalyticsUtils:
                             }
                         }
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'word_frequency_analysis': results,
                 'summary': {
                     'columns_analyzed': len(results),
@@ -1493,7 +1718,7 @@ class AnalyticsUtils:
                         'remove_stopwords': remove_stopwords
                     }
                 }
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error in word frequency analysis: {e}")
@@ -1543,14 +1768,14 @@ class AnalyticsUtils:
                             'coding_scheme_applied': coding_scheme is not None
                         }
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'content_analysis': results,
                 'summary': {
                     'columns_analyzed': len(results),
                     'framework_used': analysis_framework,
                     'custom_coding_scheme': coding_scheme is not None
                 }
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error in content analysis: {e}")
@@ -1615,14 +1840,14 @@ class AnalyticsUtils:
                             'texts_coded': len(text_data)
                         }
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'qualitative_coding': results,
                 'summary': {
                     'columns_analyzed': len(results),
                     'coding_method': coding_method,
                     'auto_coding_enabled': auto_code
                 }
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error in qualitative coding: {e}")
@@ -1667,7 +1892,7 @@ class AnalyticsUtils:
             # Generate summary report
             report = analyzer.generate_survey_report(survey_data, question_metadata)
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'survey_analysis': {
                     'question_analysis': question_analysis,
                     'question_comparison': comparison,
@@ -1679,7 +1904,7 @@ class AnalyticsUtils:
                     'total_respondents': len(list(survey_data.values())[0]) if survey_data else 0,
                     'questions_with_metadata': len(question_metadata) if question_metadata else 0
                 }
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error in survey analysis: {e}")
@@ -1725,7 +1950,7 @@ class AnalyticsUtils:
             if all_texts:
                 overall_summary = stats.generate_comprehensive_summary(all_texts, None, analysis_type)
                 
-                return AnalyticsUtils.convert_numpy_types({
+                return {
                     'column_statistics': results,
                     'overall_statistics': overall_summary,
                     'metadata': {
@@ -1733,7 +1958,7 @@ class AnalyticsUtils:
                         'columns_analyzed': len(results),
                         'total_texts': len(all_texts)
                     }
-                })
+                }
             else:
                 return {'error': 'No valid text data found for analysis'}
                 
@@ -1743,10 +1968,11 @@ class AnalyticsUtils:
     
     @staticmethod
     def format_api_response(status: str, data: Any, message: str = None) -> Dict[str, Any]:
-        """Format API response with proper serialization."""
+        """Format API response."""
         response = {
             'status': status,
-            'data': AnalyticsUtils.convert_numpy_types(data) if data is not None else None,
+            # NumPy/pandas values are encoded with the response (see app.utils.serialization)
+            'data': data,
             'timestamp': datetime.now().isoformat()
         }
         
@@ -1796,7 +2022,7 @@ class AnalyticsUtils:
             for col1 in numeric_df.columns:
                 for col2 in numeric_df.columns:
                     if col1 != col2:
-                        result = perform_correlation_test(
+                        result = hypothesis_testing.perform_correlation_test(
                             numeric_df, col1, col2, correlation_method, significance_level
                         )
                         if 'error' not in result:
@@ -1821,7 +2047,7 @@ class AnalyticsUtils:
                 }
             }
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in correlation analysis: {e}")
@@ -1847,7 +2073,7 @@ class AnalyticsUtils:
             if test_type == "one_sample":
                 # One-sample t-test
                 data = df[dependent_variable].dropna()
-                result = perform_t_test(data, pd.Series([0] * len(data)), alternative='two-sided')
+                result = hypothesis_testing.perform_t_test(data, pd.Series([0] * len(data)), alternative='two-sided')
                 
             elif test_type == "paired":
                 # Paired t-test
@@ -1856,7 +2082,7 @@ class AnalyticsUtils:
                     
                 data1 = df[dependent_variable].dropna()
                 data2 = df[independent_variable].dropna()
-                result = perform_paired_t_test(data1, data2, alternative)
+                result = hypothesis_testing.perform_paired_t_test(data1, data2, alternative)
                 
             else:  # two_sample
                 # Two-sample t-test
@@ -1871,13 +2097,13 @@ class AnalyticsUtils:
                     return {'error': 'Two-sample t-test requires exactly 2 groups'}
                     
                 data1, data2 = groups.iloc[0], groups.iloc[1]
-                result = perform_t_test(data1, data2, alternative)
+                result = hypothesis_testing.perform_t_test(data1, data2, alternative)
             
             # Add confidence interval
             alpha = 1 - confidence_level
             result['confidence_level'] = confidence_level
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in t-test analysis: {e}")
@@ -1908,18 +2134,18 @@ class AnalyticsUtils:
                 if len(independent_variables) != 1:
                     return {'error': 'One-way ANOVA requires exactly one independent variable'}
                     
-                result = perform_anova(df, independent_variables[0], dependent_variable, post_hoc=post_hoc)
+                result = hypothesis_testing.perform_anova(df, independent_variables[0], dependent_variable, post_hoc=post_hoc)
                 
                 # Add post-hoc tests if requested
                 if post_hoc and post_hoc_method == "tukey":
-                    post_hoc_result = tukey_hsd_test(df, independent_variables[0], dependent_variable)
+                    post_hoc_result = multiple_comparisons.tukey_hsd_test(df, independent_variables[0], dependent_variable)
                     result['post_hoc_tests'] = post_hoc_result
                     
             elif anova_type == "two_way":
                 if len(independent_variables) != 2:
                     return {'error': 'Two-way ANOVA requires exactly two independent variables'}
                     
-                result = perform_two_way_anova(
+                result = hypothesis_testing.perform_two_way_anova(
                     df, independent_variables[0], independent_variables[1], dependent_variable
                 )
                 
@@ -1931,13 +2157,13 @@ class AnalyticsUtils:
                 within_var = independent_variables[1]
                 between_var = independent_variables[2] if len(independent_variables) > 2 else None
                 
-                result = perform_repeated_measures_anova(
+                result = hypothesis_testing.perform_repeated_measures_anova(
                     df, subject_var, within_var, dependent_variable, between_var
                 )
             else:
                 return {'error': f'Unknown ANOVA type: {anova_type}'}
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in ANOVA analysis: {e}")
@@ -1967,25 +2193,25 @@ class AnalyticsUtils:
             alpha = 1 - confidence_level
             
             if regression_type == "linear":
-                result = perform_linear_regression(df, dependent_variable, independent_variables, alpha=alpha)
+                result = regression_analysis.perform_linear_regression(df, dependent_variable, independent_variables, alpha=alpha)
                 
             elif regression_type == "multiple":
-                result = perform_multiple_regression(df, dependent_variable, independent_variables, alpha=alpha)
+                result = regression_analysis.perform_multiple_regression(df, dependent_variable, independent_variables, alpha=alpha)
                 
             elif regression_type == "logistic":
-                result = perform_logistic_regression(df, dependent_variable, independent_variables, alpha=alpha)
+                result = regression_analysis.perform_logistic_regression(df, dependent_variable, independent_variables, alpha=alpha)
                 
             elif regression_type == "poisson":
-                result = perform_poisson_regression(df, dependent_variable, independent_variables, alpha=alpha)
+                result = regression_analysis.perform_poisson_regression(df, dependent_variable, independent_variables, alpha=alpha)
                 
             elif regression_type == "ridge":
-                result = perform_ridge_regression(df, dependent_variable, independent_variables)
+                result = regression_analysis.perform_ridge_regression(df, dependent_variable, independent_variables)
                 
             elif regression_type == "lasso":
-                result = perform_lasso_regression(df, dependent_variable, independent_variables)
+                result = regression_analysis.perform_lasso_regression(df, dependent_variable, independent_variables)
                 
             elif regression_type == "robust":
-                result = perform_robust_regression(df, dependent_variable, independent_variables)
+                result = regression_analysis.perform_robust_regression(df, dependent_variable, independent_variables)
                 
             else:
                 return {'error': f'Unknown regression type: {regression_type}'}
@@ -1998,7 +2224,7 @@ class AnalyticsUtils:
                 except:
                     pass
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in regression analysis: {e}")
@@ -2026,10 +2252,10 @@ class AnalyticsUtils:
                     
                 # Create contingency table
                 contingency_table = pd.crosstab(df[variable1], df[variable2])
-                result = perform_chi_square_test(contingency_table)
+                result = hypothesis_testing.perform_chi_square_test(contingency_table)
                 
                 # Add Cramér's V effect size
-                cramers_v_result = calculate_cramers_v(contingency_table)
+                cramers_v_result = descriptive.calculate_cramers_v(contingency_table)
                 result['effect_size'] = cramers_v_result
                 
             elif test_type == "goodness_of_fit":
@@ -2042,11 +2268,11 @@ class AnalyticsUtils:
                     # Equal expected frequencies
                     expected = pd.Series([len(df) / len(observed)] * len(observed), index=observed.index)
                 
-                result = perform_chi_square_test(observed, expected)
+                result = hypothesis_testing.perform_chi_square_test(observed, expected)
             else:
                 return {'error': f'Unknown chi-square test type: {test_type}'}
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in chi-square test: {e}")
@@ -2082,14 +2308,14 @@ class AnalyticsUtils:
                 data1 = df[variables[0]].dropna()
                 data2 = df[variables[1]].dropna() if len(variables) > 1 else pd.Series([0] * len(data1))
                 
-                result = perform_t_test(data1, data2, alternative='two-sided')
+                result = hypothesis_testing.perform_t_test(data1, data2, alternative='two-sided')
                 result['test_type'] = 'z_test (approximated with t-test)'
                 
             elif test_type == "t_test":
                 data1 = df[variables[0]].dropna()
                 data2 = df[variables[1]].dropna() if len(variables) > 1 else pd.Series([0] * len(data1))
                 
-                result = perform_t_test(data1, data2, alternative='two-sided')
+                result = hypothesis_testing.perform_t_test(data1, data2, alternative='two-sided')
                 
             elif test_type == "mann_whitney":
                 if len(variables) < 2:
@@ -2098,7 +2324,7 @@ class AnalyticsUtils:
                 data1 = df[variables[0]].dropna()
                 data2 = df[variables[1]].dropna()
                 
-                result = mann_whitney_u_test(data1, data2, alternative='two-sided')
+                result = nonparametric_tests.mann_whitney_u_test(data1, data2, alternative='two-sided')
                 
             elif test_type == "wilcoxon":
                 if len(variables) < 2:
@@ -2107,7 +2333,7 @@ class AnalyticsUtils:
                 data1 = df[variables[0]].dropna()
                 data2 = df[variables[1]].dropna()
                 
-                result = wilcoxon_signed_rank_test(data1, data2, alternative='two-sided')
+                result = nonparametric_tests.wilcoxon_signed_rank_test(data1, data2, alternative='two-sided')
                 
             else:
                 return {'error': f'Unknown test type: {test_type}'}
@@ -2118,7 +2344,7 @@ class AnalyticsUtils:
             result['significance_level'] = significance_level
             result['decision'] = 'Reject null hypothesis' if result.get('p_value', 1) < significance_level else 'Fail to reject null hypothesis'
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in hypothesis test: {e}")
@@ -2130,16 +2356,23 @@ class AnalyticsUtils:
         variables: List[str],
         confidence_level: float = 0.95,
         interval_type: str = "mean",
-        bootstrap_samples: int = 1000
+        bootstrap_samples: int = 1000,
+        progress: Optional[Callable[..., None]] = None
     ) -> Dict[str, Any]:
-        """Calculate confidence intervals for variables."""
+        """
+        Calculate confidence intervals for variables.
+
+        progress, if given, is called as progress(fraction, message, partial)
+        after each variable and during bootstrap resampling.
+        """
         if df.empty:
             return {'error': 'No data available for confidence intervals'}
         
+        progress = progress or (lambda *args, **kwargs: None)
         try:
             results = {}
             
-            for var in variables:
+            for i, var in enumerate(variables):
                 if var not in df.columns:
                     results[var] = {'error': f'Variable {var} not found'}
                     continue
@@ -2147,28 +2380,32 @@ class AnalyticsUtils:
                 data = df[var].dropna()
                 
                 if interval_type == "mean":
-                    result = calculate_mean_ci(data, confidence_level)
+                    result = confidence_intervals.calculate_mean_ci(data, confidence_level)
                 elif interval_type == "median":
-                    result = calculate_median_ci(data, confidence_level)
+                    result = confidence_intervals.calculate_median_ci(data, confidence_level)
                 elif interval_type == "proportion":
                     # For proportion, need to count successes
                     if data.dtype == bool:
                         successes = data.sum()
                         n = len(data)
-                        result = calculate_proportion_ci(successes, n, confidence_level)
+                        result = confidence_intervals.calculate_proportion_ci(successes, n, confidence_level)
                     else:
                         # Assume binary 0/1 data
                         successes = (data == 1).sum()
                         n = len(data)
-                        result = calculate_proportion_ci(successes, n, confidence_level)
+                        result = confidence_intervals.calculate_proportion_ci(successes, n, confidence_level)
                 elif interval_type == "variance":
                     # Bootstrap CI for variance
                     def var_func(x): return x.var()
-                    result = calculate_bootstrap_ci(data, var_func, confidence_level, bootstrap_samples)
+                    result = confidence_intervals.calculate_bootstrap_ci(
+                        data, var_func, confidence_level, bootstrap_samples,
+                        progress=lambda fraction, message: progress((i + fraction) / len(variables), f"{var}: {message}")
+                    )
                 else:
                     result = {'error': f'Unknown interval type: {interval_type}'}
                 
                 results[var] = result
+                progress((i + 1) / len(variables), f"Interval for {var} complete", {var: result})
             
             summary = {
                 'confidence_level': confidence_level,
@@ -2177,10 +2414,10 @@ class AnalyticsUtils:
                 'successful_calculations': sum(1 for r in results.values() if 'error' not in r)
             }
             
-            return AnalyticsUtils.convert_numpy_types({
+            return {
                 'results': results,
                 'summary': summary
-            })
+            }
             
         except Exception as e:
             logger.error(f"Error calculating confidence intervals: {e}")
@@ -2213,34 +2450,34 @@ class AnalyticsUtils:
                 group1, group2 = groups.iloc[0], groups.iloc[1]
                 
                 if effect_size_measure == "cohen_d":
-                    result = calculate_cohens_d(group1, group2)
+                    result = effect_sizes.calculate_cohens_d(group1, group2)
                 elif effect_size_measure == "hedges_g":
-                    result = calculate_hedges_g(group1, group2)
+                    result = effect_sizes.calculate_hedges_g(group1, group2)
                 elif effect_size_measure == "glass_delta":
-                    result = calculate_glass_delta(group1, group2)
+                    result = effect_sizes.calculate_glass_delta(group1, group2)
                     
             elif effect_size_measure == "eta_squared":
-                result = calculate_eta_squared(df, independent_variable, dependent_variable)
+                result = effect_sizes.calculate_eta_squared(df, independent_variable, dependent_variable)
                 
             elif effect_size_measure == "omega_squared":
-                result = calculate_omega_squared(df, independent_variable, dependent_variable)
+                result = effect_sizes.calculate_omega_squared(df, independent_variable, dependent_variable)
                 
             elif effect_size_measure == "cramers_v":
                 # Create contingency table
                 contingency_table = pd.crosstab(df[independent_variable], df[dependent_variable])
-                result = calculate_cramers_v(contingency_table)
+                result = descriptive.calculate_cramers_v(contingency_table)
                 
             elif effect_size_measure == "odds_ratio":
                 # Create 2x2 contingency table
                 contingency_table = pd.crosstab(df[independent_variable], df[dependent_variable])
                 if contingency_table.shape != (2, 2):
                     return {'error': 'Odds ratio requires 2x2 contingency table'}
-                result = calculate_odds_ratio(contingency_table)
+                result = effect_sizes.calculate_odds_ratio(contingency_table)
                 
             else:
                 return {'error': f'Unknown effect size measure: {effect_size_measure}'}
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error calculating effect size: {e}")
@@ -2266,31 +2503,31 @@ class AnalyticsUtils:
                     # Calculate power given effect size and sample size
                     if effect_size is None or sample_size is None:
                         return {'error': 'Need effect size and sample size to calculate power'}
-                    result = calculate_power_t_test(sample_size, effect_size, significance_level)
+                    result = power_analysis.calculate_power_t_test(sample_size, effect_size, significance_level)
                 elif effect_size is None:
                     # Calculate effect size needed for given power and sample size
                     if power is None or sample_size is None:
                         return {'error': 'Need power and sample size to calculate effect size'}
-                    result = calculate_effect_size_needed(sample_size, significance_level, power)
+                    result = power_analysis.calculate_effect_size_needed(sample_size, significance_level, power)
                 elif sample_size is None:
                     # Calculate sample size needed for given effect size and power
                     if effect_size is None or power is None:
                         return {'error': 'Need effect size and power to calculate sample size'}
-                    result = calculate_sample_size_t_test(effect_size, significance_level, power)
+                    result = power_analysis.calculate_sample_size_t_test(effect_size, significance_level, power)
                 else:
                     # Post-hoc power analysis
-                    result = post_hoc_power_analysis(effect_size, sample_size, significance_level)
+                    result = power_analysis.post_hoc_power_analysis(effect_size, sample_size, significance_level)
                     
             elif test_type == "anova":
                 n_groups = 3  # Default assumption
                 if power is None:
                     if effect_size is None or sample_size is None:
                         return {'error': 'Need effect size and sample size to calculate power'}
-                    result = calculate_power_anova(sample_size, effect_size, n_groups, significance_level)
+                    result = power_analysis.calculate_power_anova(sample_size, effect_size, n_groups, significance_level)
                 elif sample_size is None:
                     if effect_size is None or power is None:
                         return {'error': 'Need effect size and power to calculate sample size'}
-                    result = calculate_sample_size_anova(effect_size, n_groups, significance_level, power)
+                    result = power_analysis.calculate_sample_size_anova(effect_size, n_groups, significance_level, power)
                 else:
                     return {'error': 'Power analysis configuration not supported for ANOVA'}
                     
@@ -2298,14 +2535,14 @@ class AnalyticsUtils:
                 if sample_size is None:
                     if effect_size is None or power is None:
                         return {'error': 'Need effect size and power to calculate sample size'}
-                    result = calculate_sample_size_correlation(effect_size, significance_level, power)
+                    result = power_analysis.calculate_sample_size_correlation(effect_size, significance_level, power)
                 else:
                     return {'error': 'Power analysis configuration not supported for correlation'}
                     
             else:
                 return {'error': f'Unknown test type for power analysis: {test_type}'}
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in power analysis: {e}")
@@ -2335,7 +2572,7 @@ class AnalyticsUtils:
                     
                 data1 = df[variables[0]].dropna()
                 data2 = df[variables[1]].dropna()
-                result = mann_whitney_u_test(data1, data2, alternative)
+                result = nonparametric_tests.mann_whitney_u_test(data1, data2, alternative)
                 
             elif test_type == "wilcoxon":
                 if len(variables) < 2:
@@ -2343,7 +2580,7 @@ class AnalyticsUtils:
                     
                 data1 = df[variables[0]].dropna()
                 data2 = df[variables[1]].dropna()
-                result = wilcoxon_signed_rank_test(data1, data2, alternative)
+                result = nonparametric_tests.wilcoxon_signed_rank_test(data1, data2, alternative)
                 
             elif test_type == "kruskal_wallis":
                 if not groups or groups not in df.columns:
@@ -2351,13 +2588,13 @@ class AnalyticsUtils:
                 if len(variables) != 1:
                     return {'error': 'Kruskal-Wallis test requires exactly one dependent variable'}
                     
-                result = kruskal_wallis_test(df, groups, variables[0])
+                result = nonparametric_tests.kruskal_wallis_test(df, groups, variables[0])
                 
             elif test_type == "friedman":
                 if len(variables) < 3:
                     return {'error': 'Friedman test requires at least 3 variables'}
                     
-                result = friedman_test(df, variables)
+                result = nonparametric_tests.friedman_test(df, variables)
                 
             elif test_type == "kolmogorov_smirnov":
                 if len(variables) < 1:
@@ -2366,37 +2603,37 @@ class AnalyticsUtils:
                 data = df[variables[0]].dropna()
                 if len(variables) == 1:
                     # One-sample KS test against normal distribution
-                    result = kolmogorov_smirnov_test(data, 'norm')
+                    result = nonparametric_tests.kolmogorov_smirnov_test(data, 'norm')
                 else:
                     # Two-sample KS test
                     data2 = df[variables[1]].dropna()
-                    result = kolmogorov_smirnov_test(data, data2)
+                    result = nonparametric_tests.kolmogorov_smirnov_test(data, data2)
                     
             elif test_type == "shapiro_wilk":
                 if len(variables) != 1:
                     return {'error': 'Shapiro-Wilk test requires exactly one variable'}
                     
                 data = df[variables[0]].dropna()
-                result = shapiro_wilk_test(data)
+                result = nonparametric_tests.shapiro_wilk_test(data)
                 
             elif test_type == "anderson_darling":
                 if len(variables) != 1:
                     return {'error': 'Anderson-Darling test requires exactly one variable'}
                     
                 data = df[variables[0]].dropna()
-                result = anderson_darling_test(data)
+                result = nonparametric_tests.anderson_darling_test(data)
                 
             elif test_type == "runs_test":
                 if len(variables) != 1:
                     return {'error': 'Runs test requires exactly one variable'}
                     
                 data = df[variables[0]].dropna()
-                result = runs_test(data)
+                result = nonparametric_tests.runs_test(data)
                 
             else:
                 return {'error': f'Unknown non-parametric test type: {test_type}'}
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in non-parametric test: {e}")
@@ -2424,8 +2661,8 @@ class AnalyticsUtils:
             data1 = df[variable1].dropna()
             data2 = df[variable2].dropna()
             
-            result = bayesian_t_test(data1, data2, prior_mean, prior_variance, credible_level)
-            return AnalyticsUtils.convert_numpy_types(result)
+            result = bayesian_inference.bayesian_t_test(data1, data2, prior_mean, prior_variance, credible_level)
+            return result
             
         except Exception as e:
             logger.error(f"Error in Bayesian t-test: {e}")
@@ -2461,10 +2698,10 @@ class AnalyticsUtils:
             successes2 = group2_data[success_variable].sum()
             n2 = len(group2_data)
             
-            result = bayesian_proportion_test(
+            result = bayesian_inference.bayesian_proportion_test(
                 successes1, n1, successes2, n2, prior_alpha, prior_beta, credible_level
             )
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in Bayesian proportion test: {e}")
@@ -2483,8 +2720,8 @@ class AnalyticsUtils:
             if not methods:
                 methods = ['bonferroni', 'holm', 'benjamini_hochberg']
             
-            result = apply_multiple_corrections(p_values, alpha, methods)
-            return AnalyticsUtils.convert_numpy_types(result)
+            result = multiple_comparisons.apply_multiple_corrections(p_values, alpha, methods)
+            return result
             
         except Exception as e:
             logger.error(f"Error in multiple comparisons correction: {e}")
@@ -2507,17 +2744,17 @@ class AnalyticsUtils:
                 return {'error': 'Variables not found in dataset'}
             
             if test_type == "tukey":
-                result = tukey_hsd_test(df, group_variable, dependent_variable, alpha)
+                result = multiple_comparisons.tukey_hsd_test(df, group_variable, dependent_variable, alpha)
             elif test_type == "games_howell":
-                result = games_howell_test(df, group_variable, dependent_variable, alpha)
+                result = multiple_comparisons.games_howell_test(df, group_variable, dependent_variable, alpha)
             elif test_type == "dunnett":
                 # Need control group - use first group as control
                 control_group = df[group_variable].iloc[0]
-                result = dunnett_test(df, group_variable, dependent_variable, control_group, alpha)
+                result = multiple_comparisons.dunnett_test(df, group_variable, dependent_variable, control_group, alpha)
             else:
                 return {'error': f'Unknown post-hoc test type: {test_type}'}
             
-            return AnalyticsUtils.convert_numpy_types(result)
+            return result
             
         except Exception as e:
             logger.error(f"Error in post-hoc tests: {e}")
@@ -2541,8 +2778,8 @@ class AnalyticsUtils:
                 return {'error': f'Variable {variable} not found'}
             
             series = df[variable].dropna()
-            result = test_stationarity(series, test_types, alpha)
-            return AnalyticsUtils.convert_numpy_types(result)
+            result = time_series_inference.test_stationarity(series, test_types, alpha)
+            return result
             
         except Exception as e:
             logger.error(f"Error in stationarity test: {e}")
@@ -2564,8 +2801,8 @@ class AnalyticsUtils:
             if cause_variable not in df.columns or effect_variable not in df.columns:
                 return {'error': 'Variables not found in dataset'}
             
-            result = granger_causality_test(df, cause_variable, effect_variable, max_lag, alpha)
-            return AnalyticsUtils.convert_numpy_types(result)
+            result = time_series_inference.granger_causality_test(df, cause_variable, effect_variable, max_lag, alpha)
+            return result
             
         except Exception as e:
             logger.error(f"Error in Granger causality test: {e}")
@@ -0,0 +1,115 @@
+"""
+Coalescing of identical concurrent analysis requests.
+
+When several people open the same project dashboard at once, the engine
+receives the same analyses several times in parallel. The first request for a
+key computes the result; requests for the same key that arrive while it runs
+wait for that result instead of computing it again. Keys are the result-cache
+keys, which hash the endpoint, its normalized parameters and the project's
+data version.
+
+Waiting works across event loops, so requests and background jobs, which run
+on their own loops, share computations.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict
+
+from core.config import settings
+
+
+class _LeaderAborted(Exception):
+    """The computing request was cancelled; waiting requests compute for themselves."""
+
+
+class SingleFlight:
+    """Runs at most one computation per key at a time and shares its result."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the coalescer.
+
+        Args:
+            enabled: When False every call computes its own result
+        """
+        self.enabled = enabled
+        self._flights: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.leaders = 0
+        self.coalesced = 0
+        self.aborted = 0
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the result of `compute`, sharing it with concurrent calls for the same key.
+
+        The computation runs as its own task, so it finishes for the waiting
+        calls even if the call that started it is cancelled. Its exceptions
+        are raised in every waiting call. If it is cancelled outright, the
+        waiting calls compute for themselves.
+        """
+        if not self.enabled:
+            return await compute()
+
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = self._flights[key] = Future()
+                    self.leaders += 1
+                    leader = True
+                else:
+                    self.coalesced += 1
+                    leader = False
+
+            if leader:
+                return await self._lead(key, flight, compute)
+            try:
+                return await asyncio.wrap_future(flight)
+            except _LeaderAborted:
+                continue
+
+    async def _lead(self, key: str, flight: Future, compute: Callable[[], Awaitable[Any]]) -> Any:
+        task = asyncio.ensure_future(compute())
+
+        def settle(task: asyncio.Task) -> None:
+            with self._lock:
+                self._flights.pop(key, None)
+            if task.cancelled():
+                self._count('aborted')
+                flight.set_exception(_LeaderAborted())
+            elif isinstance(task.exception(), Exception):
+                flight.set_exception(task.exception())
+            elif task.exception() is not None:
+                # BaseExceptions such as a job's cancellation stay with the job
+                self._count('aborted')
+                flight.set_exception(_LeaderAborted())
+            else:
+                flight.set_result(task.result())
+
+        task.add_done_callback(settle)
+        return await asyncio.shield(task)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            calls = self.leaders + self.coalesced
+            return {
+                'enabled': self.enabled,
+                'in_flight': len(self._flights),
+                'computed': self.leaders,
+                'coalesced': self.coalesced,
+                'aborted': self.aborted,
+                'coalescing_rate': self.coalesced / calls if calls else 0.0,
+            }
+
+
+request_coalescer = SingleFlight(enabled=settings.REQUEST_COALESCING_ENABLED)
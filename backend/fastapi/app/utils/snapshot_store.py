@@ -0,0 +1,222 @@
+"""
+On-disk snapshots of prepared project frames.
+
+Each prepared frame is written as an uncompressed Arrow IPC file named by
+project, variant and data version. Files are read back through a memory map,
+so a restarted engine warms up without touching the database. Float columns
+are stored with NaN values rather than Arrow nulls so they convert to NumPy
+without a copy.
+
+How much of a loaded frame stays backed by the mapped file, and so is shared
+between uvicorn workers through the operating system's page cache, depends on
+pandas. With pandas 3 string columns are Arrow-backed and numeric columns are
+views, and the frame cache hands out lazy Copy-on-Write copies
+(data_cache.handoff_copy), so the frame stays mapped until a column is
+modified. With older pandas, string columns become Python objects and callers
+get deep copies, so each worker holds its own frame and the store only speeds
+up warm starts.
+
+pyarrow is optional: without it the store reports itself unavailable and the
+engine falls back to loading from the database.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Column holding each row's response id inside a snapshot file
+ROW_ID_COLUMN = '__response_id__'
+WATERMARK_METADATA_KEY = b'analytics_watermark'
+
+
+class SnapshotStore:
+    """Versioned Arrow snapshot files of prepared project frames."""
+
+    def __init__(self, base_dir: str, enabled: bool = True):
+        """
+        Initialize the store.
+
+        Args:
+            base_dir: Directory holding one sub-directory of snapshots per project
+            enabled: Turn the store off without removing existing files
+        """
+        self.base_dir = base_dir
+        self.enabled = enabled and PYARROW_AVAILABLE
+        if enabled and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow not available, project snapshot store disabled")
+
+        self.reads = 0
+        self.writes = 0
+        self.misses = 0
+
+    def _project_dir(self, project_id: str) -> str:
+        return os.path.join(self.base_dir, str(project_id))
+
+    @staticmethod
+    def _variant_name(key: Hashable) -> Tuple[str, str]:
+        """Split a cache key into (project id, variant file prefix)"""
+        if isinstance(key, tuple):
+            project_id, variant = key[0], key[1:]
+        else:
+            project_id, variant = key, ()
+        prefix = '-'.join(str(part) for part in variant) or 'long'
+        # Variants may carry arbitrary parameters (projections, filters)
+        if len(prefix) > 40 or not prefix.replace('-', '').replace('_', '').isalnum():
+            prefix = hashlib.sha1(prefix.encode('utf-8')).hexdigest()[:16]
+        return str(project_id), prefix
+
+    def _path(self, key: Hashable, version: str) -> str:
+        project_id, prefix = self._variant_name(key)
+        digest = hashlib.sha1(version.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self._project_dir(project_id), f"{prefix}.{digest}.arrow")
+
+    def load(self, key: Hashable, version: str) -> Optional[Tuple[pd.DataFrame, Optional[np.ndarray], Optional[Dict[str, Any]]]]:
+        """
+        Load a snapshot written for exactly this data version.
+
+        Returns:
+            (frame, row ids, watermark) tuple, or None if no snapshot exists
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key, version)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+
+        try:
+            with pa.memory_map(path, 'r') as source:
+                table = pa_ipc.open_file(source).read_all()
+
+            metadata = table.schema.metadata or {}
+            watermark = None
+            if WATERMARK_METADATA_KEY in metadata:
+                watermark = json.loads(metadata[WATERMARK_METADATA_KEY].decode('utf-8'))
+
+            row_ids = None
+            if ROW_ID_COLUMN in table.column_names:
+                row_ids = table.column(ROW_ID_COLUMN).to_numpy(zero_copy_only=False).astype(object)
+                table = table.drop_columns([ROW_ID_COLUMN])
+
+            # split_blocks avoids consolidating columns into fresh 2-D blocks,
+            # letting null-free numeric columns stay views onto the mapped file
+            frame = table.to_pandas(split_blocks=True)
+            self.reads += 1
+            return frame, row_ids, watermark
+        except Exception as e:
+            logger.warning(f"Could not read snapshot {path}: {e}")
+            return None
+
+    def save(self, key: Hashable, version: str, frame: pd.DataFrame,
+             row_ids: Optional[np.ndarray] = None, watermark: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write a snapshot atomically and remove older versions of the same variant.
+
+        Returns:
+            True if the snapshot was written
+        """
+        if not self.enabled or frame.empty:
+            return False
+
+        path = self._path(key, version)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            table = self._to_table(frame, row_ids, watermark)
+
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as sink:
+                    with pa_ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            self._prune(path)
+            self.writes += 1
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write snapshot {path}: {e}")
+            return False
+
+    def invalidate(self, project_id: str) -> int:
+        """Delete every snapshot of a project; returns the number of files removed"""
+        directory = self._project_dir(project_id)
+        if not os.path.isdir(directory):
+            return 0
+        removed = 0
+        for name in os.listdir(directory):
+            if name.endswith('.arrow'):
+                os.remove(os.path.join(directory, name))
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        return {
+            'enabled': self.enabled,
+            'base_dir': self.base_dir,
+            'reads': self.reads,
+            'writes': self.writes,
+            'misses': self.misses,
+        }
+
+    @staticmethod
+    def _to_table(frame: pd.DataFrame, row_ids: Optional[np.ndarray],
+                  watermark: Optional[Dict[str, Any]]) -> "pa.Table":
+        """Convert a frame to an Arrow table, keeping NaN floats as plain values"""
+        table = pa.Table.from_pandas(frame, preserve_index=not isinstance(frame.index, pd.RangeIndex))
+
+        for i, name in enumerate(table.column_names):
+            if name in frame.columns and frame[name].dtype == np.float64:
+                field = table.schema.field(i)
+                values = pa.array(frame[name].to_numpy(), type=pa.float64(), from_pandas=False)
+                table = table.set_column(i, field, values)
+
+        if row_ids is not None:
+            table = table.append_column(ROW_ID_COLUMN, pa.array(np.asarray(row_ids, dtype=object).astype(str)))
+
+        metadata = dict(table.schema.metadata or {})
+        if watermark is not None:
+            metadata[WATERMARK_METADATA_KEY] = json.dumps(watermark, default=str).encode('utf-8')
+        return table.replace_schema_metadata(metadata)
+
+    @staticmethod
+    def _prune(current_path: str) -> None:
+        """Remove snapshots of the same variant written for older versions"""
+        directory = os.path.dirname(current_path)
+        prefix = os.path.basename(current_path).split('.', 1)[0] + '.'
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.startswith(prefix) and name.endswith('.arrow') and path != current_path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+snapshot_store = SnapshotStore(
+    base_dir=settings.SNAPSHOT_DIR,
+    enabled=settings.SNAPSHOT_STORE_ENABLED,
+)
@@ -0,0 +1,496 @@
+"""
+Per-project multi-resolution spatial aggregation indexes.
+
+_analyze_spatial_values bins the points into a fixed 5x5 grid on every
+request, so a map of response density and mean values has to load and rebin
+the whole project each time the view moves. Here a project's response
+coordinates are binned once into Web Mercator tile cells at several zoom
+levels (every SPATIAL_INDEX_ZOOM_STEP levels down from SPATIAL_INDEX_MAX_ZOOM),
+and each cell keeps mergeable aggregates:
+
+    per cell     responses, latitude and longitude sums (for centroids) and,
+                 per value column, non-missing count, sum, sum of squares,
+                 min and max
+
+The cells of a level are sorted by key (x << zoom | y), so a bounding box is
+answered with one binary search per tile column it spans and reads only the
+cells it returns. A map at zoom z gets bins BIN_ZOOM_OFFSET levels finer (8x8
+bins per 256 pixel tile), stepping to coarser levels until the box spans at
+most max_bins cells, so the cost of a query depends on the viewport and not on
+the size of the project.
+
+Coordinates come from location_data (latitude/longitude), falling back to
+geo_data (lat/lng). Indexes are kept per data version like the data profiles
+(see profile_store): responses added after the watermark are binned and merged
+in, while edits and deletions rebuild the index.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.database import (
+    ResponseFilter, get_project_data_state, load_project_columns, project_data_version, run_db
+)
+from app.utils.compute import compute_executor
+from app.utils.shared import normalize_uuid
+
+logger = logging.getLogger(__name__)
+
+# Numerical response columns aggregated per cell
+VALUE_COLUMNS = ('numeric_value', 'data_quality_score')
+# Columns loaded to build or extend an index
+INDEX_COLUMNS = ['response_id', 'location_data', 'geo_data'] + list(VALUE_COLUMNS)
+# Keys of the coordinate pairs in location_data and geo_data
+COORDINATE_KEYS = (('latitude', 'longitude'), ('lat', 'lng'), ('lat', 'lon'))
+# Latitude limit of the Web Mercator projection
+MAX_LATITUDE = 85.0511287798
+# Bins are this many zoom levels finer than the map (2**3 = 8 bins across a tile)
+BIN_ZOOM_OFFSET = 3
+# Cells a bounding box may span at the chosen bin level
+MAX_MAP_BINS = 4096
+
+
+def _coordinates(value: Any) -> Tuple[float, float]:
+    """Latitude and longitude of a location_data or geo_data value (NaN if it has none)"""
+    if isinstance(value, (str, bytes)):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return np.nan, np.nan
+    if isinstance(value, dict):
+        for lat_key, lon_key in COORDINATE_KEYS:
+            if lat_key in value and lon_key in value:
+                try:
+                    return float(value[lat_key]), float(value[lon_key])
+                except (TypeError, ValueError):
+                    break
+    return np.nan, np.nan
+
+
+def extract_coordinates(location_data: Sequence[Any],
+                        geo_data: Optional[Sequence[Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coordinates of each response.
+
+    Args:
+        location_data: location_data values (dicts or JSON strings)
+        geo_data: geo_data values, used where location_data has no coordinates
+
+    Returns:
+        Latitude and longitude arrays, NaN where a response has no valid coordinates
+    """
+    points = np.array([_coordinates(value) for value in location_data], dtype=float).reshape(-1, 2)
+    if geo_data is not None:
+        missing = np.flatnonzero(np.isnan(points).any(axis=1))
+        if len(missing):
+            points[missing] = np.array([_coordinates(geo_data[i]) for i in missing], dtype=float).reshape(-1, 2)
+
+    lats, lons = points[:, 0], points[:, 1]
+    invalid = ~((np.abs(lats) <= 90) & (np.abs(lons) <= 180))
+    lats[invalid] = np.nan
+    lons[invalid] = np.nan
+    return lats, lons
+
+
+def _tile_x(lons: Any, zoom: int) -> np.ndarray:
+    n = 1 << zoom
+    x = np.floor((np.asarray(lons, dtype=float) + 180.0) / 360.0 * n)
+    return np.clip(x, 0, n - 1).astype(np.int64)
+
+
+def _tile_y(lats: Any, zoom: int) -> np.ndarray:
+    n = 1 << zoom
+    lats = np.radians(np.clip(np.asarray(lats, dtype=float), -MAX_LATITUDE, MAX_LATITUDE))
+    y = np.floor((1.0 - np.arcsinh(np.tan(lats)) / np.pi) / 2.0 * n)
+    return np.clip(y, 0, n - 1).astype(np.int64)
+
+
+def _tile_lon(x: Any, zoom: int) -> np.ndarray:
+    """Western edge of tile columns x"""
+    return np.asarray(x) / (1 << zoom) * 360.0 - 180.0
+
+
+def _tile_lat(y: Any, zoom: int) -> np.ndarray:
+    """Northern edge of tile rows y"""
+    return np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * np.asarray(y) / (1 << zoom)))))
+
+
+def _tile_ranges(south: float, west: float, north: float, east: float,
+                 zoom: int) -> Tuple[List[Tuple[int, int]], Tuple[int, int]]:
+    """Tile column ranges and the row range a bounding box covers (west > east crosses the antimeridian)"""
+    x0, x1 = (int(x) for x in _tile_x([west, east], zoom))
+    y0, y1 = (int(y) for y in _tile_y([max(south, north), min(south, north)], zoom))
+    if west > east:
+        return [(x0, (1 << zoom) - 1), (0, x1)], (y0, y1)
+    return [(x0, x1)], (y0, y1)
+
+
+@dataclass
+class SpatialBins:
+    """Aggregates of the occupied cells of one zoom level, sorted by cell key."""
+    zoom: int
+    keys: np.ndarray
+    counts: np.ndarray
+    lat_sums: np.ndarray
+    lon_sums: np.ndarray
+    # One column per indexed value column
+    value_counts: np.ndarray
+    sums: np.ndarray
+    squares: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+
+    @classmethod
+    def of(cls, zoom: int, x: np.ndarray, y: np.ndarray, lats: np.ndarray, lons: np.ndarray,
+           values: np.ndarray) -> "SpatialBins":
+        """
+        Bin points into the cells of a zoom level.
+
+        Args:
+            zoom: Zoom level of the cells
+            x, y: Tile coordinates of the points at this zoom level
+            lats, lons: Point coordinates
+            values: (points, value columns) array, NaN where missing
+        """
+        present = ~np.isnan(values)
+        filled = np.where(present, values, 0.0)
+        return cls._aggregate(
+            zoom, (x << zoom) | y, np.ones(len(x), dtype=np.int64), lats, lons,
+            present.astype(np.int64), filled, filled * filled, values, values,
+        )
+
+    @classmethod
+    def _aggregate(cls, zoom: int, keys: np.ndarray, *columns: np.ndarray) -> "SpatialBins":
+        """Combine rows with equal keys (min and max columns last, other columns added)"""
+        if len(keys) == 0:
+            return cls(zoom, keys.astype(np.int64), *columns)
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+        *added, mins, maxs = (column[order] for column in columns)
+        return cls(
+            zoom, keys[starts],
+            *(np.add.reduceat(column, starts, axis=0) for column in added),
+            np.fmin.reduceat(mins, starts, axis=0),
+            np.fmax.reduceat(maxs, starts, axis=0),
+        )
+
+    def merged(self, other: "SpatialBins") -> "SpatialBins":
+        """Cells of both point sets"""
+        return SpatialBins._aggregate(self.zoom, *(
+            np.concatenate([getattr(self, name), getattr(other, name)])
+            for name in ('keys', 'counts', 'lat_sums', 'lon_sums', 'value_counts',
+                         'sums', 'squares', 'mins', 'maxs')
+        ))
+
+    def select(self, x_ranges: List[Tuple[int, int]], y0: int, y1: int) -> np.ndarray:
+        """Positions of the occupied cells in tile columns x_ranges and rows y0..y1"""
+        columns = np.concatenate([np.arange(start, stop + 1, dtype=np.int64) for start, stop in x_ranges])
+        low = np.searchsorted(self.keys, (columns << self.zoom) | y0, side='left')
+        high = np.searchsorted(self.keys, (columns << self.zoom) | y1, side='right')
+        lengths = high - low
+        offsets = np.cumsum(lengths) - lengths
+        return np.repeat(low - offsets, lengths) + np.arange(lengths.sum())
+
+
+@dataclass
+class SpatialIndex:
+    """Binned response coordinates of a project and the data state it is current as of."""
+    levels: Dict[int, SpatialBins]
+    n_rows: int
+    n_points: int
+    value_columns: Tuple[str, ...] = VALUE_COLUMNS
+    version: str = ''
+    watermark: Optional[Dict[str, Any]] = None
+    row_ids: Optional[np.ndarray] = None
+    updated_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def of(cls, columns: Dict[str, np.ndarray], zooms: Sequence[int]) -> "SpatialIndex":
+        """
+        Index responses loaded by load_project_columns.
+
+        Args:
+            columns: INDEX_COLUMNS arrays (missing value columns count as empty)
+            zooms: Zoom levels to bin at
+        """
+        n_rows = len(columns['response_id'])
+        lats, lons = extract_coordinates(columns['location_data'], columns.get('geo_data'))
+        located = ~np.isnan(lats)
+        lats, lons = lats[located], lons[located]
+        values = np.column_stack([
+            np.asarray(columns[column], dtype=float)[located] if column in columns
+            else np.full(len(lats), np.nan)
+            for column in VALUE_COLUMNS
+        ]).reshape(len(lats), len(VALUE_COLUMNS))
+
+        finest = max(zooms)
+        x, y = _tile_x(lons, finest), _tile_y(lats, finest)
+        levels = {
+            zoom: SpatialBins.of(zoom, x >> (finest - zoom), y >> (finest - zoom), lats, lons, values)
+            for zoom in zooms
+        }
+        return cls(levels=levels, n_rows=n_rows, n_points=int(located.sum()))
+
+    def extended(self, columns: Dict[str, np.ndarray]) -> "SpatialIndex":
+        """Index of these responses plus new responses `columns`"""
+        delta = SpatialIndex.of(columns, self.zooms)
+        return SpatialIndex(
+            levels={zoom: bins.merged(delta.levels[zoom]) for zoom, bins in self.levels.items()},
+            n_rows=self.n_rows + delta.n_rows,
+            n_points=self.n_points + delta.n_points,
+        )
+
+    @property
+    def zooms(self) -> List[int]:
+        return sorted(self.levels)
+
+    def bin_zoom(self, south: float, west: float, north: float, east: float, zoom: int,
+                 max_bins: int = MAX_MAP_BINS) -> int:
+        """Finest indexed level at most BIN_ZOOM_OFFSET levels below `zoom` whose cells in the box number max_bins or fewer"""
+        target = zoom + BIN_ZOOM_OFFSET
+        candidates = [level for level in reversed(self.zooms) if level <= target] or self.zooms[:1]
+        for level in candidates:
+            x_ranges, (y0, y1) = _tile_ranges(south, west, north, east, level)
+            if sum(stop - start + 1 for start, stop in x_ranges) * (y1 - y0 + 1) <= max_bins:
+                return level
+        return candidates[-1]
+
+    def query(self, south: float, west: float, north: float, east: float, zoom: int,
+              value_column: Optional[str] = None, max_bins: int = MAX_MAP_BINS) -> Dict[str, Any]:
+        """
+        Bins of a map view.
+
+        Args:
+            south, west, north, east: Bounding box in degrees (west > east crosses the antimeridian)
+            zoom: Map zoom level
+            value_column: Indexed value column to report per bin (None for counts only)
+            max_bins: Most cells the box may span at the chosen bin level
+
+        Returns:
+            Bin zoom level, per-bin bounds, centroid, response count and value
+            statistics, and totals over the box
+        """
+        if value_column is not None and value_column not in self.value_columns:
+            raise ValueError(f"value_column must be one of {list(self.value_columns)}")
+
+        level = self.bin_zoom(south, west, north, east, zoom, max_bins)
+        bins = self.levels[level]
+        x_ranges, (y0, y1) = _tile_ranges(south, west, north, east, level)
+        selected = bins.select(x_ranges, y0, y1)
+
+        keys = bins.keys[selected]
+        x, y = keys >> level, keys & ((1 << level) - 1)
+        west_edges, east_edges = _tile_lon(x, level), _tile_lon(x + 1, level)
+        north_edges, south_edges = _tile_lat(y, level), _tile_lat(y + 1, level)
+        counts = bins.counts[selected]
+        centroid_lats = bins.lat_sums[selected] / counts
+        centroid_lons = bins.lon_sums[selected] / counts
+
+        if value_column is not None:
+            column = self.value_columns.index(value_column)
+            n = bins.value_counts[selected, column]
+            sums, squares = bins.sums[selected, column], bins.squares[selected, column]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                means = np.where(n > 0, sums / n, np.nan)
+                stds = np.sqrt(np.maximum(squares - sums * means, 0) / (n - 1))
+            mins, maxs = bins.mins[selected, column], bins.maxs[selected, column]
+
+        def number(value: float) -> Optional[float]:
+            return float(value) if np.isfinite(value) else None
+
+        results = []
+        for i in range(len(selected)):
+            item = {
+                'bounds': {
+                    'south': float(south_edges[i]), 'west': float(west_edges[i]),
+                    'north': float(north_edges[i]), 'east': float(east_edges[i]),
+                },
+                'centroid': {'lat': float(centroid_lats[i]), 'lon': float(centroid_lons[i])},
+                'count': int(counts[i]),
+            }
+            if value_column is not None:
+                item.update({
+                    'value_count': int(n[i]),
+                    'mean': number(means[i]),
+                    'std': number(stds[i]) if n[i] > 1 else None,
+                    'min': number(mins[i]),
+                    'max': number(maxs[i]),
+                })
+            results.append(item)
+
+        return {
+            'zoom': zoom,
+            'bin_zoom': level,
+            'value_column': value_column,
+            'bins': results,
+            'n_bins': len(results),
+            'total_count': int(counts.sum()),
+            'max_count': int(counts.max()) if len(counts) else 0,
+            'indexed_points': self.n_points,
+            'responses_without_location': self.n_rows - self.n_points,
+        }
+
+
+class ProjectSpatialIndexStore:
+    """Spatial indexes per project and response filter, validated against the project's data version."""
+
+    def __init__(self, max_entries: int, zooms: Sequence[int], enabled: bool = True):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Indexes kept in memory (least recently used are dropped)
+            zooms: Zoom levels indexes are binned at
+            enabled: When False every call builds a fresh index
+        """
+        self.max_entries = max_entries
+        self.zooms = sorted(set(zooms))
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, SpatialIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.hits = 0
+        self.incremental_updates = 0
+        self.rebuilds = 0
+
+    async def get_index(self, project_id: str,
+                        filters: Optional[ResponseFilter] = None) -> Optional[SpatialIndex]:
+        """
+        Current spatial index of a project's responses (shared; callers must not modify it).
+
+        Args:
+            project_id: Project identifier
+            filters: Response filter applied when loading the responses
+
+        Returns:
+            The index, or None if the project has no responses
+        """
+        normalized_project_id = normalize_uuid(project_id)
+        if filters is not None and filters.is_empty():
+            filters = None
+        key = (normalized_project_id,)
+        if filters is not None:
+            key += ("filter", filters)
+
+        state = await get_project_data_state(normalized_project_id)
+        version = project_data_version(state)
+        previous = self._lookup(key) if self.enabled else None
+        if previous is not None and previous.zooms != self.zooms:
+            previous = None
+        if previous is not None and previous.version == version:
+            with self._lock:
+                self.hits += 1
+            return previous
+
+        index = None
+        if (previous is not None and filters is None and previous.row_ids is not None and
+                settings.PROJECT_DELTA_REFRESH_ENABLED):
+            index = await self._extend(normalized_project_id, previous, state)
+        if index is None:
+            index = await self._build(normalized_project_id, filters)
+            if index is None:
+                return None
+
+        index.version = version
+        index.watermark = state
+        if self.enabled:
+            self._remember(key, index)
+        return index
+
+    async def _extend(self, normalized_project_id: str, previous: SpatialIndex,
+                      state: Dict[str, Any]) -> Optional[SpatialIndex]:
+        """
+        Bin responses added since the index's watermark into it.
+
+        Returns:
+            The extended index, or None if rows were edited or deleted and a rebuild is needed
+        """
+        try:
+            delta_columns = await run_db(load_project_columns, normalized_project_id, INDEX_COLUMNS,
+                                         since=previous.watermark)
+            if not delta_columns:
+                return None
+            delta_ids = delta_columns['response_id']
+            if previous.n_rows + len(delta_ids) != state['count'] or pd.Index(delta_ids).isin(previous.row_ids).any():
+                return None
+
+            index = await compute_executor.run_threaded(previous.extended, delta_columns)
+            index.row_ids = np.concatenate([delta_ids, previous.row_ids])
+            with self._lock:
+                self.incremental_updates += 1
+            logger.info(f"Extended spatial index of project {normalized_project_id} with {len(delta_ids)} rows")
+            return index
+        except Exception as e:
+            logger.warning(f"Incremental spatial index update failed, rebuilding: {e}")
+            return None
+
+    async def _build(self, normalized_project_id: str,
+                     filters: Optional[ResponseFilter]) -> Optional[SpatialIndex]:
+        """Index every matching response; None if there are none"""
+        columns = await run_db(load_project_columns, normalized_project_id, INDEX_COLUMNS, filters=filters)
+        if not columns:
+            return None
+        index = await compute_executor.run_threaded(SpatialIndex.of, columns, self.zooms)
+        index.row_ids = columns['response_id']
+        with self._lock:
+            self.rebuilds += 1
+        return index
+
+    def _lookup(self, key: Hashable) -> Optional[SpatialIndex]:
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None:
+                self._entries.move_to_end(key)
+            return index
+
+    def _remember(self, key: Hashable, index: SpatialIndex) -> None:
+        with self._lock:
+            self._entries[key] = index
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, project_id: Optional[str] = None) -> int:
+        """
+        Drop the indexes of one project (every filter) or of all projects.
+
+        Returns:
+            Number of indexes removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if project_id is None or key[0] == project_id]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'zooms': self.zooms,
+                'indexed_points': sum(index.n_points for index in self._entries.values()),
+                'hits': self.hits,
+                'incremental_updates': self.incremental_updates,
+                'rebuilds': self.rebuilds,
+            }
+
+
+project_spatial_indexes = ProjectSpatialIndexStore(
+    max_entries=settings.SPATIAL_INDEX_MAX_ENTRIES,
+    zooms=range(settings.SPATIAL_INDEX_MAX_ZOOM, -1, -settings.SPATIAL_INDEX_ZOOM_STEP),
+    enabled=settings.SPATIAL_INDEX_ENABLED,
+)
@@ -0,0 +1,62 @@
+"""
+Streaming NDJSON responses for analyses with per-item results.
+
+Sentiment scores, similar text pairs and theme quotes grow with the corpus.
+Built as one response they are held in memory, converted and serialized at
+once, so time-to-first-byte and peak memory scale with the project. Endpoints
+that opt in with `?stream=true` instead yield records one at a time, computing
+items in chunks, and each record is written as one line of JSON:
+
+    {"type": "summary", ...}         request parameters and input sizes, first
+    {"type": "item", "field": ...}   one per-item result
+    {"type": "field_summary", ...}   statistics of one field, after its items
+    {"type": "complete", ...}        overall statistics, last
+    {"type": "error", "message": ...}
+
+The HTTP status is sent before the first record, so failures part-way through
+arrive as an "error" record that ends the stream.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from core.config import settings
+from app.utils.serialization import encode_json
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_record(record: Dict[str, Any]) -> bytes:
+    """Encode one record as a line of JSON"""
+    return encode_json(record) + b"\n"
+
+
+def chunk_ranges(total: int, size: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """(start, stop) positions covering `total` items in chunks of `size` (default STREAM_CHUNK_SIZE)"""
+    size = max(1, size or settings.STREAM_CHUNK_SIZE)
+    for start in range(0, total, size):
+        yield start, min(start + size, total)
+
+
+async def _encode(records: AsyncIterator[Dict[str, Any]], context: str) -> AsyncIterator[bytes]:
+    try:
+        async for record in records:
+            yield ndjson_record(record)
+    except Exception as e:
+        logger.error(f"{context} stream failed: {e}")
+        yield ndjson_record({'type': 'error', 'message': f"{context} failed: {e}"})
+
+
+def ndjson_response(records: AsyncIterator[Dict[str, Any]], context: str) -> StreamingResponse:
+    """
+    Stream records from an async generator as NDJSON.
+
+    Args:
+        records: Async generator of record dicts, each with a `type` key
+        context: Analysis name used in error records and logs
+    """
+    return StreamingResponse(_encode(records, context), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,217 @@
+"""
+Background warming of hot analyses after sync ingestion.
+
+When a sync batch lands, every cached result and profile of the affected
+projects goes stale, and the first analyst to open one of them pays for the
+full recomputation. The sync service reports the projects it touched
+(POST /sync/ingested); they are marked dirty and a background worker reruns
+the hot analyses (CACHE_WARM_ANALYSES) for each, storing their results under
+the new data version before anyone asks.
+
+Endpoints join the hot set with the `cache_warmer.hot(name)` decorator and
+are warmed with their default arguments, which are the arguments an analyst
+opening the project sends, so warmed results share the analyst's cache key.
+Marks for a project that is already waiting are coalesced, and each warm
+starts CACHE_WARM_DELAY seconds after its first mark so bursts of sync
+batches are warmed once.
+"""
+
+import time
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import params
+from pydantic.fields import FieldInfo
+
+from core.config import settings
+from app.utils.shared import normalize_uuid
+
+logger = logging.getLogger(__name__)
+
+# Arguments supplied by the warmer itself or not part of an analysis
+SKIPPED_PARAMETERS = ('project_id', 'background', 'stream')
+
+
+def default_arguments(func: Callable) -> Dict[str, Any]:
+    """
+    Keyword arguments FastAPI passes an endpoint when a request sets nothing but the project.
+
+    Dependencies become None (an empty response filter is None, and the
+    database session does not affect results).
+
+    Raises:
+        ValueError: If a parameter other than project_id has no default
+    """
+    arguments = {}
+    for name, parameter in inspect.signature(func).parameters.items():
+        if name in SKIPPED_PARAMETERS:
+            continue
+        default = parameter.default
+        if isinstance(default, params.Depends):
+            default = None
+        elif isinstance(default, FieldInfo):
+            if default.is_required():
+                raise ValueError(f"{func.__name__} requires '{name}'")
+            default = default.get_default()
+        elif default is inspect.Parameter.empty:
+            raise ValueError(f"{func.__name__} requires '{name}'")
+        arguments[name] = default
+    return arguments
+
+
+class CacheWarmer:
+    """Reruns registered hot analyses for projects marked dirty by sync ingestion."""
+
+    def __init__(self, analyses: Sequence[str], delay: float = 0.0, enabled: bool = True):
+        """
+        Initialize the warmer.
+
+        Args:
+            analyses: Names of the hot analyses to warm, in order
+            delay: Seconds between a project's first mark and its warm
+            enabled: When False marks are ignored
+        """
+        self.analyses = list(analyses)
+        self.delay = delay
+        self.enabled = enabled
+        self._registry: Dict[str, Callable[[str], Awaitable[Any]]] = {}
+        self._dirty: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self.marked = 0
+        self.coalesced = 0
+        self.warmed_projects = 0
+        self.warmed_analyses = 0
+        self.errors = 0
+        self.last_warm_ms = 0.0
+
+    def register(self, name: str, warm: Callable[[str], Awaitable[Any]]) -> None:
+        """Register a coroutine function taking a project id under a hot analysis name"""
+        self._registry[name] = warm
+
+    def hot(self, name: str) -> Callable:
+        """
+        Decorate an analysis endpoint so it can be warmed as hot analysis `name`.
+
+        Place it directly above `result_cache.cached` so warming stores the
+        result. The endpoint itself is returned unchanged.
+        """
+        def decorator(func: Callable) -> Callable:
+            arguments = default_arguments(func)
+
+            async def warm(project_id: str) -> Any:
+                return await func(project_id=project_id, **arguments)
+
+            self.register(name, warm)
+            return func
+
+        return decorator
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-warm")
+            return self._executor
+
+    def mark_dirty(self, project_ids: Iterable[str]) -> List[str]:
+        """
+        Mark projects as changed by ingestion and schedule their warm.
+
+        Returns:
+            Normalized ids of the projects scheduled by this call (projects
+            already waiting for a warm are not scheduled again)
+        """
+        if not self.enabled:
+            return []
+
+        scheduled = []
+        for project_id in dict.fromkeys(normalize_uuid(str(project_id)) for project_id in project_ids):
+            with self._lock:
+                self.marked += 1
+                if project_id in self._dirty:
+                    self.coalesced += 1
+                    continue
+                self._dirty[project_id] = time.time()
+            self._get_executor().submit(self._run, project_id)
+            scheduled.append(project_id)
+        return scheduled
+
+    def _run(self, project_id: str) -> None:
+        with self._lock:
+            marked_at = self._dirty.get(project_id, time.time())
+        wait = marked_at + self.delay - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        with self._lock:
+            # Marks from here on schedule another warm, since the data may have changed again
+            self._dirty.pop(project_id, None)
+        asyncio.run(self.warm(project_id))
+
+    async def warm(self, project_id: str) -> Dict[str, str]:
+        """
+        Run the hot analyses for one project.
+
+        Returns:
+            Outcome ('warmed', 'failed' or 'unknown') per hot analysis
+        """
+        started = time.perf_counter()
+        outcomes = {}
+        for name in self.analyses:
+            warm = self._registry.get(name)
+            if warm is None:
+                logger.warning(f"Unknown hot analysis '{name}' in CACHE_WARM_ANALYSES")
+                outcomes[name] = 'unknown'
+                continue
+            try:
+                response = await warm(project_id)
+                failed = isinstance(response, dict) and response.get('status') == 'error'
+                outcomes[name] = 'failed' if failed else 'warmed'
+            except Exception as e:
+                logger.warning(f"Warming {name} for project {project_id} failed: {e}")
+                outcomes[name] = 'failed'
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.warmed_projects += 1
+            self.warmed_analyses += sum(outcome == 'warmed' for outcome in outcomes.values())
+            self.errors += sum(outcome == 'failed' for outcome in outcomes.values())
+            self.last_warm_ms = elapsed_ms
+        logger.info(f"Warmed project {project_id} in {elapsed_ms:.0f}ms: {outcomes}")
+        return outcomes
+
+    def shutdown(self) -> None:
+        """Drop pending warms without waiting for a running one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._dirty.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'analyses': self.analyses,
+                'registered': sorted(self._registry),
+                'dirty_projects': len(self._dirty),
+                'marked': self.marked,
+                'coalesced': self.coalesced,
+                'warmed_projects': self.warmed_projects,
+                'warmed_analyses': self.warmed_analyses,
+                'errors': self.errors,
+                'last_warm_ms': self.last_warm_ms,
+            }
+
+
+cache_warmer = CacheWarmer(
+    analyses=[name.strip() for name in settings.CACHE_WARM_ANALYSES.split(',') if name.strip()],
+    delay=settings.CACHE_WARM_DELAY,
+    enabled=settings.CACHE_WARMING_ENABLED,
+)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark analytics API throughput under concurrent requests.
+
+Requests are sent in-process through the ASGI app (or to a running server with
+--url) at 1, 8 and 32 parallel requests. Run it with --pool-size 1 to see the
+serialized baseline that a single database thread gives.
+
+Usage:
+    python benchmark_concurrency.py <project_id> [--requests N] [--pool-size N] [--url URL]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+# Add the FastAPI directory to the path so core/app packages resolve
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+CONCURRENCY_LEVELS = (1, 8, 32)
+
+# Database-bound endpoints that bypass the project data cache
+ENDPOINTS = (
+    "/api/v1/analytics/descriptive/project/{project_id}/data-summary",
+    "/api/v1/analytics/descriptive/project/{project_id}/explore-data?page_size=100",
+    "/api/v1/sync/status?project_id={project_id}",
+)
+
+
+async def run_level(client: httpx.AsyncClient, paths, concurrency: int, total: int):
+    """Send `total` requests with at most `concurrency` in flight; return (seconds, failures)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def one(i: int):
+        nonlocal failures
+        async with semaphore:
+            response = await client.get(paths[i % len(paths)])
+            if response.status_code != 200:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - start, failures
+
+
+async def run_benchmark(project_id: str, total: int, url: str = None):
+    """Print requests/sec at each concurrency level"""
+    paths = [path.format(project_id=project_id) for path in ENDPOINTS]
+
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=120)
+        pool_size, database = "server", "server"
+    else:
+        from main import app
+        from core.database import connection, db_pool
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=120)
+        pool_size, database = db_pool.size, connection.vendor
+
+    print("📊 Concurrent request benchmark")
+    print("=" * 50)
+    # Pooling only raises throughput when the database and CPUs can serve queries in parallel
+    print(f"  Database: {database}, pool size: {pool_size}, CPUs: {os.cpu_count()}")
+
+    async with client:
+        # Warm up connections and imports
+        await run_level(client, paths, 1, len(paths))
+        baseline = None
+        for concurrency in CONCURRENCY_LEVELS:
+            seconds, failures = await run_level(client, paths, concurrency, total)
+            rate = total / seconds if seconds else 0
+            baseline = baseline or rate
+            print(f"  {concurrency:>3} parallel  {total:>5} requests  {seconds:8.3f}s  "
+                  f"{rate:>9,.1f} req/s  ({rate / baseline:.1f}x)  failures: {failures}")
+
+    if not url:
+        print(f"\n  Pool stats: {db_pool.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("project_id", help="Project to query")
+    parser.add_argument("--requests", type=int, default=96, help="Requests per concurrency level")
+    parser.add_argument("--pool-size", type=int, help="Override DB_POOL_SIZE for the in-process app")
+    parser.add_argument("--url", help="Benchmark a running server instead, e.g. http://localhost:8001")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.pool_size:
+        os.environ["DB_POOL_SIZE"] = str(args.pool_size)
+    asyncio.run(run_benchmark(args.project_id, args.requests, args.url))
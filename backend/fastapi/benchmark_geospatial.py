@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the geospatial kernels: pairwise distance statistics and Moran's I.
+
+The previous implementations (Python loops over every pair, dense n x n
+matrices) are timed only up to --max-reference points, since they grow
+quadratically in interpreted code. Points are synthetic GPS fixes scattered
+around a few survey sites.
+
+Usage:
+    python benchmark_geospatial.py [--points 1000 10000 100000] [--max-reference N]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the FastAPI directory to the path so core/app packages resolve
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+import app.analytics.auto_detect  # noqa: F401  (must precede the descriptive package)
+from app.analytics.descriptive import geospatial_analysis as geo
+
+
+def synthetic_points(n: int) -> pd.DataFrame:
+    """GPS fixes around five sites ~50 km apart, with a value that trends north-south"""
+    rng = np.random.default_rng(0)
+    sites = np.array([[-1.29, 36.82], [-0.72, 36.43], [-1.52, 37.26], [-0.10, 37.00], [-1.05, 37.08]])
+    site = rng.integers(0, len(sites), n)
+    lats = sites[site, 0] + rng.normal(0, 0.05, n)
+    lons = sites[site, 1] + rng.normal(0, 0.05, n)
+    return pd.DataFrame({'lat': lats, 'lon': lons, 'value': lats * 10 + rng.normal(0, 1, n)})
+
+
+def reference_distance_statistics(lats: np.ndarray, lons: np.ndarray) -> dict:
+    """Dense pairwise matrix filled pair by pair, as before"""
+    n = len(lats)
+    distances = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i + 1, n):
+            distances[i, j] = distances[j, i] = geo._haversine_distance(lats[i], lons[i], lats[j], lons[j])
+    return {"mean_distance_km": float(distances[distances > 0].mean())}
+
+
+def reference_morans_i(df: pd.DataFrame, max_distance_km: float) -> float:
+    """Dense inverse-distance weights and Moran's I with double loops, as before"""
+    lats, lons, values = df['lat'].values, df['lon'].values, df['value'].values
+    n = len(values)
+    weights = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                dist = geo._haversine_distance(lats[i], lons[i], lats[j], lons[j])
+                if 0 < dist <= max_distance_km:
+                    weights[i, j] = 1 / dist
+    row_sums = weights.sum(axis=1)
+    row_sums[row_sums == 0] = 1
+    weights = weights / row_sums[:, np.newaxis]
+    deviations = values - values.mean()
+    numerator = sum(weights[i, j] * deviations[i] * deviations[j] for i in range(n) for j in range(n))
+    return (n / weights.sum()) * (numerator / (deviations ** 2).sum())
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(sizes, max_reference: int, max_distance_km: float):
+    print("🌍 Geospatial kernel benchmark")
+    print("=" * 72)
+    print(f"  {'points':>8}  {'distances':>10}  {'previous':>10}  {'moran':>9}  {'previous':>10}  weights")
+    for n in sizes:
+        df = synthetic_points(n)
+        lats, lons = df['lat'].values, df['lon'].values
+        stats, distance_time = timed(geo._distance_statistics, lats, lons)
+        moran, moran_time = timed(geo.calculate_spatial_autocorrelation, df, 'lat', 'lon', 'value', max_distance_km)
+
+        previous_distance = previous_moran = "skipped"
+        if n <= max_reference:
+            reference, elapsed = timed(reference_distance_statistics, lats, lons)
+            assert np.isclose(reference['mean_distance_km'], stats['mean_distance_km'])
+            previous_distance = f"{elapsed:.2f}s"
+            reference, elapsed = timed(reference_morans_i, df, max_distance_km)
+            assert np.isclose(reference, moran['morans_i'])
+            previous_moran = f"{elapsed:.2f}s"
+
+        print(f"  {n:>8}  {distance_time:>9.2f}s  {previous_distance:>10}  {moran_time:>8.2f}s  "
+              f"{previous_moran:>10}  {moran['weights']['type']} ({moran['weights']['neighbor_pairs']} pairs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Point counts to benchmark")
+    parser.add_argument("--max-reference", type=int, default=1000,
+                        help="Largest point count the previous implementations are timed at")
+    parser.add_argument("--max-distance-km", type=float, default=10.0, help="Moran's I neighbor band")
+    args = parser.parse_args()
+
+    run_benchmark(args.points, args.max_reference, args.max_distance_km)
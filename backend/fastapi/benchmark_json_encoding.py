@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark response encoding: convert_numpy_types + jsonable_encoder + json.dumps
+(the previous path) vs the single-pass encoder in app.utils.serialization.
+
+Payloads are the results of real analyses on a project's data. Without a
+project id, a synthetic survey frame stands in for it.
+
+Usage:
+    python benchmark_json_encoding.py [<project_id>] [--rows N] [--repeat N]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+# Add the FastAPI directory to the path so core/app packages resolve
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+
+from app.utils.shared import AnalyticsUtils
+from app.utils.serialization import encode_json
+
+
+def synthetic_frame(rows: int) -> pd.DataFrame:
+    """Survey-like frame: numeric answers with gaps, categories and timestamps"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"q{i}": rng.normal(50, 10, rows) for i in range(30)})
+    df.iloc[rng.integers(0, rows, rows // 10), 3] = np.nan
+    df["region"] = rng.choice(["north", "south", "east", "west"], rows)
+    df["collected_at"] = pd.date_range("2024-01-01", periods=rows, freq="min")
+    return df
+
+
+def payloads(df: pd.DataFrame):
+    """(name, format_api_response result) pairs for typical analyses"""
+    analyses = {
+        "correlation": lambda: AnalyticsUtils.run_correlation_analysis(df),
+        "basic_statistics": lambda: AnalyticsUtils.run_basic_statistics(df),
+        "data_characteristics": lambda: AnalyticsUtils.analyze_data_characteristics(df),
+        "per_row_values": lambda: {
+            'rows': [{'index': np.int64(i), 'value': value, 'z': (value - 50) / 10}
+                     for i, value in enumerate(df.select_dtypes(include=[np.number]).iloc[:, 0].to_numpy())]
+        },
+    }
+    for name, run in analyses.items():
+        yield name, AnalyticsUtils.format_api_response('success', run())
+
+
+def previous_path(response):
+    """convert_numpy_types, FastAPI's jsonable_encoder, then JSONResponse's json.dumps"""
+    content = jsonable_encoder(AnalyticsUtils.convert_numpy_types(response))
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def best_time(func, payload, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payload)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+async def load_frame(project_id: str) -> pd.DataFrame:
+    return await AnalyticsUtils.get_project_data(project_id)
+
+
+def run_benchmark(df: pd.DataFrame, repeat: int):
+    """Encode each payload both ways and print the timings"""
+    print("📊 Response encoding benchmark")
+    print("=" * 64)
+    print(f"  {'payload':<22} {'size':>9}  {'previous':>10}  {'encode_json':>11}  speedup")
+    for name, response in payloads(df):
+        size = len(encode_json(response))
+        previous = best_time(previous_path, response, repeat)
+        current = best_time(encode_json, response, repeat)
+        print(f"  {name:<22} {size / 1024:>7.0f}KB  {previous * 1000:>8.2f}ms  "
+              f"{current * 1000:>9.2f}ms  {previous / current:>6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("project_id", nargs="?", help="Project whose data the analyses run on")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows of the synthetic frame")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per encoder (best is reported)")
+    args = parser.parse_args()
+
+    frame = asyncio.run(load_frame(args.project_id)) if args.project_id else synthetic_frame(args.rows)
+    run_benchmark(frame, args.repeat)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark project data loading: legacy per-response records vs the columnar loader.
+
+Usage:
+    python benchmark_project_loading.py <project_id> [--repeat N]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+# Add the FastAPI directory to the path so core/app packages resolve
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.shared import AnalyticsUtils
+
+
+async def time_loader(project_id: str, loader: str, repeat: int):
+    """Return (best seconds, row count) for one loader over several runs"""
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = await AnalyticsUtils.get_project_data(project_id, loader=loader, use_cache=False)
+        elapsed = time.perf_counter() - start
+        rows = len(df)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, rows
+
+
+async def run_benchmark(project_id: str, repeat: int):
+    """Run both loaders and print rows/sec"""
+    print("📊 Project data loading benchmark")
+    print("=" * 50)
+
+    results = {}
+    for loader in ("records", "columnar"):
+        seconds, rows = await time_loader(project_id, loader, repeat)
+        results[loader] = seconds
+        rate = rows / seconds if seconds else 0
+        print(f"  {loader:<10} {rows:>9} rows  {seconds:8.3f}s  {rate:>12,.0f} rows/sec")
+
+    if results["columnar"]:
+        print(f"\n  Speedup: {results['records'] / results['columnar']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("project_id", help="Project to load")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader (best is reported)")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.project_id, args.repeat))
@@ -28,6 +28,78 @@ class Settings:
     MAX_ANALYSIS_ROWS: int = 10000
     DEFAULT_SAMPLE_SIZE: int = 1000
     
+    # Data loading settings
+    PROJECT_LOAD_BATCH_SIZE: int = int(os.getenv("PROJECT_LOAD_BATCH_SIZE", "5000"))
+    
+    # Database connection pool (per uvicorn worker process)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "8"))
+    DB_POOL_MAX_OVERFLOW: int = int(os.getenv("DB_POOL_MAX_OVERFLOW", "4"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    
+    # Prepared project DataFrame cache
+    PROJECT_CACHE_ENABLED: bool = os.getenv("PROJECT_CACHE_ENABLED", "true").lower() == "true"
+    PROJECT_CACHE_MAX_MB: int = int(os.getenv("PROJECT_CACHE_MAX_MB", "512"))
+    PROJECT_DELTA_REFRESH_ENABLED: bool = os.getenv("PROJECT_DELTA_REFRESH_ENABLED", "true").lower() == "true"
+    
+    # On-disk project frame snapshots (Arrow IPC, memory-mapped on read)
+    SNAPSHOT_STORE_ENABLED: bool = os.getenv("SNAPSHOT_STORE_ENABLED", "true").lower() == "true"
+    SNAPSHOT_DIR: str = os.getenv(
+        "SNAPSHOT_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "snapshots")
+    )
+    
+    # Per-project data profiles (variable types, missingness, duplicates), kept per data
+    # version, extended from new rows and persisted for unfiltered frames
+    PROFILE_STORE_ENABLED: bool = os.getenv("PROFILE_STORE_ENABLED", "true").lower() == "true"
+    PROFILE_STORE_MAX_ENTRIES: int = int(os.getenv("PROFILE_STORE_MAX_ENTRIES", "256"))
+    PROFILE_DIR: str = os.getenv(
+        "PROFILE_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "profiles")
+    )
+
+    # Per-project spatial aggregation indexes for map views: response coordinates binned
+    # into Web Mercator tiles every SPATIAL_INDEX_ZOOM_STEP zoom levels up to the maximum
+    SPATIAL_INDEX_ENABLED: bool = os.getenv("SPATIAL_INDEX_ENABLED", "true").lower() == "true"
+    SPATIAL_INDEX_MAX_ENTRIES: int = int(os.getenv("SPATIAL_INDEX_MAX_ENTRIES", "64"))
+    SPATIAL_INDEX_MAX_ZOOM: int = int(os.getenv("SPATIAL_INDEX_MAX_ZOOM", "16"))
+    SPATIAL_INDEX_ZOOM_STEP: int = int(os.getenv("SPATIAL_INDEX_ZOOM_STEP", "2"))
+
+    # Persistent analysis result cache (AnalyticsResult rows; freshness and per-project
+    # limits come from Django's ANALYTICS_SETTINGS)
+    RESULT_CACHE_ENABLED: bool = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    
+    # Rank error (fraction of values) of the quantile sketches kept with data profiles
+    # and used by approximate percentiles and IQR outlier bounds
+    QUANTILE_SKETCH_EPSILON: float = float(os.getenv("QUANTILE_SKETCH_EPSILON", "0.01"))
+    
+    # Identical concurrent analysis requests share one computation
+    REQUEST_COALESCING_ENABLED: bool = os.getenv("REQUEST_COALESCING_ENABLED", "true").lower() == "true"
+    
+    # Weak ETags on project analysis responses; matching If-None-Match gets a 304
+    ETAGS_ENABLED: bool = os.getenv("ETAGS_ENABLED", "true").lower() == "true"
+    
+    # Warming of hot analyses after sync ingestion (names registered with cache_warmer.hot)
+    CACHE_WARMING_ENABLED: bool = os.getenv("CACHE_WARMING_ENABLED", "true").lower() == "true"
+    CACHE_WARM_ANALYSES: str = os.getenv("CACHE_WARM_ANALYSES", "profile,project-stats,basic-statistics,categorical,data-quality,map-bins")
+    CACHE_WARM_DELAY: float = float(os.getenv("CACHE_WARM_DELAY", "2.0"))
+    
+    # Background analysis jobs (local worker threads, no external broker)
+    ANALYSIS_JOB_WORKERS: int = int(os.getenv("ANALYSIS_JOB_WORKERS", "2"))
+    ANALYSIS_JOB_RETENTION: int = int(os.getenv("ANALYSIS_JOB_RETENTION", "3600"))
+    
+    # CPU-bound analysis work (per uvicorn worker process): 'process' runs it on worker
+    # processes with a thread fallback, 'thread' on threads only
+    ANALYTICS_COMPUTE_EXECUTOR: str = os.getenv("ANALYTICS_COMPUTE_EXECUTOR", "process").lower()
+    ANALYTICS_COMPUTE_WORKERS: int = int(os.getenv("ANALYTICS_COMPUTE_WORKERS", str(os.cpu_count() or 2)))
+    ANALYTICS_COMPUTE_START_METHOD: str = os.getenv("ANALYTICS_COMPUTE_START_METHOD", "spawn")
+    
+    # Items computed per chunk when an endpoint streams NDJSON results
+    STREAM_CHUNK_SIZE: int = int(os.getenv("STREAM_CHUNK_SIZE", "200"))
+    
+    # Import analytics modules in the background at startup instead of on first use
+    ANALYTICS_PRELOAD_MODULES: bool = os.getenv("ANALYTICS_PRELOAD_MODULES", "false").lower() == "true"
+    
     # File paths
     BASE_DIR: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     DJANGO_PROJECT_DIR: str = os.path.join(BASE_DIR, "..")
@@ -5,11 +5,24 @@ Connects to Django's database to access collected data.
 
 import os
 import sys
+import json
+import time
+import uuid
+import asyncio
+import threading
+import functools
+import contextlib
 import django
-from typing import Generator
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Generator, Any, Callable, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool
 
 # Add Django project to Python path
 # FastAPI is in backend/fastapi/, Django is in backend/django_core/
@@ -25,14 +38,17 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_core.settings.developmen
 django.setup()
 
 # Import Django models after setup
-from django.db import connection
+from django.db import connection, transaction, InterfaceError, OperationalError
 from django.conf import settings
+from django.utils import timezone
 from projects.models import Project
 from forms.models import Question
 from responses.models import Response, Respondent, ResponseType
 from authentication.models import User
 from analytics_results.models import AnalyticsResult
 
+from core.config import settings as analytics_settings
+
 # Create SQLAlchemy engine using Django's database settings
 def get_django_db_url():
     """Get database URL from Django settings"""
@@ -47,16 +63,135 @@ def get_django_db_url():
     else:
         raise ValueError(f"Unsupported database engine: {db_settings['ENGINE']}")
 
-# Create SQLAlchemy engine
+# Create SQLAlchemy engine with a bounded connection pool
 engine = create_engine(
     get_django_db_url(),
-    poolclass=StaticPool,
+    poolclass=QueuePool,
+    pool_size=analytics_settings.DB_POOL_SIZE,
+    max_overflow=analytics_settings.DB_POOL_MAX_OVERFLOW,
+    pool_timeout=analytics_settings.DB_POOL_TIMEOUT,
+    pool_recycle=analytics_settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
     connect_args={"check_same_thread": False} if "sqlite" in get_django_db_url() else {}
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+class DatabasePool:
+    """
+    Bounded thread pool for Django ORM and raw-cursor work.
+
+    Django keeps one connection per thread, so a pool of N threads holds at
+    most N database connections. Unlike thread-sensitive sync_to_async, which
+    runs every call on a single shared thread, calls run concurrently up to
+    the pool size and queue beyond it. Connections stay open between calls and
+    are closed after a connection error or once older than the recycle age.
+
+    The executor is created lazily and per process, so each uvicorn worker
+    gets its own pool rather than inheriting one across a fork.
+    """
+
+    def __init__(self, size: int, recycle_seconds: int = 1800):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Number of worker threads (and database connections)
+            recycle_seconds: Reopen connections older than this
+        """
+        self.size = max(1, size)
+        self.recycle_seconds = recycle_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self.submitted = 0
+        self.completed = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_wait_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._executor is None or self._pid != pid:
+            with self._lock:
+                if self._executor is None or self._pid != pid:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.size, thread_name_prefix="analytics-db"
+                    )
+                    self._pid = pid
+        return self._executor
+
+    def _call(self, submitted_at: float, func: Callable, args, kwargs):
+        """Run one call on a pool thread, managing that thread's connection."""
+        started = time.perf_counter()
+        with self._lock:
+            self.total_wait_seconds += started - submitted_at
+            self.in_flight += 1
+
+        opened_at = getattr(self._local, 'opened_at', None)
+        if opened_at is not None and started - opened_at > self.recycle_seconds:
+            connection.close()
+            opened_at = None
+        if opened_at is None or connection.connection is None:
+            self._local.opened_at = started
+
+        try:
+            return func(*args, **kwargs)
+        except (InterfaceError, OperationalError):
+            # Drop a broken connection so the next call on this thread reconnects
+            connection.close()
+            self._local.opened_at = None
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run a blocking database function on the pool and await its result."""
+        with self._lock:
+            self.submitted += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(self._call, time.perf_counter(), func, args, kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Stop the pool threads; idle connections are closed with their threads."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                'pool_size': self.size,
+                'in_flight': self.in_flight,
+                'queued': self.submitted - self.completed - self.in_flight,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'errors': self.errors,
+                'avg_wait_ms': round(1000 * self.total_wait_seconds / self.completed, 3) if self.completed else 0.0,
+            }
+
+
+db_pool = DatabasePool(
+    size=analytics_settings.DB_POOL_SIZE,
+    recycle_seconds=analytics_settings.DB_POOL_RECYCLE,
+)
+
+async def run_db(func: Callable, *args, **kwargs):
+    """Run a blocking Django database function on the shared connection pool"""
+    return await db_pool.run(func, *args, **kwargs)
+
 def get_db() -> Generator[Session, None, None]:
     """Get database session"""
     db = SessionLocal()
@@ -69,16 +204,11 @@ async def init_db():
     """Initialize database connection"""
     # Test connection using Django's connection instead of SQLAlchemy
     try:
-        from django.db import connection
-        from asgiref.sync import sync_to_async
-        
-        # Use sync_to_async to run Django operations in async context
-        @sync_to_async
         def test_connection():
             with connection.cursor() as cursor:
                 cursor.execute("SELECT 1")
         
-        await test_connection()
+        await run_db(test_connection)
         print("✅ Database connection established")
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
@@ -98,9 +228,6 @@ def execute_django_query(query, params=None):
 # Data access utilities
 async def get_project_data(project_id: str):
     """Get all data for a specific project"""
-    from asgiref.sync import sync_to_async
-    
-    @sync_to_async
     def _get_project_data():
         try:
             # Get project
@@ -138,13 +265,107 @@ async def get_project_data(project_id: str):
             print(f"Error getting project data: {e}")
             return []
     
-    return await _get_project_data()
+    return await run_db(_get_project_data)
 
-async def get_project_stats(project_id: str):
-    """Get basic statistics for a project"""
-    from asgiref.sync import sync_to_async
-    
-    @sync_to_async
+def load_project_data_state(project_id: str) -> Dict[str, Any]:
+    """
+    Response count and latest collected/synced timestamps for a project.
+
+    Timestamps are returned exactly as the database reports them so they can
+    be passed back unchanged as delta-load watermarks.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT COUNT(*), MAX(collected_at), MAX(synced_at)
+            FROM responses_response
+            WHERE project_id = %s
+            """,
+            [project_id]
+        )
+        count, max_collected, max_synced = cursor.fetchone()
+    return {
+        'count': count,
+        'max_collected_at': max_collected,
+        'max_synced_at': max_synced,
+    }
+
+def project_data_version(state: Dict[str, Any]) -> str:
+    """
+    Cheap data-version token for a project's responses.
+
+    Combines the response count with the latest collected_at and synced_at so
+    inserts, deletions and sync updates all change the token.
+    """
+    return f"{state['count']}:{state['max_collected_at'] or ''}:{state['max_synced_at'] or ''}"
+
+def load_project_data_version(project_id: str) -> str:
+    """Data-version token for a project (see project_data_version)"""
+    return project_data_version(load_project_data_state(project_id))
+
+class RequestDataStates:
+    """Project data states already read while handling one request."""
+
+    def __init__(self):
+        self.states: Dict[str, Dict[str, Any]] = {}
+        self.open = True
+
+# Data states of the request being handled (see request_data_states)
+_request_data_states: ContextVar[Optional[RequestDataStates]] = ContextVar('request_data_states', default=None)
+
+@contextlib.contextmanager
+def request_data_states() -> Generator[RequestDataStates, None, None]:
+    """
+    Read each project's data state at most once within the block.
+
+    The ETag, the result cache key and the frame cache of one analysis request
+    all need the project's data version; inside the block they share one
+    COUNT/MAX query instead of running it once each.
+    """
+    scope = RequestDataStates()
+    token = _request_data_states.set(scope)
+    try:
+        yield scope
+    finally:
+        _request_data_states.reset(token)
+        # Background jobs started by the request read current states from here on
+        scope.open = False
+        scope.states.clear()
+
+async def get_project_data_state(project_id: str) -> Dict[str, Any]:
+    """Get count and timestamp watermarks for a project's responses"""
+    scope = _request_data_states.get()
+    if scope is None or not scope.open:
+        return await run_db(load_project_data_state, project_id)
+    if project_id not in scope.states:
+        scope.states[project_id] = await run_db(load_project_data_state, project_id)
+    return scope.states[project_id]
+
+async def get_project_data_version(project_id: str) -> str:
+    """Get the data-version token for a project"""
+    return project_data_version(await get_project_data_state(project_id))
+
+def load_project_response_counts(project_id: str) -> Dict[str, int]:
+    """Responses and distinct respondents of a project, which change only with its data version"""
+    responses = Response.objects.filter(project_id=project_id)
+    return {
+        'total_responses': responses.count(),
+        'unique_respondents': responses.values('respondent_id').distinct().count(),
+    }
+
+async def get_project_response_counts(project_id: str) -> Dict[str, int]:
+    """Get response and respondent totals for a project"""
+    return await run_db(load_project_response_counts, project_id)
+
+async def get_project_stats(project_id: str, response_counts: Optional[Dict[str, int]] = None):
+    """
+    Get basic statistics for a project
+
+    Args:
+        project_id: Project identifier
+        response_counts: total_responses and unique_respondents when already
+            known (see load_project_response_counts); queried when None
+    """
     def _get_project_stats():
         try:
             project = Project.objects.get(id=project_id)
@@ -152,8 +373,7 @@ async def get_project_stats(project_id: str):
             stats = {
                 'project_name': project.name,
                 'total_questions': project.questions.count(),
-                'total_responses': project.responses.count(),
-                'unique_respondents': project.responses.values('respondent_id').distinct().count(),
+                **(response_counts or load_project_response_counts(project_id)),
                 'analytics_results': project.analytics_results.count(),
                 'team_members': project.get_team_members_count(),
                 'created_at': project.created_at.isoformat(),
@@ -167,4 +387,403 @@ async def get_project_stats(project_id: str):
             print(f"Error getting project stats: {e}")
             return None
     
-    return await _get_project_stats() 
\ No newline at end of file
+    return await run_db(_get_project_stats)
+
+# Persistent analysis results (AnalyticsResult rows with a cache_key)
+RESULT_CACHE_TIMEOUT = settings.ANALYTICS_SETTINGS.get('RESULT_CACHE_TIMEOUT', 3600)
+RESULT_CACHE_MAX_PER_PROJECT = settings.ANALYTICS_SETTINGS.get('MAX_RESULTS_PER_PROJECT', 100)
+
+def load_cached_result(project_id: str, cache_key: str,
+                       max_age_seconds: int = RESULT_CACHE_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """
+    Stored results for a cache key if they were generated within max_age_seconds.
+
+    Returns:
+        The `results` JSON of the newest matching AnalyticsResult, or None
+    """
+    cutoff = timezone.now() - timedelta(seconds=max_age_seconds)
+    return AnalyticsResult.objects.filter(
+        project_id=project_id,
+        cache_key=cache_key,
+        sync_status='completed',
+        generated_at__gte=cutoff,
+    ).values_list('results', flat=True).first()
+
+def store_cached_result(project_id: str, cache_key: str, analysis_type: str,
+                        parameters: Dict[str, Any], results: Dict[str, Any],
+                        max_age_seconds: int = RESULT_CACHE_TIMEOUT,
+                        max_per_project: int = RESULT_CACHE_MAX_PER_PROJECT) -> None:
+    """
+    Store analysis results under a cache key, replacing any earlier row for the key.
+
+    Cached rows for the project that have expired, or that exceed
+    max_per_project, are removed in the same transaction. Results saved
+    without a cache key are never touched.
+    """
+    if analysis_type not in dict(AnalyticsResult.ANALYSIS_TYPES):
+        analysis_type = 'custom'
+
+    with transaction.atomic():
+        cached = AnalyticsResult.objects.filter(project_id=project_id).exclude(cache_key='')
+        cached.filter(cache_key=cache_key).delete()
+        AnalyticsResult.objects.create(
+            project_id=project_id,
+            analysis_type=analysis_type,
+            parameters=parameters,
+            results=results,
+            sync_status='completed',
+            cache_key=cache_key,
+        )
+
+        cutoff = timezone.now() - timedelta(seconds=max_age_seconds)
+        cached.filter(generated_at__lt=cutoff).delete()
+        overflow = list(cached.order_by('-generated_at').values_list('id', flat=True)[max_per_project:])
+        if overflow:
+            AnalyticsResult.objects.filter(id__in=overflow).delete()
+
+def create_job_record(job_id: str, project_id: str, analysis_type: str,
+                      parameters: Dict[str, Any]) -> None:
+    """Create the pending AnalyticsResult row that tracks a background analysis job (row id = job id)"""
+    if analysis_type not in dict(AnalyticsResult.ANALYSIS_TYPES):
+        analysis_type = 'custom'
+    AnalyticsResult.objects.create(
+        id=job_id,
+        project_id=project_id,
+        analysis_type=analysis_type,
+        parameters=parameters,
+        sync_status='pending',
+    )
+
+def update_job_record(job_id: str, status: str, results: Optional[Dict[str, Any]] = None) -> None:
+    """Set a background job's AnalyticsResult status (and results, when given)"""
+    fields = {'sync_status': status}
+    if results is not None:
+        fields['results'] = results
+    AnalyticsResult.objects.filter(id=job_id).update(**fields)
+
+def load_job_record(job_id: str) -> Optional[Dict[str, Any]]:
+    """The AnalyticsResult row for a background job as a dict, or None"""
+    return AnalyticsResult.objects.filter(id=job_id).values(
+        'id', 'project_id', 'analysis_type', 'parameters', 'results', 'generated_at', 'sync_status'
+    ).first()
+
+async def get_cached_result(project_id: str, cache_key: str) -> Optional[Dict[str, Any]]:
+    """Get fresh stored results for a cache key (see load_cached_result)"""
+    return await run_db(load_cached_result, project_id, cache_key)
+
+async def save_cached_result(project_id: str, cache_key: str, analysis_type: str,
+                             parameters: Dict[str, Any], results: Dict[str, Any]) -> None:
+    """Store analysis results under a cache key (see store_cached_result)"""
+    await run_db(store_cached_result, project_id, cache_key, analysis_type, parameters, results)
+
+# Columnar project loader
+#
+# Output column -> (SQL expression, value kind). The kind selects the typed
+# NumPy conversion applied to each column once all batches are fetched, so
+# no per-row Python dict is ever built.
+PROJECT_DATA_COLUMNS = {
+    'response_id': ('r.response_id', 'uuid'),
+    'question_text': ('q.question_text', 'str'),
+    'response_type': ('rt.name', 'str'),
+    'response_value': ('r.response_value', 'str'),
+    'numeric_value': ('r.numeric_value', 'float'),
+    'datetime_value': ('r.datetime_value', 'datetime'),
+    'choice_selections': ('r.choice_selections', 'json'),
+    'respondent_id': ('resp.respondent_id', 'str'),
+    'collected_at': ('r.collected_at', 'datetime'),
+    'collected_by': ('u.username', 'str'),
+    'location_data': ('r.location_data', 'raw'),
+    'device_info': ('r.device_info', 'raw'),
+    'is_validated': ('r.is_validated', 'bool'),
+    'data_quality_score': ('r.data_quality_score', 'float'),
+    # Not part of the default analysis frame; used by the wide analysis matrix
+    'question_id': ('r.question_id', 'uuid'),
+    'question_order': ('q.order_index', 'int'),
+    'response_data_type': ('rt.data_type', 'str'),
+    'supports_options': ('rt.supports_options', 'bool'),
+    'choice_text': ('r.choice_selections', 'choices'),
+    # Fallback coordinates for the spatial index
+    'geo_data': ('r.geo_data', 'raw'),
+}
+
+# Columns of the long-format frame served by AnalyticsUtils.get_project_data
+DEFAULT_PROJECT_DATA_COLUMNS = [
+    'response_id', 'question_text', 'response_type', 'response_value', 'numeric_value',
+    'datetime_value', 'choice_selections', 'respondent_id', 'collected_at', 'collected_by',
+    'location_data', 'device_info', 'is_validated', 'data_quality_score',
+]
+
+# Joins required by the table aliases used in PROJECT_DATA_COLUMNS
+PROJECT_DATA_JOINS = {
+    'q': "JOIN forms_question q ON r.question_id = q.id",
+    'rt': "LEFT JOIN responses_responsetype rt ON r.response_type_id = rt.id",
+    'resp': "JOIN responses_respondent resp ON r.respondent_id = resp.id",
+    'u': "LEFT JOIN authentication_user u ON r.collected_by_id = u.id",
+}
+
+
+@dataclass(frozen=True)
+class ResponseFilter:
+    """
+    Row filter applied in SQL when loading project responses.
+
+    Every field is optional and fields combine with AND. Instances are
+    hashable so they can be part of a cache key.
+
+    Attributes:
+        date_from: Only responses collected on or after this day
+        date_to: Only responses collected on or before this day
+        question_ids: Only responses to these questions
+        respondent_ids: Only responses from these respondents (public respondent ids)
+        collectors: Only responses collected by these usernames
+        is_validated: Only validated (True) or unvalidated (False) responses
+    """
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    question_ids: Tuple[str, ...] = ()
+    respondent_ids: Tuple[str, ...] = ()
+    collectors: Tuple[str, ...] = ()
+    is_validated: Optional[bool] = None
+
+    def is_empty(self) -> bool:
+        """Whether the filter matches every response"""
+        return self == ResponseFilter()
+
+
+def _day_start(day: date):
+    """Start of a day in the server time zone, adapted for the database"""
+    value = datetime.combine(day, dt_time.min)
+    if settings.USE_TZ:
+        value = timezone.make_aware(value, timezone.get_default_timezone())
+    return connection.ops.adapt_datetimefield_value(value)
+
+
+def _uuid_param(value: str):
+    """Adapt a UUID string (with or without hyphens) for the database"""
+    value = uuid.UUID(str(value))
+    return value if connection.features.has_native_uuid_field else value.hex
+
+
+def _filter_predicates(filters: Optional[ResponseFilter], params: List) -> List[str]:
+    """
+    SQL predicates on responses_response for a ResponseFilter.
+
+    Date bounds compare collected_at directly (no DATE() wrapping) and the
+    question filter sits next to the project predicate, so the collected_at
+    and (project, question) indexes stay usable.
+    """
+    if filters is None:
+        return []
+
+    clauses = []
+    if filters.date_from is not None:
+        clauses.append("r.collected_at >= %s")
+        params.append(_day_start(filters.date_from))
+    if filters.date_to is not None:
+        clauses.append("r.collected_at < %s")
+        params.append(_day_start(filters.date_to + timedelta(days=1)))
+    if filters.question_ids:
+        clauses.append(f"r.question_id IN ({', '.join(['%s'] * len(filters.question_ids))})")
+        params.extend(_uuid_param(value) for value in filters.question_ids)
+    if filters.respondent_ids:
+        clauses.append(
+            "r.respondent_id IN (SELECT id FROM responses_respondent "
+            f"WHERE respondent_id IN ({', '.join(['%s'] * len(filters.respondent_ids))}))"
+        )
+        params.extend(filters.respondent_ids)
+    if filters.collectors:
+        clauses.append(
+            "r.collected_by_id IN (SELECT id FROM authentication_user "
+            f"WHERE username IN ({', '.join(['%s'] * len(filters.collectors))}))"
+        )
+        params.extend(filters.collectors)
+    if filters.is_validated is not None:
+        clauses.append("r.is_validated = %s")
+        params.append(filters.is_validated)
+    return clauses
+
+
+def _build_project_columns_query(columns: Sequence[str], since: Optional[Dict[str, Any]] = None,
+                                 filters: Optional[ResponseFilter] = None) -> tuple:
+    """
+    Build the SELECT for the requested columns, joining only what they need.
+
+    Returns:
+        (query, params) tuple
+    """
+    select_list = []
+    aliases = []
+    for column in columns:
+        expression = PROJECT_DATA_COLUMNS[column][0]
+        select_list.append(expression)
+        alias = expression.split('.', 1)[0]
+        if alias != 'r' and alias not in aliases:
+            aliases.append(alias)
+
+    joins = "\n".join(PROJECT_DATA_JOINS[alias] for alias in aliases)
+    where = ["r.project_id = %s"]
+    params = []
+
+    where.extend(_filter_predicates(filters, params))
+    if since is not None:
+        where.append(_watermark_predicate(since, params))
+
+    query = f"""
+        SELECT {', '.join(select_list)}
+        FROM responses_response r
+        {joins}
+        WHERE {' AND '.join(where)}
+        ORDER BY r.collected_at DESC
+    """
+    return query, params
+
+
+def _watermark_predicate(since: Dict[str, Any], params: List) -> str:
+    """
+    SQL predicate matching rows collected or synced after a watermark.
+
+    `since` is a state dict from load_project_data_state; its raw timestamp
+    values are passed straight back as parameters.
+    """
+    clauses = []
+    if since.get('max_collected_at') is not None:
+        clauses.append("r.collected_at > %s")
+        params.append(since['max_collected_at'])
+    else:
+        clauses.append("r.collected_at IS NOT NULL")
+
+    if since.get('max_synced_at') is not None:
+        clauses.append("r.synced_at > %s")
+        params.append(since['max_synced_at'])
+    else:
+        clauses.append("r.synced_at IS NOT NULL")
+
+    return f"({' OR '.join(clauses)})"
+
+
+def _decode_json_column(values: np.ndarray) -> np.ndarray:
+    """
+    Render JSON column values the way the record loader's str() of the decoded
+    value does. Only distinct values are decoded, so choice columns cost one
+    json.loads per option rather than one per response.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    rendered = []
+    for value in uniques:
+        if isinstance(value, (str, bytes)):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        rendered.append(str(value))
+    rendered = np.array(rendered + [None], dtype=object)
+    return rendered[codes]
+
+
+def _join_choices_column(values: np.ndarray) -> np.ndarray:
+    """Render JSON choice lists as 'a, b' display text (None when nothing was selected)."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    rendered = []
+    for value in uniques:
+        if isinstance(value, (str, bytes)):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        if isinstance(value, list):
+            value = ', '.join(str(choice) for choice in value) or None
+        rendered.append(value)
+    rendered = np.array(rendered + [None], dtype=object)
+    return rendered[codes]
+
+
+def _to_typed_array(values: List, kind: str):
+    """Convert one fetched column into a typed NumPy (or NumPy-backed datetime) array."""
+    raw = np.array(values, dtype=object)
+
+    if kind == 'float':
+        return pd.to_numeric(raw, errors='coerce').astype('float64')
+    if kind == 'int':
+        return pd.to_numeric(raw, errors='coerce')
+    if kind == 'bool':
+        return raw.astype(bool)
+    if kind == 'datetime':
+        # DatetimeArray keeps the datetime64 buffer plus the UTC tz for aware settings
+        return pd.to_datetime(raw, errors='coerce', utc=settings.USE_TZ, format='ISO8601').array
+    if kind == 'uuid':
+        series = pd.Series(raw, dtype=object).astype(str)
+        # SQLite stores UUIDs as 32 hex chars; render them with hyphens
+        is_hex = series.str.len() == 32
+        if is_hex.any():
+            hex_values = series[is_hex]
+            series[is_hex] = (hex_values.str[:8] + '-' + hex_values.str[8:12] + '-' +
+                              hex_values.str[12:16] + '-' + hex_values.str[16:20] + '-' +
+                              hex_values.str[20:])
+        return series.to_numpy(dtype=object)
+    if kind == 'json':
+        return _decode_json_column(raw)
+    if kind == 'choices':
+        return _join_choices_column(raw)
+    return raw
+
+
+def load_project_columns(project_id: str, columns: Optional[Sequence[str]] = None,
+                         batch_size: Optional[int] = None,
+                         since: Optional[Dict[str, Any]] = None,
+                         filters: Optional[ResponseFilter] = None) -> Dict[str, Any]:
+    """
+    Load a project's responses as typed NumPy columns.
+
+    Rows are pulled from a raw cursor in batches and transposed straight into
+    per-column buffers, avoiding ORM model instances and per-row dicts.
+
+    Args:
+        project_id: Normalized project identifier
+        columns: Columns to load (defaults to DEFAULT_PROJECT_DATA_COLUMNS)
+        batch_size: Rows fetched per cursor round trip
+        since: Optional watermark state (see load_project_data_state); only rows
+            collected or synced after it are loaded
+        filters: Optional ResponseFilter applied in the WHERE clause
+
+    Returns:
+        Mapping of column name to NumPy array (empty if no responses match)
+    """
+    columns = list(columns or DEFAULT_PROJECT_DATA_COLUMNS)
+    unknown = [column for column in columns if column not in PROJECT_DATA_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown project data columns: {unknown}")
+
+    batch_size = batch_size or analytics_settings.PROJECT_LOAD_BATCH_SIZE
+    query, params = _build_project_columns_query(columns, since, filters)
+    buffers = [[] for _ in columns]
+
+    with connection.cursor() as cursor:
+        cursor.execute(query, [project_id] + params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for buffer, values in zip(buffers, zip(*rows)):
+                buffer.extend(values)
+
+    if not buffers or not buffers[0]:
+        return {}
+
+    return {
+        column: _to_typed_array(buffer, PROJECT_DATA_COLUMNS[column][1])
+        for column, buffer in zip(columns, buffers)
+    }
+
+
+async def get_project_data_columnar(project_id: str, columns: Optional[Sequence[str]] = None,
+                                    since: Optional[Dict[str, Any]] = None,
+                                    filters: Optional[ResponseFilter] = None):
+    """Get project data as typed NumPy columns (see load_project_columns)"""
+    def _get_project_data_columnar():
+        try:
+            return load_project_columns(project_id, columns, since=since, filters=filters)
+        except Exception as e:
+            print(f"Error getting columnar project data: {e}")
+            return {}
+
+    return await run_db(_get_project_data_columnar)
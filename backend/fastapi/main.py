@@ -5,20 +5,32 @@ Main FastAPI application for the streamlined analytics engine.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import threading
 
 from app.api.v1.api import api_router
 from core.config import settings
-from core.database import init_db
+from core.database import init_db, db_pool
+from app.utils.module_registry import analytics_modules
+from app.utils.jobs import analysis_jobs
+from app.utils.compute import compute_executor
+from app.utils.warming import cache_warmer
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for the FastAPI application."""
     # Startup
     await init_db()
+    if settings.ANALYTICS_PRELOAD_MODULES:
+        # Serve requests right away; analysis modules finish importing in the background
+        threading.Thread(target=analytics_modules.preload, name="analytics-preload", daemon=True).start()
     print("Modular Analytics Engine started successfully")
     print("Available modules: Auto-Analytics, Descriptive Analytics, Qualitative Analytics, Inferential Analytics")
     yield
     # Shutdown
+    cache_warmer.shutdown()
+    analysis_jobs.shutdown()
+    compute_executor.shutdown()
+    db_pool.shutdown()
     print("Modular Analytics Engine shutting down")
 
 app = FastAPI(
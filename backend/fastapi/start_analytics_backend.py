@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """
 Startup script for the FastAPI analytics backend.
+
+Usage:
+    python start_analytics_backend.py                       # start the server
+    python start_analytics_backend.py --profile-imports     # report startup import times
+    python start_analytics_backend.py --download-nltk-data  # install NLTK corpora and models
 """
 
 import os
 import sys
+import argparse
 import subprocess
 import time
 from pathlib import Path
@@ -90,14 +96,82 @@ def start_backend():
     except Exception as e:
         print(f"❌ Failed to start server: {e}")
 
+def profile_imports(top: int = 25, include_analytics: bool = False):
+    """
+    Report where startup import time goes, per module.
+
+    Imports the app in a fresh interpreter under ``python -X importtime`` and
+    prints the modules with the largest cumulative import time.
+
+    Args:
+        top: Number of modules to list
+        include_analytics: Also import the lazily loaded analytics modules, to
+            see what their first use costs
+    """
+    code = "import main"
+    if include_analytics:
+        code += "; from app.utils.module_registry import analytics_modules; analytics_modules.preload()"
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True
+    )
+    wall_seconds = time.perf_counter() - start
+    if result.returncode != 0:
+        print(f"❌ Importing the app failed:\n{result.stderr[-2000:]}")
+        return False
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        timings.append((int(fields[1]), int(fields[0]), fields[2].strip()))
+
+    print(f"📊 Startup import profile ({wall_seconds:.2f}s wall clock, {len(timings)} modules)")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative, self_us, module in sorted(timings, reverse=True)[:top]:
+        print(f"{cumulative / 1e6:>11.3f}s {self_us / 1e6:>9.3f}s  {module}")
+    return True
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Start the FastAPI analytics backend")
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="Report per-module import times for app startup and exit")
+    parser.add_argument("--include-analytics", action="store_true",
+                        help="With --profile-imports, also import the lazily loaded analytics modules")
+    parser.add_argument("--top", type=int, default=25,
+                        help="Number of modules listed by --profile-imports")
+    parser.add_argument("--download-nltk-data", action="store_true",
+                        help="Download the NLTK resources used by qualitative analysis and exit")
+    return parser.parse_args()
+
 def main():
     """Main startup function"""
-    print("🔧 Setting up FastAPI Analytics Backend...")
+    args = parse_args()
     
     # Change to FastAPI directory
     fastapi_dir = Path(__file__).parent
     os.chdir(fastapi_dir)
     
+    if args.profile_imports:
+        sys.exit(0 if profile_imports(args.top, args.include_analytics) else 1)
+    
+    if args.download_nltk_data:
+        sys.path.insert(0, str(fastapi_dir))
+        from app.analytics.qualitative.nltk_resources import download_nltk_data
+        if download_nltk_data():
+            print("✅ NLTK data downloaded")
+            sys.exit(0)
+        print("❌ Some NLTK resources could not be downloaded")
+        sys.exit(1)
+    
+    print("🔧 Setting up FastAPI Analytics Backend...")
+    
     # Check dependencies
     if not check_dependencies():
         sys.exit(1)
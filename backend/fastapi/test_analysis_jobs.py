@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for background analysis jobs.
+"""
+
+import os
+import sys
+import asyncio
+import inspect
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils import jobs
+from app.utils.jobs import (
+    AnalysisJob, AnalysisJobManager, JobCancelled, _current_job, report_progress, run_compute_step
+)
+
+
+async def no_db(*args, **kwargs):
+    return None
+
+
+def halfway(values, progress=None):
+    """Step reporting half of its work done, then the rest"""
+    if progress is not None:
+        progress(0.5, "Half the values", {'first': values[0]})
+    return sum(values)
+
+
+def test_report_progress_outside_job_is_noop():
+    report_progress(0.5, "Halfway", {'section': 1})
+
+
+def test_report_progress_updates_job_and_checks_cancellation():
+    job = AnalysisJob(id='job', endpoint='descriptive.report', project_id='p', parameters={})
+    token = _current_job.set(job)
+    try:
+        report_progress(0.5, "Halfway", {'a': 1})
+        report_progress(0.3, partial={'b': 2})
+        assert job.progress == 0.5
+        assert job.message == "Halfway"
+        assert job.to_dict()['partial_sections'] == ['a', 'b']
+
+        job.cancel_requested.set()
+        try:
+            report_progress(0.9)
+            assert False, "Expected JobCancelled"
+        except JobCancelled:
+            pass
+    finally:
+        _current_job.reset(token)
+
+
+def test_background_decorator_adds_query_parameter():
+    manager = AnalysisJobManager(max_workers=1)
+
+    async def endpoint(project_id: str, variables: str = None):
+        return {'status': 'success', 'data': {}}
+
+    wrapped = manager.background(endpoint)
+    parameters = inspect.signature(wrapped).parameters
+    assert list(parameters) == ['project_id', 'variables', 'background']
+    assert parameters['background'].kind == inspect.Parameter.KEYWORD_ONLY
+    assert manager.stats()['submitted'] == 0
+
+
+def test_compute_step_reports_into_job_range():
+    job = AnalysisJob(id='job', endpoint='inferential.ci', project_id='p', parameters={})
+
+    async def run():
+        token = _current_job.set(job)
+        try:
+            return await run_compute_step(0.2, 0.6, halfway, [1, 2, 3])
+        finally:
+            _current_job.reset(token)
+
+    assert asyncio.run(run()) == 6
+    assert job.progress == 0.4 and job.message == "Half the values"
+    assert job.partial == {'first': 1}
+
+    # Outside a job the step runs without progress
+    assert asyncio.run(run_compute_step(0.2, 0.6, halfway, [1, 2])) == 3
+
+    job.cancel_requested.set()
+    try:
+        asyncio.run(run())
+        assert False, "Expected JobCancelled"
+    except JobCancelled:
+        pass
+
+
+def test_cancel_after_last_checkpoint_ends_cancelled(monkeypatch):
+    monkeypatch.setattr(jobs, 'run_db', no_db)
+    manager = AnalysisJobManager(max_workers=1)
+    job = AnalysisJob(id='job', endpoint='descriptive.report', project_id='p', parameters={})
+
+    async def endpoint(project_id: str):
+        report_progress(0.2, "Project data loaded")
+        # Cancelled while the last step runs
+        job.cancel_requested.set()
+        return {'status': 'success', 'data': {'report': 1}}
+
+    asyncio.run(manager._run_async(job, endpoint, {'project_id': 'p'}))
+    assert job.status == 'cancelled' and job.result is None
+    assert manager.stats()['cancelled'] == 1 and manager.stats()['completed'] == 0
+
+
+if __name__ == "__main__":
+    for test in [test_report_progress_outside_job_is_noop,
+                 test_report_progress_updates_job_and_checks_cancellation,
+                 test_background_decorator_adds_query_parameter,
+                 test_compute_step_reports_into_job_range]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the wide respondent x question analysis matrix.
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.analysis_matrix import build_analysis_matrix
+
+
+def make_columns(extra_rows=()):
+    """Long-format columns as load_project_columns returns them (newest first)"""
+    rows = list(extra_rows) + [
+        # respondent, question id, text, order, data type, options, value, numeric, choice
+        ('r1', 'q1', 'Age', 0, 'numeric', False, '30', 30.0, None),
+        ('r2', 'q1', 'Age', 0, 'numeric', False, '41', 41.0, None),
+        ('r1', 'q2', 'Region', 1, 'text', True, 'North', np.nan, 'North'),
+        ('r3', 'q2', 'Region', 1, 'text', True, 'South', np.nan, 'South'),
+        ('r2', 'q3', 'Crops', 2, 'json', True, '["cocoa", "maize"]', np.nan, 'cocoa, maize'),
+        ('r3', 'q4', 'Owns land', 3, 'boolean', False, 'Yes', np.nan, None),
+        ('r1', 'q5', 'Age', 4, 'text', False, 'duplicate text', np.nan, None),
+    ]
+    respondent, qid, text, order, dtype, options, value, numeric, choice = zip(*rows)
+    return {
+        'respondent_id': np.array(respondent, dtype=object),
+        'question_id': np.array(qid, dtype=object),
+        'question_text': np.array(text, dtype=object),
+        'question_order': np.array(order),
+        'response_data_type': np.array(dtype, dtype=object),
+        'supports_options': np.array(options, dtype=bool),
+        'response_value': np.array(value, dtype=object),
+        'numeric_value': np.array(numeric, dtype=float),
+        'datetime_value': pd.to_datetime([None] * len(rows), utc=True).array,
+        'choice_text': np.array(choice, dtype=object),
+    }
+
+
+def test_matrix_shape_and_types():
+    """One row per respondent, one typed column per question in form order"""
+    df = build_analysis_matrix(make_columns())
+
+    assert list(df.index) == ['r1', 'r2', 'r3']
+    assert list(df.columns) == ['Age', 'Region', 'Crops', 'Owns land', 'Age (2)']
+    assert df['Age'].dtype == 'float64'
+    assert df.loc['r2', 'Age'] == 41.0
+    assert np.isnan(df.loc['r3', 'Age'])
+    assert str(df['Region'].dtype) == 'category'
+    assert df.loc['r2', 'Crops'] == 'cocoa, maize'
+    assert df.loc['r3', 'Owns land'] == True
+    assert pd.isna(df.loc['r1', 'Owns land'])
+
+
+def test_latest_answer_kept_for_repeated_answers():
+    """A respondent who answered twice gets the newest answer, which is loaded first"""
+    df = build_analysis_matrix(make_columns(extra_rows=[
+        ('r1', 'q1', 'Age', 0, 'numeric', False, '31', 31.0, None),
+        ('r3', 'q2', 'Region', 1, 'text', True, 'East', np.nan, 'East'),
+    ]))
+
+    assert df.shape == (3, 5)
+    assert df.loc['r1', 'Age'] == 31.0
+    assert df.loc['r2', 'Age'] == 41.0
+    assert df.loc['r3', 'Region'] == 'East'
+    assert df.loc['r1', 'Region'] == 'North'
+
+
+def test_empty_input():
+    assert build_analysis_matrix({}).empty
+
+
+if __name__ == "__main__":
+    for test in [test_matrix_shape_and_types, test_latest_answer_kept_for_repeated_answers, test_empty_input]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch analysis endpoint.
+"""
+
+import os
+import sys
+import asyncio
+import inspect
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import batch
+from app.api.v1.endpoints.batch import _analysis_options, _parse_specs, _run_analysis
+from app.utils.shared import AnalyticsUtils
+from app.utils.profile_store import project_profiles
+
+
+def make_frame(rows: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'age': rng.normal(40, 10, rows),
+        'score': rng.normal(size=rows),
+        'district': rng.choice(['north', 'south'], rows),
+    })
+
+
+def test_specs_get_unique_keys():
+    specs = _parse_specs([
+        {'analysis': 'outliers', 'variables': ['age'], 'methods': ['iqr']},
+        {'analysis': 'outliers'},
+        {'analysis': 'missing-data', 'key': 'gaps'},
+    ])
+    assert [key for key, _, _ in specs] == ['outliers', 'outliers_2', 'gaps']
+    assert specs[0][2] == {'variables': ['age'], 'methods': ['iqr']}
+    assert specs[2][2] == {}
+
+
+def test_invalid_specs_rejected():
+    for analyses in ([], [{'analysis': 'unknown'}], [{'analysis': 'missing-data', 'variables': ['a']}]):
+        try:
+            _parse_specs(analyses)
+            assert False, "Expected HTTPException"
+        except HTTPException as e:
+            assert e.status_code == 422
+
+
+def test_analysis_options_exclude_frame_and_profile():
+    assert _analysis_options('outliers') == ['variables', 'methods']
+    assert _analysis_options('missing-data') == []
+
+
+def test_profile_analysis_reuses_shared_profile():
+    profile = {'n_rows': 3}
+    outcome = _run_analysis(None, profile, 'data-characteristics', {})
+    assert outcome['status'] == 'success'
+    assert outcome['results'] is profile
+    assert outcome['duration_ms'] >= 0
+
+
+def test_analysis_errors_captured(monkeypatch):
+    df = make_frame()
+
+    async def get_project_data(project_id, data_mode="long", filters=None):
+        return df
+
+    async def get_characteristics(project_id, data_mode="long", filters=None, df=None):
+        return {'sample_size': len(df)}
+
+    compute_calls = []
+
+    async def run_inline(func, *args, **kwargs):
+        compute_calls.append(func.__name__)
+        return func(*args, **kwargs)
+
+    async def run_step_inline(start, end, func, *args, **kwargs):
+        return await run_inline(func, *args, **kwargs)
+
+    monkeypatch.setattr(AnalyticsUtils, 'get_project_data', get_project_data)
+    monkeypatch.setattr(project_profiles, 'get_characteristics', get_characteristics)
+    monkeypatch.setattr(batch, 'run_compute', run_inline)
+    monkeypatch.setattr(batch, 'run_compute_step', run_step_inline)
+
+    # The middle spec asks for a column the project does not have
+    endpoint = inspect.unwrap(batch.run_batch_analysis)
+    specs = [
+        {'analysis': 'outliers', 'variables': ['age']},
+        {'analysis': 'basic-statistics', 'variables': ['income']},
+        {'analysis': 'correlation', 'variables': ['age', 'score']},
+    ]
+    for parallel in (False, True):
+        response = asyncio.run(endpoint(project_id='p', analyses=specs, parallel=parallel,
+                                        data_mode="long", filters=None, db=None))
+
+        assert response['status'] == 'success'
+        results = response['data']['results']
+        assert list(results) == ['outliers', 'basic-statistics', 'correlation']
+        assert results['basic-statistics']['status'] == 'error'
+        assert 'results' not in results['basic-statistics']
+        for key in ('outliers', 'correlation'):
+            assert results[key]['status'] == 'success'
+            assert results[key]['results']
+            assert results[key]['duration_ms'] >= 0
+        assert response['data']['summary']['analyses_succeeded'] == 2
+        assert response['data']['timing']['analyses_ms'] >= 0
+
+    # A sequential batch is one compute call; a parallel one is a call per spec
+    assert compute_calls == ['_run_analyses'] + ['_run_analysis'] * 3
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for warming hot analyses after sync ingestion.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import Depends, Query
+
+from app.utils.result_cache import AnalysisResultCache
+from app.utils.shared import normalize_uuid
+from app.utils.warming import CacheWarmer, default_arguments
+
+PROJECT = '11111111-2222-3333-4444-555555555555'
+
+
+def get_session():
+    return None
+
+
+async def summarize(project_id: str, variables: Optional[List[str]] = None, data_mode: str = "long",
+                    limit: int = Query(10), filters=Depends(get_session), db=Depends(get_session)):
+    return {'status': 'success', 'data': {'project_id': project_id}}
+
+
+def test_default_arguments_match_a_bare_request():
+    arguments = default_arguments(summarize)
+    assert arguments == {'variables': None, 'data_mode': 'long', 'limit': 10, 'filters': None, 'db': None}
+    # Warmed results share the key of a request that sets nothing but the project
+    request = {'project_id': PROJECT, 'variables': None, 'data_mode': 'long', 'limit': 10,
+               'filters': None, 'db': object()}
+    assert (AnalysisResultCache.normalize_parameters(request) ==
+            AnalysisResultCache.normalize_parameters({'project_id': PROJECT, **arguments}))
+
+
+def test_required_parameters_cannot_be_warmed():
+    async def needs_variable(project_id: str, variable: str):
+        return {}
+
+    try:
+        default_arguments(needs_variable)
+        assert False, "Expected ValueError"
+    except ValueError as e:
+        assert 'variable' in str(e)
+
+
+def test_hot_analyses_run_in_configured_order():
+    warmer = CacheWarmer(analyses=['profile', 'summary', 'missing'])
+    calls = []
+
+    async def profile(project_id):
+        calls.append(('profile', project_id))
+
+    warmer.register('profile', profile)
+    hot = warmer.hot('summary')(summarize)
+    assert hot is summarize
+
+    outcomes = asyncio.run(warmer.warm(PROJECT))
+    assert outcomes == {'profile': 'warmed', 'summary': 'warmed', 'missing': 'unknown'}
+    assert calls == [('profile', PROJECT)]
+    assert warmer.stats()['warmed_analyses'] == 2
+
+
+def test_marks_coalesce_until_the_warm_starts():
+    warmer = CacheWarmer(analyses=['profile'], delay=0.2)
+    warmed = []
+    done = threading.Event()
+
+    async def profile(project_id):
+        warmed.append(project_id)
+        done.set()
+
+    warmer.register('profile', profile)
+    try:
+        assert warmer.mark_dirty([PROJECT.upper()]) == [normalize_uuid(PROJECT)]
+        assert warmer.mark_dirty([PROJECT]) == []
+        assert warmer.stats()['dirty_projects'] == 1
+        assert done.wait(5)
+        time.sleep(0.05)
+        assert warmed == [normalize_uuid(PROJECT)]
+        stats = warmer.stats()
+        assert stats['coalesced'] == 1
+        assert stats['dirty_projects'] == 0
+    finally:
+        warmer.shutdown()
+
+
+def test_disabled_warmer_ignores_marks():
+    warmer = CacheWarmer(analyses=['profile'], enabled=False)
+    assert warmer.mark_dirty([PROJECT]) == []
+    assert warmer.stats()['marked'] == 0
+
+
+def test_default_hot_analyses_are_registered():
+    from app.api.v1.endpoints import analytics, autoanalytics, descriptive  # noqa: F401
+    from app.utils.warming import cache_warmer
+    from core.config import settings
+
+    registered = cache_warmer.stats()['registered']
+    for name in settings.CACHE_WARM_ANALYSES.split(','):
+        assert name in registered
+    assert 'project-stats' in registered and 'descriptive' in registered
+
+
+if __name__ == "__main__":
+    for test in [test_default_arguments_match_a_bare_request, test_required_parameters_cannot_be_warmed,
+                 test_hot_analyses_run_in_configured_order, test_marks_coalesce_until_the_warm_starts,
+                 test_disabled_warmer_ignores_marks, test_default_hot_analyses_are_registered]:
+        test()
+        print(f"✅ {test.__name__}")
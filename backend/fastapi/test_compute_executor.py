@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the compute executor that runs CPU-bound analyses off the event loop.
+"""
+
+import os
+import sys
+import asyncio
+import contextvars
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.compute import ComputeExecutor
+
+_label = contextvars.ContextVar('label', default=None)
+
+
+def square_pid(x):
+    return x * x, os.getpid()
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def read_label():
+    return _label.get()
+
+
+def test_process_pool_runs_in_worker_process():
+    executor = ComputeExecutor(workers=2, mode='process')
+    try:
+        results = asyncio.run(_gather(executor, square_pid, range(4)))
+    finally:
+        executor.shutdown()
+    assert [value for value, _ in results] == [0, 1, 4, 9]
+    stats = executor.stats()
+    if stats['mode'] == 'process':
+        assert all(pid != os.getpid() for _, pid in results)
+        assert stats['thread_fallbacks'] == 0
+    assert stats['completed'] == 4
+    assert stats['queue_depth'] == 0
+
+
+def test_unpicklable_call_falls_back_to_threads():
+    executor = ComputeExecutor(workers=1, mode='process')
+    try:
+        value, pid = asyncio.run(executor.run(lambda x: (x + 1, os.getpid()), 1))
+    finally:
+        executor.shutdown()
+    assert (value, pid) == (2, os.getpid())
+    if executor.stats()['mode'] == 'process':
+        assert executor.stats()['thread_fallbacks'] == 1
+
+
+def test_analysis_errors_propagate_without_fallback():
+    for mode in ('process', 'thread'):
+        executor = ComputeExecutor(workers=1, mode=mode)
+        try:
+            asyncio.run(executor.run(fail, 'bad input'))
+            assert False, "Expected ValueError"
+        except ValueError as e:
+            assert str(e) == 'bad input'
+        finally:
+            executor.shutdown()
+        stats = executor.stats()
+        assert stats['errors'] == 1
+        assert stats['thread_fallbacks'] == 0
+
+
+def test_run_threaded_keeps_caller_context():
+    executor = ComputeExecutor(workers=1, mode='thread')
+
+    async def run():
+        _label.set('job-1')
+        return await executor.run_threaded(read_label)
+
+    try:
+        assert asyncio.run(run()) == 'job-1'
+    finally:
+        executor.shutdown()
+    assert executor.stats()['avg_run_ms'] >= 0
+
+
+async def _gather(executor, func, values):
+    return await asyncio.gather(*(executor.run(func, value) for value in values))
+
+
+if __name__ == "__main__":
+    for test in [test_process_pool_runs_in_worker_process, test_unpicklable_call_falls_back_to_threads,
+                 test_analysis_errors_propagate_without_fallback, test_run_threaded_keeps_caller_context]:
+        test()
+        print(f"✅ {test.__name__}")
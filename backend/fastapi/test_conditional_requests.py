@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for ETags and If-None-Match handling on analysis routes.
+"""
+
+import os
+import sys
+
+from fastapi import APIRouter, Body, FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import core.database as database
+from app.utils import conditional
+from app.utils.conditional import conditional_responses, etag_matches
+from app.utils.serialization import AnalyticsRoute
+from app.utils.shared import normalize_uuid
+
+PROJECT = '066965b7-0d3c-4775-adf9-a0b45e79a351'
+
+
+def make_client(monkeypatch, versions):
+    """App with one analysis route whose data version is versions[0]"""
+    async def data_version(project_id):
+        return versions[0]
+
+    monkeypatch.setattr(conditional, 'get_project_data_version', data_version)
+
+    calls = []
+    router = APIRouter(route_class=AnalyticsRoute)
+
+    @router.post("/project/{project_id}/analysis")
+    @conditional_responses.versioned
+    async def analysis(project_id: str, variables: list = Body(None, embed=True),
+                       fail: bool = False, background: bool = False):
+        calls.append(variables)
+        if fail:
+            return {'status': 'error', 'message': 'boom'}
+        return {'status': 'success', 'data': {'variables': variables}}
+
+    @router.get("/project/{project_id}/stats")
+    async def stats(project_id: str):
+        calls.append('stats')
+        return {'status': 'success', 'data': {'team_members': 3}}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), calls
+
+
+def test_etag_matches():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches('*', 'W/"abc"')
+    assert not etag_matches('W/"abd"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+
+
+def test_not_modified_until_data_changes(monkeypatch):
+    versions = ['10:a:b']
+    client, calls = make_client(monkeypatch, versions)
+    url = f"/project/{PROJECT}/analysis"
+
+    first = client.post(url, json={'variables': ['age', 'region']})
+    etag = first.headers['etag']
+    assert first.status_code == 200 and etag.startswith('W/"')
+
+    again = client.post(url, json={'variables': ['age', 'region']}, headers={'If-None-Match': etag})
+    assert again.status_code == 304 and again.content == b'' and again.headers['etag'] == etag
+    assert len(calls) == 1
+
+    # Other parameters get another tag
+    other = client.post(url, json={'variables': ['age']}, headers={'If-None-Match': etag})
+    assert other.status_code == 200 and other.headers['etag'] != etag
+
+    versions[0] = '11:a:c'
+    changed = client.post(url, json={'variables': ['age', 'region']}, headers={'If-None-Match': etag})
+    assert changed.status_code == 200 and changed.headers['etag'] != etag
+    assert len(calls) == 3
+
+
+def test_errors_and_background_jobs_are_not_tagged(monkeypatch):
+    client, calls = make_client(monkeypatch, ['10:a:b'])
+    url = f"/project/{PROJECT}/analysis"
+
+    failed = client.post(f"{url}?fail=true", json={})
+    assert failed.status_code == 200 and 'etag' not in failed.headers
+
+    job = client.post(f"{url}?background=true", json={}, headers={'If-None-Match': '*'})
+    assert job.status_code == 200 and 'etag' not in job.headers
+    assert len(calls) == 2
+
+
+def test_only_versioned_endpoints_are_tagged(monkeypatch):
+    client, calls = make_client(monkeypatch, ['10:a:b'])
+    stats = client.get(f"/project/{PROJECT}/stats", headers={'If-None-Match': '*'})
+    assert stats.status_code == 200 and 'etag' not in stats.headers
+    assert calls == ['stats']
+
+
+def test_data_state_read_once_per_request(monkeypatch):
+    reads = []
+
+    def load_state(project_id):
+        reads.append(project_id)
+        return {'count': 10, 'max_collected_at': 'a', 'max_synced_at': 'b'}
+
+    monkeypatch.setattr(database, 'load_project_data_state', load_state)
+    monkeypatch.setattr(conditional, 'get_project_data_version', database.get_project_data_version)
+
+    router = APIRouter(route_class=AnalyticsRoute)
+
+    @router.get("/project/{project_id}/analysis")
+    @conditional_responses.versioned
+    async def analysis(project_id: str):
+        # As the result cache and the data load would
+        project_id = normalize_uuid(project_id)
+        state = await database.get_project_data_state(project_id)
+        version = await database.get_project_data_version(project_id)
+        return {'status': 'success', 'data': {'count': state['count'], 'version': version}}
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.get(f"/project/{PROJECT}/analysis")
+    assert response.json()['data'] == {'count': 10, 'version': '10:a:b'} and 'etag' in response.headers
+    assert reads == [normalize_uuid(PROJECT)]
+    client.get(f"/project/{PROJECT}/analysis")
+    assert len(reads) == 2
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
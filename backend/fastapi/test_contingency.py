@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the integer-coded contingency tables behind cross-tabulation and Cramér's V.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2_contingency
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.analytics.auto_detect  # noqa: F401  (resolves the descriptive package's circular import)
+from app.analytics.descriptive import analyze_categorical_associations, analyze_cross_tabulation
+from app.analytics.descriptive import contingency
+from app.analytics.descriptive.contingency import ContingencyTables
+from app.utils.shared import AnalyticsUtils
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'region': rng.choice(['north', 'south', 'east'], rows),
+        'consent': rng.choice(['yes', 'no'], rows),
+        'gender': rng.choice(['f', 'm'], rows),
+        'crop': rng.choice(list('abcdefg'), rows),
+        'respondent': [f"r{i}" for i in rng.integers(0, rows // 2, rows)],
+    })
+    df.loc[rng.integers(0, rows, rows // 10), 'region'] = None
+    # Associated with region, and only asked when consent is yes
+    df['irrigation'] = np.where(df['consent'] == 'yes', df['region'].fillna('north').str[0], None)
+    return df
+
+
+def test_tables_and_cross_tabulation_match_crosstab():
+    df = make_frame(2000)
+    tables = ContingencyTables(df, list(df.columns))
+    pd.testing.assert_frame_equal(tables.table('region', 'irrigation'), pd.crosstab(df['region'], df['irrigation']),
+                                  check_dtype=False)
+
+    result = analyze_cross_tabulation(df, 'crop', 'irrigation')
+    crosstab = pd.crosstab(df['crop'], df['irrigation'], margins=True, margins_name="Total")
+    assert result['crosstab'] == crosstab.to_dict()
+    assert result['grand_total'] == len(df.dropna(subset=['crop', 'irrigation']))
+    row_percentages = (pd.crosstab(df['crop'], df['irrigation'], normalize='index') * 100).to_dict()
+    assert result['row_percentages']['n']['a'] == row_percentages['n']['a']
+
+
+def test_all_pairs_statistics_match_chi2_contingency():
+    df = make_frame(3000, seed=1)
+    columns = list(df.columns)
+    tables = ContingencyTables(df, columns)
+
+    for a, var1 in enumerate(columns):
+        for var2 in columns[a + 1:]:
+            crosstab = pd.crosstab(df[var1], df[var2])
+            statistic, p_value, dof, _ = chi2_contingency(crosstab)
+            summary = tables.pair_statistics(var1, var2)
+            assert np.isclose(summary['chi2_statistic'], statistic), (var1, var2)
+            assert np.isclose(summary['p_value'], p_value) and summary['degrees_of_freedom'] == dof
+            assert summary['sample_size'] == crosstab.to_numpy().sum()
+
+    # 2x2 tables get Yates' correction, as chi2_contingency applies it
+    assert tables.pair_statistics('consent', 'gender')['degrees_of_freedom'] == 1
+    matrix = analyze_categorical_associations(df, columns)
+    assert np.allclose(np.diag(matrix), 1) and np.allclose(matrix, matrix.T)
+    assert matrix.loc['region', 'irrigation'] > 0.5 > matrix.loc['crop', 'gender']
+
+
+def test_categorical_analysis_lists_small_tables_only(monkeypatch):
+    monkeypatch.setattr(contingency, 'MAX_LISTED_TABLE_CELLS', 1000)
+    df = make_frame(1200, seed=2)
+    results = AnalyticsUtils.run_categorical_analysis(df)
+    cross_tabs = results['cross_tabulations']
+    assert results['summary']['cross_tabs_computed'] == 15
+
+    assert cross_tabs['region_vs_crop']['crosstab'] == analyze_cross_tabulation(df, 'region', 'crop')['crosstab']
+    identifiers = cross_tabs['crop_vs_respondent']
+    assert 'crosstab' not in identifiers and 'note' in identifiers
+    assert identifiers['chi_square']['table_shape'] == [7, df['respondent'].nunique()]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
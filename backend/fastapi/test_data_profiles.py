@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-project data profiles kept by the profile store.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.shared import AnalyticsUtils
+from app.utils.profile_store import DataProfile, DistinctSketch, ProjectProfileStore
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'score': rng.normal(50, 10, rows),
+        'rating': rng.integers(1, 6, rows).astype(float),
+        'region': rng.choice(['north', 'south', 'east'], rows),
+        'consent': rng.choice(['yes', 'no'], rows),
+        'comment': [f"comment {i}" for i in rng.integers(0, 500, rows)],
+        'source': 'mobile',
+        'collected_at': pd.date_range('2024-01-01', periods=rows, freq='h'),
+    })
+    df.loc[rng.integers(0, rows, rows // 10), 'rating'] = np.nan
+    return df
+
+
+def test_profile_matches_profiler():
+    """The profile yields the same characteristics as a full profiler scan"""
+    df = make_frame(400)
+    df = pd.concat([df, df.iloc[:7]], ignore_index=True)
+
+    expected = AnalyticsUtils.analyze_data_characteristics(df)
+    summary = DataProfile.of(df).summary
+    for key in ('sample_size', 'variable_count', 'numeric_variables', 'categorical_variables',
+                'text_variables', 'datetime_variables', 'missing_data_summary', 'data_quality'):
+        assert summary[key] == expected[key], key
+    assert summary['data_quality']['duplicate_rows'] == 7
+    assert summary['data_quality']['constant_columns'] == ['source']
+    assert abs(summary['completeness_score'] - expected['completeness_score']) < 1e-9
+
+
+def test_extended_profile_equals_full_profile():
+    """Folding new rows in gives the profile of the combined frame"""
+    base, delta = make_frame(300, seed=1), make_frame(120, seed=2)
+    delta = pd.concat([delta, base.iloc[:3]], ignore_index=True)
+
+    extended = DataProfile.of(base).extended(delta)
+    combined = DataProfile.of(pd.concat([delta, base], ignore_index=True))
+    assert extended.n_rows == 423
+    assert extended.summary == combined.summary
+
+
+def test_distinct_sketch_exact_below_k_and_estimates_above():
+    values = pd.Series(np.arange(100_000))
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+    assert DistinctSketch(hashes=hashes[:200]).estimate() == 200
+    merged = DistinctSketch(hashes=hashes[:60_000]).merged(DistinctSketch(hashes=hashes[40_000:]))
+    assert abs(merged.estimate() - 100_000) / 100_000 < 0.2
+
+
+def test_profiles_persist_and_reload():
+    with tempfile.TemporaryDirectory() as base_dir:
+        store = ProjectProfileStore(base_dir=base_dir, max_entries=4)
+        profile = DataProfile.of(make_frame(50))
+        profile.version = '50:a:b'
+        profile.row_ids = np.array([f"r{i}" for i in range(50)], dtype=object)
+        assert store._write(('p1', 'long'), profile)
+
+        restarted = ProjectProfileStore(base_dir=base_dir, max_entries=4)
+        loaded = restarted._lookup(('p1', 'long'))
+        assert loaded.version == '50:a:b'
+        assert loaded.summary == profile.summary
+        assert list(loaded.row_ids) == list(profile.row_ids)
+        assert restarted.stats()['disk_reads'] == 1
+
+        # Filtered variants are kept in memory only
+        assert restarted._path(('p1', 'long', 'filter', object())) is None
+        assert restarted.invalidate('p1') == 1
+        assert restarted._lookup(('p1', 'long')) is None
+
+
+if __name__ == "__main__":
+    for test in [test_profile_matches_profiler, test_extended_profile_equals_full_profile,
+                 test_distinct_sketch_exact_below_k_and_estimates_above, test_profiles_persist_and_reload]:
+        test()
+        print(f"✅ {test.__name__}")
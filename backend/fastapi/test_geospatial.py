@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized distance kernel and sparse Moran's I.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.analytics.auto_detect  # noqa: F401  (resolves the descriptive package's circular import)
+from app.analytics.descriptive import geospatial_analysis as geo
+
+
+def make_points(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'lat': -1.28 + rng.normal(0, 0.1, n), 'lon': 36.8 + rng.normal(0, 0.1, n)})
+    # Repeated fixes at one location
+    df.loc[:9, ['lat', 'lon']] = df.loc[0, ['lat', 'lon']].values
+    df['value'] = df['lat'] * 3 + rng.normal(0, 0.1, n)
+    return df
+
+
+def dense_morans_i(df: pd.DataFrame, max_distance_km: float) -> float:
+    lats, lons, values = df['lat'].values, df['lon'].values, df['value'].values
+    distances = geo._haversine_distances(lats, lons, lats, lons)
+    weights = np.where((distances > 0) & (distances <= max_distance_km), 1 / np.where(distances > 0, distances, 1), 0)
+    row_sums = weights.sum(axis=1)
+    row_sums[row_sums == 0] = 1
+    weights = weights / row_sums[:, np.newaxis]
+    deviations = values - values.mean()
+    return len(values) / weights.sum() * (deviations @ weights @ deviations) / (deviations @ deviations)
+
+
+def test_distance_kernel_matches_scalar_haversine(monkeypatch):
+    df = make_points(120)
+    lats, lons = df['lat'].values, df['lon'].values
+    # Blocks of a few rows each
+    monkeypatch.setattr(geo, 'DISTANCE_BLOCK_BYTES', 6 * 8 * 120 * 7)
+    blocks = list(geo._distance_blocks(lats, lons))
+    assert len(blocks) > 1 and all(len(block) <= 7 for _, block in blocks)
+    matrix = np.vstack([block for _, block in blocks])
+
+    assert matrix.shape == (120, 120)
+    assert np.isclose(matrix[3, 77], geo._haversine_distance(lats[3], lons[3], lats[77], lons[77]))
+    assert np.allclose(matrix, matrix.T) and np.all(np.diag(matrix) == 0)
+
+    # Upper blocks hold each pair once, from column `start` on
+    for start, block in geo._distance_blocks(lats, lons, upper=True):
+        expected = matrix[start:start + len(block), start:].copy()
+        expected[np.tril_indices(len(block))] = np.nan
+        np.testing.assert_allclose(block, expected)
+
+    stats = geo._distance_statistics(lats, lons)
+    positive = matrix[matrix > 0]
+    assert np.isclose(stats['mean_distance_km'], positive.mean())
+    assert np.isclose(stats['max_distance_km'], positive.max())
+    assert np.isclose(stats['min_distance_km'], positive.min())
+
+
+def test_large_point_sets_sample_mean_and_max(monkeypatch):
+    monkeypatch.setattr(geo, 'MAX_EXACT_DISTANCE_POINTS', 200)
+    monkeypatch.setattr(geo, 'DISTANCE_SAMPLE_POINTS', 150)
+    df = make_points(600, seed=1)
+    stats = geo._distance_statistics(df['lat'].values, df['lon'].values)
+    exact = geo._haversine_distances(df['lat'].values, df['lon'].values, df['lat'].values, df['lon'].values)
+    positive = exact[exact > 0]
+
+    assert 150 <= stats['sampled_points'] <= 154
+    assert abs(stats['mean_distance_km'] - positive.mean()) / positive.mean() < 0.1
+    assert np.isclose(stats['min_distance_km'], positive.min())
+
+
+def test_sparse_morans_i_matches_dense_weights():
+    df = make_points(400, seed=2)
+    result = geo.calculate_spatial_autocorrelation(df, 'lat', 'lon', 'value', max_distance_km=8)
+    assert result['weights']['type'] == 'distance_band'
+    assert np.isclose(result['morans_i'], dense_morans_i(df, 8))
+    assert result['morans_i'] > 0.3
+
+
+def test_k_nearest_weights(monkeypatch):
+    df = make_points(400, seed=3)
+    result = geo.calculate_spatial_autocorrelation(df, 'lat', 'lon', 'value', neighbors=6)
+    assert result['weights']['type'] == 'k_nearest'
+    assert result['weights']['neighbor_pairs'] <= 400 * 6
+
+    # Bands too dense for sparse weights fall back to k nearest neighbors
+    monkeypatch.setattr(geo, 'MAX_NEIGHBOR_PAIRS', 1000)
+    fallback = geo.calculate_spatial_autocorrelation(df, 'lat', 'lon', 'value')
+    assert fallback['weights'] == {'type': 'k_nearest', 'neighbors': geo.DEFAULT_NEIGHBORS,
+                                   'neighbor_pairs': fallback['weights']['neighbor_pairs']}
+
+    for neighbors in (0, -2):
+        assert geo.calculate_spatial_autocorrelation(df, 'lat', 'lon', 'value', neighbors=neighbors) == {
+            'error': 'neighbors must be at least 1'}
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
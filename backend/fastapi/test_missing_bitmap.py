@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the packed missingness bitsets behind missing-data analysis.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.analytics.auto_detect  # noqa: F401  (resolves the descriptive package's circular import)
+from app.analytics.descriptive import (
+    analyze_missing_by_group, analyze_missing_data, calculate_missing_correlations, get_missing_patterns
+)
+from app.analytics.descriptive import missing_bitmap
+from app.analytics.descriptive.missing_bitmap import MissingMask
+
+
+def make_frame(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({f"q{i}": rng.normal(size=rows) for i in range(columns)})
+    dropout = rng.random(rows)
+    for i in range(columns):
+        # Respondents who drop out skip every later question, plus scattered gaps
+        df.loc[dropout < 0.01 * (i % 9 + 1), f"q{i}"] = np.nan
+        df.loc[rng.random(rows) < 0.02, f"q{i}"] = np.nan
+    df['district'] = rng.choice(['north', 'south', None], rows)
+    return df
+
+
+def test_patterns_match_row_tuple_counts():
+    # 150 columns take three words per row
+    df = make_frame(3000, 150)
+    expected = df.isna().astype(int).value_counts()
+    result = get_missing_patterns(df, max_patterns=5)
+
+    assert result['unique_patterns'] == len(expected)
+    for i, (pattern, count) in enumerate(expected.head(5).items()):
+        top = result['top_patterns'][f"pattern_{i + 1}"]
+        assert top['count'] == count
+        assert top['missing_columns'] == [column for column, missing in zip(df.columns, pattern) if missing]
+
+
+def test_equally_frequent_patterns_ordered_by_column_bits():
+    # Every row has its own pattern; 70 columns take two words per row
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame(np.where(rng.random((40, 70)) < 0.3, np.nan, 1.0), columns=[f"q{i}" for i in range(70)])
+    assert len(df.isna().drop_duplicates()) == len(df)
+    result = get_missing_patterns(df, max_patterns=len(df))
+
+    expected = sorted(tuple(row) for row in df.isna().astype(int).to_numpy())
+    for i, pattern in enumerate(expected):
+        top = result['top_patterns'][f"pattern_{i + 1}"]
+        assert top['count'] == 1
+        assert top['missing_columns'] == [column for column, missing in zip(df.columns, pattern) if missing]
+
+
+def test_correlations_and_counts_from_popcounts():
+    df = make_frame(2500, 12, seed=1)
+    df['never_answered'] = np.nan
+    df['always_answered'] = 1.0
+    mask = MissingMask.of(df)
+
+    assert np.array_equal(mask.column_counts(), df.isna().sum().to_numpy())
+    assert np.array_equal(mask.row_counts(), df.isna().sum(axis=1).to_numpy())
+    expected = df.isna().astype(int)
+    expected = expected.loc[:, expected.sum() > 0].corr()
+    pd.testing.assert_frame_equal(calculate_missing_correlations(df, mask=mask), expected)
+
+    analysis = analyze_missing_data(df, mask=mask)
+    assert analysis['summary']['complete_rows'] == len(df.dropna())
+    assert analysis['by_row']['row_counts'] == df.isna().sum(axis=1).value_counts().to_dict()
+
+
+def test_group_breakdown_matches_groupby():
+    df = make_frame(1800, 6, seed=2)
+    result = analyze_missing_by_group(df, 'district')
+    assert list(result) == ['north', 'south']
+    for name, group in df.groupby('district'):
+        assert result[name]['total_rows'] == len(group)
+        assert result[name]['missing_by_column']['q5']['count'] == group['q5'].isna().sum()
+        assert 'district' not in result[name]['missing_by_column']
+
+
+def test_popcount_without_bitwise_count(monkeypatch):
+    words = np.array([0, 1, 2 ** 63 + 5, 2 ** 64 - 1], dtype=np.uint64)
+    expected = [0, 1, 3, 64]
+    assert list(missing_bitmap._popcount(words)) == expected
+    monkeypatch.delattr(np, 'bitwise_count', raising=False)
+    assert list(missing_bitmap._popcount(words)) == expected
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
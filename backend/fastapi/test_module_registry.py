@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazy analytics module registry.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.module_registry import AnalyticsModuleRegistry
+
+
+def test_module_imported_on_first_attribute_access():
+    registry = AnalyticsModuleRegistry()
+    module = registry.lazy('json')
+    assert not registry.is_loaded('json')
+    assert registry.stats()['loaded'] == 0
+
+    assert module.dumps({'a': 1}) == '{"a": 1}'
+    assert registry.is_loaded('json')
+    stats = registry.stats()
+    assert stats['registered'] == 1
+    assert 'json' in stats['import_seconds']
+
+
+def test_required_modules_imported_first():
+    registry = AnalyticsModuleRegistry()
+    sys.modules.pop('colorsys', None)
+    module = registry.lazy('json', requires=['colorsys'])
+    module.loads('{}')
+    assert 'colorsys' in sys.modules
+
+
+def test_preload_skips_broken_modules():
+    registry = AnalyticsModuleRegistry()
+    registry.lazy('json')
+    registry.lazy('app.analytics.does_not_exist')
+    registry.preload()
+    assert registry.is_loaded('json')
+    assert not registry.is_loaded('app.analytics.does_not_exist')
+
+
+if __name__ == "__main__":
+    for test in [test_module_imported_on_first_attribute_access, test_required_modules_imported_first,
+                 test_preload_skips_broken_modules]:
+        test()
+        print(f"✅ {test.__name__}")
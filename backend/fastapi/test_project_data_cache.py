@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Tests for the prepared project DataFrame cache.
+"""
+
+import os
+import sys
+import asyncio
+import pandas as pd
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils import shared
+from app.utils.data_cache import CacheEntry, ProjectDataCache
+from app.utils.shared import AnalyticsUtils
+from app.utils.snapshot_store import SnapshotStore
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'numeric_value': np.arange(rows, dtype=float),
+        'question_text': ['Q'] * rows,
+    })
+
+
+def test_hit_and_version_mismatch():
+    """A matching version hits; a changed version is a stale miss"""
+    cache = ProjectDataCache(max_bytes=10 * 1024 * 1024)
+    cache.put(('p1',), 'v1', make_frame(10))
+
+    assert cache.get(('p1',), 'v1') is not None
+    assert cache.get(('p1',), 'v2') is None
+    assert cache.get(('p2',), 'v1') is None
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['stale'] == 1
+    assert stats['misses'] == 2
+
+    # The stale entry stays available for a delta refresh until replaced
+    assert cache.peek(('p1',)).version == 'v1'
+    cache.put(('p1',), 'v2', make_frame(12), row_ids=np.arange(12), delta=True)
+    assert len(cache.get(('p1',), 'v2')) == 12
+    assert cache.stats()['delta_refreshes'] == 1
+
+
+class FakeResponses:
+    """Responses table standing in for load_project_columns, newest collected first"""
+
+    def __init__(self, rows: int):
+        self.rows = {f"r{i}": {'question_text': 'Q', 'numeric_value': float(i), 'collected_at': i, 'synced_at': i}
+                     for i in range(rows)}
+        self.clock = rows
+        self.loads = []
+
+    def tick(self) -> int:
+        self.clock += 1
+        return self.clock
+
+    def add(self, id: str, value: float):
+        self.rows[id] = {'question_text': 'Q', 'numeric_value': value,
+                         'collected_at': self.tick(), 'synced_at': self.clock}
+
+    def update(self, id: str, value: float):
+        self.rows[id].update(numeric_value=value, synced_at=self.tick())
+
+    def state(self):
+        return {'count': len(self.rows),
+                'max_collected_at': max(row['collected_at'] for row in self.rows.values()),
+                'max_synced_at': max(row['synced_at'] for row in self.rows.values())}
+
+    def load_project_columns(self, project_id, columns=None, since=None):
+        self.loads.append((tuple(columns), since is not None))
+        ids = sorted(self.rows, key=lambda id: self.rows[id]['collected_at'], reverse=True)
+        if since is not None:
+            ids = [id for id in ids if self.rows[id]['collected_at'] > since['max_collected_at']
+                   or self.rows[id]['synced_at'] > since['max_synced_at']]
+        if not ids:
+            return {}
+        return {column: np.array([id if column == 'response_id' else self.rows[id][column] for id in ids],
+                                 dtype=float if column == 'numeric_value' else object)
+                for column in columns}
+
+    def full_frame(self):
+        columns = self.load_project_columns('p', ['response_id', *PROJECTION])
+        return pd.DataFrame(columns).drop(columns='response_id'), columns['response_id']
+
+
+PROJECTION = ('question_text', 'numeric_value')
+
+
+def cached_entry(responses: FakeResponses) -> CacheEntry:
+    frame, row_ids = responses.full_frame()
+    responses.loads.clear()
+    return CacheEntry(version='v1', frame=frame, nbytes=0, row_ids=row_ids, watermark=responses.state())
+
+
+def refresh(monkeypatch, responses: FakeResponses, entry: CacheEntry):
+    async def run_inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(shared, 'run_db', run_inline)
+    monkeypatch.setattr(shared, 'load_project_columns', responses.load_project_columns)
+    return asyncio.run(AnalyticsUtils._refresh_project_frame('p', entry, responses.state(), PROJECTION))
+
+
+def assert_matches_full_load(responses: FakeResponses, frame: pd.DataFrame, row_ids: np.ndarray):
+    expected, expected_ids = responses.full_frame()
+    assert sorted(row_ids) == sorted(expected_ids)
+    pd.testing.assert_frame_equal(frame.set_index(pd.Index(row_ids)).sort_index(),
+                                  expected.set_index(pd.Index(expected_ids)).sort_index(), check_dtype=False)
+
+
+def test_delta_replaces_updated_rows_and_prepends_new_ones(monkeypatch):
+    """Re-synced rows replace their cached versions; new rows come first"""
+    responses = FakeResponses(5)
+    entry = cached_entry(responses)
+    responses.update('r1', 101.0)
+    responses.update('r3', 103.0)
+    responses.add('r5', 5.0)
+
+    frame, row_ids = refresh(monkeypatch, responses, entry)
+    assert len(frame) == 6 and len(set(row_ids)) == 6
+    assert row_ids[0] == 'r5'
+    assert frame['numeric_value'][list(row_ids).index('r3')] == 103.0
+    # Only the delta was loaded
+    assert responses.loads == [(('response_id',) + PROJECTION, True)]
+    assert_matches_full_load(responses, frame, row_ids)
+
+
+def test_delta_drops_deleted_rows_by_reconciling_ids(monkeypatch):
+    """Deleted responses are dropped once the count disagrees with the database"""
+    responses = FakeResponses(6)
+    entry = cached_entry(responses)
+    del responses.rows['r0'], responses.rows['r4']
+    responses.update('r2', 42.0)
+    responses.add('r6', 6.0)
+
+    frame, row_ids = refresh(monkeypatch, responses, entry)
+    assert 'r0' not in row_ids and 'r4' not in row_ids
+    # The count mismatch loaded the current response ids
+    assert responses.loads[-1] == (('response_id',), False)
+    assert_matches_full_load(responses, frame, row_ids)
+
+
+def test_unreconciled_delta_falls_back_to_full_reload(monkeypatch):
+    """A frame that cannot be brought to the database count is reloaded in full"""
+    responses = FakeResponses(4)
+    entry = cached_entry(responses)
+    # The cached frame is missing a row that no delta will bring back
+    entry.frame, entry.row_ids = entry.frame.iloc[1:].reset_index(drop=True), entry.row_ids[1:]
+    responses.add('r4', 4.0)
+    assert refresh(monkeypatch, responses, entry) is None
+
+    cache = ProjectDataCache(max_bytes=10 * 1024 * 1024)
+    cache.put(('p', 'columns') + tuple(sorted(PROJECTION)), 'stale', entry.frame,
+              row_ids=entry.row_ids, watermark=entry.watermark)
+    full_loads = []
+
+    async def get_state(project_id):
+        return responses.state()
+
+    async def load_frame(project_id, loader, projection=None, filters=None):
+        full_loads.append(projection)
+        return responses.full_frame()
+
+    async def no_snapshot(cache_key, version):
+        return None
+
+    monkeypatch.setattr(shared, 'project_data_cache', cache)
+    monkeypatch.setattr(shared, 'get_project_data_state', get_state)
+    monkeypatch.setattr(AnalyticsUtils, '_load_project_frame', load_frame)
+    monkeypatch.setattr(AnalyticsUtils, '_load_snapshot', no_snapshot)
+    df = asyncio.run(AnalyticsUtils.get_project_data('p', columns=list(PROJECTION)))
+    assert full_loads == [PROJECTION]
+    assert len(df) == 5 and cache.stats()['delta_refreshes'] == 0
+
+
+def test_returned_frame_is_isolated():
+    """Mutating a returned frame does not change the cached copy"""
+    cache = ProjectDataCache(max_bytes=10 * 1024 * 1024)
+    cache.put(('p1',), 'v1', make_frame(5))
+
+    frame = cache.get(('p1',), 'v1')
+    frame['numeric_value'] = 0.0
+    frame['extra'] = 1
+
+    again = cache.get(('p1',), 'v1')
+    assert again['numeric_value'].sum() == 10.0
+    assert 'extra' not in again.columns
+
+
+def test_returned_frame_shares_unmodified_columns():
+    """Under Copy-on-Write a cache hit shares column memory until it is written"""
+    cache = ProjectDataCache(max_bytes=10 * 1024 * 1024)
+    cache.put(('p1',), 'v1', make_frame(5))
+
+    frame = cache.get(('p1',), 'v1')
+    again = cache.get(('p1',), 'v1')
+    if int(pd.__version__.split('.')[0]) >= 3:
+        assert np.shares_memory(frame['numeric_value'].to_numpy(), again['numeric_value'].to_numpy())
+
+    frame.loc[0, 'numeric_value'] = 100.0
+    assert again.loc[0, 'numeric_value'] == 0.0
+    assert cache.get(('p1',), 'v1').loc[0, 'numeric_value'] == 0.0
+
+
+def test_column_subset_lookup():
+    """A projection is served from a cached frame holding all of its columns"""
+    cache = ProjectDataCache(max_bytes=10 * 1024 * 1024)
+    cache.put(('p1',), 'v1', make_frame(5))
+
+    narrow = cache.get(('p1',), 'v1', columns=['question_text'])
+    assert list(narrow.columns) == ['question_text']
+    assert len(narrow) == 5
+    assert cache.get(('p1',), 'v1', columns=['question_text', 'missing']) is None
+    assert cache.get(('p1',), 'v2', columns=['question_text']) is None
+
+
+def test_lru_eviction_under_memory_budget():
+    """Least recently used frames are evicted to stay within the budget"""
+    frame = make_frame(1000)
+    budget = ProjectDataCache.frame_nbytes(frame) * 2 + 100
+    cache = ProjectDataCache(max_bytes=budget)
+
+    cache.put(('a',), 'v', frame)
+    cache.put(('b',), 'v', frame)
+    cache.get(('a',), 'v')  # 'b' is now least recently used
+    cache.put(('c',), 'v', frame)
+
+    assert cache.get(('b',), 'v') is None
+    assert cache.get(('a',), 'v') is not None
+    assert cache.get(('c',), 'v') is not None
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['current_bytes'] <= budget
+
+
+def test_oversized_frame_rejected_and_invalidate():
+    """Frames larger than the budget are not cached; invalidate drops every key variant"""
+    cache = ProjectDataCache(max_bytes=1024)
+    assert not cache.put(('big',), 'v', make_frame(10000))
+    assert cache.stats()['rejected'] == 1
+
+    cache = ProjectDataCache(max_bytes=10 * 1024 * 1024)
+    cache.put(('p1',), 'v', make_frame(3))
+    cache.put(('p1', 'wide'), 'v', make_frame(3))
+    cache.put(('p2',), 'v', make_frame(3))
+    assert cache.invalidate('p1') == 2
+    assert cache.stats()['entries'] == 1
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Snapshots restore the frame, row ids and watermark for the same version only"""
+    pytest.importorskip("pyarrow")
+    store = SnapshotStore(str(tmp_path))
+
+    frame = make_frame(4)
+    frame.loc[1, 'numeric_value'] = np.nan
+    row_ids = np.array(['a', 'b', 'c', 'd'], dtype=object)
+    watermark = {'count': 4, 'max_collected_at': '2024-01-01 10:00:00', 'max_synced_at': None}
+
+    assert store.save(('p1',), 'v1', frame, row_ids, watermark)
+    loaded, loaded_ids, loaded_watermark = store.load(('p1',), 'v1')
+    pd.testing.assert_frame_equal(loaded, frame)
+    assert list(loaded_ids) == list(row_ids)
+    assert loaded_watermark == watermark
+    assert store.load(('p1',), 'v2') is None
+
+    # Writing a newer version replaces the older file
+    store.save(('p1',), 'v2', frame)
+    assert store.load(('p1',), 'v1') is None
+    assert store.invalidate('p1') == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the mergeable quantile sketches behind approximate percentiles.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.analytics.auto_detect  # noqa: F401  (resolves the descriptive package's circular import)
+from app.analytics.descriptive import detect_outliers_iqr
+from app.analytics.descriptive.quantile_sketch import QuantileSketch
+from app.analytics.descriptive.streaming_statistics import summarize_chunks
+from app.analytics.inferential.confidence_intervals import calculate_median_ci
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+def rank_error(sketch: QuantileSketch, values: np.ndarray) -> float:
+    """Largest distance between a requested quantile and the true rank of the sketch's answer"""
+    ordered = np.sort(values)
+    answers = sketch.quantiles(QUANTILES)
+    below = np.searchsorted(ordered, answers, side='left') / len(ordered)
+    at_or_below = np.searchsorted(ordered, answers, side='right') / len(ordered)
+    return float(np.max(np.maximum(0, np.maximum(below - QUANTILES, QUANTILES - at_or_below))))
+
+
+def test_rank_error_within_bound():
+    values = np.random.default_rng(0).exponential(3, 200_000)
+    for epsilon in (0.05, 0.01):
+        sketch = QuantileSketch.of(values, epsilon)
+        assert rank_error(sketch, values) <= epsilon
+        assert sketch.size() < 10 / epsilon
+        assert (sketch.quantile(0), sketch.quantile(1)) == (values.min(), values.max())
+
+
+def test_merged_and_streamed_sketches_keep_the_bound():
+    values = np.random.default_rng(1).normal(50, 10, 150_000)
+    parts = [QuantileSketch.of(chunk) for chunk in np.array_split(values, 25)]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged = merged.merged(part)
+    assert merged.n == len(values)
+    assert rank_error(merged, values) <= 0.01
+
+    streamed = QuantileSketch()
+    for chunk in np.array_split(values, 1500):
+        streamed.update(chunk)
+    assert rank_error(streamed, values) <= 0.01
+    # Deterministic for the same values in the same order
+    assert QuantileSketch.of(values).quantiles(QUANTILES) == QuantileSketch.of(values).quantiles(QUANTILES)
+
+
+def test_approximate_percentiles_from_column_statistics():
+    df = pd.DataFrame({'wait': np.random.default_rng(2).gamma(2, 2, 60_000)})
+    summary = summarize_chunks((df.iloc[start:start + 7000] for start in range(0, len(df), 7000)),
+                               sketch_epsilon=0.01)
+    approximate = summary['wait'].percentiles([0.25, 0.5, 0.9], approximate=True)
+    for key, q in (('p25', 0.25), ('p50', 0.5), ('p90', 0.9)):
+        assert abs((df['wait'] <= approximate[key]).mean() - q) <= 0.01
+
+    # Without a sketch the exact value table answers
+    assert summarize_chunks([df])['wait'].percentiles([0.5], approximate=True)['p50'] == df['wait'].median()
+
+
+def test_iqr_outliers_from_sketch_quartiles():
+    series = pd.Series(np.concatenate([np.random.default_rng(3).normal(0, 1, 20_000), [25.0, -30.0]]))
+    sketch = QuantileSketch.of(series)
+    result = detect_outliers_iqr(series, quartiles=tuple(sketch.quantiles([0.25, 0.75])))
+    assert result['quartile_method'] == 'sketch'
+    assert {25.0, -30.0} <= set(result['outlier_values'])
+
+
+def test_median_ci_selects_order_statistics():
+    series = pd.Series(np.random.default_rng(4).exponential(2.0, 5001))
+    series[::50] = np.nan
+    result = calculate_median_ci(series)
+
+    ordered = series.dropna().sort_values().to_numpy()
+    n = len(ordered)
+    lower_idx = max(int(stats.binom.ppf(0.025, n, 0.5)) - 1, 0)
+    assert result['median'] == np.median(ordered)
+    assert result['confidence_interval'] == {'lower': ordered[lower_idx], 'upper': ordered[n - lower_idx - 1]}
+
+
+if __name__ == "__main__":
+    for test in [test_rank_error_within_bound, test_merged_and_streamed_sketches_keep_the_bound,
+                 test_approximate_percentiles_from_column_statistics, test_iqr_outliers_from_sketch_quartiles,
+                 test_median_ci_selects_order_statistics]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for translating analysis response filters into SQL predicates.
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.database import ResponseFilter, _build_project_columns_query, _filter_predicates
+
+QUESTION_ID = '5f0c7a52-2d1e-4c3b-9a56-0f3f1c2b7d10'
+
+
+def test_empty_filter_adds_no_predicates():
+    params = []
+    assert ResponseFilter().is_empty()
+    assert _filter_predicates(None, params) == []
+    assert _filter_predicates(ResponseFilter(), params) == []
+    assert params == []
+
+
+def test_filter_predicates_and_params():
+    """Each field becomes one predicate; dates are a half-open collected_at range"""
+    filters = ResponseFilter(
+        date_from=date(2024, 3, 1),
+        date_to=date(2024, 3, 7),
+        question_ids=(QUESTION_ID,),
+        respondent_ids=('R-1', 'R-2'),
+        collectors=('enumerator1',),
+        is_validated=True,
+    )
+    params = []
+    clauses = _filter_predicates(filters, params)
+
+    assert clauses[0] == "r.collected_at >= %s"
+    assert clauses[1] == "r.collected_at < %s"
+    assert str(params[1]).startswith('2024-03-08')
+    assert clauses[2] == "r.question_id IN (%s)"
+    assert "responses_respondent" in clauses[3]
+    assert "authentication_user" in clauses[4]
+    assert clauses[5] == "r.is_validated = %s"
+    assert len(params) == 7
+    assert params[3:6] == ['R-1', 'R-2', 'enumerator1']
+
+
+def test_filter_params_follow_project_id():
+    """Filter parameters come right after the project id placeholder"""
+    query, params = _build_project_columns_query(
+        ['numeric_value'], filters=ResponseFilter(is_validated=False)
+    )
+    where = query.split('WHERE', 1)[1]
+    assert where.index('r.project_id = %s') < where.index('r.is_validated = %s')
+    assert params == [False]
+    # Only columns from responses_response: no joins needed
+    assert 'JOIN' not in query
+
+
+if __name__ == "__main__":
+    for test in [test_empty_filter_adds_no_predicates, test_filter_predicates_and_params,
+                 test_filter_params_follow_project_id]:
+        test()
+        print(f"✅ {test.__name__}")
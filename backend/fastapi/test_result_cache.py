@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent analysis result cache.
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from django.db import transaction
+
+from core.database import ResponseFilter, load_cached_result, store_cached_result
+from app.utils.result_cache import AnalysisResultCache
+from projects.models import Project
+from analytics_results.models import AnalyticsResult
+
+
+def test_parameters_normalized_for_hashing():
+    """Session and project id are dropped; filters become plain JSON"""
+    parameters = AnalysisResultCache.normalize_parameters({
+        'project_id': 'abc',
+        'db': object(),
+        'variables': ['b', 'a'],
+        'filters': ResponseFilter(date_from=date(2024, 1, 1), collectors=('x',)),
+    })
+    assert set(parameters) == {'variables', 'filters'}
+    assert parameters['variables'] == ['b', 'a']
+    assert parameters['filters']['date_from'] == '2024-01-01'
+    assert parameters['filters']['collectors'] == ['x']
+
+
+def test_key_depends_on_endpoint_parameters_and_version():
+    key = AnalysisResultCache.make_key('descriptive.basic', {'a': 1, 'b': 2}, '10:x:y')
+    assert len(key) == 64
+    assert key == AnalysisResultCache.make_key('descriptive.basic', {'b': 2, 'a': 1}, '10:x:y')
+    assert key != AnalysisResultCache.make_key('descriptive.basic', {'a': 1, 'b': 2}, '11:x:y')
+    assert key != AnalysisResultCache.make_key('descriptive.other', {'a': 1, 'b': 2}, '10:x:y')
+    assert key != AnalysisResultCache.make_key('descriptive.basic', {'a': 1, 'b': 3}, '10:x:y')
+
+
+def test_store_and_load_round_trip():
+    """Stored results are found while fresh, replaced per key and capped per project"""
+    project = Project.objects.first()
+    if project is None:
+        return
+
+    with transaction.atomic():
+        store_cached_result(project.id, 'k' * 64, 't_test', {'p': 1}, {'value': 1})
+        store_cached_result(project.id, 'k' * 64, 'unknown_type', {'p': 1}, {'value': 2})
+        assert load_cached_result(project.id, 'k' * 64) == {'value': 2}
+        assert load_cached_result(project.id, 'k' * 64, max_age_seconds=-1) is None
+        assert AnalyticsResult.objects.get(project=project, cache_key='k' * 64).analysis_type == 'custom'
+
+        for i in range(3):
+            store_cached_result(project.id, f'{i}' * 64, 'custom', {}, {}, max_per_project=2)
+        assert AnalyticsResult.objects.filter(project=project).exclude(cache_key='').count() == 2
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    for test in [test_parameters_normalized_for_hashing, test_key_depends_on_endpoint_parameters_and_version,
+                 test_store_and_load_round_trip]:
+        test()
+        print(f"✅ {test.__name__}")
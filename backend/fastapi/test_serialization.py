@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the NumPy-aware response encoder.
+"""
+
+import os
+import sys
+import json
+import asyncio
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from app.utils.serialization import _respond_directly, encode_json, to_jsonable, AnalyticsJSONResponse
+
+
+def test_numpy_and_pandas_values_encoded():
+    payload = {
+        'int': np.int64(3),
+        'float': np.float32(0.5),
+        'bool': np.bool_(True),
+        'array': np.arange(3),
+        'strided': np.arange(6).reshape(2, 3)[:, 1],
+        'series': pd.Series([1, 2], index=['a', 'b']),
+        'frame': pd.DataFrame({'x': [1.5]}),
+        'timestamp': pd.Timestamp('2024-01-02 03:04:05'),
+        'date': date(2024, 1, 2),
+        'missing': [np.nan, float('inf'), pd.NA, pd.NaT, None],
+        'tuple': (1, 2),
+        1: 'int key',
+    }
+    assert json.loads(encode_json(payload)) == {
+        'int': 3,
+        'float': 0.5,
+        'bool': True,
+        'array': [0, 1, 2],
+        'strided': [1, 4],
+        'series': {'a': 1, 'b': 2},
+        'frame': {'x': {'0': 1.5}},
+        'timestamp': '2024-01-02T03:04:05',
+        'date': '2024-01-02',
+        'missing': [None, None, None, None, None],
+        'tuple': [1, 2],
+        '1': 'int key',
+    }
+
+
+def test_to_jsonable_returns_plain_python():
+    assert to_jsonable({'values': np.array([1.0, np.nan])}) == {'values': [1.0, None]}
+
+
+def test_non_string_keys_encoded_as_strings():
+    grouped = pd.DataFrame({'group': ['a', 'a', 'b'], 'numeric_value': [1.0, 3.0, 5.0]})
+    payload = {
+        'grouped_analysis': grouped.groupby('group').agg(['mean', 'count']).to_dict(),
+        'by_code': {np.int64(3): 'three', np.float64(0.5): 'half'},
+        'by_day': {pd.Timestamp('2024-01-02'): np.int64(4)},
+        'frame': pd.DataFrame({('q1', 'mean'): [1.5]}),
+    }
+    assert json.loads(encode_json(payload)) == {
+        'grouped_analysis': {
+            'numeric_value,mean': {'a': 2.0, 'b': 5.0},
+            'numeric_value,count': {'a': 2, 'b': 1},
+        },
+        'by_code': {'3': 'three', '0.5': 'half'},
+        'by_day': {'2024-01-02T00:00:00': 4},
+        'frame': {'q1,mean': {'0': 1.5}},
+    }
+    assert to_jsonable({(1, 'x'): [np.nan]}) == {'1,x': [None]}
+
+
+def test_endpoint_dict_results_returned_as_response():
+    async def endpoint(project_id: str):
+        return {'status': 'success', 'data': {'mean': np.float64(1.25)}}
+
+    wrapped = _respond_directly(endpoint)
+    response = asyncio.run(wrapped(project_id='p'))
+    assert isinstance(response, AnalyticsJSONResponse)
+    assert json.loads(response.body) == {'status': 'success', 'data': {'mean': 1.25}}
+
+
+if __name__ == "__main__":
+    for test in [test_numpy_and_pandas_values_encoded, test_to_jsonable_returns_plain_python,
+                 test_non_string_keys_encoded_as_strings,
+                 test_endpoint_dict_results_returned_as_response]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for coalescing identical concurrent analysis requests.
+"""
+
+import os
+import sys
+import asyncio
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_computation():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'status': 'success'}
+
+    async def run():
+        return await asyncio.gather(*(flights.run('key', compute) for _ in range(5)),
+                                    flights.run('other', compute))
+
+    results = asyncio.run(run())
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results[:5])
+    stats = flights.stats()
+    assert (stats['computed'], stats['coalesced'], stats['in_flight']) == (2, 4, 0)
+    assert stats['coalescing_rate'] == 4 / 6
+
+
+def test_errors_reach_every_waiting_call():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad")
+
+    async def run():
+        return await asyncio.gather(*(flights.run('key', compute) for _ in range(3)), return_exceptions=True)
+
+    assert [str(e) for e in asyncio.run(run())] == ['bad', 'bad', 'bad']
+
+
+def test_cancelled_leader_keeps_computing_for_waiters():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'done'
+
+    async def run():
+        leader = asyncio.ensure_future(flights.run('key', compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.run('key', compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == 'done'
+    assert len(calls) == 1
+
+
+def test_calls_from_other_event_loops_wait_for_the_same_result():
+    flights = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.1)
+        return 'shared'
+
+    results = []
+
+    def other_loop():
+        started.wait()
+        results.append(asyncio.run(flights.run('key', compute)))
+
+    thread = threading.Thread(target=other_loop)
+    thread.start()
+    results.append(asyncio.run(flights.run('key', compute)))
+    thread.join()
+    assert results == ['shared', 'shared']
+    assert len(calls) == 1
+
+
+if __name__ == "__main__":
+    for test in [test_concurrent_calls_share_one_computation, test_errors_reach_every_waiting_call,
+                 test_cancelled_leader_keeps_computing_for_waiters,
+                 test_calls_from_other_event_loops_wait_for_the_same_result]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the multi-resolution spatial aggregation index behind map bins.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils import spatial_index
+from app.utils.spatial_index import SpatialIndex, extract_coordinates
+
+ZOOMS = [12, 10, 8, 6, 4, 2, 0]
+
+
+def make_columns(n: int, seed: int = 0, start: int = 0):
+    rng = np.random.default_rng(seed)
+    lats, lons = 5.6 + rng.normal(0, 0.3, n), -0.2 + rng.normal(0, 0.3, n)
+    location_data = np.array([json.dumps({'latitude': lat, 'longitude': lon}) for lat, lon in zip(lats, lons)],
+                             dtype=object)
+    geo_data = np.full(n, None, dtype=object)
+    # Some responses only have geo_data, some have no location at all
+    location_data[::7] = None
+    geo_data[::14] = [{'lat': lat, 'lng': lon} for lat, lon in zip(lats[::14], lons[::14])]
+    values = rng.gamma(2, 10, n)
+    values[::5] = np.nan
+    return {
+        'response_id': np.arange(start, start + n),
+        'location_data': location_data,
+        'geo_data': geo_data,
+        'numeric_value': values,
+        'data_quality_score': rng.uniform(0, 100, n),
+    }
+
+
+def points_in(columns, south, west, north, east):
+    lats, lons = extract_coordinates(columns['location_data'], columns['geo_data'])
+    inside = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+    return inside, columns['numeric_value'][inside]
+
+
+def test_coordinates_from_location_and_geo_data():
+    lats, lons = extract_coordinates(
+        [{'latitude': 1.5, 'longitude': 2.5}, '{"lat": 3, "lng": 4}', None, 'not json', {'latitude': 95, 'longitude': 0}],
+        [None, None, {'lat': -1, 'lng': -2}, None, None],
+    )
+    assert np.allclose(lats[:3], [1.5, 3, -1]) and np.allclose(lons[:3], [2.5, 4, -2])
+    assert np.isnan(lats[3:]).all() and np.isnan(lons[3:]).all()
+
+
+def test_bins_aggregate_the_points_in_view():
+    columns = make_columns(5000)
+    index = SpatialIndex.of(columns, ZOOMS)
+    located = ~np.isnan(extract_coordinates(columns['location_data'], columns['geo_data'])[0])
+    assert index.n_rows == 5000 and index.n_points == located.sum()
+
+    # The whole world at zoom 0 is one bin holding everything
+    world = index.query(-85, -180, 85, 180, 0, 'numeric_value')
+    assert world['bin_zoom'] == 2 and world['total_count'] == index.n_points
+    assert sum(item['value_count'] for item in world['bins']) == (located & ~np.isnan(columns['numeric_value'])).sum()
+
+    result = index.query(5.0, -1.0, 6.5, 0.5, 7, 'numeric_value')
+    assert result['bin_zoom'] == 10
+    for item in result['bins']:
+        bounds = item['bounds']
+        inside, values = points_in(columns, bounds['south'], bounds['west'], bounds['north'], bounds['east'])
+        values = values[~np.isnan(values)]
+        assert item['count'] == inside.sum()
+        assert item['value_count'] == len(values)
+        if len(values):
+            assert np.isclose(item['mean'], values.mean()) and item['max'] == values.max()
+        if len(values) > 1:
+            assert np.isclose(item['std'], values.std(ddof=1))
+
+
+def test_extended_index_matches_rebuilt_index():
+    base, delta = make_columns(3000, seed=1), make_columns(400, seed=2, start=3000)
+    extended = SpatialIndex.of(base, ZOOMS).extended(delta)
+    combined = {column: np.concatenate([base[column], delta[column]]) for column in base}
+    rebuilt = SpatialIndex.of(combined, ZOOMS)
+
+    assert (extended.n_rows, extended.n_points) == (rebuilt.n_rows, rebuilt.n_points)
+    for zoom in ZOOMS:
+        a, b = extended.levels[zoom], rebuilt.levels[zoom]
+        assert np.array_equal(a.keys, b.keys) and np.array_equal(a.counts, b.counts)
+        assert np.allclose(a.sums, b.sums) and np.array_equal(a.mins, b.mins, equal_nan=True)
+
+
+def test_bin_level_limits_and_antimeridian(monkeypatch):
+    index = SpatialIndex.of(make_columns(2000, seed=3), ZOOMS)
+    # A wide view at a high zoom steps down to a level within max_bins
+    assert index.query(4.0, -2.0, 7.0, 1.5, 12, max_bins=64)['bin_zoom'] < 12
+    monkeypatch.setattr(spatial_index, 'BIN_ZOOM_OFFSET', 0)
+    assert index.bin_zoom(5.0, -1.0, 6.0, 0.0, 9) == 8
+
+    columns = {
+        'response_id': np.arange(3),
+        'location_data': np.array([{'latitude': 0.5, 'longitude': 179.9}, {'latitude': 0.5, 'longitude': -179.9},
+                                   {'latitude': 0.5, 'longitude': 0.0}], dtype=object),
+    }
+    crossing = SpatialIndex.of(columns, ZOOMS).query(0, 170, 1, -170, 4, value_column=None)
+    assert crossing['total_count'] == 2 and 'mean' not in crossing['bins'][0]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming NDJSON analysis responses.
+"""
+
+import os
+import sys
+import json
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from app.utils.streaming import _encode, chunk_ranges, ndjson_record
+
+
+def test_chunk_ranges_cover_all_items():
+    assert list(chunk_ranges(5, 2)) == [(0, 2), (2, 4), (4, 5)]
+    assert list(chunk_ranges(0, 2)) == []
+
+
+def test_records_are_single_json_lines():
+    line = ndjson_record({'type': 'item', 'score': np.float64(0.5), 'text': 'a\nb'})
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line) == {'type': 'item', 'score': 0.5, 'text': 'a\nb'}
+
+
+def test_failure_ends_stream_with_error_record():
+    async def records():
+        yield {'type': 'summary'}
+        raise ValueError("boom")
+
+    async def collect():
+        return [json.loads(line) async for line in _encode(records(), "sentiment analysis")]
+
+    lines = asyncio.run(collect())
+    assert lines[0] == {'type': 'summary'}
+    assert lines[1] == {'type': 'error', 'message': 'sentiment analysis failed: boom'}
+
+
+if __name__ == "__main__":
+    for test in [test_chunk_ranges_cover_all_items, test_records_are_single_json_lines,
+                 test_failure_ends_stream_with_error_record]:
+        test()
+        print(f"✅ {test.__name__}")
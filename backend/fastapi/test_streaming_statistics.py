@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the mergeable column statistics behind basic statistics.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app.analytics.auto_detect  # noqa: F401  (resolves the descriptive package's circular import)
+from app.analytics.descriptive import calculate_basic_stats, calculate_percentiles
+from app.analytics.descriptive.streaming_statistics import ColumnStatistics, summarize_chunks
+from app.utils.profile_store import DataProfile
+from app.utils.shared import AnalyticsUtils
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'score': rng.normal(50, 10, rows),
+        'rating': rng.integers(1, 6, rows).astype(float),
+        'wait': rng.exponential(3, rows),
+        'region': rng.choice(['north', 'south'], rows),
+    })
+    df.loc[rng.integers(0, rows, rows // 10), 'rating'] = np.nan
+    return df
+
+
+def assert_close(actual, expected, key):
+    if expected is None or actual is None:
+        assert actual is expected, key
+    else:
+        assert np.isclose(actual, expected, rtol=1e-9, atol=1e-9, equal_nan=True), (key, actual, expected)
+
+
+def test_basic_stats_match_full_column_computation():
+    df = make_frame(2000)
+    results = calculate_basic_stats(df)
+    assert list(results) == ['score', 'rating', 'wait']
+
+    rating = df['rating'].dropna()
+    expected = {
+        'mean': rating.mean(), 'median': rating.median(), 'mode': rating.mode()[0],
+        'trimmed_mean_5': stats.trim_mean(rating, 0.05), 'std': rating.std(), 'variance': rating.var(),
+        'mad': (rating - rating.mean()).abs().mean(), 'q1': rating.quantile(0.25), 'q3': rating.quantile(0.75),
+        'skewness': rating.skew(), 'kurtosis': rating.kurtosis(), 'count': len(rating),
+        'missing_count': int(df['rating'].isna().sum()), 'unique_count': rating.nunique(),
+        'missing_percentage': df['rating'].isna().mean() * 100,
+    }
+    for key, value in expected.items():
+        assert_close(results['rating'][key], value, key)
+
+    percentiles = calculate_percentiles(df, ['wait'], [0.1, 0.5, 0.99])
+    assert percentiles['wait'].keys() == {'p10', 'p50', 'p99'}
+    assert_close(percentiles['wait']['p99'], df['wait'].quantile(0.99), 'p99')
+
+
+def test_chunks_merge_to_whole_column_statistics():
+    df = make_frame(3000, seed=1)
+    whole = calculate_basic_stats(df)
+    merged = summarize_chunks(df.iloc[start:start + 450] for start in range(0, len(df), 450))
+
+    for column, statistics in merged.items():
+        for key, value in whole[column].items():
+            assert_close(statistics.basic_stats()[key], value, f"{column}.{key}")
+
+
+def test_small_and_empty_columns():
+    empty = ColumnStatistics.of(pd.Series([np.nan, np.nan]))
+    assert empty.basic_stats()['count'] == 0
+    assert empty.basic_stats()['mode'] is None
+    assert empty.basic_stats()['missing_percentage'] == 100.0
+
+    single = ColumnStatistics.of(pd.Series([4.0]))
+    assert single.merged(empty).basic_stats()['median'] == 4.0
+    assert np.isnan(single.moments.variance)
+
+
+def test_extended_profile_carries_statistics():
+    base, delta = make_frame(500, seed=2), make_frame(80, seed=3)
+    profile = DataProfile.of(base).extended(delta)
+    summaries = {column: column_profile.statistics for column, column_profile in profile.columns.items()
+                 if column_profile.statistics is not None}
+
+    results = AnalyticsUtils.summarize_basic_statistics(summaries, profile.n_rows)
+    expected = calculate_basic_stats(pd.concat([base, delta], ignore_index=True))
+    assert results['summary']['variable_names'] == ['score', 'rating', 'wait']
+    for column in expected:
+        for key, value in expected[column].items():
+            assert_close(results['basic_statistics'][column][key], value, f"{column}.{key}")
+
+
+if __name__ == "__main__":
+    for test in [test_basic_stats_match_full_column_computation, test_chunks_merge_to_whole_column_statistics,
+                 test_small_and_empty_columns, test_extended_profile_carries_statistics]:
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,45 @@
+"""
+Helpers shared by the sync views.
+"""
+
+import logging
+import threading
+from typing import Iterable
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def notify_analytics_engine(project_ids: Iterable[str]) -> None:
+    """
+    Tell the analytics engine which projects a sync batch changed.
+
+    The engine marks them dirty and recomputes their hot analyses in the
+    background. The request is sent from a daemon thread so sync requests
+    never wait for it, and a missing or slow engine is only logged.
+    """
+    project_ids = sorted({str(project_id) for project_id in project_ids if project_id})
+    if not project_ids:
+        return
+
+    analytics_settings = getattr(settings, 'ANALYTICS_SETTINGS', {})
+    engine_url = analytics_settings.get('ENGINE_URL')
+    if not engine_url:
+        return
+    timeout = analytics_settings.get('INGEST_NOTIFY_TIMEOUT', 2)
+
+    def send():
+        try:
+            response = requests.post(
+                f"{engine_url.rstrip('/')}/sync/ingested",
+                json={'project_ids': project_ids},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            logger.info(f"Analytics engine notified of {len(project_ids)} changed projects")
+        except Exception as e:
+            logger.warning(f"Could not notify analytics engine of changed projects: {e}")
+
+    threading.Thread(target=send, name="analytics-ingest-notify", daemon=True).start()
@@ -11,6 +11,7 @@ import json
 
 from .models import SyncQueue
 from .serializers import SyncQueueSerializer
+from .utils import notify_analytics_engine
 
 logger = logging.getLogger(__name__)
 
@@ -96,12 +97,17 @@ class SyncQueueViewSet(viewsets.ModelViewSet):
             processed_count = 0
             failed_count = 0
             errors = []
+            changed_projects = set()
             
             for item in pending_items:
                 try:
+                    # Resolved first: a deleted record can no longer be looked up
+                    project_id = self._affected_project(item)
                     result = self._process_single_item(item)
                     if result['success']:
                         processed_count += 1
+                        if project_id:
+                            changed_projects.add(project_id)
                     else:
                         failed_count += 1
                         errors.append(f"Item {item.id}: {result.get('error', 'Unknown error')}")
@@ -111,6 +117,9 @@ class SyncQueueViewSet(viewsets.ModelViewSet):
                     errors.append(f"Item {item.id}: {str(e)}")
                     logger.error(f"Error processing sync item {item.id}: {str(e)}")
             
+            # Let the analytics engine warm the changed projects' hot analyses
+            notify_analytics_engine(changed_projects)
+            
             return Response({
                 'success': processed_count > 0,
                 'message': f'Processed {processed_count} items, {failed_count} failed',
@@ -217,6 +226,29 @@ class SyncQueueViewSet(viewsets.ModelViewSet):
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+    def _affected_project(self, item: SyncQueue):
+        """Project whose analytics data a sync item changes (None if it changes none)"""
+        try:
+            if item.table_name == 'projects':
+                return str(item.record_id)
+            if item.table_name not in ['responses', 'questions']:
+                return None
+            
+            data = item.data
+            if isinstance(data, str):
+                data = json.loads(data)
+            project_id = (data or {}).get('project_id') or (data or {}).get('project')
+            if project_id:
+                return str(project_id)
+            
+            from django.apps import apps
+            model_class = apps.get_model(*self._parse_table_name(item.table_name))
+            project_id = model_class.objects.filter(pk=item.record_id).values_list('project_id', flat=True).first()
+            return str(project_id) if project_id else None
+        except Exception as e:
+            logger.debug(f"Could not resolve project of sync item {item.id}: {str(e)}")
+            return None
+
     def _parse_table_name(self, table_name: str) -> tuple:
         """Parse table name to get app_label and model_name"""
         # Map table names to Django app.model format
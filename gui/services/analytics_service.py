@@ -1,5 +1,7 @@
+import copy
 import json
 import requests
+from collections import OrderedDict
 from datetime import datetime
 import pandas as pd
 from typing import Dict, List, Any, Optional
@@ -25,6 +27,9 @@ class AnalyticsService:
         self.db_service = db_service
         self.base_url = "http://127.0.0.1:8001"  # Analytics backend URL
         self.cache = {}  # Simple caching mechanism
+        # Last payload and ETag per request, revalidated with If-None-Match
+        self.etag_cache = OrderedDict()
+        self.etag_cache_size = 200
         self.session = requests.Session()
         self._setup_session_headers()
         self.available_analysis_types = [
@@ -41,27 +46,41 @@ class AnalyticsService:
         })
         
     def _make_analytics_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Dict:
-        """Make authenticated request to analytics backend"""
+        """Make authenticated request to analytics backend
+        
+        Successful payloads are kept with their ETag; repeating the request sends
+        it as If-None-Match, and a 304 Not Modified reuses the kept payload
+        instead of downloading it again.
+        """
         try:
             url = f"{self.base_url}/api/v1/analytics/{endpoint}"
+            etag_key = (method, url, json.dumps(data, sort_keys=True) if data else '')
+            cached = self.etag_cache.get(etag_key)
+            headers = {'If-None-Match': cached[0]} if cached else {}
             
             if method == 'GET':
-                response = self.session.get(url, timeout=30)
+                response = self.session.get(url, headers=headers, timeout=30)
             elif method == 'POST':
                 if data:
-                    response = self.session.post(url, json=data, timeout=60)
+                    response = self.session.post(url, json=data, headers=headers, timeout=60)
                 else:
                     # POST request without JSON body (query parameters only)
-                    response = self.session.post(url, timeout=60)
+                    response = self.session.post(url, headers=headers, timeout=60)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            if response.status_code == 304 and cached:
+                self.etag_cache.move_to_end(etag_key)
+                return copy.deepcopy(cached[1])
                 
             if response.status_code == 200:
                 result = response.json()
                 # Handle the standardized response format
                 if isinstance(result, dict) and 'status' in result:
                     if result['status'] == 'success':
-                        return result.get('data', {})
+                        payload = result.get('data', {})
+                        self._remember_etag(etag_key, response.headers.get('ETag'), payload)
+                        return payload
                     else:
                         return {'error': result.get('message', 'Unknown error')}
                 return result
@@ -94,6 +113,16 @@ class AnalyticsService:
         except Exception as e:
             return {'error': f'Request error: {str(e)}'}
 
+    def _remember_etag(self, etag_key: tuple, etag: Optional[str], payload: Any):
+        """Keep a payload for revalidation, dropping the least recently used beyond the cache size"""
+        if not etag:
+            self.etag_cache.pop(etag_key, None)
+            return
+        self.etag_cache[etag_key] = (etag, copy.deepcopy(payload))
+        self.etag_cache.move_to_end(etag_key)
+        while len(self.etag_cache) > self.etag_cache_size:
+            self.etag_cache.popitem(last=False)
+
     # === Core Analytics Methods ===
 
     def get_project_stats(self, project_id: str) -> Dict:
@@ -349,6 +378,23 @@ class AnalyticsService:
         except Exception as e:
             return {'error': f'Geospatial analysis failed: {str(e)}'}
 
+    def get_map_bins(self, project_id: str, south: float, west: float, north: float, east: float,
+                     zoom: int, value_column: Optional[str] = 'numeric_value') -> Dict:
+        """Get response density and value bins for the visible map area"""
+        try:
+            import urllib.parse
+            
+            params = {'south': south, 'west': west, 'north': north, 'east': east, 'zoom': zoom}
+            if value_column:
+                params['value_column'] = value_column
+            
+            url = f'descriptive/project/{project_id}/map/bins?{urllib.parse.urlencode(params)}'
+            result = self._make_analytics_request(url)
+            return result
+            
+        except Exception as e:
+            return {'error': f'Map bins failed: {str(e)}'}
+
     def generate_comprehensive_report(self, project_id: str, include_plots: bool = False) -> Dict:
         """Generate comprehensive analytics report"""
         try: